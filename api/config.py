@@ -34,6 +34,9 @@ class Settings(BaseSettings):
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
     frontend_url: str = "http://localhost:3000"  # Production: https://getfindable.online
     rate_limit_enabled: bool = True  # Set to False to disable rate limiting in dev
+    rate_limit_local_max_keys: int = 10000  # Per-process fallback buckets if Redis is down
+    rate_limit_redis_max_connections: int = 20  # Limiter's own Redis pool, per event loop
+    rate_limit_redis_timeout_seconds: float = 0.25  # Pool wait/connect/read before falling back
 
     # Database
     database_url: PostgresDsn
@@ -77,6 +80,15 @@ class Settings(BaseSettings):
     # Embeddings
     embedding_model: str = "BAAI/bge-small-en-v1.5"
     embedding_dimension: int = 384
+    embedding_cache_memory_entries: int = 50_000  # Per-process LRU; lasts one forked job
+    embedding_cache_disk_enabled: bool = True  # Shared on-disk tier for worker processes
+    embedding_cache_dir: str | None = None  # Disk tier directory (default: system temp dir)
+    embedding_cache_disk_entries: int = 500_000  # Disk tier size before LRU eviction
+    embedding_service_address: str | None = (
+        None  # Shared embedding service, e.g. unix:///tmp/x.sock
+    )
+    embedding_service_max_batch: int = 128  # Texts per batched model call in the service
+    embedding_service_max_wait_ms: float = 10.0  # Max time a request waits for a batch to fill
 
     # Storage (S3-compatible)
     storage_bucket_name: str = "findable-artifacts"
@@ -85,6 +97,13 @@ class Settings(BaseSettings):
     storage_secret_key: str | None = None
     storage_region: str = "auto"
 
+    # Public score page artifacts (rendered HTML and OG images of completed runs)
+    score_artifacts_enabled: bool = True  # Cache rendered score pages and OG images
+    score_artifacts_dir: str | None = None  # Local tier directory (default: system temp dir)
+    score_artifacts_max_bytes: int = 512 * 1024 * 1024  # Local tier size before LRU eviction
+    score_artifacts_s3_enabled: bool = False  # Shared tier; required for eager worker renders
+    public_base_url: str | None = None  # Public site URL; score page HTML is cached only if set
+
     # Crawler
     crawler_max_pages: int = 250
     crawler_max_depth: int = 3
@@ -92,6 +111,34 @@ class Settings(BaseSettings):
     crawler_user_agent: str = "FindableBot/1.0 (+https://findable.ai/bot)"
     crawler_cache_enabled: bool = True  # Enable crawl result caching
     crawler_cache_ttl_seconds: int = 86400  # Cache TTL: 24 hours
+    html_parser_backend: Literal["lxml", "html.parser"] = "html.parser"  # lxml: faster, opt-in
+
+    # Entity recognition lookups (Wikipedia, Wikidata, RDAP, web presence)
+    entity_cache_enabled: bool = True  # Share lookup results across audits via Redis
+    entity_cache_stale_seconds: int = 3 * 86400  # Serve expired entries while refreshing
+
+    # Per-page analysis (extraction + structure/schema/authority checks)
+    audit_analysis_workers: int = 0  # Processes; 0 = one per CPU, 1 = in-process
+    audit_analysis_min_pages: int = 8  # Smaller crawls are analyzed in-process
+    audit_streaming_enabled: bool = True  # Analyze, chunk and embed pages during the crawl
+    audit_stream_queue_pages: int = 16  # Crawled pages awaiting analysis before the crawl waits
+
+    # Incremental re-audits (monitoring): reuse unchanged pages from the last run
+    audit_incremental_enabled: bool = True  # Save baselines and honor incremental runs
+    audit_baseline_dir: str | None = None  # Shared baseline volume (default: local temp dir)
+
+    # Run progress (Redis pub/sub to SSE/HTMX viewers; DB gets coalesced checkpoints)
+    run_progress_bus_enabled: bool = True  # False = write every tick to the DB and poll it
+    run_progress_checkpoint_seconds: float = 5.0  # Min time between DB writes within a step
+    run_progress_wait_seconds: float = 20.0  # Longest a status request waits for a change
+
+    # Worker process
+    worker_preload_enabled: bool = True  # Load the embedding model and job modules before forking
+    worker_preload_modules: list[str] = Field(
+        default_factory=list
+    )  # Extra modules to import at startup
+    worker_fork_jobs: bool = True  # False = run jobs in the warm worker process (no fork)
+    worker_metrics_port: int = 0  # Serve worker Prometheus metrics on this port; 0 = off
 
     # Sentry
     sentry_dsn: str | None = None
@@ -121,6 +168,7 @@ class Settings(BaseSettings):
     calibration_drift_threshold_bias: float = 0.20  # 20% bias triggers alert
     calibration_min_samples_for_analysis: int = 100  # Min samples for calibration analysis
     calibration_experiment_min_samples: int = 100  # Min samples per A/B experiment arm
+    calibration_optimizer_workers: int = 1  # Threads for optimizer grid search (0 = one per CPU)
 
     @property
     def is_production(self) -> bool:
@@ -60,6 +60,12 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown tasks
     logger.info("Shutting down Findable API")
 
+    from api.rate_limit import rate_limiter
+    from worker.progress import close_progress_hub
+
+    await close_progress_hub()
+    await rate_limiter.close()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -98,6 +98,34 @@ JOB_PROCESSING_TIME = Histogram(
     buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0],
 )
 
+WORKER_WARMUP_TIME = Gauge(
+    "findable_worker_warmup_seconds",
+    "Time spent preloading models and modules at worker startup",
+    ["phase"],
+)
+
+EMBEDDING_SERVICE_TEXTS = Counter(
+    "findable_embedding_service_texts_total",
+    "Texts embedded by the shared embedding service",
+)
+
+EMBEDDING_SERVICE_BATCH_SIZE = Histogram(
+    "findable_embedding_service_batch_size",
+    "Texts per batched model call in the embedding service",
+    buckets=[1, 4, 8, 16, 32, 64, 128, 256, 512],
+)
+
+EMBEDDING_SERVICE_BATCH_TIME = Histogram(
+    "findable_embedding_service_batch_seconds",
+    "Model time per batch in the embedding service",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+EMBEDDING_SERVICE_QUEUE_DEPTH = Gauge(
+    "findable_embedding_service_queue_depth",
+    "Texts waiting for a batch in the embedding service",
+)
+
 # Public audit adoption metrics
 PUBLIC_AUDITS_TOTAL = Counter("findable_public_audits_total", "Total public audits started")
 EMAIL_CAPTURES_TOTAL = Counter("findable_email_captures_total", "Email capture conversions")
@@ -242,6 +270,19 @@ def record_job_duration(job_type: str, duration: float) -> None:
     JOB_PROCESSING_TIME.labels(job_type=job_type).observe(duration)
 
 
+def record_worker_warmup(phase: str, duration: float) -> None:
+    """Record worker warm-up time for a phase."""
+    WORKER_WARMUP_TIME.labels(phase=phase).set(duration)
+
+
+def record_embedding_batch(texts: int, duration: float, queue_depth: int) -> None:
+    """Record a batched model call in the embedding service."""
+    EMBEDDING_SERVICE_TEXTS.inc(texts)
+    EMBEDDING_SERVICE_BATCH_SIZE.observe(texts)
+    EMBEDDING_SERVICE_BATCH_TIME.observe(duration)
+    EMBEDDING_SERVICE_QUEUE_DEPTH.set(queue_depth)
+
+
 def record_public_audit() -> None:
     """Record a public audit started."""
     PUBLIC_AUDITS_TOTAL.inc()
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import time
 import uuid
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
@@ -14,6 +13,8 @@ from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from api.rate_limit import RateLimiter, RateLimitResult, TokenBucket, rate_limiter
+
 # Type alias for call_next function
 CallNext = Callable[[Request], Awaitable[Response]]
 
@@ -29,13 +30,13 @@ class RateLimitConfig:
     requests_per_hour: int = 1000
     burst_size: int = 10  # Allow burst above limit
 
-
-@dataclass
-class RateLimitBucket:
-    """Token bucket for rate limiting."""
-
-    tokens: float = 0.0
-    last_update: float = field(default_factory=time.time)
+    @property
+    def token_bucket(self) -> TokenBucket:
+        """Per-minute limit as a token bucket with room for the burst."""
+        return TokenBucket(
+            rate=self.requests_per_minute / 60.0,
+            capacity=self.burst_size + self.requests_per_minute,
+        )
 
 
 # Default rate limits by plan tier
@@ -106,7 +107,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using token bucket algorithm."""
+    """Rate limiting middleware using shared Redis token buckets."""
 
     # Paths excluded from rate limiting
     EXCLUDE_PATHS = {"/api/health", "/api/ready", "/metrics", "/docs", "/openapi.json"}
@@ -114,12 +115,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     # Auth paths with stricter limits
     AUTH_PATHS = {"/v1/auth/login", "/v1/auth/register", "/v1/auth/forgot-password"}
 
-    def __init__(self, app: Any, enabled: bool = True) -> None:
+    def __init__(self, app: Any, enabled: bool = True, limiter: RateLimiter | None = None) -> None:
         super().__init__(app)
         self.enabled = enabled
-        # In-memory buckets (use Redis in production for multi-instance)
-        self._user_buckets: dict[str, RateLimitBucket] = defaultdict(RateLimitBucket)
-        self._ip_buckets: dict[str, RateLimitBucket] = defaultdict(RateLimitBucket)
+        self.limiter = limiter or rate_limiter
 
     async def dispatch(self, request: Request, call_next: CallNext) -> Response:
         if not self.enabled:
@@ -132,69 +131,41 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Get client identifier
         client_ip = self._get_client_ip(request)
 
-        # Check auth endpoint rate limits (by IP)
-        if request.url.path in self.AUTH_PATHS:
-            allowed, retry_after = self._check_rate_limit(
-                f"ip:{client_ip}",
-                AUTH_RATE_LIMITS,
-                self._ip_buckets,
-            )
-            if not allowed:
-                return self._rate_limit_response(retry_after)
-
         # Check user rate limits (by user ID or IP)
         user_id = self._get_user_id(request)
         plan = self._get_user_plan(request)
         limits = PLAN_RATE_LIMITS.get(plan, PLAN_RATE_LIMITS["starter"])
-
         identifier = f"user:{user_id}" if user_id else f"ip:{client_ip}"
-        allowed, retry_after = self._check_rate_limit(identifier, limits, self._user_buckets)
 
-        if not allowed:
+        # Auth endpoints also get a stricter per-IP limit, checked in the
+        # same round trip
+        checks = [(f"api:{identifier}", limits.token_bucket)]
+        if request.url.path in self.AUTH_PATHS:
+            checks.append((f"auth:ip:{client_ip}", AUTH_RATE_LIMITS.token_bucket))
+        results = await self.limiter.check_many(checks)
+
+        denied = self._first_denied(results)
+        if denied is not None:
             logger.warning(
                 "rate_limit_exceeded",
                 identifier=identifier,
                 path=request.url.path,
             )
-            return self._rate_limit_response(retry_after)
+            return self._rate_limit_response(denied.retry_after)
 
         response = await call_next(request)  # type: ignore[return-value]
 
         # Add rate limit headers
         response.headers["X-RateLimit-Limit"] = str(limits.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(
-            max(0, int(self._user_buckets[identifier].tokens))
-        )
+        response.headers["X-RateLimit-Remaining"] = str(results[0].remaining)
 
         return response
 
-    def _check_rate_limit(
-        self,
-        identifier: str,
-        config: RateLimitConfig,
-        buckets: dict[str, RateLimitBucket],
-    ) -> tuple[bool, int]:
-        """Check if request is allowed. Returns (allowed, retry_after_seconds)."""
-        now = time.time()
-        bucket = buckets[identifier]
-
-        # Refill tokens based on time elapsed
-        elapsed = now - bucket.last_update
-        refill_rate = config.requests_per_minute / 60.0  # tokens per second
-        bucket.tokens = min(
-            config.burst_size + config.requests_per_minute,
-            bucket.tokens + elapsed * refill_rate,
-        )
-        bucket.last_update = now
-
-        # Check if we have tokens
-        if bucket.tokens >= 1.0:
-            bucket.tokens -= 1.0
-            return True, 0
-
-        # Calculate retry after
-        retry_after = int((1.0 - bucket.tokens) / refill_rate) + 1
-        return False, retry_after
+    @staticmethod
+    def _first_denied(results: list[RateLimitResult]) -> RateLimitResult | None:
+        """The denied check with the longest wait, or None if all passed."""
+        denied = [r for r in results if not r.allowed]
+        return max(denied, key=lambda r: r.retry_after) if denied else None
 
     def _get_client_ip(self, request: Request) -> str:
         """Get client IP, handling proxies."""
@@ -66,6 +66,7 @@ class Embedding(Base):
         Index("idx_embeddings_site_id", "site_id"),
         Index("idx_embeddings_page_id", "page_id"),
         Index("idx_embeddings_content_hash", "content_hash"),
+        Index("idx_embeddings_model_content_hash", "model_name", "content_hash"),
         # Unique constraint for deduplication
         {"sqlite_autoincrement": True},
     )
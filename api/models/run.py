@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
@@ -40,6 +40,16 @@ class RunType(StrEnum):
     RESCORE = "rescore"
 
 
+def shareable_id_for(run_id: uuid.UUID) -> str:
+    """Short, URL-safe public ID for a run: the first 12 hex chars of its UUID."""
+    return run_id.hex[:12]
+
+
+def _default_shareable_id(context: Any) -> str | None:
+    run_id = context.get_current_parameters().get("id")
+    return shareable_id_for(run_id) if run_id else None
+
+
 class Run(Base):
     """Run model - represents an audit run for a site."""
 
@@ -58,6 +68,15 @@ class Run(Base):
         index=True,
     )
 
+    # Public score page ID (derived from id, indexed for /score/{shareable_id})
+    shareable_id: Mapped[str | None] = mapped_column(
+        String(12),
+        default=_default_shareable_id,
+        nullable=True,
+        unique=True,
+        index=True,
+    )
+
     # Run configuration
     run_type: Mapped[str] = mapped_column(
         String(50),
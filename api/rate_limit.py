@@ -0,0 +1,351 @@
+"""Shared rate limiting backed by Redis.
+
+Limits are kept in Redis so they hold across every uvicorn worker and API
+instance. Each check runs as a Lua script, so reading, refilling and
+charging a bucket is one atomic step with no WATCH/retry loop, and all the
+checks for a request are sent in a single pipelined round trip.
+
+Two algorithms are available:
+
+- ``TokenBucket``: steady refill with a burst allowance (API request limits)
+- ``SlidingWindow``: at most N hits in any trailing window (public audit quota)
+
+The limiter has its own blocking connection pool with short timeouts, so
+progress streams sharing the default client cannot starve it and a slow
+Redis costs a request at most ``rate_limit_redis_timeout_seconds``.
+
+If Redis is unreachable, checks fall back to per-process state held in a
+bounded LRU. Limits are then enforced per worker rather than globally,
+but requests are never let through unchecked and memory stays flat no
+matter how many clients are seen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import time
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from redis.exceptions import NoScriptError
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "findable:ratelimit"
+
+# KEYS[1]: bucket hash; ARGV: rate (tokens/s), capacity, now (s), cost
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+# KEYS[1]: sorted set of hit timestamps; ARGV: limit, window (s), now (s), member
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+  redis.call('ZADD', KEYS[1], now, ARGV[4])
+  redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+  return {1, tostring(limit - count - 1), '0'}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, '0', tostring(tonumber(oldest[2]) + window - now)}
+"""
+
+_SCRIPT_SHAS = {
+    script: hashlib.sha1(script.encode()).hexdigest()
+    for script in (TOKEN_BUCKET_SCRIPT, SLIDING_WINDOW_SCRIPT)
+}
+
+
+@dataclass(frozen=True)
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``capacity``; each request takes one."""
+
+    rate: float
+    capacity: float
+
+
+@dataclass(frozen=True)
+class SlidingWindow:
+    """Allows at most ``limit`` requests in any ``window_seconds`` span."""
+
+    limit: int
+    window_seconds: float
+
+
+RateLimit = TokenBucket | SlidingWindow
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    remaining: int
+    retry_after: int = 0  # Seconds until a request would be allowed
+
+
+@dataclass
+class RateLimitBucket:
+    """Local token bucket state."""
+
+    tokens: float = 0.0
+    last_update: float = field(default_factory=time.time)
+
+
+def _retry_after(seconds: float) -> int:
+    return max(1, math.ceil(seconds))
+
+
+class LocalRateLimiter:
+    """
+    In-process limiter used when Redis is unavailable.
+
+    Implements the same algorithms as the Lua scripts. State is kept in an
+    LRU capped at ``max_keys``; evicting a key resets that client's limit,
+    which is the price of bounded memory.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._state: OrderedDict[str, RateLimitBucket | deque[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def _get(self, key: str) -> RateLimitBucket | deque[float] | None:
+        state = self._state.get(key)
+        if state is not None:
+            self._state.move_to_end(key)
+        return state
+
+    def _put(self, key: str, state: RateLimitBucket | deque[float]) -> None:
+        self._state[key] = state
+        while len(self._state) > self.max_keys:
+            self._state.popitem(last=False)
+
+    def check(self, key: str, limit: RateLimit, now: float | None = None) -> RateLimitResult:
+        """Check and charge one request against ``key``."""
+        now = time.time() if now is None else now
+        if isinstance(limit, TokenBucket):
+            return self._check_token_bucket(key, limit, now)
+        return self._check_sliding_window(key, limit, now)
+
+    def _check_token_bucket(self, key: str, limit: TokenBucket, now: float) -> RateLimitResult:
+        bucket = self._get(key)
+        if not isinstance(bucket, RateLimitBucket):
+            bucket = RateLimitBucket(tokens=limit.capacity, last_update=now)
+            self._put(key, bucket)
+
+        elapsed = max(0.0, now - bucket.last_update)
+        bucket.tokens = min(limit.capacity, bucket.tokens + elapsed * limit.rate)
+        bucket.last_update = now
+
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return RateLimitResult(allowed=True, remaining=int(bucket.tokens))
+        return RateLimitResult(
+            allowed=False,
+            remaining=0,
+            retry_after=_retry_after((1.0 - bucket.tokens) / limit.rate),
+        )
+
+    def _check_sliding_window(self, key: str, limit: SlidingWindow, now: float) -> RateLimitResult:
+        hits = self._get(key)
+        if not isinstance(hits, deque):
+            hits = deque()
+            self._put(key, hits)
+
+        cutoff = now - limit.window_seconds
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+
+        if len(hits) < limit.limit:
+            hits.append(now)
+            return RateLimitResult(allowed=True, remaining=limit.limit - len(hits))
+        return RateLimitResult(
+            allowed=False,
+            remaining=0,
+            retry_after=_retry_after(hits[0] + limit.window_seconds - now),
+        )
+
+
+# Async clients bind their connections to an event loop, so keep one per loop
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = weakref.WeakKeyDictionary()
+
+
+def _create_client() -> Any:
+    from redis.asyncio import BlockingConnectionPool, Redis
+
+    from api.config import get_settings
+
+    settings = get_settings()
+    timeout = settings.rate_limit_redis_timeout_seconds
+    pool = BlockingConnectionPool.from_url(
+        str(settings.redis_url),
+        max_connections=settings.rate_limit_redis_max_connections,
+        timeout=timeout,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+    )
+    return Redis.from_pool(pool)
+
+
+class RateLimiter:
+    """Redis-backed rate limiter with a local fallback."""
+
+    def __init__(
+        self,
+        redis: Any | None = None,
+        local: LocalRateLimiter | None = None,
+        prefix: str = KEY_PREFIX,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            redis: Async Redis client (default: the limiter's own client for the running loop)
+            local: Fallback limiter used while Redis is unreachable
+            prefix: Key prefix for all buckets
+        """
+        self._redis = redis
+        self._local = local
+        self.prefix = prefix
+
+    def _client(self) -> Any:
+        if self._redis is not None:
+            return self._redis
+        loop = asyncio.get_running_loop()
+        client = _clients.get(loop)
+        if client is None:
+            client = _create_client()
+            _clients[loop] = client
+        return client
+
+    async def close(self) -> None:
+        """Close the limiter's own client for the running event loop."""
+        client = _clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def local(self) -> LocalRateLimiter:
+        if self._local is None:
+            from api.config import get_settings
+
+            self._local = LocalRateLimiter(get_settings().rate_limit_local_max_keys)
+        return self._local
+
+    async def check(self, key: str, limit: RateLimit) -> RateLimitResult:
+        """Check and charge one request against ``key``."""
+        return (await self.check_many([(key, limit)]))[0]
+
+    async def check_many(self, checks: Sequence[tuple[str, RateLimit]]) -> list[RateLimitResult]:
+        """
+        Check and charge several limits in one Redis round trip.
+
+        Every check is charged independently, in order. Falls back to the
+        local limiter if Redis fails.
+
+        Args:
+            checks: ``(key, limit)`` pairs
+
+        Returns:
+            One result per check
+        """
+        now = time.time()
+        try:
+            return await self._check_redis(checks, now)
+        except Exception as e:
+            logger.warning("rate_limit_redis_failed_using_fallback", error=str(e))
+            return [self.local.check(f"{self.prefix}:{key}", limit, now) for key, limit in checks]
+
+    @staticmethod
+    def _script_args(limit: RateLimit, now: float) -> tuple[str, list[Any]]:
+        if isinstance(limit, TokenBucket):
+            return TOKEN_BUCKET_SCRIPT, [limit.rate, limit.capacity, now, 1]
+        return SLIDING_WINDOW_SCRIPT, [limit.limit, limit.window_seconds, now, uuid.uuid4().hex]
+
+    async def _run_scripts(self, calls: list[tuple[str, str, list[Any]]]) -> list[Any]:
+        async with self._client().pipeline(transaction=False) as pipe:
+            for script, key, args in calls:
+                pipe.evalsha(_SCRIPT_SHAS[script], 1, key, *args)
+            return list(await pipe.execute(raise_on_error=False))
+
+    async def _check_redis(
+        self, checks: Sequence[tuple[str, RateLimit]], now: float
+    ) -> list[RateLimitResult]:
+        calls = []
+        for key, limit in checks:
+            script, args = self._script_args(limit, now)
+            calls.append((script, f"{self.prefix}:{key}", args))
+
+        replies = await self._run_scripts(calls)
+
+        missing = [i for i, reply in enumerate(replies) if isinstance(reply, NoScriptError)]
+        if missing:
+            # Script cache was flushed (e.g. Redis restarted); load and rerun
+            # only the calls that did not execute
+            client = self._client()
+            for script in {calls[i][0] for i in missing}:
+                await client.script_load(script)
+            retried = await self._run_scripts([calls[i] for i in missing])
+            for i, reply in zip(missing, retried, strict=True):
+                replies[i] = reply
+
+        results = []
+        for (_, limit), reply in zip(checks, replies, strict=True):
+            if isinstance(reply, Exception):
+                raise reply
+            results.append(self._parse_reply(limit, reply))
+        return results
+
+    @staticmethod
+    def _parse_reply(limit: RateLimit, reply: list[Any]) -> RateLimitResult:
+        if isinstance(limit, TokenBucket):
+            allowed, tokens = int(reply[0]), float(reply[1])
+            if allowed:
+                return RateLimitResult(allowed=True, remaining=int(tokens))
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                retry_after=_retry_after((1.0 - tokens) / limit.rate),
+            )
+
+        allowed, remaining, wait = int(reply[0]), int(reply[1]), float(reply[2])
+        if allowed:
+            return RateLimitResult(allowed=True, remaining=remaining)
+        return RateLimitResult(allowed=False, remaining=0, retry_after=_retry_after(wait))
+
+
+# Singleton instance shared by the middleware and routers
+rate_limiter = RateLimiter()
@@ -3,7 +3,7 @@
 Provides a free audit tool that accepts a URL, runs the Findable Score
 pipeline, and returns score + pillar breakdown + top fixes.
 
-Rate limited to 3 audits per hour per IP address via Redis.
+Rate limited to 3 audits per hour per IP address via the shared Redis limiter.
 """
 
 import asyncio
@@ -12,6 +12,7 @@ import ipaddress
 import json
 import socket
 import uuid
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Annotated
@@ -25,42 +26,23 @@ from pydantic import BaseModel, field_validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.config import get_settings
 from api.database import async_session_maker
 from api.models import Report, Run, Site
+from api.models.run import shareable_id_for
+from api.rate_limit import SlidingWindow, rate_limiter
+from worker.progress import RunProgressEvent, watch_run
+from worker.reports.artifacts import (
+    OG_IMAGE_ARTIFACT,
+    SCORE_PAGE_ARTIFACT,
+    Artifact,
+    get_artifact_cache,
+    public_base_url,
+    render_og_image,
+    render_score_page,
+)
 
 logger = structlog.get_logger(__name__)
 
-# ============================================================================
-# Redis Connection Pool (module-level, reused across requests)
-# ============================================================================
-
-_redis_pool: object | None = None
-_redis_pool_lock = asyncio.Lock()
-
-
-async def _get_redis_pool():
-    """Get or create a cached Redis connection pool."""
-    global _redis_pool
-    if _redis_pool is not None:
-        return _redis_pool
-
-    async with _redis_pool_lock:
-        # Double-check after acquiring lock
-        if _redis_pool is not None:
-            return _redis_pool
-
-        import redis.asyncio as aioredis
-
-        settings = get_settings()
-        _redis_pool = aioredis.from_url(
-            str(settings.redis_url),
-            decode_responses=True,
-            max_connections=10,
-        )
-        return _redis_pool
-
-
 # Template configuration
 TEMPLATES_DIR = Path(__file__).parent.parent.parent / "web" / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
@@ -73,6 +55,7 @@ router = APIRouter(prefix="/public", tags=["public"])
 # ============================================================================
 
 MAX_AUDITS_PER_HOUR = 3
+PUBLIC_AUDIT_LIMIT = SlidingWindow(limit=MAX_AUDITS_PER_HOUR, window_seconds=3600)
 
 
 def _get_client_ip(request: Request) -> str:
@@ -86,78 +69,18 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-# In-memory fallback rate limiter when Redis is unavailable
-_rate_limit_fallback: dict[str, list[float]] = {}
-_FALLBACK_MAX_ENTRIES = 10000  # Prevent memory exhaustion
-
-
-def _check_rate_limit_fallback(ip_hash: str) -> bool:
-    """In-memory rate limit check. Returns True if request should be blocked."""
-    import time
-
-    now = time.time()
-    cutoff = now - 3600  # 1 hour window
-
-    # Evict old entries periodically
-    if len(_rate_limit_fallback) > _FALLBACK_MAX_ENTRIES:
-        stale_keys = [k for k, v in _rate_limit_fallback.items() if not v or v[-1] < cutoff]
-        for k in stale_keys:
-            del _rate_limit_fallback[k]
-
-    timestamps = _rate_limit_fallback.get(ip_hash, [])
-    # Remove expired timestamps
-    timestamps = [t for t in timestamps if t > cutoff]
-
-    if len(timestamps) >= MAX_AUDITS_PER_HOUR:
-        _rate_limit_fallback[ip_hash] = timestamps
-        return True
-
-    timestamps.append(now)
-    _rate_limit_fallback[ip_hash] = timestamps
-    return False
-
-
 async def _check_rate_limit(request: Request) -> None:
-    """Check per-IP rate limit using Redis with in-memory fallback."""
-    settings = get_settings()
+    """Check the per-IP audit quota (shared across workers via Redis)."""
     client_ip = _get_client_ip(request)
     ip_hash = hashlib.sha256(client_ip.encode()).hexdigest()[:16]
 
-    if not settings.redis_url:
-        # No Redis configured — use in-memory fallback (fail closed)
-        if _check_rate_limit_fallback(ip_hash):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {MAX_AUDITS_PER_HOUR} audits per hour.",
-            )
-        return
-
-    try:
-        r = await _get_redis_pool()
-
-        key = f"findable:public_audit:rate:{ip_hash}"
-
-        current = await r.get(key)
-        if current and int(current) >= MAX_AUDITS_PER_HOUR:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {MAX_AUDITS_PER_HOUR} audits per hour.",
-            )
-        pipe = r.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, 3600)  # 1 hour TTL
-        await pipe.execute()
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.warning("rate_limit_redis_failed_using_fallback", error=str(e))
-        # Redis down — fall back to in-memory rate limiting (fail closed)
-        if _check_rate_limit_fallback(ip_hash):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {MAX_AUDITS_PER_HOUR} audits per hour.",
-            )
+    result = await rate_limiter.check(f"public_audit:{ip_hash}", PUBLIC_AUDIT_LIMIT)
+    if not result.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded. Maximum {MAX_AUDITS_PER_HOUR} audits per hour.",
+            headers={"Retry-After": str(result.retry_after)},
+        )
 
 
 # ============================================================================
@@ -293,34 +216,51 @@ async def _ensure_public_user(db: AsyncSession) -> None:
 
 def _make_shareable_id(run_id: uuid.UUID) -> str:
     """Generate a short, URL-safe shareable ID from a run UUID."""
-    return run_id.hex[:12]
+    return shareable_id_for(run_id)
+
+
+# Shareable ID -> run ID, so repeat hits on a score page skip the index lookup
+_shareable_id_cache: OrderedDict[str, uuid.UUID] = OrderedDict()
+_SHAREABLE_ID_CACHE_MAX_ENTRIES = 4096
+
+
+def _is_valid_shareable_id(shareable_id: str) -> bool:
+    """Whether shareable_id is 12 hex chars (safe for SQL and cache paths)."""
+    return (
+        bool(shareable_id)
+        and len(shareable_id) == 12
+        and all(c in "0123456789abcdef" for c in shareable_id.lower())
+    )
 
 
 async def _find_run_by_shareable_id(db: AsyncSession, shareable_id: str) -> Run | None:
-    """Find a run by its shareable ID prefix.
+    """Find a run by its shareable ID.
 
-    Uses SQL-level filtering to avoid loading all runs into memory.
-    The shareable_id is the first 12 hex chars of the UUID (no dashes).
+    The shareable_id is the first 12 hex chars of the UUID (no dashes),
+    stored in the uniquely indexed ``runs.shareable_id`` column. Resolved
+    IDs are kept in a small in-process LRU and loaded by primary key.
     """
     # Validate shareable_id format to prevent SQL injection / bad queries
-    if (
-        not shareable_id
-        or len(shareable_id) != 12
-        or not all(c in "0123456789abcdef" for c in shareable_id.lower())
-    ):
+    if not _is_valid_shareable_id(shareable_id):
         return None
-
-    # Reconstruct UUID prefix pattern for SQL LIKE query
-    # UUID text format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
-    # First 12 hex chars = first 8 chars + first 4 of second group
-    # e.g., "550e8400e29b" -> LIKE '550e8400-e29b%'
-    prefix = f"{shareable_id[:8]}-{shareable_id[8:12]}"
-
-    from sqlalchemy import String as SAString
-    from sqlalchemy import cast
-
-    result = await db.execute(select(Run).where(cast(Run.id, SAString).like(f"{prefix}%")).limit(1))
-    return result.scalar_one_or_none()
+    shareable_id = shareable_id.lower()
+
+    run_id = _shareable_id_cache.get(shareable_id)
+    if run_id is not None:
+        _shareable_id_cache.move_to_end(shareable_id)
+        result = await db.execute(select(Run).where(Run.id == run_id))
+        run = result.scalar_one_or_none()
+        if run is not None:
+            return run
+        del _shareable_id_cache[shareable_id]  # Run was deleted
+
+    result = await db.execute(select(Run).where(Run.shareable_id == shareable_id))
+    run = result.scalar_one_or_none()
+    if run is not None:
+        _shareable_id_cache[shareable_id] = run.id
+        while len(_shareable_id_cache) > _SHAREABLE_ID_CACHE_MAX_ENTRIES:
+            _shareable_id_cache.popitem(last=False)
+    return run
 
 
 # ============================================================================
@@ -373,6 +313,7 @@ async def start_public_audit(
         # Create run
         run = Run(
             id=run_id,
+            shareable_id=shareable_id,
             site_id=site_id,
             run_type="starter_audit",
             status="queued",
@@ -458,6 +399,7 @@ async def start_public_audit_form(
 
         run = Run(
             id=run_id,
+            shareable_id=shareable_id,
             site_id=site_id,
             run_type="starter_audit",
             status="queued",
@@ -488,45 +430,40 @@ async def get_audit_status(audit_id: str) -> StreamingResponse:
     """Stream audit progress via Server-Sent Events."""
 
     async def event_generator() -> AsyncGenerator[str, None]:
-        last_status = None
-        last_progress = None
-        timeout_counter = 0
-        max_timeout = 600  # 10 minutes
-
-        while timeout_counter < max_timeout:
-            async with async_session_maker() as db:
-                run = await _find_run_by_shareable_id(db, audit_id)
-
-                if not run:
-                    yield f"event: error\ndata: {json.dumps({'error': 'Audit not found'})}\n\n"
-                    break
+        async with async_session_maker() as db:
+            run = await _find_run_by_shareable_id(db, audit_id)
 
-                current_status = run.status
-                current_progress = run.progress
-
-                if current_status != last_status or current_progress != last_progress:
-                    event_data = {
-                        "status": current_status,
-                        "progress": current_progress,
-                    }
-
-                    if current_status == "complete":
-                        event_data["report_id"] = str(run.report_id) if run.report_id else None
-                        event_data["result_url"] = f"/score/{audit_id}"
-                        yield f"event: complete\ndata: {json.dumps(event_data)}\n\n"
-                        break
+        if not run:
+            yield f"event: error\ndata: {json.dumps({'error': 'Audit not found'})}\n\n"
+            return
 
-                    if current_status == "failed":
-                        event_data["error"] = run.error_message or "Audit failed"
-                        yield f"event: error\ndata: {json.dumps(event_data)}\n\n"
-                        break
+        run_id = run.id
 
-                    yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
-                    last_status = current_status
-                    last_progress = current_progress
+        async def reload() -> RunProgressEvent | None:
+            async with async_session_maker() as db:
+                result = await db.execute(select(Run).where(Run.id == run_id))
+                current = result.scalar_one_or_none()
+            return RunProgressEvent.from_run(current) if current else None
+
+        # Progress arrives over the progress bus; the DB is only re-read
+        # as a fallback
+        async for state in watch_run(
+            str(run_id), RunProgressEvent.from_run(run), reload, max_seconds=600
+        ):
+            event_data: dict = {
+                "status": state.status,
+                "progress": state.progress,
+            }
 
-            await asyncio.sleep(2)
-            timeout_counter += 2
+            if state.status == "complete":
+                event_data["report_id"] = state.report_id
+                event_data["result_url"] = f"/score/{audit_id}"
+                yield f"event: complete\ndata: {json.dumps(event_data)}\n\n"
+            elif state.status == "failed":
+                event_data["error"] = state.error_message or "Audit failed"
+                yield f"event: error\ndata: {json.dumps(event_data)}\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -598,9 +535,83 @@ async def get_audit_result(audit_id: str) -> dict:
 score_router = APIRouter(tags=["public"])
 
 
+SCORE_PAGE_CACHE_CONTROL = "public, max-age=3600"
+OG_IMAGE_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _etag_matches(request: Request, digest: str) -> bool:
+    """Whether the request's If-None-Match covers this artifact."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")}
+    return "*" in tags or digest in tags
+
+
+def _artifact_response(
+    request: Request, artifact: Artifact, media_type: str, cache_control: str
+) -> Response:
+    """Serve an artifact, or 304 if the client already has it."""
+    headers = {"ETag": artifact.etag, "Cache-Control": cache_control}
+    if _etag_matches(request, artifact.digest):
+        return Response(status_code=304, headers=headers)
+    return Response(content=artifact.data, media_type=media_type, headers=headers)
+
+
+async def _cached_artifact_response(
+    request: Request, shareable_id: str, name: str, media_type: str, cache_control: str
+) -> Response | None:
+    """Serve a completed run's artifact from the cache, without the database.
+
+    A conditional request for a locally cached artifact is answered from
+    its ref alone.
+    """
+    cache = get_artifact_cache()
+    if cache is None or not _is_valid_shareable_id(shareable_id):
+        return None
+
+    digest = cache.digest(shareable_id, name)
+    if digest is not None and _etag_matches(request, digest):
+        return Response(
+            status_code=304, headers={"ETag": f'"{digest}"', "Cache-Control": cache_control}
+        )
+
+    artifact = await asyncio.to_thread(cache.get, shareable_id, name)
+    if artifact is None:
+        return None
+    return _artifact_response(request, artifact, media_type, cache_control)
+
+
+async def _store_artifact(
+    shareable_id: str, name: str, data: bytes, cacheable: bool = True
+) -> Artifact:
+    """Cache a freshly rendered artifact (if the cache is enabled)."""
+    cache = get_artifact_cache()
+    if cache is None or not cacheable:
+        return Artifact(data=data, digest=hashlib.sha256(data).hexdigest())
+    return await asyncio.to_thread(cache.put, shareable_id, name, data)
+
+
 @score_router.get("/score/{shareable_id}", response_class=HTMLResponse)
-async def score_page(request: Request, shareable_id: str) -> HTMLResponse:
+async def score_page(request: Request, shareable_id: str) -> Response:
     """Public shareable score results page."""
+    shareable_id = shareable_id.lower()
+    # The page embeds absolute URLs: only a configured base URL is cached,
+    # never one built from the client's Host header
+    configured_base_url = public_base_url()
+    base_url = configured_base_url or str(request.base_url)
+
+    if configured_base_url:
+        cached = await _cached_artifact_response(
+            request,
+            shareable_id,
+            SCORE_PAGE_ARTIFACT,
+            "text/html; charset=utf-8",
+            SCORE_PAGE_CACHE_CONTROL,
+        )
+        if cached is not None:
+            return cached
+
     async with async_session_maker() as db:
         run = await _find_run_by_shareable_id(db, shareable_id)
 
@@ -643,38 +654,27 @@ async def score_page(request: Request, shareable_id: str) -> HTMLResponse:
             raise HTTPException(status_code=404, detail="Report not ready")
 
         report_data = report.data
-        score_section = report_data.get("score", {})
-        v2_score = score_section.get("v2", {})
 
-        # Extract top 3 fixes
-        fixes_section = report_data.get("fixes", {})
-        all_fixes = fixes_section.get("items", [])
-        top_fixes = all_fixes[:3]
-
-        # Build OG meta tags
-        total_score = v2_score.get("total_score", 0)
-        level_label = v2_score.get("level_label", "Unknown")
-
-        return templates.TemplateResponse(
-            "public/score.html",
-            {
-                "request": request,
-                "domain": domain,
-                "score": round(total_score),
-                "level_label": level_label,
-                "pillars": v2_score.get("pillars", []),
-                "top_fixes": top_fixes,
-                "shareable_id": shareable_id,
-                "shareable_url": f"{request.base_url}score/{shareable_id}",
-                "og_title": f"Findable Score: {round(total_score)}/100 - {domain}",
-                "og_description": f"{domain} scored {round(total_score)}/100 on the Findable Score. Level: {level_label}.",
-            },
-        )
+    html = render_score_page(report_data, domain, shareable_id, base_url)
+    artifact = await _store_artifact(
+        shareable_id, SCORE_PAGE_ARTIFACT, html, cacheable=configured_base_url is not None
+    )
+    return _artifact_response(
+        request, artifact, "text/html; charset=utf-8", SCORE_PAGE_CACHE_CONTROL
+    )
 
 
 @score_router.get("/score/{shareable_id}/og.png")
-async def score_og_image(shareable_id: str) -> Response:
+async def score_og_image(request: Request, shareable_id: str) -> Response:
     """Generate and return an OG image (1200x630 PNG) for a completed score page."""
+    shareable_id = shareable_id.lower()
+
+    cached = await _cached_artifact_response(
+        request, shareable_id, OG_IMAGE_ARTIFACT, "image/png", OG_IMAGE_CACHE_CONTROL
+    )
+    if cached is not None:
+        return cached
+
     async with async_session_maker() as db:
         run = await _find_run_by_shareable_id(db, shareable_id)
 
@@ -688,25 +688,16 @@ async def score_og_image(shareable_id: str) -> Response:
         if not report or not report.data:
             raise HTTPException(status_code=404, detail="Report not found")
 
-        v2_score = report.data.get("score", {}).get("v2", {})
-        score = round(v2_score.get("total_score", 0))
-        level_label = v2_score.get("level_label", "Unknown")
+        report_data = report.data
 
         # Get domain from site
         site_result = await db.execute(select(Site).where(Site.id == run.site_id))
         site = site_result.scalar_one_or_none()
         domain = site.domain if site else "unknown"
 
-    # Lazy import to avoid heavy PIL import on startup
-    from worker.reports.og_image import generate_og_image
-
-    png_bytes = generate_og_image(score, domain, level_label)
-
-    return Response(
-        content=png_bytes,
-        media_type="image/png",
-        headers={"Cache-Control": "public, max-age=86400"},
-    )
+    png_bytes = await asyncio.to_thread(render_og_image, report_data, domain)
+    artifact = await _store_artifact(shareable_id, OG_IMAGE_ARTIFACT, png_bytes)
+    return _artifact_response(request, artifact, "image/png", OG_IMAGE_CACHE_CONTROL)
 
 
 @score_router.get("/audit", response_class=HTMLResponse)
@@ -1,6 +1,5 @@
 """Audit run management endpoints."""
 
-import asyncio
 import json
 import uuid
 from collections.abc import AsyncGenerator
@@ -20,6 +19,7 @@ from api.models.user import User
 from api.schemas.responses import PaginatedResponse, SuccessResponse
 from api.schemas.run import RunCreate, RunRead, RunWithReport
 from api.services import job_service, run_service, site_service
+from worker.progress import RunProgressEvent, publish_run_progress, watch_run
 
 router = APIRouter(prefix="/sites/{site_id}/runs", tags=["runs"])
 
@@ -233,58 +233,33 @@ async def stream_run_progress(
         await site_service.get_site(db, site_id, auth_user.id)
 
         # Verify run exists
-        await run_service.get_run(db, run_id, auth_user.id)
-
-        async def event_generator() -> AsyncGenerator[str, None]:
-            """Generate SSE events for run progress."""
-            from sqlalchemy import select
+        run = await run_service.get_run(db, run_id, auth_user.id)
+        initial = RunProgressEvent.from_run(run)
 
+        async def reload() -> RunProgressEvent | None:
             from api.models import Run
 
-            last_status = None
-            last_progress = None
-            timeout_counter = 0
-            max_timeout = 600  # 10 minutes
-
-            while timeout_counter < max_timeout:
-                # Get fresh run data
-                async with get_session_maker()() as session:
-                    result = await session.execute(select(Run).where(Run.id == run_id))
-                    current_run = result.scalar_one_or_none()
-
-                    if not current_run:
-                        yield f"event: error\ndata: {json.dumps({'error': 'Run not found'})}\n\n"
-                        break
-
-                    # Check if status or progress changed
-                    current_status = current_run.status
-                    current_progress = current_run.progress
-
-                    if current_status != last_status or current_progress != last_progress:
-                        # Emit progress event
-                        event_data = {
-                            "status": current_status,
-                            "progress": current_progress,
-                        }
-
-                        if current_status == "complete":
-                            event_data["report_id"] = (
-                                str(current_run.report_id) if current_run.report_id else None
-                            )
-                            yield f"event: complete\ndata: {json.dumps(event_data)}\n\n"
-                            break
-                        elif current_status == "failed":
-                            event_data["error"] = current_run.error_message
-                            yield f"event: failed\ndata: {json.dumps(event_data)}\n\n"
-                            break
-                        else:
-                            yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
-
-                        last_status = current_status
-                        last_progress = current_progress
-
-                await asyncio.sleep(2)
-                timeout_counter += 2
+            async with get_session_maker()() as session:
+                result = await session.execute(select(Run).where(Run.id == run_id))
+                current_run = result.scalar_one_or_none()
+            return RunProgressEvent.from_run(current_run) if current_run else None
+
+        async def event_generator() -> AsyncGenerator[str, None]:
+            """Generate SSE events for run progress."""
+            async for state in watch_run(str(run_id), initial, reload, max_seconds=600):
+                event_data: dict = {
+                    "status": state.status,
+                    "progress": state.progress,
+                }
+
+                if state.status == "complete":
+                    event_data["report_id"] = state.report_id
+                    yield f"event: complete\ndata: {json.dumps(event_data)}\n\n"
+                elif state.status == "failed":
+                    event_data["error"] = state.error_message
+                    yield f"event: failed\ndata: {json.dumps(event_data)}\n\n"
+                else:
+                    yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
 
         return StreamingResponse(
             event_generator(),
@@ -339,6 +314,8 @@ async def cancel_run(
             "failed",
             error_message="Cancelled by user",
         )
+        await db.commit()
+        await publish_run_progress(RunProgressEvent.from_run(run))
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
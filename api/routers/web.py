@@ -18,6 +18,7 @@ from api.config import get_settings
 from api.database import async_session_maker, get_db
 from api.models.user import User
 from api.services import run_service, site_service
+from worker.progress import RunProgressEvent, get_progress_hub
 
 logger = structlog.get_logger()
 
@@ -712,9 +713,16 @@ async def view_report(
 async def run_status_fragment(
     request: Request,
     run_id: uuid.UUID,
+    since: float | None = None,
     db: Any = Depends(get_db),
 ) -> HTMLResponse:
-    """Return HTML fragment for run status (used by HTMX polling)."""
+    """Return HTML fragment for run status (used by HTMX polling).
+
+    With the progress bus, the fragment long-polls: when the client has
+    already seen the latest event (``since``), the response waits for the
+    next one, so each viewer makes about one request per change instead of
+    one every few seconds.
+    """
     user = await get_optional_user(request)
     if not user:
         return HTMLResponse(content="<div>Unauthorized</div>", status_code=401)
@@ -724,11 +732,25 @@ async def run_status_fragment(
     except Exception:
         return HTMLResponse(content="<div>Run not found</div>", status_code=404)
 
-    # Get job status if available
-    from api.services import job_service
-
+    state = RunProgressEvent.from_run(run)
+    hub = get_progress_hub()
+    live = hub.enabled and not state.is_terminal and await hub.wait_connected(timeout=1.0)
     job_status = None
-    if run.job_id:
+
+    if live:
+        await db.close()  # Don't hold a pooled connection while waiting
+        # Subscribe before reading the latest event so none is missed
+        async with hub.subscribe(str(run_id)) as subscription:
+            latest = await hub.latest(str(run_id))
+            if latest is not None and (since is None or latest.ts > since):
+                state = latest
+            elif since is not None:
+                event = await subscription.next(get_settings().run_progress_wait_seconds)
+                state = event or latest or state
+    elif run.job_id:
+        # No bus: fall back to the RQ job status
+        from api.services import job_service
+
         job_info = job_service.get_job_status(run.job_id)
         if job_info:
             job_status = job_info.status.value
@@ -739,12 +761,13 @@ async def run_status_fragment(
         context={
             "run": {
                 "id": str(run.id),
-                "status": run.status,
-                "progress": run.progress or 0,
+                "status": state.status,
+                "progress": state.progress or 0,
                 "job_status": job_status,
-                "completed": run.status in ("complete", "failed"),
-                "error_message": run.error_message,
-                "report_id": str(run.report_id) if run.report_id else None,
+                "completed": state.is_terminal,
+                "error_message": state.error_message,
+                "report_id": state.report_id,
+                "since": state.ts if live else None,
             },
         },
     )
@@ -0,0 +1,33 @@
+"""add_embedding_cache_index
+
+Add a composite index on embeddings (model_name, content_hash) so the
+embedding cache can look up previously computed vectors across sites.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: str | None = "f6a7b8c9d0e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_embeddings_model_content_hash",
+        "embeddings",
+        ["model_name", "content_hash"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_embeddings_model_content_hash", table_name="embeddings", if_exists=True)
@@ -0,0 +1,37 @@
+"""add_run_shareable_id
+
+Add a persisted, uniquely indexed shareable_id column to runs so public
+score pages can look runs up by index instead of scanning
+cast(id AS text) LIKE 'prefix%'. Existing runs are backfilled from
+their UUIDs.
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("runs", sa.Column("shareable_id", sa.String(length=12), nullable=True))
+    op.execute(
+        "UPDATE runs SET shareable_id = left(replace(id::text, '-', ''), 12) "
+        "WHERE shareable_id IS NULL"
+    )
+    op.create_index("ix_runs_shareable_id", "runs", ["shareable_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_runs_shareable_id", table_name="runs")
+    op.drop_column("runs", "shareable_id")
@@ -0,0 +1,231 @@
+"""Tests for the Redis crawl cache."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+import orjson
+import pytest
+
+from worker.crawler import cache as cache_module
+from worker.crawler.cache import CrawlCache
+from worker.crawler.crawler import CrawlPage, CrawlResult
+
+
+class FakePipeline:
+    """Queues commands and runs them against FakeRedis on execute."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self._redis.round_trips += 1
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def hset(self, key: str, mapping: dict[str, bytes]) -> int:
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        values = self.data.get(key, {})
+        return [values.get(field) for field in fields]
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return key in self.data
+
+    async def ttl(self, key: str) -> int:
+        return self.ttls.get(key, -2) if key in self.data else -2
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+def _crawl(count: int, body: str = "Hello") -> CrawlResult:
+    now = datetime.now(UTC)
+    pages = [
+        CrawlPage(
+            url=f"https://example.com/p{i}",
+            final_url=f"https://example.com/p{i}",
+            title=f"Page {i}",
+            html=f"<html><body>{body} {i}</body></html>",
+            content_type="text/html",
+            status_code=200,
+            depth=1,
+            fetch_time_ms=12,
+            fetched_at=now,
+            links_found=3,
+            etag=f'"{i}"',
+        )
+        for i in range(count)
+    ]
+    return CrawlResult(
+        domain="Example.com",
+        start_url="https://example.com/",
+        pages=pages,
+        urls_discovered=count,
+        urls_crawled=count,
+        urls_skipped=0,
+        urls_failed=0,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=1.5,
+        robots_respected=True,
+        max_depth_reached=1,
+    )
+
+
+class TestCrawlCache:
+    """Tests for CrawlCache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self) -> None:
+        cache = CrawlCache(redis=FakeRedis())
+        crawl = _crawl(3)
+
+        assert await cache.set(crawl)
+        cached = await cache.get("example.com")
+
+        assert cached is not None
+        assert cached.pages == crawl.pages
+        assert cached.duration_seconds == 1.5
+
+    @pytest.mark.asyncio
+    async def test_pages_are_separate_compressed_entries(self) -> None:
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        await cache.set(_crawl(3, body="x" * 5000))
+
+        manifest = await cache.get_manifest("example.com")
+        assert manifest is not None
+        assert b"xxxx" not in redis.data["crawl:cache:example.com"]
+
+        entries = redis.data[f"crawl:cache:example.com:pages:{manifest['version']}"]
+        assert len(entries) == 3
+        assert all(len(entry) < 1000 for entry in entries.values())
+
+    @pytest.mark.asyncio
+    async def test_partial_load(self) -> None:
+        cache = CrawlCache(redis=FakeRedis())
+        await cache.set(_crawl(5))
+
+        cached = await cache.get("example.com", urls=["https://example.com/p3"])
+
+        assert cached is not None
+        assert [p.url for p in cached.pages] == ["https://example.com/p3"]
+        assert cached.urls_crawled == 5
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_in_one_pipeline(self, monkeypatch) -> None:
+        monkeypatch.setattr(cache_module, "PAGE_BATCH_SIZE", 2)
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        await cache.set(_crawl(5))
+        redis.round_trips = 0
+
+        cached = await cache.get("example.com")
+
+        assert cached is not None and len(cached.pages) == 5
+        assert redis.round_trips == 2  # manifest GET + one pipelined batch of HMGETs
+
+    @pytest.mark.asyncio
+    async def test_replacing_expires_previous_version(self) -> None:
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        await cache.set(_crawl(2))
+        old = await cache.get_manifest("example.com")
+        assert old is not None
+
+        await cache.set(_crawl(1, body="New"))
+
+        old_key = f"crawl:cache:example.com:pages:{old['version']}"
+        assert redis.ttls[old_key] == cache_module.STALE_PAGES_TTL_SECONDS
+        cached = await cache.get("example.com")
+        assert cached is not None
+        assert [p.html for p in cached.pages] == ["<html><body>New 0</body></html>"]
+
+    @pytest.mark.asyncio
+    async def test_missing_page_entries_are_a_miss(self) -> None:
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        await cache.set(_crawl(2))
+        manifest = await cache.get_manifest("example.com")
+        assert manifest is not None
+        del redis.data[f"crawl:cache:example.com:pages:{manifest['version']}"]
+
+        assert await cache.get("example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_entry_is_a_miss_and_overwritten(self) -> None:
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        legacy = {"domain": "example.com", "pages": [{"url": "https://example.com/"}]}
+        redis.data["crawl:cache:example.com"] = orjson.dumps(legacy)
+
+        assert await cache.get("example.com") is None
+        assert await cache.get_cache_info("example.com") is None
+        assert await cache.set(_crawl(2))
+
+        cached = await cache.get("example.com")
+        assert cached is not None and len(cached.pages) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_info_reads_manifest_only(self) -> None:
+        cache = CrawlCache(ttl_seconds=600, redis=FakeRedis())
+        await cache.set(_crawl(4))
+
+        info = await cache.get_cache_info("example.com")
+
+        assert info is not None
+        assert info["pages_count"] == 4
+        assert info["ttl_remaining_seconds"] == 600
+        assert info["stored_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self) -> None:
+        redis = FakeRedis()
+        cache = CrawlCache(redis=redis)
+        await cache.set(_crawl(2))
+
+        assert await cache.invalidate("example.com")
+        assert redis.data == {}
+        assert await cache.get("example.com") is None
+        assert await cache.get_cache_info("example.com") is None
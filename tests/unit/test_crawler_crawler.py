@@ -0,0 +1,248 @@
+"""Tests for the concurrent BFS crawler."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from worker.crawler.crawler import CrawlConfig, Crawler, CrawlFrontier
+from worker.crawler.fetcher import Fetcher, FetchResult
+
+SITE = {
+    "https://example.com/": ["/a", "/b", "/c"],
+    "https://example.com/a": ["/a1", "/a2"],
+    "https://example.com/b": ["/b1"],
+    "https://example.com/c": [],
+    "https://example.com/a1": [],
+    "https://example.com/a2": [],
+    "https://example.com/b1": ["/deep"],
+    "https://example.com/deep": [],
+}
+
+
+def _html(url: str) -> str:
+    links = "".join(f'<a href="{href}">link</a>' for href in SITE[url])
+    return f"<html><head><title>{url}</title></head><body>{links}</body></html>"
+
+
+class FakeFetcher:
+    """Fetcher stand-in that serves SITE with a fixed latency."""
+
+    def __init__(self, latency: float = 0.0, fail: set[str] | None = None):
+        self.latency = latency
+        self.fail = fail or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched: list[str] = []
+
+    async def fetch(self, url: str, crawl_delay: float | None = None) -> FetchResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.fetched.append(url)
+
+        ok = url in SITE and url not in self.fail
+        return FetchResult(
+            url=url,
+            final_url=url,
+            status_code=200 if ok else 404,
+            content_type="text/html" if ok else None,
+            html=_html(url) if ok else None,
+            error=None if ok else "not found",
+            fetch_time_ms=int(self.latency * 1000),
+            fetched_at=datetime.now(UTC),
+        )
+
+
+class ConditionalFetcher(FakeFetcher):
+    """FakeFetcher that answers 304 when the client sends a matching ETag."""
+
+    def __init__(self, changed: set[str] | None = None):
+        super().__init__()
+        self.changed = changed or set()
+        self.validators: dict[str, dict[str, str]] = {}
+
+    async def fetch(
+        self,
+        url: str,
+        crawl_delay: float | None = None,
+        validators: dict[str, str] | None = None,
+    ) -> FetchResult:
+        self.validators[url] = validators or {}
+        if validators and url not in self.changed:
+            self.fetched.append(url)
+            return FetchResult(
+                url=url,
+                final_url=url,
+                status_code=304,
+                content_type=None,
+                html=None,
+                error=None,
+                fetch_time_ms=0,
+                fetched_at=datetime.now(UTC),
+                etag=validators.get("If-None-Match"),
+            )
+        result = await super().fetch(url, crawl_delay)
+        result.etag = f'"{url}"'
+        return result
+
+
+def _make_crawler(fetcher: FakeFetcher, previous_pages=None, **config) -> Crawler:
+    crawler = Crawler(
+        CrawlConfig(respect_robots=False, priority_paths=["/"], max_depth=2, **config),
+        previous_pages=previous_pages,
+    )
+    crawler.fetcher = fetcher  # type: ignore[assignment]
+    return crawler
+
+
+class TestCrawlFrontier:
+    """Tests for CrawlFrontier ordering."""
+
+    def test_pops_by_depth_then_insertion(self) -> None:
+        frontier = CrawlFrontier()
+        frontier.push("https://x.com/deep", 2)
+        frontier.push("https://x.com/a", 1)
+        frontier.push("https://x.com/", 0)
+        frontier.push("https://x.com/b", 1)
+
+        order = [frontier.pop()[0] for _ in range(len(frontier))]
+
+        assert order == [
+            "https://x.com/",
+            "https://x.com/a",
+            "https://x.com/b",
+            "https://x.com/deep",
+        ]
+
+    def test_len_tracks_contents(self) -> None:
+        frontier = CrawlFrontier()
+        assert not frontier
+        frontier.push("https://x.com/", 0)
+        assert len(frontier) == 1
+
+
+class TestCrawler:
+    """Tests for Crawler.crawl."""
+
+    @pytest.mark.asyncio
+    async def test_serial_and_concurrent_crawls_match(self) -> None:
+        serial = await _make_crawler(FakeFetcher(), concurrency=1).crawl("https://example.com/")
+        parallel = await _make_crawler(FakeFetcher(latency=0.01), concurrency=5).crawl(
+            "https://example.com/"
+        )
+
+        assert [p.url for p in parallel.pages] == [p.url for p in serial.pages]
+        assert parallel.urls_discovered == serial.urls_discovered
+        assert parallel.max_depth_reached == serial.max_depth_reached == 2
+        # /deep is at depth 3 and must never be fetched
+        assert "https://example.com/deep" not in [p.url for p in serial.pages]
+
+    @pytest.mark.asyncio
+    async def test_pages_in_bfs_order(self) -> None:
+        result = await _make_crawler(FakeFetcher(latency=0.01), concurrency=4).crawl(
+            "https://example.com/"
+        )
+
+        depths = [p.depth for p in result.pages]
+        assert depths == sorted(depths)
+        assert result.pages[0].url == "https://example.com/"
+
+    @pytest.mark.asyncio
+    async def test_uses_configured_concurrency(self) -> None:
+        fetcher = FakeFetcher(latency=0.02)
+        await _make_crawler(fetcher, concurrency=3).crawl("https://example.com/")
+
+        assert fetcher.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self) -> None:
+        fetcher = FakeFetcher(latency=0.01)
+        result = await _make_crawler(fetcher, concurrency=5, max_pages=3).crawl(
+            "https://example.com/"
+        )
+
+        assert len(result.pages) == 3
+        # No more fetches are started than pages wanted
+        assert len(fetcher.fetched) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_pages_do_not_count_toward_limit(self) -> None:
+        fetcher = FakeFetcher(fail={"https://example.com/a"})
+        result = await _make_crawler(fetcher, concurrency=2, max_pages=3).crawl(
+            "https://example.com/"
+        )
+
+        assert len(result.pages) == 3
+        assert result.urls_failed == 1
+        assert "https://example.com/a" not in [p.url for p in result.pages]
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_reports_each_page(self) -> None:
+        calls: list[tuple[int, int]] = []
+        result = await _make_crawler(FakeFetcher(), concurrency=3).crawl(
+            "https://example.com/", progress_callback=lambda n, total: calls.append((n, total))
+        )
+
+        assert [n for n, _ in calls] == list(range(1, len(result.pages) + 1))
+
+
+class TestConditionalRecrawl:
+    """Tests for re-crawling against a previous crawl's validators."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_pages_reuse_previous_html(self) -> None:
+        first = await _make_crawler(ConditionalFetcher(), concurrency=1).crawl(
+            "https://example.com/"
+        )
+        previous = {page.url: page for page in first.pages}
+
+        fetcher = ConditionalFetcher(changed={"https://example.com/a"})
+        second = await _make_crawler(fetcher, previous_pages=previous, concurrency=1).crawl(
+            "https://example.com/"
+        )
+
+        assert [p.url for p in second.pages] == [p.url for p in first.pages]
+        assert fetcher.validators["https://example.com/"] == {
+            "If-None-Match": '"https://example.com/"'
+        }
+        home = second.pages[0]
+        assert home.not_modified
+        assert home.html == previous[home.url].html
+        assert home.content_hash == previous[home.url].content_hash
+        assert not next(p for p in second.pages if p.url == "https://example.com/a").not_modified
+        assert second.pages_not_modified == len(second.pages) - 1
+
+
+class TestFetcherRateLimit:
+    """Tests for per-domain politeness under concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_spaced(self) -> None:
+        fetcher = Fetcher(user_agent="test", min_delay_between_requests=0.05)
+        loop = asyncio.get_event_loop()
+        times: list[float] = []
+
+        async def hit() -> None:
+            await fetcher._rate_limit("example.com")
+            times.append(loop.time())
+
+        await asyncio.gather(*(hit() for _ in range(4)))
+
+        times.sort()
+        gaps = [b - a for a, b in zip(times, times[1:], strict=False)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_domains_are_independent(self) -> None:
+        fetcher = Fetcher(user_agent="test", min_delay_between_requests=1.0)
+        loop = asyncio.get_event_loop()
+
+        start = loop.time()
+        await fetcher._rate_limit("a.com")
+        await fetcher._rate_limit("b.com")
+
+        assert loop.time() - start < 0.5
@@ -0,0 +1,157 @@
+"""Tests for the content-addressed page store and crawl storage."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from worker.crawler import page_store
+from worker.crawler.crawler import CrawlPage, CrawlResult, hash_html
+from worker.crawler.page_store import PageBlobStore
+from worker.crawler.storage import CrawlStorage
+
+
+def _html(n: int) -> str:
+    return f"<html><body><h1>Page {n}</h1>{'<p>Lorem ipsum dolor sit amet.</p>' * 50}</body></html>"
+
+
+def _crawl(paths: list[str], version: int = 0) -> CrawlResult:
+    now = datetime.now(UTC)
+    pages = [
+        CrawlPage(
+            url=f"https://example.com{path}",
+            final_url=f"https://example.com{path}",
+            title=path,
+            html=_html(i + version * 100),
+            content_type="text/html",
+            status_code=200,
+            depth=1,
+            fetch_time_ms=0,
+            fetched_at=now,
+            links_found=0,
+        )
+        for i, path in enumerate(paths)
+    ]
+    return CrawlResult(
+        domain="example.com",
+        start_url="https://example.com/",
+        pages=pages,
+        urls_discovered=len(pages),
+        urls_crawled=len(pages),
+        urls_skipped=0,
+        urls_failed=0,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=0.0,
+        robots_respected=True,
+        max_depth_reached=1,
+    )
+
+
+class TestPageBlobStore:
+    """Tests for PageBlobStore."""
+
+    def test_round_trip_and_dedup(self, tmp_path: Path) -> None:
+        store = PageBlobStore(tmp_path)
+
+        assert store.put_many({"a": _html(1), "b": _html(2)}) == 2
+        assert store.put_many({"a": _html(1), "c": _html(3)}) == 1
+
+        assert store.get("a") == _html(1)
+        assert store.get_many(["b", "c", "missing"]) == {"b": _html(2), "c": _html(3)}
+        assert "a" in store and "missing" not in store
+        # Compressed on disk
+        assert store.stored_size(["a"]) < len(_html(1))
+
+    def test_reads_blobs_appended_after_mapping(self, tmp_path: Path) -> None:
+        store = PageBlobStore(tmp_path)
+        store.put("a", _html(1))
+        assert store.get("a") == _html(1)  # segment is now mapped
+
+        store.put("b", _html(2))
+
+        assert store.get("b") == _html(2)
+
+    def test_rolls_over_segments(self, tmp_path: Path) -> None:
+        store = PageBlobStore(tmp_path, segment_max_bytes=64)
+        store.put_many({str(i): _html(i) for i in range(4)})
+
+        assert len(list(tmp_path.glob("segment_*.seg"))) == 4
+        assert store.get("3") == _html(3)
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        PageBlobStore(tmp_path).put("a", _html(1))
+
+        assert PageBlobStore(tmp_path).get("a") == _html(1)
+
+    def test_zlib_fallback_is_recorded_per_blob(self, tmp_path: Path) -> None:
+        with patch.object(page_store, "ZSTD_AVAILABLE", False):
+            store = PageBlobStore(tmp_path)
+            store.put("a", _html(1))
+
+        codec = store._conn.execute("SELECT codec FROM blobs").fetchone()[0]
+        assert codec == page_store.CODEC_ZLIB
+        assert store.get("a") == _html(1)
+
+    def test_garbage_collection_rewrites_dead_segments(self, tmp_path: Path) -> None:
+        store = PageBlobStore(tmp_path, segment_max_bytes=200)
+        store.put_many({str(i): _html(i) for i in range(6)})
+        segments_before = len(list(tmp_path.glob("segment_*.seg")))
+
+        result = store.collect_garbage({"0", "5"}, grace_seconds=0)
+
+        assert result.blobs_removed == 4
+        assert result.segments_rewritten >= 1
+        assert len(list(tmp_path.glob("segment_*.seg"))) < segments_before
+        assert store.get_many([str(i) for i in range(6)]) == {"0": _html(0), "5": _html(5)}
+
+    def test_garbage_collection_grace_period(self, tmp_path: Path) -> None:
+        store = PageBlobStore(tmp_path)
+        store.put("a", _html(1))
+
+        assert store.collect_garbage(set()).blobs_removed == 0
+        assert store.get("a") == _html(1)
+
+
+class TestCrawlStorage:
+    """Tests for CrawlStorage on top of the page store."""
+
+    def test_unchanged_pages_are_stored_once(self, tmp_path: Path) -> None:
+        storage = CrawlStorage(tmp_path)
+        first = storage.store_crawl(_crawl(["/", "/about"]))
+        second = storage.store_crawl(_crawl(["/", "/about"]))
+
+        count = storage.page_store._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        assert count == 2
+        assert storage.load_page_html(second, "page_0001") == _html(1)
+        assert storage.list_crawls() == sorted([first, second])
+
+    def test_load_crawl(self, tmp_path: Path) -> None:
+        storage = CrawlStorage(tmp_path)
+        crawl_id = storage.store_crawl(_crawl(["/", "/about"]))
+
+        loaded = storage.load_crawl(crawl_id)
+
+        assert loaded is not None
+        assert [p.html for p in loaded.pages] == [_html(0), _html(1)]
+        assert storage.get_total_size(crawl_id) > 0
+
+    def test_reads_legacy_page_files(self, tmp_path: Path) -> None:
+        storage = CrawlStorage(tmp_path)
+        crawl_id = storage.store_crawl(_crawl(["/"]))
+        legacy = tmp_path / crawl_id / "pages"
+        legacy.mkdir()
+        (legacy / "page_0000.html").write_text("<html>legacy</html>", encoding="utf-8")
+
+        assert storage.load_page_html(crawl_id, "page_0000") == "<html>legacy</html>"
+
+    def test_collect_garbage_after_delete(self, tmp_path: Path) -> None:
+        storage = CrawlStorage(tmp_path)
+        old = storage.store_crawl(_crawl(["/", "/about"]))
+        kept = storage.store_crawl(_crawl(["/"], version=1))
+        storage.delete_crawl(old)
+
+        result = storage.collect_garbage(grace_seconds=0)
+
+        assert result.blobs_removed == 2
+        assert storage.page_store.get(hash_html(_html(100))) is not None
+        assert storage.load_crawl(kept) is not None
@@ -0,0 +1,197 @@
+"""Tests for the tiered embedding cache."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from worker.embeddings.cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    EmbeddingCacheConfig,
+    EmbeddingCacheMetrics,
+)
+from worker.embeddings.embedder import Embedder
+from worker.embeddings.models import MODELS, MockEmbeddingModel
+
+
+def _vector(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).random(8).astype(np.float32)
+
+
+class CountingModel(MockEmbeddingModel):
+    """Mock model that records how many texts it embedded."""
+
+    def __init__(self) -> None:
+        super().__init__(MODELS["mock"])
+        self.embedded = 0
+
+    def embed(self, texts: list[str]) -> list[np.ndarray]:
+        self.embedded += len(texts)
+        return super().embed(texts)
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple]):
+        self._rows = rows
+
+    def fetchall(self) -> list[tuple]:
+        return self._rows
+
+
+class FakeSession:
+    """Async session answering the cache's embeddings lookup from a dict."""
+
+    def __init__(self, rows: dict[tuple[str, str], np.ndarray]):
+        self.rows = rows
+        self.queried: list[list[str]] = []
+
+    async def execute(self, _query, params: dict) -> FakeResult:
+        self.queried.append(list(params["content_hashes"]))
+        return FakeResult(
+            [
+                (h, json.dumps(self.rows[(params["model_name"], h)].tolist()))
+                for h in params["content_hashes"]
+                if (params["model_name"], h) in self.rows
+            ]
+        )
+
+
+class TestEmbeddingCacheMetrics:
+    """Tests for EmbeddingCacheMetrics."""
+
+    def test_hit_rate(self) -> None:
+        metrics = EmbeddingCacheMetrics(memory_hits=2, disk_hits=1, database_hits=1, misses=4)
+
+        assert metrics.hits == 4
+        assert metrics.to_dict()["hit_rate"] == 0.5
+        assert EmbeddingCacheMetrics().hit_rate == 0.0
+
+
+class TestMemoryTier:
+    """Tests for the in-process LRU tier."""
+
+    def test_round_trip_and_miss(self) -> None:
+        cache = EmbeddingCache()
+        cache.put_many("m", {"a": _vector(1)})
+
+        found = cache.get_many("m", ["a", "b"])
+
+        np.testing.assert_array_equal(found["a"], _vector(1))
+        assert "b" not in found
+        assert cache.metrics.memory_hits == 1
+        assert cache.metrics.misses == 1
+
+    def test_keys_are_namespaced_by_model(self) -> None:
+        cache = EmbeddingCache()
+        cache.put_many("model-a", {"h": _vector(1)})
+
+        assert cache.get_many("model-b", ["h"]) == {}
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = EmbeddingCache(EmbeddingCacheConfig(memory_max_entries=2))
+        cache.put_many("m", {"a": _vector(1), "b": _vector(2)})
+        cache.get_many("m", ["a"])  # "b" is now the oldest
+
+        cache.put_many("m", {"c": _vector(3)})
+
+        assert set(cache.get_many("m", ["a", "b", "c"])) == {"a", "c"}
+        assert cache.metrics.memory_evictions == 1
+
+
+class TestDiskTier:
+    """Tests for the on-disk tier."""
+
+    def test_shared_between_caches(self, tmp_path: Path) -> None:
+        config = EmbeddingCacheConfig(disk_path=str(tmp_path))
+        EmbeddingCache(config).put_many("m", {"a": _vector(1)})
+
+        other = EmbeddingCache(config)
+        found = other.get_many("m", ["a"])
+
+        np.testing.assert_array_equal(found["a"], _vector(1))
+        assert other.metrics.disk_hits == 1
+        # Promoted to memory
+        other.get_many("m", ["a"])
+        assert other.metrics.memory_hits == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        store = DiskEmbeddingStore(tmp_path, max_entries=4, evict_fraction=0.5)
+        store.put_many({f"k{i}": _vector(i) for i in range(4)})
+        store.get_many(["k0"])
+
+        evicted = store.put_many({"k4": _vector(4)})
+
+        assert evicted == 3
+        assert set(store.get_many([f"k{i}" for i in range(5)])) == {"k0", "k4"}
+
+
+class TestDatabaseTier:
+    """Tests for prefetching from the embeddings table."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_cached_hashes(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(EmbeddingCacheConfig(disk_path=str(tmp_path)))
+        cache.put_many("m", {"a": _vector(1)})
+        session = FakeSession({("m", "b"): _vector(2), ("other", "c"): _vector(3)})
+
+        loaded = await cache.prefetch(session, "m", ["a", "b", "c"])
+
+        assert loaded == 1
+        assert session.queried == [["b", "c"]]
+        assert cache.metrics.database_hits == 1
+        np.testing.assert_allclose(cache.get_many("m", ["b"])["b"], _vector(2))
+        # Back-filled into the disk tier for other workers
+        assert len(DiskEmbeddingStore(tmp_path)) == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_survives_disk_errors(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = EmbeddingCache(EmbeddingCacheConfig(disk_path=str(tmp_path)))
+
+        def fail(_items: dict) -> int:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(cache._disk, "put_many", fail)
+        session = FakeSession({("m", "a"): _vector(1)})
+
+        assert await cache.prefetch(session, "m", ["a"]) == 1
+        np.testing.assert_allclose(cache.get_many("m", ["a"])["a"], _vector(1))
+
+    @pytest.mark.asyncio
+    async def test_prefetch_disabled(self) -> None:
+        cache = EmbeddingCache(EmbeddingCacheConfig(database_lookup=False))
+        session = FakeSession({})
+
+        assert await cache.prefetch(session, "m", ["a"]) == 0
+        assert session.queried == []
+
+
+class TestEmbedderWithCache:
+    """Tests for Embedder using a shared cache."""
+
+    def test_reuses_embeddings_across_embedders(self) -> None:
+        cache = EmbeddingCache()
+        first, second = CountingModel(), CountingModel()
+
+        Embedder(model=first, cache=cache).embed_texts(["one", "two"])
+        Embedder(model=second, cache=cache).embed_texts(["one", "two", "three"])
+
+        assert first.embedded == 2
+        assert second.embedded == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetched_chunks_are_not_embedded(self) -> None:
+        model = CountingModel()
+        embedder = Embedder(model=model, cache=EmbeddingCache())
+        stored = _vector(7)
+        session = FakeSession({(embedder.model_id, "hash1"): stored})
+
+        await embedder.prefetch(session, ["hash1", "hash2"])
+        vectors = embedder.embed_texts(["stored text", "new text"], ["hash1", "hash2"])
+
+        assert model.embedded == 1
+        np.testing.assert_allclose(vectors[0], stored)
@@ -0,0 +1,204 @@
+"""Tests for the local embedding service."""
+
+import asyncio
+import tempfile
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from worker.embeddings import service
+from worker.embeddings.embedder import Embedder
+from worker.embeddings.models import MODELS, MockEmbeddingModel
+from worker.embeddings.service import (
+    DynamicBatcher,
+    EmbeddingServer,
+    EmbeddingServiceClient,
+    EmbeddingServiceConfig,
+    EmbeddingServiceError,
+    get_embedding_model,
+    parse_address,
+)
+
+
+class CountingModel(MockEmbeddingModel):
+    """Mock model that records the size of each call."""
+
+    def __init__(self) -> None:
+        super().__init__(MODELS["mock"])
+        self.calls: list[int] = []
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(len(texts))
+        return super().embed(texts)
+
+
+def _serve(config: EmbeddingServiceConfig, model: CountingModel) -> Iterator[EmbeddingServer]:
+    """Run a server on a background event loop."""
+    loop = asyncio.new_event_loop()
+    server = EmbeddingServer(config, model=model)
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=5)
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+@pytest.fixture(autouse=True)
+def clients() -> Iterator[list[EmbeddingServiceClient]]:
+    """Clients to close after the test."""
+    opened: list[EmbeddingServiceClient] = []
+    yield opened
+    for client in [*opened, *service._clients.values()]:
+        client.close_connection()
+    service._clients.clear()
+
+
+@pytest.fixture
+def model() -> CountingModel:
+    return CountingModel()
+
+
+@pytest.fixture
+def server(model: CountingModel) -> Iterator[EmbeddingServer]:
+    config = EmbeddingServiceConfig(address="tcp://127.0.0.1:0", model_name="mock", max_wait_ms=50)
+    yield from _serve(config, model)
+
+
+class TestParseAddress:
+    """Tests for parse_address."""
+
+    def test_formats(self) -> None:
+        assert parse_address("unix:///tmp/e.sock")[1] == "/tmp/e.sock"
+        assert parse_address("/tmp/e.sock")[1] == "/tmp/e.sock"
+        assert parse_address("tcp://127.0.0.1:8765")[1] == ("127.0.0.1", 8765)
+        assert parse_address("localhost:8765")[1] == ("localhost", 8765)
+
+
+class TestDynamicBatcher:
+    """Tests for DynamicBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_requests(self, model: CountingModel) -> None:
+        batcher = DynamicBatcher(model, max_batch_size=100, max_wait_ms=50)
+        runner = asyncio.create_task(batcher.run())
+        try:
+            requests = [[f"text {i}-{j}" for j in range(3)] for i in range(5)]
+            results = await asyncio.gather(*(batcher.submit(texts) for texts in requests))
+        finally:
+            runner.cancel()
+
+        assert model.calls == [15]
+        for texts, vectors in zip(requests, results, strict=True):
+            np.testing.assert_allclose(vectors, model.embed(texts), rtol=1e-6)
+        assert batcher.metrics.batches == 1
+        assert batcher.metrics.requests == 5
+        assert batcher.metrics.queue_depth == 0
+        assert batcher.metrics.max_queue_depth == 15
+
+    @pytest.mark.asyncio
+    async def test_full_batch_does_not_wait(self, model: CountingModel) -> None:
+        batcher = DynamicBatcher(model, max_batch_size=4, max_wait_ms=10_000)
+        runner = asyncio.create_task(batcher.run())
+        try:
+            result = await asyncio.wait_for(batcher.submit(["a", "b", "c", "d"]), timeout=2)
+        finally:
+            runner.cancel()
+
+        assert result.shape == (4, 384)
+
+    @pytest.mark.asyncio
+    async def test_model_errors_reach_callers(self, model: CountingModel) -> None:
+        batcher = DynamicBatcher(model, max_wait_ms=1)
+        runner = asyncio.create_task(batcher.run())
+        try:
+            with (
+                patch.object(model, "embed", side_effect=RuntimeError("boom")),
+                pytest.raises(RuntimeError, match="boom"),
+            ):
+                await batcher.submit(["a"])
+        finally:
+            runner.cancel()
+
+        assert batcher.metrics.errors == 1
+
+
+class TestEmbeddingService:
+    """Tests for the server and client over a socket."""
+
+    def test_client_matches_local_model(self, server: EmbeddingServer, clients: list) -> None:
+        client = EmbeddingServiceClient(server.address, model_name="mock")
+        clients.append(client)
+        local = MockEmbeddingModel(MODELS["mock"])
+
+        np.testing.assert_allclose(client.embed(["a", "b"]), local.embed(["a", "b"]), rtol=1e-6)
+        np.testing.assert_allclose(client.embed_query("q"), local.embed_query("q"), rtol=1e-6)
+        assert client.ping()
+        assert client.dimensions == 384
+
+    def test_batches_across_clients(
+        self, server: EmbeddingServer, model: CountingModel, clients: list
+    ) -> None:
+        clients.extend(EmbeddingServiceClient(server.address, model_name="mock") for _ in range(4))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda c: c.embed([f"{id(c)}-{i}" for i in range(5)]), clients))
+
+        assert all(r.shape == (5, 384) for r in results)
+        stats = clients[0].stats()
+        assert stats["texts"] == 20
+        assert stats["batches"] < 4
+        assert sum(model.calls) == 20
+
+    def test_unix_socket(self, model: CountingModel, clients: list) -> None:
+        with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+            address = f"unix://{Path(tmp) / 'e.sock'}"
+            config = EmbeddingServiceConfig(address=address, model_name="mock", max_wait_ms=1)
+            for server in _serve(config, model):
+                client = EmbeddingServiceClient(server.address, model_name="mock")
+                clients.append(client)
+                assert client.embed(["a"]).shape == (1, 384)
+
+    def test_model_mismatch_is_rejected(self, server: EmbeddingServer, clients: list) -> None:
+        client = EmbeddingServiceClient(server.address, model_name="bge-small")
+        clients.append(client)
+
+        assert not client.ping()
+        with pytest.raises(EmbeddingServiceError, match="Service runs mock"):
+            client.embed(["a"])
+
+    def test_unreachable_service(self) -> None:
+        client = EmbeddingServiceClient("tcp://127.0.0.1:1", model_name="mock", timeout=1)
+
+        assert not client.ping()
+        with pytest.raises(EmbeddingServiceError):
+            client.embed(["a"])
+
+
+class TestGetEmbeddingModel:
+    """Tests for choosing between the service and a local model."""
+
+    def test_uses_service_when_reachable(self, server: EmbeddingServer) -> None:
+        with patch("api.config.get_settings") as settings:
+            settings.return_value.embedding_service_address = server.address
+            model = get_embedding_model("mock")
+
+        assert isinstance(model, EmbeddingServiceClient)
+        embedder = Embedder(model=model)
+        assert len(embedder.embed_texts(["hello"])) == 1
+
+    def test_falls_back_to_local_model(self) -> None:
+        with patch("api.config.get_settings") as settings:
+            settings.return_value.embedding_service_address = "tcp://127.0.0.1:1"
+            model = get_embedding_model("mock")
+
+        assert isinstance(model, MockEmbeddingModel)
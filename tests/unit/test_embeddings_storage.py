@@ -1,15 +1,93 @@
 """Tests for embedding storage."""
 
+from contextlib import asynccontextmanager
 from uuid import uuid4
 
+import numpy as np
+import pytest
+
 from worker.embeddings.storage import (
     CREATE_TABLE_SQL,
+    EmbeddingStore,
     EmbeddingStoreConfig,
     SearchResult,
     StoredEmbedding,
 )
 
 
+class FakeResult:
+    def __init__(self, rows: list[tuple]):
+        self._rows = rows
+
+    def fetchall(self) -> list[tuple]:
+        return self._rows
+
+
+class FakeSession:
+    """Records executed statements and answers RETURNING with the rows' ids."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, dict]] = []
+
+    async def execute(self, query, params: dict | None = None) -> FakeResult:
+        params = params or {}
+        self.statements.append((str(query), params))
+        rows = []
+        i = 0
+        while f"id_{i}" in params:
+            rows.append((params[f"id_{i}"], params[f"site_id_{i}"], params[f"content_hash_{i}"]))
+            i += 1
+        return FakeResult(rows)
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def connection(self):
+        raise RuntimeError("no asyncpg connection")
+
+
+class FakeDriver:
+    def __init__(self) -> None:
+        self.copied: list[tuple] = []
+
+    async def copy_records_to_table(self, table: str, records: list, columns: list) -> None:
+        self.copied.extend(records)
+
+
+class FakeCopySession(FakeSession):
+    """Session exposing an asyncpg-like driver connection."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.driver = FakeDriver()
+
+    async def connection(self):
+        session = self
+
+        class Connection:
+            async def get_raw_connection(self):
+                return type("Raw", (), {"driver_connection": session.driver})()
+
+        return Connection()
+
+
+def _rows(site_id, count: int) -> list[dict]:
+    return [
+        {
+            "chunk_id": uuid4(),
+            "page_id": uuid4(),
+            "site_id": site_id,
+            "content": f"Chunk {i}",
+            "content_hash": f"hash{i}",
+            "embedding": np.full(4, i, dtype=np.float32),
+            "model_name": "mock",
+            "source_url": "https://example.com",
+        }
+        for i in range(count)
+    ]
+
+
 class TestStoredEmbedding:
     """Tests for StoredEmbedding dataclass."""
 
@@ -220,3 +298,73 @@ class TestSimilarityScoring:
         )
 
         assert result.score + result.distance == 1.0
+
+
+class TestStoreEmbeddingsBulk:
+    """Tests for EmbeddingStore.store_embeddings_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_multi_row_insert_batches(self) -> None:
+        store = EmbeddingStore(EmbeddingStoreConfig(bulk_batch_size=2))
+        session = FakeSession()
+
+        result = await store.store_embeddings_bulk(session, _rows(uuid4(), 5), method="insert")
+
+        assert result.rows == 5
+        assert result.method == "insert"
+        assert len(session.statements) == 3
+        sql, params = session.statements[0]
+        assert "ON CONFLICT (content_hash, site_id) DO UPDATE" in sql
+        assert params["embedding_1"] == str([1.0] * 4)
+        assert params["dimensions_1"] == 4
+        assert params["source_url_0"] == "https://example.com"
+        assert result.to_dict()["rows_per_second"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_hashes_keep_last_row(self) -> None:
+        site_id = uuid4()
+        rows = _rows(site_id, 2)
+        rows.append({**rows[0], "content": "Updated"})
+        session = FakeSession()
+
+        result = await EmbeddingStore().store_embeddings_bulk(session, rows, method="insert")
+
+        _, params = session.statements[0]
+        assert result.rows == 2
+        assert params["content_0"] == "Updated"
+        assert "content_2" not in params
+
+    @pytest.mark.asyncio
+    async def test_copy_falls_back_to_insert(self) -> None:
+        store = EmbeddingStore(EmbeddingStoreConfig(copy_min_rows=3))
+        session = FakeSession()
+
+        result = await store.store_embeddings_bulk(session, _rows(uuid4(), 3))
+
+        assert result.method == "insert"
+        assert len(session.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_copy_loads_staging_table(self) -> None:
+        session = FakeCopySession()
+
+        result = await EmbeddingStore().store_embeddings_bulk(
+            session, _rows(uuid4(), 3), method="copy"
+        )
+
+        assert result.method == "copy"
+        assert len(session.driver.copied) == 3
+        assert session.driver.copied[2][6] == [2.0] * 4  # embedding as real[]
+        statements = [sql for sql, _ in session.statements]
+        assert "CREATE TEMP TABLE" in statements[0]
+        assert "embedding::vector" in statements[1]
+        assert "TRUNCATE" in statements[2]
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_ids_in_input_order(self) -> None:
+        site_id = uuid4()
+        rows = [{**row, "id": uuid4()} for row in _rows(site_id, 3)]
+
+        ids = await EmbeddingStore().store_embeddings_batch(FakeSession(), rows)
+
+        assert ids == [row["id"] for row in rows]
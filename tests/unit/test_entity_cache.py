@@ -0,0 +1,268 @@
+"""Tests for the entity recognition signal cache."""
+
+from collections import Counter
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from worker.extraction.entity_cache import (
+    EntitySignalCache,
+    MemorySignalBackend,
+    PartialLookup,
+    signals_from_dict,
+)
+from worker.extraction.entity_recognition import (
+    DomainSignals,
+    EntityRecognitionAnalyzer,
+    WikipediaSignals,
+)
+
+
+class Clock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def cache(clock: Clock) -> EntitySignalCache:
+    return EntitySignalCache(
+        backend=MemorySignalBackend(clock=clock),
+        ttl_seconds={"wikipedia": 100},
+        negative_ttl_seconds=10,
+        stale_seconds=50,
+        clock=clock,
+    )
+
+
+def _page(title: str = "Stripe, Inc.") -> WikipediaSignals:
+    return WikipediaSignals(
+        has_page=True,
+        page_title=title,
+        citation_count=12,
+        last_edited=datetime(2024, 5, 1, tzinfo=UTC),
+    )
+
+
+def _fake_http(handler: Callable[[httpx.Request], httpx.Response]) -> Any:
+    """Route the entity clients' httpx requests to ``handler``."""
+    real_client = httpx.AsyncClient
+
+    def client(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    return patch("worker.extraction.entity_recognition.httpx.AsyncClient", side_effect=client)
+
+
+class TestEntitySignalCache:
+    """Tests for EntitySignalCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_fetch_and_restores_dataclass(self, cache: EntitySignalCache) -> None:
+        fetch = AsyncMock(return_value=_page())
+
+        first = await cache.get_or_fetch("wikipedia", "Stripe", fetch, cls=WikipediaSignals)
+        second = await cache.get_or_fetch("wikipedia", "stripe", fetch, cls=WikipediaSignals)
+
+        assert fetch.await_count == 1
+        assert second == first
+        assert second.last_edited == datetime(2024, 5, 1, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(
+        self, cache: EntitySignalCache, clock: Clock
+    ) -> None:
+        await cache.get_or_fetch("wikipedia", "Stripe", AsyncMock(return_value=_page("Old")))
+        clock.now += 120  # Past the TTL, inside the stale window
+        fetch = AsyncMock(return_value=_page("New"))
+
+        stale = await cache.get_or_fetch("wikipedia", "Stripe", fetch, cls=WikipediaSignals)
+        await cache.wait_for_refreshes()
+        fresh = await cache.get_or_fetch("wikipedia", "Stripe", fetch, cls=WikipediaSignals)
+
+        assert stale.page_title == "Old"
+        assert fresh.page_title == "New"
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_past_stale_window_refetches(
+        self, cache: EntitySignalCache, clock: Clock
+    ) -> None:
+        await cache.get_or_fetch("wikipedia", "Stripe", AsyncMock(return_value=_page("Old")))
+        clock.now += 151
+        fetch = AsyncMock(return_value=_page("New"))
+
+        value = await cache.get_or_fetch("wikipedia", "Stripe", fetch, cls=WikipediaSignals)
+
+        assert value.page_title == "New"
+
+    @pytest.mark.asyncio
+    async def test_negative_answers_use_short_ttl(
+        self, cache: EntitySignalCache, clock: Clock
+    ) -> None:
+        found = lambda s: s.has_page  # noqa: E731
+        await cache.get_or_fetch(
+            "wikipedia", "Nobody", AsyncMock(return_value=WikipediaSignals()), found=found
+        )
+        clock.now += 11
+        fetch = AsyncMock(return_value=_page())
+
+        await cache.get_or_fetch("wikipedia", "Nobody", fetch, cls=WikipediaSignals, found=found)
+        await cache.wait_for_refreshes()
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_are_not_cached(self, cache: EntitySignalCache) -> None:
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("wikipedia", "Stripe", AsyncMock(side_effect=RuntimeError))
+
+        fetch = AsyncMock(return_value={"results_estimate": 5})
+        assert await cache.get_or_fetch("wikipedia", "Stripe", fetch) == {"results_estimate": 5}
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_fall_through_to_fetch(self) -> None:
+        backend = MemorySignalBackend()
+        backend.get = AsyncMock(side_effect=ConnectionError("down"))  # type: ignore[method-assign]
+        cache = EntitySignalCache(backend=backend)
+        fetch = AsyncMock(return_value={"results_estimate": 5})
+
+        assert await cache.get_or_fetch("web_presence", "Stripe", fetch) == {"results_estimate": 5}
+
+    @pytest.mark.asyncio
+    async def test_partial_lookup_is_returned_but_not_stored(
+        self, cache: EntitySignalCache
+    ) -> None:
+        fetch = AsyncMock(side_effect=[PartialLookup(_page(), "citations failed"), _page()])
+
+        assert (await cache.get_or_fetch("wikipedia", "Stripe", fetch)).has_page
+        assert cache.backend.data == {}  # type: ignore[attr-defined]
+
+        await cache.get_or_fetch("wikipedia", "Stripe", fetch)
+        await cache.get_or_fetch("wikipedia", "Stripe", fetch)
+        assert fetch.await_count == 2
+
+    def test_signals_from_dict_ignores_unknown_fields(self) -> None:
+        signals = signals_from_dict(DomainSignals, {"domain": "stripe.com", "removed": 1})
+
+        assert signals == DomainSignals(domain="stripe.com")
+
+
+class TestAnalyzerCaching:
+    """Tests for EntityRecognitionAnalyzer with a cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_analysis_skips_lookups(self) -> None:
+        analyzer = EntityRecognitionAnalyzer(cache=EntitySignalCache(MemorySignalBackend()))
+        analyzer.wikipedia.search_entity = AsyncMock(return_value="Stripe, Inc.")
+        analyzer.wikipedia.get_page_info = AsyncMock(return_value=_page())
+        analyzer.wikidata.search_entity = AsyncMock(return_value=None)
+        analyzer.domain_client.get_domain_info = AsyncMock(
+            return_value=DomainSignals(
+                domain="stripe.com",
+                is_registered=True,
+                creation_date=datetime(2010, 1, 1, tzinfo=UTC),
+                domain_age_years=1.0,
+            )
+        )
+        analyzer.web_presence.estimate_search_results = AsyncMock(return_value=1_000_000)
+
+        first = await analyzer.analyze("stripe.com", "Stripe")
+        second = await analyzer.analyze("stripe.com", "Stripe")
+
+        assert analyzer.wikipedia.search_entity.await_count == 1
+        assert analyzer.wikidata.search_entity.await_count == 1
+        assert analyzer.domain_client.get_domain_info.await_count == 1
+        assert analyzer.web_presence.estimate_search_results.await_count == 1
+        assert second.total_score == first.total_score
+        # Domain age is recomputed from the creation date, not taken from the cache
+        assert second.domain_signals.domain_age_years > 14
+        assert second.web_presence.google_results_estimate == 1_000_000
+
+    @staticmethod
+    def _analyzer() -> EntityRecognitionAnalyzer:
+        """Analyzer with every lookup stubbed; delete a stub to use the real client."""
+        analyzer = EntityRecognitionAnalyzer(cache=EntitySignalCache(MemorySignalBackend()))
+        analyzer.wikipedia.search_entity = AsyncMock(return_value=None)
+        analyzer.wikidata.search_entity = AsyncMock(return_value=None)
+        analyzer.domain_client.get_domain_info = AsyncMock(return_value=DomainSignals())
+        analyzer.web_presence.estimate_search_results = AsyncMock(return_value=0)
+        return analyzer
+
+    @pytest.mark.asyncio
+    async def test_failed_citation_count_is_not_cached(self) -> None:
+        requests: Counter[str] = Counter()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            action = request.url.params["action"]
+            requests[action] += 1
+            if action == "parse":
+                return httpx.Response(503)
+            page = {"title": "Stripe, Inc.", "revisions": [{"size": 5000}]}
+            return httpx.Response(200, json={"query": {"pages": {"1": page}}})
+
+        analyzer = self._analyzer()
+        analyzer.wikipedia.search_entity.return_value = "Stripe, Inc."  # type: ignore[attr-defined]
+        with _fake_http(handler):
+            first = await analyzer.analyze("stripe.com", "Stripe")
+            await analyzer.analyze("stripe.com", "Stripe")
+
+        # The page was found, so this audit still uses it
+        assert first.wikipedia.has_page
+        assert first.wikipedia.page_length_chars == 5000
+        assert first.wikipedia.citation_count == 0
+        # Nothing was cached, so the second audit looked it up again
+        assert requests == {"query": 2, "parse": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_rdap_lookup_is_not_cached(self) -> None:
+        requests: Counter[str] = Counter()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests[request.method] += 1
+            if request.method == "GET":
+                raise httpx.ConnectTimeout("RDAP timed out", request=request)
+            return httpx.Response(200)
+
+        analyzer = self._analyzer()
+        del analyzer.domain_client.get_domain_info
+        with _fake_http(handler):
+            first = await analyzer.analyze("stripe.com", "Stripe")
+            await analyzer.analyze("stripe.com", "Stripe")
+
+        # The HEAD fallback still shows the domain is registered
+        assert first.domain_signals.is_registered
+        assert first.domain_signals.creation_date is None
+        assert requests == {"GET": 2, "HEAD": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_web_presence_lookup_is_not_cached(self) -> None:
+        requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal requests
+            requests += 1
+            return httpx.Response(429)
+
+        analyzer = self._analyzer()
+        del analyzer.web_presence.estimate_search_results
+        with _fake_http(handler):
+            first = await analyzer.analyze("stripe.com", "Stripe")
+            await analyzer.analyze("stripe.com", "Stripe")
+
+        assert first.web_presence.google_results_estimate == 0
+        assert any(error.startswith("Web presence:") for error in first.errors)
+        assert requests == 2
@@ -0,0 +1,293 @@
+"""Tests for the shared parsed-once page document."""
+
+import pickle
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from worker.crawler.crawler import CrawlPage
+from worker.extraction.cleaner import clean_html
+from worker.extraction.document import (
+    PageDocument,
+    available_parsers,
+    get_default_parser,
+    parse_html,
+    set_default_parser,
+)
+from worker.extraction.js_detection import detect_js_dependency
+from worker.extraction.metadata import extract_metadata
+from worker.tasks.authority_check import run_authority_checks_sync
+from worker.tasks.page_analysis import analyze_page
+from worker.tasks.schema_check import run_schema_checks_sync
+from worker.tasks.structure_check import run_structure_checks_sync
+
+HTML = """
+<html>
+<head>
+  <title> Example Page </title>
+  <meta name="description" content="An example page">
+  <script type="application/ld+json">{"@type": "Organization", "name": "Example"}</script>
+  <script type="application/ld+json">{not json</script>
+</head>
+<body>
+  <nav><a href="/home">Home</a></nav>
+  <main>
+    <h1>Welcome</h1>
+    <p>Example is a company that builds example software for teams.</p>
+    <h2>Features</h2>
+    <p>It has many features. Read the <a href="https://other.com/x">docs</a>.</p>
+    <h2></h2>
+  </main>
+  <footer>Copyright 2026</footer>
+</body>
+</html>
+"""
+
+RICH_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>Pricing | Acme</title>
+  <meta name="description" content="Plans and pricing for Acme">
+  <meta property="og:title" content="Acme Pricing">
+  <link rel="canonical" href="https://acme.io/pricing">
+  <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "Product", "name": "Acme",
+     "offers": {"@type": "Offer", "price": "49", "priceCurrency": "USD"}}
+  </script>
+</head>
+<body>
+  <header><nav class="menu"><a href="/">Home</a> <a href="/pricing">Pricing</a></nav></header>
+  <article>
+    <h1>Acme pricing</h1>
+    <p class="byline">By <a rel="author" href="/team/jane">Jane Doe</a>,
+      updated <time datetime="2026-01-05">January 5, 2026</time></p>
+    <p>Acme helps teams automate workflows. According to a
+      <a href="https://research.example.org/study">2025 study</a>, 87% of customers
+      save five hours a week.</p>
+    <h2>Plans</h2>
+    <table><tr><th>Plan</th><th>Price</th></tr><tr><td>Team</td><td>$49</td></tr></table>
+    <ul><li>Unlimited workflows</li><li>SSO</li><li>Audit logs</li></ul>
+    <h2>FAQ</h2>
+    <h3>Is there a free trial?</h3><p>Yes, every plan has a 14 day free trial.</p>
+    <img src="/chart.png" alt="Hours saved per week by plan">
+  </article>
+  <aside class="sidebar"><div class="widget">Related posts</div></aside>
+  <footer><p>&copy; 2026 Acme Inc.</p></footer>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def restore_parser():
+    original = get_default_parser()
+    yield
+    set_default_parser(original)
+
+
+class TestPageDocument:
+    """Tests for PageDocument views."""
+
+    def test_views(self) -> None:
+        document = PageDocument(HTML, "https://example.com/")
+
+        assert document.title == "Example Page"
+        assert document.headings == {"h1": ["Welcome"], "h2": ["Features"]}
+        assert document.hrefs == ["/home", "https://other.com/x"]
+        assert document.json_ld == [{"@type": "Organization", "name": "Example"}]
+        assert "example software" in document.text
+
+    def test_parses_once(self) -> None:
+        document = PageDocument(HTML)
+
+        with patch("worker.extraction.document.BeautifulSoup", wraps=BeautifulSoup) as bs:
+            _ = document.title, document.headings, document.hrefs, document.text
+            assert bs.call_count == 1
+
+    def test_mutable_soup_is_isolated(self) -> None:
+        document = PageDocument(HTML)
+        _ = document.soup
+
+        copy = document.mutable_soup()
+        for tag in copy.find_all("nav"):
+            tag.decompose()
+
+        assert copy.find("nav") is None
+        assert document.soup.find("nav") is not None
+
+    def test_ensure_reuses_document(self) -> None:
+        document = PageDocument(HTML)
+
+        assert PageDocument.ensure(HTML, document=document) is document
+        assert PageDocument.ensure(HTML).html == HTML
+
+    def test_release_and_pickle_drop_parsed_state(self) -> None:
+        document = PageDocument(HTML, "https://example.com/")
+        _ = document.headings
+        assert document.is_parsed
+
+        restored = pickle.loads(pickle.dumps(document))
+        document.release()
+
+        assert not document.is_parsed
+        assert not restored.is_parsed
+        assert restored.url == "https://example.com/"
+        assert restored.title == "Example Page"
+
+
+class TestCrawlPageDocument:
+    """Tests for CrawlPage.document."""
+
+    def test_document_follows_html(self) -> None:
+        page = CrawlPage(
+            url="https://example.com/",
+            final_url="https://example.com/",
+            title=None,
+            html=HTML,
+            content_type="text/html",
+            status_code=200,
+            depth=0,
+            fetch_time_ms=0,
+            fetched_at=datetime.now(UTC),
+            links_found=0,
+        )
+
+        document = page.document
+        assert page.document is document
+
+        page.html = "<html><title>Other</title></html>"
+        assert page.document.title == "Other"
+
+
+class TestSharedDocumentEquivalence:
+    """Analyzers give the same results with and without a shared document."""
+
+    def test_metadata_and_cleaner(self) -> None:
+        document = PageDocument(HTML, "https://example.com/")
+
+        assert extract_metadata(HTML, "https://example.com/", document=document).to_dict() == (
+            extract_metadata(HTML, "https://example.com/").to_dict()
+        )
+        assert clean_html(HTML, document=document).main_content == clean_html(HTML).main_content
+        # Cleaning must not modify the shared DOM
+        assert document.soup.find("nav") is not None
+
+    def test_page_checks(self) -> None:
+        url = "https://example.com/"
+        document = PageDocument(HTML, url)
+
+        shared = [
+            run_structure_checks_sync(HTML, url, "text", 10, document=document),
+            run_schema_checks_sync(HTML, url, document=document),
+            run_authority_checks_sync(HTML, url, "text", document=document),
+            detect_js_dependency(HTML, url, document=document),
+        ]
+        separate = [
+            run_structure_checks_sync(HTML, url, "text", 10),
+            run_schema_checks_sync(HTML, url),
+            run_authority_checks_sync(HTML, url, "text"),
+            detect_js_dependency(HTML, url),
+        ]
+
+        assert [r.to_dict() for r in shared] == [r.to_dict() for r in separate]
+        assert document.soup.find("footer") is not None
+
+
+class TestParserBackends:
+    """Tests for the pluggable tree builder."""
+
+    def test_html_parser_is_the_default(self) -> None:
+        # lxml is installed and fastest, but opt-in until calibration is re-checked
+        assert available_parsers()[0] == "lxml"
+        assert get_default_parser() == "html.parser"
+        assert PageDocument(HTML).parser == "html.parser"
+
+    def test_set_default_parser(self, restore_parser) -> None:
+        assert set_default_parser("html.parser") == "html.parser"
+        assert PageDocument(HTML).parser == "html.parser"
+        assert parse_html(HTML).builder.NAME == "html.parser"
+
+        with pytest.raises(ValueError, match="Unknown HTML parser backend"):
+            set_default_parser("html5lib-fast")
+
+    def test_document_keeps_its_backend_when_pickled(self, restore_parser) -> None:
+        document = PageDocument(HTML, parser="html.parser")
+        set_default_parser("lxml")
+
+        restored = pickle.loads(pickle.dumps(document))
+
+        assert restored.parser == "html.parser"
+        assert restored.soup.builder.NAME == "html.parser"
+
+    def test_css_and_xpath_queries(self) -> None:
+        document = PageDocument(RICH_HTML, "https://acme.io/pricing")
+
+        assert [a["href"] for a in document.select("nav.menu a")] == ["/", "/pricing"]
+        assert document.select_one("a[rel=author]").get_text() == "Jane Doe"
+        assert document.xpath("//h2/text()") == ["Plans", "FAQ"]
+        assert document.xpath("string(//time/@datetime)") == "2026-01-05"
+        assert PageDocument("").xpath("//a") == []
+
+        document.release()
+        assert "tree" not in document.__dict__
+
+    def test_xpath_on_page_with_xml_declaration(self) -> None:
+        html = (
+            '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+            '<html><head><meta charset="iso-8859-1"></head><body><p>Café menu</p></body></html>'
+        )
+
+        assert PageDocument(html).xpath("string(//p)") == "Café menu"
+
+    @pytest.mark.parametrize("html", ["<!-- draft -->", "  \n<!-- draft -->\n  ", "   "])
+    def test_xpath_on_document_without_elements(self, html: str) -> None:
+        assert PageDocument(html).xpath("//a") == []
+
+
+class TestBackendEquivalence:
+    """Both backends give the same analysis results on well-formed pages."""
+
+    @staticmethod
+    def _analyze(html: str, parser: str) -> dict:
+        set_default_parser(parser)
+        page = CrawlPage(
+            url="https://acme.io/pricing",
+            final_url="https://acme.io/pricing",
+            title=None,
+            html=html,
+            content_type="text/html",
+            status_code=200,
+            depth=0,
+            fetch_time_ms=0,
+            fetched_at=datetime.now(UTC),
+            links_found=0,
+        )
+        result = analyze_page(page, 0, detect_js=True)
+        assert result.extracted is not None
+        return {
+            "main_content": result.extracted.main_content,
+            "metadata": result.extracted.metadata.to_dict(),
+            "page_type": result.page_type.to_dict(),
+            "js": result.js.to_dict(),
+            "structure": result.structure.to_dict(),
+            "schema": result.schema.to_dict(),
+            "authority": result.authority.to_dict(),
+            "errors": result.errors,
+        }
+
+    @pytest.mark.parametrize("html", [HTML, RICH_HTML], ids=["simple", "rich"])
+    def test_analyze_page_matches(self, html: str, restore_parser) -> None:
+        assert self._analyze(html, "lxml") == self._analyze(html, "html.parser")
+
+    @pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+    def test_nested_boilerplate_is_removed_once(self, parser: str, restore_parser) -> None:
+        set_default_parser(parser)
+        html = (
+            '<html><body><div class="sidebar"><div class="menu"><a href="/">Menu</a></div>'
+            "</div><p>Plain body text here.</p></body></html>"
+        )
+
+        assert clean_html(html).main_content == "Plain body text here."
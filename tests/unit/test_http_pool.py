@@ -0,0 +1,224 @@
+"""Tests for the shared pooled HTTP client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from worker.crawler.fetcher import Fetcher
+from worker.crawler.llms_txt import LlmsTxtChecker
+from worker.crawler.robots import RobotsChecker
+from worker.http_pool import (
+    HTTPClientPool,
+    PoolConfig,
+    PoolMetrics,
+    close_http_pool,
+    get_http_pool,
+    run_with_http_pool,
+)
+from worker.redis import close_async_redis, get_async_redis_connection_bytes
+
+
+def _pool(handler, **config) -> HTTPClientPool:
+    return HTTPClientPool(PoolConfig(**config), transport=httpx.MockTransport(handler))
+
+
+class TestPoolMetrics:
+    """Tests for PoolMetrics."""
+
+    def test_reuse_rate_empty(self) -> None:
+        assert PoolMetrics().connection_reuse_rate == 0.0
+
+    def test_reuse_rate(self) -> None:
+        metrics = PoolMetrics(requests=10, connections_opened=2)
+        assert metrics.connection_reuse_rate == pytest.approx(0.8)
+
+    def test_to_dict(self) -> None:
+        metrics = PoolMetrics(requests=1)
+        metrics.requests_by_host["example.com"] += 1
+
+        data = metrics.to_dict()
+
+        assert data["requests"] == 1
+        assert data["requests_by_host"] == {"example.com": 1}
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_request_tracks_metrics(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200, text="ok"))
+
+        response = await pool.get("https://example.com/a")
+        await pool.get("https://example.com/b")
+        await pool.get("https://other.com/")
+
+        assert response.text == "ok"
+        assert pool.metrics.requests == 3
+        assert pool.metrics.requests_by_host == {"example.com": 2, "other.com": 1}
+        assert pool.metrics.in_flight == 0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_reuses_single_client(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200))
+
+        first = pool.client
+        await pool.get("https://example.com/")
+
+        assert pool.client is first
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self) -> None:
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        pool = _pool(handler, max_connections_per_host=2)
+
+        await asyncio.gather(*(pool.get(f"https://example.com/{i}") for i in range(6)))
+
+        assert peak == 2
+        assert pool.metrics.peak_in_flight == 2
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_counted(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        pool = _pool(handler)
+
+        with pytest.raises(httpx.ConnectError):
+            await pool.get("https://example.com/")
+
+        assert pool.metrics.errors == 1
+        assert pool.metrics.in_flight == 0
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200, content=b"streamed"))
+
+        async with pool.stream("GET", "https://example.com/") as response:
+            body = await response.aread()
+
+        assert body == b"streamed"
+        assert pool.metrics.requests == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_allows_reopen(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200))
+        first = pool.client
+
+        await pool.aclose()
+
+        assert pool.client is not first
+        await pool.aclose()
+
+
+class TestPoolRegistry:
+    """Tests for the per-loop pool registry."""
+
+    @pytest.mark.asyncio
+    async def test_same_pool_within_loop(self) -> None:
+        assert get_http_pool() is get_http_pool()
+        await close_http_pool()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_pool(self) -> None:
+        first = get_http_pool()
+        await close_http_pool()
+
+        assert get_http_pool() is not first
+        await close_http_pool()
+
+    def test_run_with_http_pool_closes_pool(self) -> None:
+        async def job() -> HTTPClientPool:
+            pool = get_http_pool()
+            _ = pool.client
+            return pool
+
+        pool = run_with_http_pool(job())
+
+        assert pool._client is None
+
+    def test_run_with_http_pool_closes_async_redis(self) -> None:
+        async def job() -> None:
+            get_async_redis_connection_bytes()
+
+        settings = MagicMock(redis_url="redis://localhost:6379/0")
+        with (
+            patch("worker.redis.get_settings", return_value=settings),
+            patch("redis.asyncio.Redis.aclose", new_callable=AsyncMock) as aclose,
+        ):
+            run_with_http_pool(job())
+
+        aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_async_redis_resets_client(self) -> None:
+        settings = MagicMock(redis_url="redis://localhost:6379/0")
+        with patch("worker.redis.get_settings", return_value=settings):
+            first = get_async_redis_connection_bytes()
+            await close_async_redis()
+            second = get_async_redis_connection_bytes()
+            await close_async_redis()
+
+        assert second is not first
+
+
+class TestCallSitesUsePool:
+    """Call sites route requests through an injected pool."""
+
+    @pytest.mark.asyncio
+    async def test_fetcher(self) -> None:
+        pool = _pool(
+            lambda request: httpx.Response(
+                200, text="<html></html>", headers={"content-type": "text/html"}
+            )
+        )
+        fetcher = Fetcher(user_agent="test", min_delay_between_requests=0, http_pool=pool)
+
+        result = await fetcher.fetch("https://example.com/")
+
+        assert result.success
+        assert pool.metrics.requests == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_robots_checker(self) -> None:
+        pool = _pool(lambda request: httpx.Response(200, text="User-agent: *\nDisallow: /x"))
+        checker = RobotsChecker(user_agent="test", http_pool=pool)
+
+        assert await checker.is_allowed("https://example.com/x") is False
+        assert await checker.is_allowed("https://example.com/y") is True
+        # robots.txt fetched once and cached
+        assert pool.metrics.requests == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_llms_txt_checker(self) -> None:
+        pool = _pool(
+            lambda request: httpx.Response(
+                200, text="# Example\n", headers={"content-type": "text/plain"}
+            )
+        )
+        checker = LlmsTxtChecker(http_pool=pool)
+
+        content = await checker._fetch_llms_txt("https://example.com/llms.txt")
+
+        assert content == "# Example\n"
+        assert pool.metrics.requests_by_host == {"example.com": 1}
+        await pool.aclose()
@@ -0,0 +1,204 @@
+"""Tests for incremental re-audits."""
+
+import os
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from structlog.testing import capture_logs
+
+from worker.chunking.chunker import SemanticChunker
+from worker.crawler.crawler import CrawlPage, CrawlResult
+from worker.tasks import incremental
+from worker.tasks.incremental import (
+    GC_MARKER_FILE,
+    AuditBaselineStore,
+    IncrementalStats,
+    get_audit_baseline_store,
+)
+from worker.tasks.page_analysis import PageAnalysisConfig, PageAnalysisExecutor, analyze_page
+
+BODY = " ".join(["Example builds reliable software for growing teams."] * 10)
+
+
+def _page(path: str, body: str = BODY, etag: str | None = None) -> CrawlPage:
+    url = f"https://example.com{path}"
+    return CrawlPage(
+        url=url,
+        final_url=url,
+        title=path,
+        html=f"<html><head><title>{path}</title></head><body><main><h1>{path}</h1>"
+        f"<p>{body}</p></main></body></html>",
+        content_type="text/html",
+        status_code=200,
+        depth=0 if path == "/" else 1,
+        fetch_time_ms=0,
+        fetched_at=datetime.now(UTC),
+        links_found=0,
+        etag=etag,
+    )
+
+
+def _crawl(pages: list[CrawlPage]) -> CrawlResult:
+    now = datetime.now(UTC)
+    return CrawlResult(
+        domain="example.com",
+        start_url="https://example.com/",
+        pages=pages,
+        urls_discovered=len(pages),
+        urls_crawled=len(pages),
+        urls_skipped=0,
+        urls_failed=0,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=0.0,
+        robots_respected=True,
+        max_depth_reached=1,
+    )
+
+
+class TestAuditBaselineStore:
+    """Tests for AuditBaselineStore."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        store = AuditBaselineStore(tmp_path)
+        pages = [_page("/", etag='"v1"'), _page("/about")]
+        results = [analyze_page(page, i, detect_js=i == 0) for i, page in enumerate(pages)]
+        chunked = SemanticChunker().chunk_text(text=BODY, url=pages[1].url, title="About")
+
+        assert store.save("site-1", _crawl(pages), results, {pages[1].content_hash: chunked})
+        baseline = store.load("site-1")
+
+        assert baseline is not None
+        assert baseline.pages_by_url["https://example.com/"].etag == '"v1"'
+        assert baseline.pages_by_url["https://example.com/"].html == pages[0].html
+        assert set(baseline.page_results) == {p.content_hash for p in pages}
+        assert baseline.reusable_chunks(pages[1].url, pages[1].content_hash) is not None
+        assert baseline.reusable_chunks(pages[0].url, pages[1].content_hash) is None
+
+    def test_save_replaces_previous_baseline(self, tmp_path: Path) -> None:
+        store = AuditBaselineStore(tmp_path)
+        store.save("site-1", _crawl([_page("/"), _page("/old")]), [], {})
+        store.save("site-1", _crawl([_page("/")]), [], {})
+
+        baseline = store.load("site-1")
+
+        assert baseline is not None
+        assert list(baseline.pages_by_url) == ["https://example.com/"]
+        assert store.storage.list_crawls() == ["site-1"]
+
+    def test_missing_baseline(self, tmp_path: Path) -> None:
+        assert AuditBaselineStore(tmp_path).load("unknown") is None
+
+    def test_results_from_other_analysis_version_are_ignored(self, tmp_path: Path) -> None:
+        store = AuditBaselineStore(tmp_path)
+        page = _page("/")
+        store.save("site-1", _crawl([page]), [analyze_page(page, 0)], {})
+
+        with patch("worker.tasks.incremental.analysis_version", return_value="other"):
+            baseline = store.load("site-1")
+
+        assert baseline is not None
+        assert baseline.page_results == {}
+        # The crawl is still reused for conditional requests
+        assert list(baseline.pages_by_url) == ["https://example.com/"]
+
+    def test_results_from_other_parser_backend_are_ignored(self, tmp_path: Path) -> None:
+        store = AuditBaselineStore(tmp_path)
+        page = _page("/")
+        store.save("site-1", _crawl([page]), [analyze_page(page, 0)], {})
+
+        with patch("worker.tasks.incremental.get_default_parser", return_value="lxml"):
+            baseline = store.load("site-1")
+
+        assert baseline is not None
+        assert baseline.page_results == {}
+
+    def test_garbage_collection_schedule_is_shared(self, tmp_path: Path) -> None:
+        crawl = _crawl([_page("/")])
+        with patch("worker.crawler.storage.CrawlStorage.collect_garbage") as collect:
+            # Each forked job gets a fresh store; the schedule still holds
+            AuditBaselineStore(tmp_path).save("site-1", crawl, [], {})
+            AuditBaselineStore(tmp_path).save("site-2", crawl, [], {})
+            assert collect.call_count == 1
+
+            # Due again once the interval has passed since the last pass
+            stale = time.time() - 7200
+            os.utime(tmp_path / GC_MARKER_FILE, (stale, stale))
+            AuditBaselineStore(tmp_path).save("site-3", crawl, [], {})
+            assert collect.call_count == 2
+
+
+class TestGetAuditBaselineStore:
+    """Tests for the settings-configured baseline store."""
+
+    @pytest.fixture(autouse=True)
+    def reset_store(self):
+        with patch.object(incremental, "_baseline_store", None):
+            yield
+
+    def test_configured_dir_is_used(self, tmp_path: Path) -> None:
+        settings = MagicMock(audit_baseline_dir=str(tmp_path))
+        with patch("api.config.get_settings", return_value=settings), capture_logs() as logs:
+            store = get_audit_baseline_store()
+
+        assert store.storage.base_path == tmp_path
+        assert not logs
+
+    def test_unset_dir_warns_about_local_storage(self) -> None:
+        settings = MagicMock(audit_baseline_dir=None)
+        with patch("api.config.get_settings", return_value=settings), capture_logs() as logs:
+            store = get_audit_baseline_store()
+
+        assert store.storage.base_path.name == "findable-baselines"
+        assert [log["event"] for log in logs] == ["audit_baseline_dir_not_shared"]
+
+
+class TestIncrementalStats:
+    """Tests for IncrementalStats.compare."""
+
+    def test_classifies_pages(self, tmp_path: Path) -> None:
+        store = AuditBaselineStore(tmp_path)
+        store.save("site-1", _crawl([_page("/"), _page("/about")]), [], {})
+        baseline = store.load("site-1")
+        assert baseline is not None
+
+        crawl = _crawl([_page("/"), _page("/about", body="Rewritten."), _page("/new")])
+        stats = IncrementalStats.compare(crawl, baseline)
+
+        assert (stats.pages_unchanged, stats.pages_changed, stats.pages_new) == (1, 1, 1)
+
+
+class TestAnalysisReuse:
+    """Tests for PageAnalysisExecutor reusing earlier results."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_pages_are_analyzed(self) -> None:
+        executor = PageAnalysisExecutor(PageAnalysisConfig(workers=1))
+        before = [_page("/"), _page("/about"), _page("/pricing")]
+        previous = {r.content_hash: r for r in await executor.analyze_pages(before)}
+
+        after = [_page("/"), _page("/about", body="Rewritten about page."), _page("/pricing")]
+        with patch("worker.tasks.page_analysis.analyze_page", wraps=analyze_page) as analyze:
+            results = await executor.analyze_pages(after, previous=previous)
+
+        assert [call.args[0].url for call in analyze.call_args_list] == [after[1].url]
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[1].content_hash == after[1].content_hash
+        assert results[0].js is not None
+
+    @pytest.mark.asyncio
+    async def test_homepage_needs_js_result(self) -> None:
+        executor = PageAnalysisExecutor(PageAnalysisConfig(workers=1))
+        page = _page("/")
+        # Analyzed when it was not the homepage, so it has no JS result
+        previous = {page.content_hash: replace(analyze_page(page, 3), index=3)}
+
+        with patch("worker.tasks.page_analysis.analyze_page", wraps=analyze_page) as analyze:
+            results = await executor.analyze_pages([page], previous=previous)
+
+        assert analyze.call_count == 1
+        assert results[0].js is not None
@@ -0,0 +1,231 @@
+"""Tests for the shared multi-pattern matcher and the scanners using it."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from worker.extraction import authority, content_uniqueness, source_primacy
+from worker.extraction.matcher import MultiPatternMatcher
+from worker.simulation.runner import (
+    SIGNAL_PATTERNS,
+    RetrievedContext,
+    SimulationConfig,
+    SimulationRunner,
+)
+
+SAMPLE_TEXTS = [
+    "",
+    "Nothing to see here.",
+    "Founded by Jane Doe in 2012, Acme is a leading platform that helps teams automate "
+    "workflows. Contact us at hello@acme.io or call (555) 123-4567. Our survey of 1,200 "
+    "customers found 87% of respondents save 5 hours a week. Pricing starts at $49 per month. "
+    "Get in touch for a demo. Trusted by 10,000+ companies worldwide. SOC 2 certified.",
+    "Written by Dr. John Smith, PhD. Published March 3, 2024. Updated 2024-05-01. "
+    "In this case study we interviewed 40 engineers; our proprietary benchmark shows "
+    "a 3x improvement. Click here to learn more. In today's fast-paced world, it's important "
+    "to note that best practices matter.",
+    "GET IN TOUCH — CONTACT FORM below. 123 Main Street, Springfield. Since 1998.",
+]
+
+
+def _naive_first_matches(patterns: dict[str, re.Pattern[str]], text: str) -> dict[str, tuple]:
+    result = {}
+    for id_, pattern in patterns.items():
+        m = pattern.search(text)
+        if m:
+            result[id_] = (m.start(), m.end(), m.groups())
+    return result
+
+
+def _spans(matches: dict[str, re.Match[str]]) -> dict[str, tuple]:
+    return {id_: (m.start(), m.end(), m.groups()) for id_, m in matches.items()}
+
+
+class TestMultiPatternMatcher:
+    """Tests for MultiPatternMatcher."""
+
+    def test_first_matches_equal_per_pattern_search(self) -> None:
+        patterns = {
+            f"{key}:{i}": p for key, ps in SIGNAL_PATTERNS.items() for i, p in enumerate(ps)
+        }
+        matcher = MultiPatternMatcher(patterns)
+
+        for text in SAMPLE_TEXTS:
+            assert _spans(matcher.first_matches(text)) == _naive_first_matches(patterns, text)
+
+    def test_first_match_uses_first_matching_pattern(self) -> None:
+        matcher = MultiPatternMatcher({"contact": ["form", "touch"]})
+
+        assert matcher.first_matches("touch then form")["contact"].group() == "form"
+        assert matcher.first_matches("touch")["contact"].group() == "touch"
+
+    def test_prefilter_skips_patterns_without_required_literals(self) -> None:
+        matcher = MultiPatternMatcher({"year": r"founded\s+in\s+(\d{4})", "any": r"\d+"})
+        entry = matcher._entries["year"][0]
+
+        assert entry.requirement == ("founded",)
+        assert matcher._entries["any"][0].requirement is None
+        assert matcher.matching_ids("est. 1998") == ["any"]
+        assert matcher.first_matches("founded  in 1998")["year"].group(1) == "1998"
+
+    def test_alternation_requires_any_branch_literal(self) -> None:
+        matcher = MultiPatternMatcher({"press": r"(?:press|news|featured\s+in)"}, flags=re.I)
+
+        assert matcher._entries["press"][0].requirement == ("press", "news", "featured")
+        assert matcher.matching_ids("In the NEWS") == ["press"]
+        assert matcher.matching_ids("Nothing") == []
+
+    def test_patterns_keep_their_own_flags(self) -> None:
+        matcher = MultiPatternMatcher(
+            {"sensitive": re.compile("Acme"), "insensitive": re.compile("acme", re.I)}
+        )
+
+        assert matcher.matching_ids("ACME") == ["insensitive"]
+        assert matcher.matching_ids("Acme") == ["sensitive", "insensitive"]
+
+    def test_case_folding_of_non_ascii_text(self) -> None:
+        matcher = MultiPatternMatcher({"kit": "kit", "s": "ask"}, flags=re.IGNORECASE)
+
+        # Kelvin sign, dotted capital I and long s all match ASCII letters under IGNORECASE
+        assert matcher.matching_ids("\u212a\u0130T") == ["kit"]
+        assert matcher.matching_ids("a\u017fk") == ["s"]
+
+    def test_string_patterns_use_default_flags(self) -> None:
+        matcher = MultiPatternMatcher({"a": "hello"}, flags=re.IGNORECASE)
+
+        assert matcher.matching_ids("HELLO") == ["a"]
+
+    def test_literals(self) -> None:
+        matcher = MultiPatternMatcher.from_literals({"dot": "a.b", "up": "Up"})
+
+        assert matcher.matching_ids("axb up") == []
+        assert matcher.matching_ids("a.b Up") == ["dot", "up"]
+        assert matcher.matches_any("xa.b")
+        assert not matcher.matches_any("UP")
+
+    def test_restricting_ids(self) -> None:
+        matcher = MultiPatternMatcher.from_literals(["a", "b", "c"])
+
+        assert matcher.matching_ids("abc", ids=["c", "a"]) == ["a", "c"]
+        with pytest.raises(KeyError):
+            matcher.matching_ids("abc", ids=["z"])
+
+
+class TestScannerEquivalence:
+    """The scanners' matchers agree with testing each pattern separately."""
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            authority.ORIGINAL_DATA_PATTERNS,
+            authority.CREDENTIAL_PATTERNS,
+            authority.AUTHOR_BYLINE_PATTERNS,
+            authority.DATE_PATTERNS,
+        ],
+    )
+    def test_authority_patterns(self, patterns: list[str]) -> None:
+        matcher = MultiPatternMatcher({p: p for p in patterns}, flags=re.IGNORECASE)
+
+        for text in SAMPLE_TEXTS:
+            expected = [p for p in patterns if re.search(p, text, re.IGNORECASE)]
+            assert matcher.matching_ids(text) == expected
+
+    def test_source_primacy_paths(self) -> None:
+        paths = ["/docs/api", "/blog/top-10", "/vs-competitor", "/pricing", "/about"]
+        for literals, matcher in [
+            (source_primacy._PRIMARY_URL_PATTERNS, source_primacy._PRIMARY_URL_MATCHER),
+            (source_primacy._DERIVATIVE_URL_PATTERNS, source_primacy._DERIVATIVE_URL_MATCHER),
+            (source_primacy._OWN_TOPIC_URL_PATTERNS, source_primacy._OWN_TOPIC_URL_MATCHER),
+            (
+                source_primacy._EXTERNAL_TOPIC_URL_PATTERNS,
+                source_primacy._EXTERNAL_TOPIC_URL_MATCHER,
+            ),
+        ]:
+            for path in paths:
+                expected = any(p in path for p in literals)
+                assert matcher.matches_any(path) == expected
+
+    def test_content_uniqueness_matchers(self) -> None:
+        groups = {
+            content_uniqueness._GENERIC_PHRASE_MATCHER: {
+                phrase: [pattern]
+                for phrase, pattern in zip(
+                    content_uniqueness.GENERIC_MARKETING_PHRASES,
+                    content_uniqueness._GENERIC_PHRASE_PATTERNS,
+                    strict=True,
+                )
+            },
+            content_uniqueness._PROPRIETARY_MATCHER: {
+                "pricing": content_uniqueness._PRICING_PATTERNS,
+                "specs": content_uniqueness._SPEC_PATTERNS,
+                "research": content_uniqueness._RESEARCH_PATTERNS,
+                "statistics": content_uniqueness._STAT_PATTERNS,
+                "code": content_uniqueness._CODE_PATTERNS,
+                "api_docs": content_uniqueness._API_DOC_PATTERNS,
+            },
+            content_uniqueness._FIRST_PARTY_MATCHER: {
+                "author_bylines": content_uniqueness._AUTHOR_BYLINE_PATTERNS,
+                "publication_dates": content_uniqueness._PUB_DATE_PATTERNS,
+                "case_studies": content_uniqueness._CASE_STUDY_PATTERNS,
+                "primary_research": content_uniqueness._PRIMARY_RESEARCH_PATTERNS,
+            },
+        }
+        for matcher, patterns in groups.items():
+            for text in SAMPLE_TEXTS:
+                expected = [
+                    id_ for id_, group in patterns.items() if any(p.search(text) for p in group)
+                ]
+                assert matcher.matching_ids(text) == expected
+
+
+class TestSimulationSignals:
+    """Signal evaluation with the shared matcher."""
+
+    @staticmethod
+    def _naive(signals: list[str], content: str) -> dict[str, str | None]:
+        result = {}
+        for signal in signals:
+            evidence = None
+            for key, patterns in SIGNAL_PATTERNS.items():
+                if key in signal.lower():
+                    for pattern in patterns:
+                        m = pattern.search(content)
+                        if m:
+                            start = max(0, m.start() - 30)
+                            evidence = content[start : min(len(content), m.end() + 30)]
+                            break
+                    if evidence is not None:
+                        break
+            result[signal] = evidence
+        return result
+
+    def test_evidence_matches_per_pattern_search(self) -> None:
+        runner = SimulationRunner(
+            retriever=MagicMock(), config=SimulationConfig(use_fuzzy_matching=False)
+        )
+        signals = [
+            "contact form",
+            "email address",
+            "founding year",
+            "pricing tiers",
+            "customer count",
+            "unknown signal",
+        ]
+        for content in SAMPLE_TEXTS[1:]:
+            context = RetrievedContext(
+                chunks=[],
+                total_chunks=0,
+                avg_relevance_score=0.0,
+                max_relevance_score=0.0,
+                source_pages=[],
+                content_preview=content,
+            )
+
+            matches = runner._evaluate_signals(signals, context)
+            expected = self._naive(signals, content)
+
+            for match in matches:
+                if expected[match.signal] is not None:
+                    assert match.found
+                    assert match.evidence == expected[match.signal]
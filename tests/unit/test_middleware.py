@@ -1,6 +1,5 @@
 """Tests for middleware components."""
 
-import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,11 +7,11 @@ import pytest
 from api.middleware import (
     AUTH_RATE_LIMITS,
     PLAN_RATE_LIMITS,
-    RateLimitBucket,
     RateLimitConfig,
     RateLimitMiddleware,
     SecurityHeadersMiddleware,
 )
+from api.rate_limit import LocalRateLimiter, RateLimitBucket, RateLimiter
 
 
 class TestRateLimitConfig:
@@ -114,31 +113,64 @@ class TestRateLimitMiddleware:
         assert "/v1/auth/register" in middleware.AUTH_PATHS
         assert "/v1/auth/forgot-password" in middleware.AUTH_PATHS
 
-    def test_check_rate_limit_allowed(self, middleware):
-        config = RateLimitConfig(requests_per_minute=60, burst_size=10)
-        buckets = {"test": RateLimitBucket(tokens=5.0, last_update=time.time())}
+    @pytest.fixture
+    def local_middleware(self):
+        """Middleware whose limiter always uses the local fallback."""
+        redis = MagicMock()
+        redis.pipeline.side_effect = ConnectionError("Connection refused")
+        limiter = RateLimiter(redis=redis, local=LocalRateLimiter())
+        return RateLimitMiddleware(MagicMock(), enabled=True, limiter=limiter)
+
+    @staticmethod
+    def _request(path: str, ip: str = "192.168.1.1"):
+        request = MagicMock()
+        request.url.path = path
+        request.headers.get.return_value = None
+        request.client.host = ip
+        request.state = MagicMock(spec=[])
+        return request
+
+    @staticmethod
+    async def _call_next(request):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        return response
+
+    def test_token_bucket_from_config(self):
+        bucket = RateLimitConfig(requests_per_minute=60, burst_size=10).token_bucket
+        assert bucket.rate == 1.0
+        assert bucket.capacity == 70
 
-        allowed, retry_after = middleware._check_rate_limit("test", config, buckets)
-        assert allowed is True
-        assert retry_after == 0
+    @pytest.mark.asyncio
+    async def test_dispatch_allowed_sets_headers(self, local_middleware):
+        response = await local_middleware.dispatch(self._request("/v1/sites"), self._call_next)
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "30"
+        assert int(response.headers["X-RateLimit-Remaining"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_dispatch_denies_when_auth_limit_exhausted(self, local_middleware):
+        request = self._request("/v1/auth/login")
+        capacity = AUTH_RATE_LIMITS.token_bucket.capacity
 
-    def test_check_rate_limit_denied(self, middleware):
-        config = RateLimitConfig(requests_per_minute=60, burst_size=10)
-        buckets = {"test": RateLimitBucket(tokens=0.0, last_update=time.time())}
+        for _ in range(int(capacity)):
+            response = await local_middleware.dispatch(request, self._call_next)
+            assert response.status_code == 200
+        response = await local_middleware.dispatch(request, self._call_next)
 
-        allowed, retry_after = middleware._check_rate_limit("test", config, buckets)
-        assert allowed is False
-        assert retry_after > 0
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_dispatch_skips_excluded_paths(self, local_middleware):
+        local_middleware.limiter = MagicMock()
 
-    def test_check_rate_limit_refills(self, middleware):
-        config = RateLimitConfig(requests_per_minute=60, burst_size=10)
-        # Set last update to 2 seconds ago
-        past_time = time.time() - 2.0
-        buckets = {"test": RateLimitBucket(tokens=0.0, last_update=past_time)}
+        response = await local_middleware.dispatch(self._request("/api/health"), self._call_next)
 
-        allowed, retry_after = middleware._check_rate_limit("test", config, buckets)
-        # Should have refilled some tokens (2 seconds * 1 token/second)
-        assert allowed is True
+        assert response.status_code == 200
+        local_middleware.limiter.check_many.assert_not_called()
 
     def test_get_client_ip_direct(self, middleware):
         request = MagicMock()
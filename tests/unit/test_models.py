@@ -45,3 +45,18 @@ def test_snapshot_trigger_enum() -> None:
     assert SnapshotTrigger.SCHEDULED_MONTHLY.value == "scheduled_monthly"
     assert SnapshotTrigger.MANUAL.value == "manual"
     assert SnapshotTrigger.ON_DEMAND.value == "on_demand"
+
+
+def test_run_shareable_id() -> None:
+    """Test shareable IDs are derived from the run UUID and indexed."""
+    import uuid
+
+    from api.models import Run
+    from api.models.run import shareable_id_for
+
+    run_id = uuid.UUID("550e8400-e29b-41d4-a716-446655440000")
+    assert shareable_id_for(run_id) == "550e8400e29b"
+
+    column = Run.__table__.c.shareable_id
+    assert column.unique
+    assert column.index
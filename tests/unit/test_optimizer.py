@@ -1,15 +1,27 @@
 """Tests for calibration optimizer."""
 
+import random
+from types import SimpleNamespace
+
 from worker.calibration.optimizer import (
     DEFAULT_WEIGHTS,
     MAX_WEIGHT,
     MIN_WEIGHT,
     TOTAL_WEIGHT,
     OptimizationResult,
+    SampleMatrix,
+    _answerability_arrays,
     _are_adjacent,
     _calculate_threshold_accuracy,
     _calculate_weighted_accuracy,
+    _calculate_weighted_metrics,
+    _evaluate_weights,
+    _generate_constrained_combinations,
     _generate_fine_search_combinations,
+    _grid_search,
+    _grid_search_arrays,
+    _optimize_weights_for_samples,
+    _threshold_accuracies,
     generate_weight_combinations,
 )
 
@@ -254,6 +266,151 @@ class TestCalculateThresholdAccuracy:
         assert 0.0 <= accuracy <= 1.0
 
 
+# ============================================================================
+# Test Vectorized Evaluation
+# ============================================================================
+
+
+def _random_samples(n: int, seed: int = 7, domains: int = 20) -> list[SimpleNamespace]:
+    """Samples with some missing pillars, primacy scores and empty score dicts."""
+    rng = random.Random(seed)
+    samples = []
+    for i in range(n):
+        scores: dict[str, float | None] | None = {
+            p: (None if rng.random() < 0.1 else round(rng.uniform(0, 100), 1))
+            for p in DEFAULT_WEIGHTS
+        }
+        if rng.random() < 0.5:
+            scores["source_primacy"] = round(rng.uniform(0, 100), 1)
+        if i % 25 == 0:
+            scores = None
+        samples.append(
+            SimpleNamespace(
+                pillar_scores=scores,
+                obs_cited=rng.random() < 0.6,
+                obs_mentioned=rng.random() < 0.8,
+                sim_score=rng.random(),
+                site_id=f"site-{i % domains}",
+                site_type=None,
+            )
+        )
+    return samples
+
+
+def _scalar_grid_search(samples, combos, thresholds, primacy_weights):
+    """Reference nested-loop search with strict > tie-breaking."""
+    best = None
+    for weights in combos:
+        for threshold in thresholds:
+            for pw in primacy_weights:
+                metrics = _calculate_weighted_metrics(samples, weights, threshold, pw)
+                if best is None or metrics.mcc > best[0]:
+                    best = (metrics.mcc, weights, threshold, pw, metrics)
+    return best
+
+
+class TestVectorizedEvaluation:
+    """Vectorized engine must agree exactly with the scalar evaluation."""
+
+    def test_evaluate_weights_matches_scalar(self):
+        """_evaluate_weights equals _calculate_weighted_metrics."""
+        samples = _random_samples(300)
+        matrix = SampleMatrix.from_samples(samples)
+        combos = _generate_constrained_combinations(DEFAULT_WEIGHTS, max_change=5.0, step=5.0)
+
+        for weights in [DEFAULT_WEIGHTS, *combos[:10]]:
+            for threshold, pw in [(30, 0.0), (50, 0.0), (45, 10.0)]:
+                expected = _calculate_weighted_metrics(samples, weights, threshold, pw)
+                actual = _evaluate_weights(matrix, weights, threshold, pw)
+                assert actual == expected
+
+    def test_grid_search_matches_scalar_loop(self):
+        """Best weights, threshold and primacy weight match the nested loop."""
+        samples = _random_samples(200)
+        combos = _generate_constrained_combinations(DEFAULT_WEIGHTS, max_change=5.0, step=5.0)
+        thresholds = [40, 45, 50, 55]
+        primacy_weights = [0, 5, 10]
+
+        expected = _scalar_grid_search(samples, combos, thresholds, primacy_weights)
+        result = _grid_search(
+            SampleMatrix.from_samples(samples), combos, thresholds, primacy_weights
+        )
+
+        assert result is not None
+        assert result.weights == expected[1]
+        assert result.threshold == expected[2]
+        assert result.primacy_weight == expected[3]
+        assert result.metrics == expected[4]
+
+    def test_chunking_and_workers_do_not_change_result(self):
+        """Small chunks evaluated on several threads give the same answer."""
+        matrix = SampleMatrix.from_samples(_random_samples(200))
+        combos = _generate_constrained_combinations(DEFAULT_WEIGHTS, max_change=10.0, step=5.0)
+        pillars = list(DEFAULT_WEIGHTS)
+        mask = matrix.eligible(pillars)
+        args = (matrix.columns(pillars)[mask], matrix.actuals[mask], combos, pillars, [40, 50])
+
+        whole = _grid_search_arrays(*args, primacy_scores=matrix.primacy[mask])
+        chunked = _grid_search_arrays(
+            *args, primacy_scores=matrix.primacy[mask], chunk_elements=500, workers=4
+        )
+
+        assert whole is not None and chunked is not None
+        assert chunked.weights == whole.weights
+        assert chunked.threshold == whole.threshold
+        assert chunked.metrics == whole.metrics
+
+    def test_ties_go_to_first_candidate(self):
+        """Identical candidates resolve to the first one, across chunks."""
+        matrix = SampleMatrix.from_samples(_random_samples(100))
+        pillars = list(DEFAULT_WEIGHTS)
+        mask = matrix.eligible(pillars)
+        first = dict(DEFAULT_WEIGHTS)
+        duplicate = dict(DEFAULT_WEIGHTS)
+
+        result = _grid_search_arrays(
+            matrix.columns(pillars)[mask],
+            matrix.actuals[mask],
+            [first, duplicate],
+            pillars,
+            [50, 50],
+            chunk_elements=1,
+        )
+
+        assert result is not None
+        assert result.weights is first
+
+    def test_empty_matrix(self):
+        """No samples means no result and empty metrics."""
+        matrix = SampleMatrix.from_samples([])
+        assert _grid_search(matrix, [DEFAULT_WEIGHTS], [50]) is None
+        assert _evaluate_weights(matrix, DEFAULT_WEIGHTS).total == 0
+
+    def test_threshold_accuracies_match_scalar(self):
+        """Vectorized threshold accuracy equals _calculate_threshold_accuracy."""
+        samples = _random_samples(300)
+        pairs = [(0.7, 0.3), (0.5, 0.15), (0.9, 0.5), (0.55, 0.5)]
+
+        accuracies = _threshold_accuracies(*_answerability_arrays(samples), pairs)
+
+        for (fully, partially), accuracy in zip(pairs, accuracies, strict=True):
+            expected = _calculate_threshold_accuracy(
+                samples, {"fully_answerable": fully, "partially_answerable": partially}
+            )
+            assert accuracy == expected
+
+    def test_optimizer_workers_do_not_change_result(self):
+        """The full optimization is deterministic across worker counts."""
+        samples = _random_samples(250)
+        kwargs = {"min_samples": 100, "coarse_then_fine": False, "max_weight_change": 5.0}
+
+        single = _optimize_weights_for_samples(samples, workers=1, **kwargs)
+        threaded = _optimize_weights_for_samples(samples, workers=3, **kwargs)
+
+        assert single.errors == []
+        assert threaded.to_dict() == single.to_dict()
+
+
 # ============================================================================
 # Test Adjacent Levels
 # ============================================================================
@@ -0,0 +1,136 @@
+"""Tests for parallel per-page analysis."""
+
+import pickle
+from datetime import UTC, datetime
+
+import pytest
+
+from worker.crawler.crawler import CrawlPage
+from worker.extraction.extractor import ContentExtractor
+from worker.tasks.page_analysis import (
+    PageAnalysisConfig,
+    PageAnalysisExecutor,
+    analyze_page,
+)
+from worker.tasks.schema_check import run_schema_checks_sync
+from worker.tasks.structure_check import run_structure_checks_sync
+
+BODY = " ".join(["Example builds reliable software for growing teams."] * 10)
+
+
+def _page(path: str, html: str | None = None) -> CrawlPage:
+    url = f"https://example.com{path}"
+    if html is None:
+        html = (
+            f"<html><head><title>{path}</title>"
+            '<script type="application/ld+json">{"@type": "Organization"}</script>'
+            f"</head><body><main><h1>Page {path}</h1><p>{BODY}</p>"
+            '<a href="/other">Other</a></main></body></html>'
+        )
+    return CrawlPage(
+        url=url,
+        final_url=url,
+        title=path,
+        html=html,
+        content_type="text/html",
+        status_code=200,
+        depth=0 if path == "/" else 1,
+        fetch_time_ms=0,
+        fetched_at=datetime.now(UTC),
+        links_found=1,
+    )
+
+
+PAGES = [_page("/"), _page("/about"), _page("/empty", html=""), _page("/blog/post")]
+
+
+class TestAnalyzePage:
+    """Tests for analyze_page."""
+
+    def test_matches_individual_checks(self) -> None:
+        page = _page("/about")
+        result = analyze_page(page, 1)
+
+        extracted = ContentExtractor().extract_page(page)
+        assert result.extracted is not None and extracted is not None
+        assert result.extracted.main_content == extracted.main_content
+        assert result.schema.to_dict() == run_schema_checks_sync(page.html, page.url).to_dict()
+        assert (
+            result.structure.to_dict()
+            == run_structure_checks_sync(
+                page.html, page.url, extracted.main_content, extracted.word_count
+            ).to_dict()
+        )
+        assert result.authority is not None
+        assert result.js is None
+        assert result.errors == {}
+
+    def test_js_only_when_requested(self) -> None:
+        assert analyze_page(_page("/"), 0, detect_js=True).js is not None
+
+    def test_page_without_html(self) -> None:
+        result = analyze_page(_page("/empty", html=""), 2)
+
+        assert result.extracted is None
+        assert result.schema is None
+
+    def test_result_is_picklable(self) -> None:
+        result = analyze_page(_page("/"), 0, detect_js=True)
+
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored.schema.to_dict() == result.schema.to_dict()
+
+
+class TestPageAnalysisExecutor:
+    """Tests for PageAnalysisExecutor."""
+
+    def test_uses_processes_for_large_crawls(self) -> None:
+        executor = PageAnalysisExecutor(PageAnalysisConfig(workers=4, min_pages_for_pool=10))
+
+        assert not executor.uses_processes(9)
+        assert executor.uses_processes(10)
+        assert not PageAnalysisExecutor(PageAnalysisConfig(workers=1)).uses_processes(100)
+
+    @pytest.mark.asyncio
+    async def test_thread_and_process_results_match(self) -> None:
+        in_process = PageAnalysisExecutor(PageAnalysisConfig(workers=1))
+        pooled = PageAnalysisExecutor(PageAnalysisConfig(workers=2, min_pages_for_pool=1))
+
+        serial = await in_process.analyze_pages(PAGES)
+        try:
+            parallel = await pooled.analyze_pages(PAGES)
+        finally:
+            pooled.shutdown()
+
+        assert [r.index for r in parallel] == [0, 1, 2, 3]
+        assert [r.url for r in parallel] == [p.url for p in PAGES]
+        for a, b in zip(serial, parallel, strict=True):
+            assert (a.schema and a.schema.to_dict()) == (b.schema and b.schema.to_dict())
+            assert (a.structure and a.structure.to_dict()) == (
+                b.structure and b.structure.to_dict()
+            )
+        # JS detection runs on the homepage only
+        assert [r.js is not None for r in parallel] == [True, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_reports_progress(self) -> None:
+        calls: list[tuple[int, int]] = []
+
+        async def progress(done: int, total: int) -> None:
+            calls.append((done, total))
+
+        executor = PageAnalysisExecutor(PageAnalysisConfig(workers=1, progress_interval_seconds=0))
+        await executor.analyze_pages(PAGES, progress_callback=progress)
+
+        assert calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    @pytest.mark.asyncio
+    async def test_results_summarize_into_extraction_result(self) -> None:
+        results = await PageAnalysisExecutor(PageAnalysisConfig(workers=1)).analyze_pages(PAGES)
+
+        summary = ContentExtractor.summarize("example.com", [r.extracted for r in results])
+
+        assert summary.total_pages == 3
+        assert summary.extraction_errors == 1
+        assert summary.schema_types_found == ["Organization"]
@@ -0,0 +1,220 @@
+"""Tests for streaming crawl-to-embedding processing."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from worker.chunking.chunker import SemanticChunker
+from worker.crawler.crawler import CrawlPage, CrawlResult
+from worker.embeddings.embedder import Embedder
+from worker.embeddings.models import MODELS, MockEmbeddingModel
+from worker.tasks.page_analysis import PageAnalysisConfig, PageAnalysisExecutor
+from worker.tasks.page_stream import PageStream, PageStreamConfig
+
+BODY = " ".join(["Example builds reliable software for growing teams."] * 10)
+
+
+def _page(path: str, html: str | None = None) -> CrawlPage:
+    url = f"https://example.com{path}"
+    if html is None:
+        html = (
+            f"<html><head><title>{path}</title></head><body><main>"
+            f"<h1>Page {path}</h1><p>{BODY}</p></main></body></html>"
+        )
+    return CrawlPage(
+        url=url,
+        final_url=url,
+        title=path,
+        html=html,
+        content_type="text/html",
+        status_code=200,
+        depth=0 if path == "/" else 1,
+        fetch_time_ms=0,
+        fetched_at=datetime.now(UTC),
+        links_found=0,
+    )
+
+
+def _result(pages: list[CrawlPage]) -> CrawlResult:
+    now = datetime.now(UTC)
+    return CrawlResult(
+        domain="example.com",
+        start_url="https://example.com/",
+        pages=pages,
+        urls_discovered=len(pages),
+        urls_crawled=len(pages),
+        urls_skipped=0,
+        urls_failed=0,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=0.0,
+        robots_respected=True,
+        max_depth_reached=1,
+    )
+
+
+def _embedder() -> Embedder:
+    return Embedder(model=MockEmbeddingModel(MODELS["mock"]))
+
+
+def _chunk(result):
+    extracted = result.extracted
+    return SemanticChunker().chunk_text(
+        text=extracted.main_content, url=extracted.url, title=extracted.title
+    )
+
+
+def _stream(config: PageStreamConfig | None = None, workers: int = 2) -> PageStream:
+    return PageStream(
+        analyzer=PageAnalysisExecutor(PageAnalysisConfig(workers=workers, min_pages_for_pool=99)),
+        chunk=_chunk,
+        embedder_factory=_embedder,
+        start_url="https://example.com/",
+        config=config,
+    )
+
+
+def _streaming_crawl(pages: list[CrawlPage], delay: float = 0.0):
+    async def crawl(page_callback):
+        for page in pages:
+            await asyncio.sleep(delay)
+            await page_callback(page)
+        return _result(pages)
+
+    return crawl
+
+
+PATHS = ["/", "/about", "/empty", "/blog/a", "/blog/b", "/blog/c"]
+
+
+def _pages() -> list[CrawlPage]:
+    return [_page(path, html="" if path == "/empty" else None) for path in PATHS]
+
+
+class TestPageStream:
+    """Tests for PageStream."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_crawl_order(self) -> None:
+        pages = _pages()
+
+        streamed = await _stream().run(_streaming_crawl(pages))
+
+        assert [r.url for r in streamed.page_results] == [p.url for p in pages]
+        assert [r.index for r in streamed.page_results] == list(range(len(pages)))
+        # The empty page has no content to chunk or embed
+        assert len(streamed.chunked_pages) == len(pages) - 1
+        assert [p.url for p in streamed.embedded_pages] == [p.url for p in streamed.chunked_pages]
+        assert streamed.page_results[0].js is not None
+
+    @pytest.mark.asyncio
+    async def test_matches_batch_processing(self) -> None:
+        pages = _pages()
+        streamed = await _stream().run(_streaming_crawl(pages))
+
+        batch = await PageAnalysisExecutor(PageAnalysisConfig(workers=1)).analyze_pages(_pages())
+        chunked = [_chunk(r) for r in batch if r.extracted is not None]
+        embedded = _embedder().embed_pages(chunked)
+
+        assert [r.extracted and r.extracted.main_content for r in streamed.page_results] == [
+            r.extracted and r.extracted.main_content for r in batch
+        ]
+        assert [c.to_dict() for c in streamed.chunked_pages] == [c.to_dict() for c in chunked]
+        assert [len(e.embeddings) for e in streamed.embedded_pages] == [
+            len(e.embeddings) for e in embedded
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queue_bounds_pages_in_flight(self) -> None:
+        pages = [_page(f"/p{i}") for i in range(20)]
+
+        streamed = await _stream(PageStreamConfig(queue_size=2), workers=1).run(
+            _streaming_crawl(pages)
+        )
+
+        assert len(streamed.pages) == 20
+        assert streamed.max_queued <= 2
+
+    @pytest.mark.asyncio
+    async def test_release_html_after_analysis(self) -> None:
+        pages = _pages()
+
+        streamed = await _stream(PageStreamConfig(release_html=True)).run(_streaming_crawl(pages))
+
+        assert all(page.html == "" for page in pages)
+        assert streamed.page_results[1].extracted is not None
+
+    @pytest.mark.asyncio
+    async def test_pages_returned_without_callback_are_processed(self) -> None:
+        pages = _pages()
+
+        async def cached_crawl(page_callback):
+            return _result(pages)
+
+        streamed = await _stream().run(cached_crawl)
+
+        assert [r.url for r in streamed.page_results] == [p.url for p in pages]
+        assert len(streamed.embedded_pages) == len(pages) - 1
+
+    @pytest.mark.asyncio
+    async def test_consumer_failure_stops_the_crawl(self) -> None:
+        crawl_cancelled = asyncio.Event()
+
+        def failing_chunk(result):
+            raise RuntimeError("chunking failed")
+
+        stream = _stream()
+        stream.chunk = failing_chunk
+
+        async def endless_crawl(page_callback):
+            try:
+                for i in range(1000):
+                    await page_callback(_page(f"/p{i}"))
+                    await asyncio.sleep(0.01)
+            except asyncio.CancelledError:
+                crawl_cancelled.set()
+                raise
+            return _result([])
+
+        with pytest.raises(RuntimeError, match="chunking failed"):
+            await asyncio.wait_for(stream.run(endless_crawl), timeout=5)
+        assert crawl_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_waits_without_spinning_during_a_slow_crawl(self) -> None:
+        async def slow_crawl(page_callback):
+            await asyncio.sleep(0.3)
+            await page_callback(_page("/"))
+            await asyncio.sleep(0.3)
+            return _result([])
+
+        with patch("asyncio.wait", wraps=asyncio.wait) as wait:
+            await _stream().run(slow_crawl)
+
+        # Woken when the crawl ends, not once per loop tick
+        assert wait.call_count <= 3
+
+    @pytest.mark.asyncio
+    async def test_crawl_failure_propagates(self) -> None:
+        async def failing_crawl(page_callback):
+            raise ConnectionError("Connection refused")
+
+        with pytest.raises(ConnectionError):
+            await _stream().run(failing_crawl)
+
+    @pytest.mark.asyncio
+    async def test_crawl_failure_wins_over_embedder_failure(self) -> None:
+        def missing_model() -> Embedder:
+            raise ImportError("sentence-transformers not installed")
+
+        async def failing_crawl(page_callback):
+            await asyncio.sleep(0.05)
+            raise ConnectionError("Connection refused")
+
+        stream = _stream()
+        stream.embedder_factory = missing_model
+
+        with pytest.raises(ConnectionError):
+            await stream.run(failing_crawl)
@@ -0,0 +1,356 @@
+"""Tests for the run progress bus."""
+
+import asyncio
+import time
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from worker.progress import (
+    RUN_PROGRESS_CHANNEL,
+    ProgressCheckpointer,
+    ProgressHub,
+    RunProgressEvent,
+    get_run_progress,
+    publish_run_progress,
+    watch_run,
+)
+
+
+class FakePubSub:
+    """In-memory pub/sub subscription."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._messages: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._redis.subscribers.setdefault(channel, []).append(self)
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self._messages.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        for subs in self._redis.subscribers.values():
+            if self in subs:
+                subs.remove(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        self._commands.append(("set", args, kwargs))
+
+    def publish(self, *args: Any) -> None:
+        self._commands.append(("publish", args, {}))
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the progress bus."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.subscribers: dict[str, list[FakePubSub]] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def publish(self, channel: str, data: bytes) -> int:
+        subs = self.subscribers.get(channel, [])
+        for sub in subs:
+            sub._messages.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(subs)
+
+
+class BrokenRedis(FakeRedis):
+    """Redis that is down."""
+
+    def pubsub(self) -> FakePubSub:
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
+
+
+class TestProgressCheckpointer:
+    """Tests for coalescing database writes."""
+
+    def test_ticks_within_a_step_are_coalesced(self) -> None:
+        checkpoints = ProgressCheckpointer(interval_seconds=60)
+
+        checkpoints.update("r", "crawling", {"pages_crawled": 0})
+        assert checkpoints.is_due("r", "crawling")
+        assert checkpoints.take_pending("r") == {"pages_crawled": 0, "current_step": "crawling"}
+        checkpoints.mark_written("r", "crawling")
+
+        checkpoints.update("r", "crawling", {"pages_crawled": 5})
+        progress = checkpoints.update("r", "crawling", {"pages_crawled": 9})
+        assert progress["pages_crawled"] == 9
+        assert not checkpoints.is_due("r", "crawling")
+
+        # A new step is written straight away, with the skipped ticks
+        checkpoints.update("r", "extracting", {"pages_to_extract": 9})
+        assert checkpoints.is_due("r", "extracting")
+        assert checkpoints.take_pending("r") == {
+            "pages_crawled": 9,
+            "pages_to_extract": 9,
+            "current_step": "extracting",
+        }
+
+    def test_interval_and_terminal_statuses(self) -> None:
+        checkpoints = ProgressCheckpointer(interval_seconds=0)
+        checkpoints.update("r", "crawling", {"pages_crawled": 1})
+        checkpoints.mark_written("r", "crawling")
+        assert checkpoints.is_due("r", "crawling")
+
+        checkpoints.interval_seconds = 60
+        assert checkpoints.is_due("r", "failed")
+        checkpoints.mark_written("r", "failed")
+        assert checkpoints.discard("r") == {}
+
+
+class TestPublish:
+    """Tests for publishing and reading events."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, redis: FakeRedis) -> None:
+        event = RunProgressEvent(run_id="r1", status="crawling", progress={"pages_crawled": 3})
+
+        assert await publish_run_progress(event, redis)
+        latest = await get_run_progress("r1", redis)
+
+        assert latest == event
+        assert await get_run_progress("other", redis) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_not_raised(self) -> None:
+        redis = MagicMock()
+        redis.pipeline.side_effect = ConnectionError("down")
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        event = RunProgressEvent(run_id="r1", status="crawling")
+
+        assert not await publish_run_progress(event, redis)
+        assert await get_run_progress("r1", redis) is None
+
+
+class TestProgressHub:
+    """Tests for fanning events out to subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_to_run_subscribers(self, redis: FakeRedis) -> None:
+        hub = ProgressHub(redis=redis)
+        try:
+            async with hub.subscribe("r1") as first, hub.subscribe("r2") as second:
+                assert await hub.wait_connected(timeout=1)
+                assert len(redis.subscribers[RUN_PROGRESS_CHANNEL]) == 1
+
+                await publish_run_progress(RunProgressEvent("r1", "crawling"), redis)
+
+                event = await first.next(timeout=1)
+                assert event is not None
+                assert event.status == "crawling"
+                assert await second.next(timeout=0.05) is None
+                assert hub.subscriber_count == 2
+            assert hub.subscriber_count == 0
+        finally:
+            await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_latest_undelivered_event(self) -> None:
+        hub = ProgressHub(redis=FakeRedis())
+        async with hub.subscribe("r1") as subscription:
+            hub.dispatch(RunProgressEvent("r1", "crawling"))
+            hub.dispatch(RunProgressEvent("r1", "extracting"))
+
+            event = await subscription.next(timeout=1)
+            assert event is not None
+            assert event.status == "extracting"
+            assert await subscription.next(timeout=0.01) is None
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_listener(self, redis: FakeRedis) -> None:
+        hub = ProgressHub(redis=redis)
+        assert await hub.wait_connected(timeout=1)
+        # A message is ready when close() cancels the listener
+        await publish_run_progress(RunProgressEvent("r1", "crawling"), redis)
+
+        await asyncio.wait_for(hub.close(), timeout=5)
+
+        assert not hub.connected
+
+    @pytest.mark.asyncio
+    async def test_not_connected_when_redis_is_down(self) -> None:
+        hub = ProgressHub(redis=BrokenRedis(), reconnect_delay=0.01)
+        try:
+            assert not await hub.wait_connected(timeout=0.1)
+        finally:
+            await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_no_listener_when_bus_disabled(self) -> None:
+        hub = ProgressHub()
+        with patch("worker.progress._bus_enabled", return_value=False):
+            async with hub.subscribe("r1"):
+                assert not await hub.wait_connected(timeout=1)
+                assert hub._task is None
+                assert hub.subscriber_count == 1
+        await hub.close()
+
+
+class TestWatchRun:
+    """Tests for watch_run."""
+
+    @pytest.mark.asyncio
+    async def test_streams_events_until_complete(self, redis: FakeRedis) -> None:
+        hub = ProgressHub(redis=redis)
+        reload = AsyncMock()
+        initial = RunProgressEvent("r1", "queued")
+
+        async def worker() -> None:
+            await hub.wait_connected(timeout=1)
+            for status in ("crawling", "extracting"):
+                await asyncio.sleep(0.02)
+                await publish_run_progress(RunProgressEvent("r1", status), redis)
+            await asyncio.sleep(0.02)
+            await publish_run_progress(RunProgressEvent("r1", "complete", report_id="x"), redis)
+
+        try:
+            task = asyncio.create_task(worker())
+            states = [s async for s in watch_run("r1", initial, reload, max_seconds=5, hub=hub)]
+            await task
+        finally:
+            await hub.close()
+
+        assert [s.status for s in states] == ["queued", "crawling", "extracting", "complete"]
+        assert states[-1].report_id == "x"
+        reload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_starts_from_latest_published_state(self, redis: FakeRedis) -> None:
+        hub = ProgressHub(redis=redis)
+        await publish_run_progress(RunProgressEvent("r1", "crawling", {"pages_crawled": 7}), redis)
+        initial = RunProgressEvent("r1", "crawling", {"pages_crawled": 0})
+
+        try:
+            states = [
+                s async for s in watch_run("r1", initial, AsyncMock(), max_seconds=0.05, hub=hub)
+            ]
+        finally:
+            await hub.close()
+
+        assert [s.progress for s in states] == [{"pages_crawled": 7}]
+
+    @pytest.mark.asyncio
+    async def test_polls_database_without_bus(self) -> None:
+        hub = ProgressHub(redis=BrokenRedis(), reconnect_delay=0.01)
+        reload = AsyncMock(
+            side_effect=[
+                RunProgressEvent("r1", "crawling"),
+                RunProgressEvent("r1", "failed", error_message="boom"),
+            ]
+        )
+        initial = RunProgressEvent("r1", "queued")
+
+        try:
+            states = [
+                s
+                async for s in watch_run(
+                    "r1", initial, reload, max_seconds=5, poll_interval=0.01, hub=hub
+                )
+            ]
+        finally:
+            await hub.close()
+
+        assert [s.status for s in states] == ["queued", "crawling", "failed"]
+        assert states[-1].error_message == "boom"
+
+
+class TestUpdateRunStatus:
+    """Tests for coalesced status writes in the audit task."""
+
+    @pytest.mark.asyncio
+    async def test_progress_ticks_are_checkpointed(self) -> None:
+        from worker.tasks import audit
+
+        run = MagicMock(progress={}, started_at=None)
+        db = AsyncMock()
+        db.execute.return_value.scalar_one_or_none = MagicMock(return_value=run)
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=db)
+        session.__aexit__ = AsyncMock(return_value=None)
+        run_id = uuid.uuid4()
+        published: list[RunProgressEvent] = []
+
+        async def publish(event: RunProgressEvent) -> bool:
+            published.append(event)
+            return True
+
+        with (
+            patch.object(audit, "publish_run_progress", side_effect=publish),
+            patch.object(audit, "async_session_maker", return_value=session),
+        ):
+            await audit.update_run_status(run_id, "crawling", {"pages_crawled": 0})
+            for pages in range(1, 6):
+                await audit.update_run_status(run_id, "crawling", {"pages_crawled": pages})
+            await audit.update_run_status(run_id, "complete")
+
+        assert len(published) == 7
+        assert published[-2].progress["pages_crawled"] == 5
+        # First tick and the terminal status; the ticks in between coalesce
+        assert db.commit.await_count == 2
+        assert run.progress["pages_crawled"] == 5
+        assert str(run_id) not in audit._progress_checkpoints._runs
+
+    @pytest.mark.asyncio
+    async def test_writes_every_update_when_publish_fails(self) -> None:
+        from worker.tasks import audit
+
+        run = MagicMock(progress={}, started_at=time.time())
+        db = AsyncMock()
+        db.execute.return_value.scalar_one_or_none = MagicMock(return_value=run)
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=db)
+        session.__aexit__ = AsyncMock(return_value=None)
+        run_id = uuid.uuid4()
+
+        with (
+            patch.object(audit, "publish_run_progress", AsyncMock(return_value=False)),
+            patch.object(audit, "async_session_maker", return_value=session),
+        ):
+            for pages in range(3):
+                await audit.update_run_status(run_id, "crawling", {"pages_crawled": pages})
+
+        assert db.commit.await_count == 3
+        audit._progress_checkpoints.discard(str(run_id))
@@ -0,0 +1,233 @@
+"""Tests for the shared rate limiter."""
+
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import NoScriptError
+
+from api import rate_limit
+from api.rate_limit import (
+    LocalRateLimiter,
+    RateLimiter,
+    SlidingWindow,
+    TokenBucket,
+)
+
+
+class FakePipeline:
+    """Queues EVALSHA calls and runs them against FakeRedis on execute."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._calls: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def evalsha(self, sha: str, numkeys: int, *args: Any) -> "FakePipeline":
+        self._calls.append((sha, numkeys, *args))
+        return self
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        self._redis.round_trips += 1
+        return [self._redis.run(*call) for call in self._calls]
+
+
+class FakeRedis:
+    """
+    Emulates the limiter's Lua scripts with the local implementation, so
+    the Redis code path (script loading, batching, reply parsing) is
+    exercised without a server.
+    """
+
+    def __init__(self) -> None:
+        self.loaded: set[str] = set()
+        self.round_trips = 0
+        self.calls: list[str] = []
+        self._state = LocalRateLimiter()
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def script_load(self, script: str) -> str:
+        self.round_trips += 1
+        sha = rate_limit._SCRIPT_SHAS[script]
+        self.loaded.add(sha)
+        return sha
+
+    def run(self, sha: str, numkeys: int, key: str, *args: Any) -> Any:
+        if sha not in self.loaded:
+            return NoScriptError("NOSCRIPT No matching script")
+        self.calls.append(key)
+        if sha == rate_limit._SCRIPT_SHAS[rate_limit.TOKEN_BUCKET_SCRIPT]:
+            rate, capacity, now, _cost = args
+            result = self._state.check(key, TokenBucket(rate, capacity), now)
+            tokens = self._state._state[key].tokens
+            return [int(result.allowed), str(tokens).encode()]
+        limit, window, now, _member = args
+        result = self._state.check(key, SlidingWindow(limit, window), now)
+        wait = 0 if result.allowed else self._state._state[key][0] + window - now
+        return [int(result.allowed), str(result.remaining).encode(), str(wait).encode()]
+
+
+class FailingRedis:
+    """Redis client whose every command fails."""
+
+    def pipeline(self, transaction: bool = True) -> Any:
+        raise RedisConnectionError("Connection refused")
+
+
+class TestLocalRateLimiter:
+    """Tests for the in-process fallback limiter."""
+
+    def test_token_bucket_allows_burst_then_denies(self) -> None:
+        limiter = LocalRateLimiter()
+        limit = TokenBucket(rate=1.0, capacity=3)
+
+        results = [limiter.check("k", limit, now=100.0) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert results[0].remaining == 2
+        assert results[3].retry_after == 1
+
+    def test_token_bucket_refills(self) -> None:
+        limiter = LocalRateLimiter()
+        limit = TokenBucket(rate=1.0, capacity=1)
+        assert limiter.check("k", limit, now=100.0).allowed
+        assert not limiter.check("k", limit, now=100.5).allowed
+
+        assert limiter.check("k", limit, now=101.5).allowed
+
+    def test_sliding_window(self) -> None:
+        limiter = LocalRateLimiter()
+        limit = SlidingWindow(limit=2, window_seconds=60)
+
+        assert limiter.check("k", limit, now=0.0).allowed
+        assert limiter.check("k", limit, now=10.0).allowed
+        denied = limiter.check("k", limit, now=20.0)
+
+        assert not denied.allowed
+        assert denied.retry_after == 40
+        assert limiter.check("k", limit, now=61.0).allowed
+
+    def test_state_is_bounded(self) -> None:
+        limiter = LocalRateLimiter(max_keys=2)
+        limit = TokenBucket(rate=1.0, capacity=1)
+
+        limiter.check("a", limit, now=0.0)
+        limiter.check("b", limit, now=0.0)
+        limiter.check("a", limit, now=0.0)  # "a" is now most recently used
+        limiter.check("c", limit, now=0.0)
+
+        assert len(limiter) == 2
+        # "b" was evicted, so it starts with a full bucket again
+        assert limiter.check("b", limit, now=0.0).allowed
+        assert not limiter.check("c", limit, now=0.0).allowed
+
+
+class TestRateLimiter:
+    """Tests for the Redis-backed limiter."""
+
+    @pytest.mark.asyncio
+    async def test_checks_are_batched_in_one_round_trip(self) -> None:
+        redis = FakeRedis()
+        redis.loaded = set(rate_limit._SCRIPT_SHAS.values())
+        limiter = RateLimiter(redis=redis, prefix="rl")
+
+        results = await limiter.check_many(
+            [("a", TokenBucket(rate=1.0, capacity=5)), ("b", SlidingWindow(3, 60))]
+        )
+
+        assert redis.round_trips == 1
+        assert redis.calls == ["rl:a", "rl:b"]
+        assert [r.remaining for r in results] == [4, 2]
+
+    @pytest.mark.asyncio
+    async def test_loads_scripts_on_noscript(self) -> None:
+        redis = FakeRedis()
+        limiter = RateLimiter(redis=redis)
+
+        result = await limiter.check("a", TokenBucket(rate=1.0, capacity=5))
+
+        assert result.allowed
+        assert redis.loaded == {rate_limit._SCRIPT_SHAS[rate_limit.TOKEN_BUCKET_SCRIPT]}
+        # Only the call that hit NOSCRIPT is rerun, so it is charged once
+        assert redis.calls == ["findable:ratelimit:a"]
+
+    @pytest.mark.asyncio
+    async def test_denial_reports_retry_after(self) -> None:
+        redis = FakeRedis()
+        limiter = RateLimiter(redis=redis)
+        limit = SlidingWindow(limit=1, window_seconds=3600)
+
+        assert (await limiter.check("a", limit)).allowed
+        denied = await limiter.check("a", limit)
+
+        assert not denied.allowed
+        assert 3500 < denied.retry_after <= 3600
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_limits(self) -> None:
+        local = LocalRateLimiter()
+        limiter = RateLimiter(redis=FailingRedis(), local=local)
+        limit = SlidingWindow(limit=1, window_seconds=60)
+
+        assert (await limiter.check("a", limit)).allowed
+        assert not (await limiter.check("a", limit)).allowed
+        assert len(local) == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_falls_back_without_stalling(self) -> None:
+        settings = MagicMock(
+            redis_url="redis://localhost:6379/0",
+            rate_limit_redis_max_connections=1,
+            rate_limit_redis_timeout_seconds=0.05,
+        )
+        local = LocalRateLimiter()
+        limiter = RateLimiter(local=local)
+        with patch("api.config.get_settings", return_value=settings):
+            pool = limiter._client().connection_pool
+        # Every connection in the limiter's pool is checked out
+        held = pool.get_available_connection()
+        try:
+            start = time.monotonic()
+            result = await limiter.check("a", TokenBucket(rate=1.0, capacity=5))
+            elapsed = time.monotonic() - start
+        finally:
+            await pool.release(held)
+            await limiter.close()
+
+        assert result.allowed
+        assert len(local) == 1
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_uses_its_own_pool(self) -> None:
+        from worker.redis import close_async_redis, get_async_redis_connection_bytes
+
+        settings = MagicMock(
+            redis_url="redis://localhost:6379/0",
+            rate_limit_redis_max_connections=20,
+            rate_limit_redis_timeout_seconds=0.25,
+        )
+        limiter = RateLimiter()
+        with (
+            patch("api.config.get_settings", return_value=settings),
+            patch("worker.redis.get_settings", return_value=settings),
+        ):
+            client = limiter._client()
+            try:
+                assert limiter._client() is client
+                assert client.connection_pool is not (
+                    get_async_redis_connection_bytes().connection_pool
+                )
+                assert client.connection_pool.max_connections == 20
+            finally:
+                await limiter.close()
+                await close_async_redis()
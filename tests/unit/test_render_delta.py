@@ -1,12 +1,109 @@
 """Tests for render delta detection."""
 
+import asyncio
+import time
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from worker.crawler.fetcher import FetchResult
 from worker.crawler.render import (
+    PageRenderer,
     RenderDelta,
+    RenderDeltaDetector,
     RendererConfig,
     RenderMode,
     _jaccard_similarity,
 )
 
+STATIC_HTML = "<html><body><main><p>Short static shell.</p></main></body></html>"
+RENDERED_HTML = (
+    "<html><body><main><p>"
+    + " ".join(["Rendered product details for customers."] * 30)
+    + "</p></main></body></html>"
+)
+
+
+class FakePage:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def goto(self, url, timeout, wait_until):
+        await asyncio.sleep(self.delay)
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def content(self):
+        return RENDERED_HTML
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.routes = []
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def new_page(self):
+        return FakePage(self.delay)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.contexts: list[FakeContext] = []
+        self.closed = False
+
+    async def new_context(self, viewport):
+        context = FakeContext(self.delay)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self, delay: float):
+        self.launches = 0
+        self.stopped = False
+        self.browser = FakeBrowser(delay)
+        self.chromium = self
+
+    async def launch(self, headless):
+        self.launches += 1
+        return self.browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+class FakeFetcher:
+    async def fetch(self, url):
+        return FetchResult(
+            url=url,
+            final_url=url,
+            status_code=200,
+            content_type="text/html",
+            html=STATIC_HTML,
+            error=None,
+            fetch_time_ms=0,
+            fetched_at=datetime.now(UTC),
+        )
+
 
 class TestJaccardSimilarity:
     """Tests for Jaccard similarity calculation."""
@@ -269,3 +366,129 @@ class TestMajorityVoting:
         mode = RenderMode.RENDERED if needs_rendering_count > len(deltas) / 2 else RenderMode.STATIC
 
         assert mode == RenderMode.STATIC
+
+
+class TestPageRendererPool:
+    """Tests for the browser context pool (with a fake Playwright driver)."""
+
+    @pytest.mark.asyncio
+    async def test_renders_concurrently_on_one_browser(self) -> None:
+        driver = FakePlaywright(delay=0.1)
+        config = RendererConfig(contexts=3, wait_for_load=0)
+
+        with patch("worker.crawler.render.async_playwright", return_value=driver):
+            async with PageRenderer(config) as renderer:
+                start = time.perf_counter()
+                results = await asyncio.gather(
+                    *(renderer.render_page(f"https://example.com/{i}") for i in range(3))
+                )
+                elapsed = time.perf_counter() - start
+
+        assert all(html == RENDERED_HTML and error is None for html, error in results)
+        assert elapsed < 0.25
+        assert driver.launches == 1
+        assert len(driver.browser.contexts) == 3
+        assert renderer.metrics.renders == 3
+        assert renderer.metrics.peak_in_use == 3
+        # Stopping closes the contexts, the browser and the driver
+        assert all(context.closed for context in driver.browser.contexts)
+        assert driver.browser.closed and driver.stopped
+
+    @pytest.mark.asyncio
+    async def test_renders_wait_for_a_free_context(self) -> None:
+        driver = FakePlaywright(delay=0.05)
+        config = RendererConfig(contexts=1, wait_for_load=0)
+
+        with patch("worker.crawler.render.async_playwright", return_value=driver):
+            async with PageRenderer(config) as renderer:
+                await asyncio.gather(
+                    *(renderer.render_page(f"https://example.com/{i}") for i in range(2))
+                )
+
+        assert renderer.metrics.peak_in_use == 1
+        assert renderer.metrics.context_wait_seconds >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_blocks_heavy_resources(self) -> None:
+        renderer = PageRenderer(RendererConfig())
+        calls = []
+
+        class FakeRoute:
+            def __init__(self, resource_type):
+                self.request = type("Request", (), {"resource_type": resource_type})()
+
+            async def abort(self):
+                calls.append(("abort", self.request.resource_type))
+
+            async def continue_(self):
+                calls.append(("continue", self.request.resource_type))
+
+        for resource_type in ("image", "font", "media", "document", "script"):
+            await renderer._route(FakeRoute(resource_type))
+
+        assert calls == [
+            ("abort", "image"),
+            ("abort", "font"),
+            ("abort", "media"),
+            ("continue", "document"),
+            ("continue", "script"),
+        ]
+        assert renderer.metrics.requests_blocked == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_launch_stops_the_driver(self) -> None:
+        driver = FakePlaywright(delay=0)
+
+        async def failing_launch(headless):
+            raise RuntimeError("no browser")
+
+        driver.launch = failing_launch
+
+        with (
+            patch("worker.crawler.render.async_playwright", return_value=driver),
+            pytest.raises(RuntimeError),
+        ):
+            await PageRenderer().start()
+
+        assert driver.stopped
+
+
+class TestDetectSiteMode:
+    """Tests for concurrent sampling in RenderDeltaDetector."""
+
+    @pytest.mark.asyncio
+    async def test_samples_render_concurrently_on_a_shared_renderer(self) -> None:
+        driver = FakePlaywright(delay=0.1)
+        config = RendererConfig(contexts=3, wait_for_load=0, sample_count=3)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        with patch("worker.crawler.render.async_playwright", return_value=driver):
+            detector = RenderDeltaDetector(config=config, fetcher=FakeFetcher())
+            start = time.perf_counter()
+            mode, deltas = await detector.detect_site_mode(urls)
+            elapsed = time.perf_counter() - start
+
+        assert mode == RenderMode.RENDERED
+        assert [d.detection_url for d in deltas] == urls[:3]
+        assert elapsed < 0.25
+        assert driver.launches == 1
+        assert driver.stopped
+
+    @pytest.mark.asyncio
+    async def test_long_lived_renderer_is_not_stopped(self) -> None:
+        driver = FakePlaywright(delay=0)
+        config = RendererConfig(wait_for_load=0)
+
+        with patch("worker.crawler.render.async_playwright", return_value=driver):
+            async with PageRenderer(config) as renderer:
+                detector = RenderDeltaDetector(
+                    config=config, fetcher=FakeFetcher(), renderer=renderer
+                )
+                await detector.detect_site_mode(["https://example.com/"])
+                await detector.detect_site_mode(["https://example.com/about"])
+
+                assert not driver.stopped
+
+        assert driver.launches == 1
+        assert renderer.metrics.renders == 2
+        assert driver.stopped
@@ -0,0 +1,153 @@
+"""Tests for the score page artifact cache."""
+
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from worker.reports.artifacts import (
+    OG_IMAGE_ARTIFACT,
+    SCORE_PAGE_ARTIFACT,
+    ArtifactCache,
+    publish_score_artifacts,
+    render_score_page,
+    score_page_context,
+)
+
+REPORT_DATA = {
+    "score": {
+        "v2": {
+            "total_score": 72.4,
+            "level_label": "Strong",
+            "pillars": [],
+        }
+    },
+    "fixes": {"items": [{"title": f"Fix {i}"} for i in range(5)]},
+}
+
+
+class FakeS3:
+    """In-memory stand-in for a boto3 S3 client."""
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> None:  # noqa: N803
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+class TestArtifactCache:
+    """Tests for ArtifactCache."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path)
+
+        artifact = cache.put("550e8400e29b", OG_IMAGE_ARTIFACT, b"png-bytes")
+
+        assert artifact.digest == hashlib.sha256(b"png-bytes").hexdigest()
+        assert artifact.etag == f'"{artifact.digest}"'
+        assert cache.digest("550e8400e29b", OG_IMAGE_ARTIFACT) == artifact.digest
+        assert cache.get("550e8400e29b", OG_IMAGE_ARTIFACT) == artifact
+        assert cache.get("550e8400e29b", "missing.html") is None
+
+    def test_identical_content_is_stored_once(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path)
+
+        cache.put("aaaaaaaaaaaa", OG_IMAGE_ARTIFACT, b"same")
+        cache.put("bbbbbbbbbbbb", OG_IMAGE_ARTIFACT, b"same")
+
+        blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+        assert len(blobs) == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ArtifactCache(tmp_path, max_bytes=250)
+        cache.put("aaaaaaaaaaaa", OG_IMAGE_ARTIFACT, b"a" * 100)
+        cache.put("bbbbbbbbbbbb", OG_IMAGE_ARTIFACT, b"b" * 100)
+        # Touch "a" so "b" is the least recently used
+        old = time.time() - 60
+        os.utime(cache._ref_path("aaaaaaaaaaaa", OG_IMAGE_ARTIFACT), (old, old))
+        os.utime(cache._ref_path("bbbbbbbbbbbb", OG_IMAGE_ARTIFACT), (old - 60, old - 60))
+        assert cache.get("aaaaaaaaaaaa", OG_IMAGE_ARTIFACT) is not None
+
+        cache.put("cccccccccccc", OG_IMAGE_ARTIFACT, b"c" * 100)
+
+        assert cache.get("bbbbbbbbbbbb", OG_IMAGE_ARTIFACT) is None
+        assert cache.get("aaaaaaaaaaaa", OG_IMAGE_ARTIFACT) is not None
+        assert cache.get("cccccccccccc", OG_IMAGE_ARTIFACT) is not None
+        blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+        assert len(blobs) == 2
+
+    def test_s3_tier_fills_local_misses(self, tmp_path: Path) -> None:
+        s3 = FakeS3()
+        writer = ArtifactCache(tmp_path / "worker", s3_client=s3, bucket="b")
+        reader = ArtifactCache(tmp_path / "api", s3_client=s3, bucket="b")
+
+        written = writer.put("550e8400e29b", OG_IMAGE_ARTIFACT, b"png-bytes")
+
+        assert reader.digest("550e8400e29b", OG_IMAGE_ARTIFACT) is None
+        assert reader.get("550e8400e29b", OG_IMAGE_ARTIFACT) == written
+        # Copied locally for the next request
+        assert reader.digest("550e8400e29b", OG_IMAGE_ARTIFACT) == written.digest
+
+    def test_s3_errors_are_not_raised(self, tmp_path: Path) -> None:
+        class BrokenS3(FakeS3):
+            def put_object(self, **kwargs: Any) -> None:
+                raise ConnectionError("down")
+
+        cache = ArtifactCache(tmp_path, s3_client=BrokenS3(), bucket="b")
+
+        artifact = cache.put("550e8400e29b", OG_IMAGE_ARTIFACT, b"png-bytes")
+
+        assert cache.get("550e8400e29b", OG_IMAGE_ARTIFACT) == artifact
+
+
+class TestRendering:
+    """Tests for score page rendering."""
+
+    def test_score_page_context(self) -> None:
+        context = score_page_context(REPORT_DATA, "example.com", "550e8400e29b", "https://x/")
+
+        assert context["score"] == 72
+        assert len(context["top_fixes"]) == 3
+        assert context["shareable_url"] == "https://x/score/550e8400e29b"
+        assert context["og_title"] == "Findable Score: 72/100 - example.com"
+
+    def test_render_score_page(self) -> None:
+        html = render_score_page(REPORT_DATA, "example.com", "550e8400e29b", "https://x/")
+
+        assert b"https://x/score/550e8400e29b/og.png" in html
+        assert b"example.com" in html
+
+    def test_publish_score_artifacts(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from api.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "public_base_url", "https://x")
+        cache = ArtifactCache(tmp_path)
+
+        publish_score_artifacts("550e8400e29b", REPORT_DATA, "example.com", cache=cache)
+
+        og = cache.get("550e8400e29b", OG_IMAGE_ARTIFACT)
+        assert og is not None and og.data.startswith(b"\x89PNG")
+        page = cache.get("550e8400e29b", SCORE_PAGE_ARTIFACT)
+        assert page is not None and b"https://x/score/550e8400e29b/og.png" in page.data
+
+    def test_publish_skipped_without_shared_tier(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from api.config import get_settings
+        from worker.reports import artifacts
+
+        monkeypatch.setattr(get_settings(), "score_artifacts_s3_enabled", False)
+        monkeypatch.setattr(artifacts, "render_og_image", MagicMock())
+
+        publish_score_artifacts("550e8400e29b", REPORT_DATA, "example.com")
+
+        artifacts.render_og_image.assert_not_called()
@@ -1,5 +1,9 @@
 """Tests for BM25 lexical search."""
 
+import math
+
+import pytest
+
 from worker.retrieval.bm25 import (
     BM25Config,
     BM25Document,
@@ -314,3 +318,105 @@ class TestBM25Index:
 
         assert len(results) == 1
         assert results[0].metadata["url"] == "https://example.com"
+
+
+def _reference_scores(docs: dict[str, str], query: str, config: BM25Config) -> dict[str, float]:
+    """Textbook BM25 over token lists, for comparison."""
+    tokenized = {doc_id: tokenize(text, config) for doc_id, text in docs.items()}
+    avgdl = sum(len(t) for t in tokenized.values()) / len(tokenized)
+    scores: dict[str, float] = {}
+    for token in tokenize(query, config):
+        containing = [doc_id for doc_id, tokens in tokenized.items() if token in tokens]
+        if not containing:
+            continue
+        df = len(containing)
+        idf = math.log((len(docs) - df + 0.5) / (df + 0.5) + 1.0)
+        for doc_id in containing:
+            tf = tokenized[doc_id].count(token)
+            dl = len(tokenized[doc_id])
+            norm = config.k1 * (1 - config.b + config.b * dl / avgdl)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (config.k1 + 1) / (tf + norm)
+    return scores
+
+
+CORPUS = {
+    "doc1": "Python programming language guide for beginners",
+    "doc2": "Java programming tutorial with programming exercises",
+    "doc3": "Cooking recipes and food for every season",
+    "doc4": "Pricing plans for the Python hosting service",
+    "doc5": "Language learning app for Java and Python developers",
+}
+
+
+class TestCompactBM25Index:
+    """Tests for the array-backed index internals."""
+
+    def test_scores_match_reference(self) -> None:
+        config = BM25Config()
+        index = BM25Index(config)
+        index.add_documents([{"doc_id": k, "content": v} for k, v in CORPUS.items()])
+
+        for query in ["python programming", "java java", "food pricing", "language"]:
+            expected = _reference_scores(CORPUS, query, config)
+            results = index.search(query, limit=10)
+            assert {r.doc_id: r.score for r in results} == pytest.approx(expected)
+
+    def test_bulk_and_incremental_build_match(self) -> None:
+        bulk = BM25Index()
+        bulk.add_documents([{"doc_id": k, "content": v} for k, v in CORPUS.items()])
+        incremental = BM25Index()
+        for doc_id, content in CORPUS.items():
+            incremental.add_document(doc_id, content)
+
+        assert bulk.get_stats() == incremental.get_stats()
+        assert [r.doc_id for r in bulk.search("python language")] == [
+            r.doc_id for r in incremental.search("python language")
+        ]
+
+    def test_removal_matches_fresh_index(self) -> None:
+        index = BM25Index()
+        index.add_documents([{"doc_id": k, "content": v} for k, v in CORPUS.items()])
+        index.remove_document("doc1")
+        index.remove_document("doc4")
+        remaining = {k: v for k, v in CORPUS.items() if k not in ("doc1", "doc4")}
+
+        assert index.get_stats()["tombstones"] == 2
+        results = index.search("python programming language")
+        assert {r.doc_id: r.score for r in results} == pytest.approx(
+            _reference_scores(remaining, "python programming language", index.config)
+        )
+
+    def test_compaction_drops_tombstones(self) -> None:
+        index = BM25Index()
+        index.add_documents(
+            [{"doc_id": f"doc{i}", "content": f"shared term unique{i}"} for i in range(100)]
+        )
+        for i in range(80):
+            index.remove_document(f"doc{i}")
+
+        stats = index.get_stats()
+        assert stats["tombstones"] < 64
+        assert index.document_count == 20
+        assert sorted(r.doc_id for r in index.search("shared", limit=100)) == sorted(
+            f"doc{i}" for i in range(80, 100)
+        )
+        assert [r.doc_id for r in index.search("unique85")] == ["doc85"]
+
+    def test_vocabulary_excludes_removed_terms(self) -> None:
+        index = BM25Index()
+        index.add_document("doc1", "alpha beta")
+        index.add_document("doc2", "beta gamma")
+        index.remove_document("doc1")
+
+        assert index.get_stats()["vocabulary_size"] == 2
+        assert index.search("alpha") == []
+
+    def test_tokens_not_retained(self) -> None:
+        index = BM25Index()
+        index.add_document("doc1", "Test content here")
+
+        doc = index.get_document("doc1")
+
+        assert doc is not None
+        assert doc.tokens == []
+        assert doc.token_count == 3
@@ -344,3 +344,34 @@ class TestHybridRetriever:
         assert "total_documents" in stats
         assert "bm25_stats" in stats
         assert "config" in stats
+
+    def test_search_batch_matches_search(self) -> None:
+        """Batched search returns the same results as per-query search."""
+        retriever = HybridRetriever(RetrieverConfig(vector_search_limit=3))
+        for i, text in enumerate(
+            ["Python programming guide", "Java tutorial", "Cooking recipes", "Pricing plans"]
+        ):
+            retriever.add_document(f"doc{i}", text, source_url=f"https://example.com/{i}")
+        queries = ["programming", "how much does it cost", "recipes"]
+
+        batched = retriever.search_batch(queries)
+
+        assert len(batched) == len(queries)
+        for query, results in zip(queries, batched, strict=True):
+            single = retriever.search(query)
+            assert [r.doc_id for r in results] == [r.doc_id for r in single]
+            assert [r.score for r in results] == [r.score for r in single]
+
+    def test_search_batch_empty(self) -> None:
+        """Batched search with no queries returns nothing."""
+        assert HybridRetriever().search_batch([]) == []
+
+    def test_removed_document_not_in_vector_results(self) -> None:
+        """Removed documents leave the vector index."""
+        retriever = HybridRetriever()
+        retriever.add_document("doc1", "First document")
+        retriever.add_document("doc2", "Second document")
+        retriever.remove_document("doc1")
+
+        assert [doc_id for doc_id, _ in retriever._vector_search("document")] == ["doc2"]
+        assert retriever.get_stats()["embedded_documents"] == 1
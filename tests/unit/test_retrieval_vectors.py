@@ -0,0 +1,123 @@
+"""Tests for the matrix-backed vector index."""
+
+import numpy as np
+import pytest
+
+from worker.retrieval.vectors import VectorIndex
+
+
+def _unit(vector: list[float]) -> np.ndarray:
+    array = np.array(vector, dtype=np.float64)
+    return array / np.linalg.norm(array)
+
+
+def _reference_search(
+    embeddings: dict[str, np.ndarray], query: np.ndarray, limit: int
+) -> list[tuple[str, float]]:
+    """The original per-document loop, for comparison."""
+    results = [(doc_id, float(np.dot(query, emb))) for doc_id, emb in embeddings.items()]
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:limit]
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex."""
+
+    def test_add_and_len(self) -> None:
+        index = VectorIndex()
+        index.add("a", _unit([1, 0, 0]))
+        index.add("b", _unit([0, 1, 0]))
+
+        assert len(index) == 2
+        assert "a" in index
+        assert index.dimensions == 3
+        assert index.matrix.dtype == np.float32
+        assert index.matrix.shape == (2, 3)
+
+    def test_replace_keeps_single_row(self) -> None:
+        index = VectorIndex()
+        index.add("a", _unit([1, 0, 0]))
+        index.add("a", _unit([0, 1, 0]))
+
+        assert len(index) == 1
+        assert index.search(_unit([0, 1, 0]), 1)[0][0] == "a"
+
+    def test_dimension_mismatch(self) -> None:
+        index = VectorIndex()
+        index.add("a", _unit([1, 0, 0]))
+
+        with pytest.raises(ValueError):
+            index.add("b", _unit([1, 0]))
+
+    def test_grows_beyond_initial_capacity(self) -> None:
+        index = VectorIndex(initial_capacity=2)
+        for i in range(5):
+            index.add(f"d{i}", _unit([1, i, 0]))
+
+        assert len(index) == 5
+        assert index.search(_unit([1, 4, 0]), 1)[0][0] == "d4"
+
+    def test_remove_moves_last_row(self) -> None:
+        index = VectorIndex()
+        index.add("a", _unit([1, 0, 0]))
+        index.add("b", _unit([0, 1, 0]))
+        index.add("c", _unit([0, 0, 1]))
+
+        assert index.remove("a")
+        assert not index.remove("a")
+
+        assert len(index) == 2
+        assert index.search(_unit([0, 0, 1]), 1)[0][0] == "c"
+        assert index.search(_unit([0, 1, 0]), 1)[0][0] == "b"
+
+    def test_matches_reference_loop(self) -> None:
+        rng = np.random.default_rng(0)
+        embeddings = {f"d{i}": _unit(rng.standard_normal(16).tolist()) for i in range(50)}
+        index = VectorIndex()
+        for doc_id, embedding in embeddings.items():
+            index.add(doc_id, embedding)
+        query = _unit(rng.standard_normal(16).tolist())
+
+        results = index.search(query, 10)
+        expected = _reference_search(embeddings, query, 10)
+
+        assert [doc_id for doc_id, _ in results] == [doc_id for doc_id, _ in expected]
+        assert [score for _, score in results] == pytest.approx(
+            [score for _, score in expected], abs=1e-5
+        )
+
+    def test_search_batch_matches_single(self) -> None:
+        rng = np.random.default_rng(1)
+        index = VectorIndex()
+        for i in range(30):
+            index.add(f"d{i}", _unit(rng.standard_normal(8).tolist()))
+        queries = np.stack([_unit(rng.standard_normal(8).tolist()) for _ in range(4)])
+
+        batched = index.search_batch(queries, 5)
+
+        for results, query in zip(batched, queries, strict=True):
+            single = index.search(query, 5)
+            assert [doc_id for doc_id, _ in results] == [doc_id for doc_id, _ in single]
+            assert [s for _, s in results] == pytest.approx([s for _, s in single], abs=1e-6)
+
+    def test_limit_larger_than_index(self) -> None:
+        index = VectorIndex()
+        index.add("a", _unit([1, 0]))
+        index.add("b", _unit([1, 1]))
+
+        results = index.search(_unit([1, 0]), 10)
+
+        assert [doc_id for doc_id, _ in results] == ["a", "b"]
+
+    def test_ties_keep_insertion_order(self) -> None:
+        index = VectorIndex()
+        for doc_id in ["x", "y", "z"]:
+            index.add(doc_id, _unit([1, 0]))
+
+        assert [doc_id for doc_id, _ in index.search(_unit([1, 0]), 2)] == ["x", "y"]
+
+    def test_empty(self) -> None:
+        index = VectorIndex()
+
+        assert index.search(_unit([1, 0]), 5) == []
+        assert index.search_batch(np.zeros((2, 2)), 5) == [[], []]
@@ -0,0 +1,218 @@
+"""Tests for the stage graph executor and the audit graph."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from worker.tasks.audit_graph import AUDIT_STATUSES, build_audit_graph
+from worker.tasks.stage_graph import Stage, StageGraph
+
+
+def _stage(name: str, inputs=(), outputs=(), delay: float = 0.0, status=None) -> Stage:
+    async def func(context, **kwargs):
+        context.append(("start", name))
+        await asyncio.sleep(delay)
+        context.append(("end", name))
+        return {output: f"{name}:{output}" for output in outputs}
+
+    return Stage(name, func, tuple(inputs), tuple(outputs), status)
+
+
+class TestStageGraph:
+    """Tests for StageGraph."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self) -> None:
+        graph = StageGraph(
+            [
+                _stage("crawl", outputs=["pages"], delay=0.1),
+                _stage("entity", outputs=["entity"], delay=0.1),
+                _stage("report", inputs=["pages", "entity"], outputs=["report"]),
+            ]
+        )
+        events: list = []
+
+        graph_run = await graph.run(events)
+
+        assert events[:2] == [("start", "crawl"), ("start", "entity")]
+        assert graph_run.values["report"] == "report:report"
+        assert graph_run.wall_seconds < 0.18
+        assert graph_run.summary()["parallelism"] > 1.5
+
+    @pytest.mark.asyncio
+    async def test_stage_starts_after_its_inputs(self) -> None:
+        graph = StageGraph(
+            [
+                _stage("b", inputs=["a"], outputs=["b"]),
+                _stage("a", outputs=["a"], delay=0.02),
+            ]
+        )
+        events: list = []
+
+        await graph.run(events)
+
+        assert events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    @pytest.mark.asyncio
+    async def test_initial_values_and_missing_inputs(self) -> None:
+        graph = StageGraph([_stage("b", inputs=["a"], outputs=["b"])])
+
+        graph_run = await graph.run([], values={"a": 1})
+        assert graph_run.values == {"a": 1, "b": "b:b"}
+
+        with pytest.raises(ValueError, match="Missing graph inputs"):
+            await graph.run([])
+
+    @pytest.mark.asyncio
+    async def test_undeclared_outputs_rejected(self) -> None:
+        async def func(context):
+            return {"other": 1}
+
+        graph = StageGraph([Stage("a", func, (), ("a",))])
+
+        with pytest.raises(ValueError, match="declared"):
+            await graph.run(None)
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate stage"):
+            StageGraph([_stage("a"), _stage("a")])
+        with pytest.raises(ValueError, match="produced by both"):
+            StageGraph([_stage("a", outputs=["x"]), _stage("b", outputs=["x"])])
+        with pytest.raises(ValueError, match="cycle"):
+            StageGraph(
+                [
+                    _stage("a", inputs=["y"], outputs=["x"]),
+                    _stage("b", inputs=["x"], outputs=["y"]),
+                ]
+            )
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_stages(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def slow(context):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {"slow": 1}
+
+        async def failing(context):
+            raise RuntimeError("crawl failed")
+
+        graph = StageGraph([Stage("slow", slow, (), ("slow",)), Stage("crawl", failing)])
+
+        with pytest.raises(RuntimeError, match="crawl failed"):
+            await graph.run(None)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_targets_prune_stages(self) -> None:
+        graph = StageGraph(
+            [
+                _stage("a", outputs=["a"]),
+                _stage("b", inputs=["a"], outputs=["b"]),
+                _stage("unused", outputs=["unused"]),
+            ]
+        )
+        events: list = []
+
+        graph_run = await graph.run(events, targets=["b"])
+
+        assert set(graph_run.timings) == {"a", "b"}
+        assert ("start", "unused") not in events
+
+    @pytest.mark.asyncio
+    async def test_critical_path_follows_slowest_input(self) -> None:
+        graph = StageGraph(
+            [
+                _stage("fast", outputs=["fast"]),
+                _stage("slow", outputs=["slow"], delay=0.05),
+                _stage("merge", inputs=["fast", "slow"], outputs=["merged"]),
+            ]
+        )
+
+        graph_run = await graph.run([])
+
+        assert [t.name for t in graph_run.critical_path()] == ["slow", "merge"]
+        summary = graph_run.summary()
+        assert summary["critical_path"] == ["slow", "merge"]
+        assert set(summary["stages"]) == {"fast", "slow", "merge"}
+
+    @pytest.mark.asyncio
+    async def test_listener_notified(self) -> None:
+        listener = MagicMock(stage_started=AsyncMock(), stage_finished=AsyncMock())
+        graph = StageGraph([_stage("a", outputs=["a"], status="crawling")])
+
+        await graph.run([], listener=listener)
+
+        listener.stage_started.assert_awaited_once()
+        listener.stage_finished.assert_awaited_once()
+
+
+class TestAuditGraph:
+    """The audit pipeline's declared stages."""
+
+    def test_graph_is_valid_with_and_without_observation(self) -> None:
+        for include_observation in (False, True):
+            graph = build_audit_graph(include_observation=include_observation)
+            stages = graph.required_stages(["full_report"])
+            produced = {output for stage in stages for output in stage.outputs}
+            needed = {value for stage in stages for value in stage.inputs}
+            missing = needed - produced
+            if include_observation:
+                assert not missing
+            else:
+                assert missing == {"observation_run", "comparison_summary"}
+
+    def test_streaming_graph_replaces_crawl_to_embedding_stages(self) -> None:
+        graph = build_audit_graph(include_observation=True, streaming=True)
+
+        assert "stream" in graph.stages
+        assert not {"crawl", "page_analysis", "chunking", "embedding"} & set(graph.stages)
+        stages = graph.required_stages(["full_report"])
+        produced = {output for stage in stages for output in stage.outputs}
+        assert {value for stage in stages for value in stage.inputs} <= produced
+
+    def test_network_stages_do_not_wait_for_crawl(self) -> None:
+        graph = build_audit_graph()
+
+        assert graph.stages["technical_check"].inputs == ()
+        assert graph.stages["entity_recognition"].inputs == ()
+
+    def test_statuses_are_known(self) -> None:
+        graph = build_audit_graph(include_observation=True)
+
+        for stage in graph.stages.values():
+            assert stage.status is None or stage.status in AUDIT_STATUSES
+
+
+class TestRunStatusReporter:
+    """Status shown while several audit stages run at once."""
+
+    @pytest.mark.asyncio
+    async def test_shows_earliest_unfinished_step_and_never_goes_back(self) -> None:
+        from worker.tasks import audit
+
+        graph = build_audit_graph()
+        reporter = audit.RunStatusReporter("run-1", graph.stages.values())
+        statuses = []
+
+        async def update(run_id, status, progress=None):
+            statuses.append(status)
+
+        with patch.object(audit, "update_run_status", side_effect=update):
+            await reporter.stage_started(graph.stages["technical_check"])
+            await reporter.stage_started(graph.stages["entity_recognition"])
+            await reporter.stage_started(graph.stages["crawl"])
+            await reporter.stage_finished(graph.stages["technical_check"])
+            await reporter.update({"pages_crawled": 3})
+            await reporter.stage_finished(graph.stages["crawl"])
+            await reporter.stage_started(graph.stages["page_analysis"])
+            await reporter.stage_finished(graph.stages["entity_recognition"])
+
+        # Entity recognition (later in the order) finishing early does not
+        # move the run back or ahead of extraction
+        assert statuses == ["technical_check", "crawling", "crawling", "extracting"]
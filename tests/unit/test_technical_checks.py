@@ -1,7 +1,9 @@
 """Unit tests for Phase 1 Technical Readiness checks."""
 
+import asyncio
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from worker.crawler.llms_txt import (
@@ -9,8 +11,11 @@ from worker.crawler.llms_txt import (
     LlmsTxtResult,
 )
 from worker.crawler.performance import (
+    PerformanceChecker,
     TTFBResult,
     _calculate_ttfb_score,
+    _percentile,
+    measure_site_ttfb,
 )
 from worker.crawler.robots_ai import (
     AI_CRAWLERS,
@@ -120,6 +125,88 @@ class TestPerformance:
         assert critical.is_critical is True
 
 
+class TestTTFBSampling:
+    """Tests for concurrent cold/warm TTFB sampling."""
+
+    def test_percentile(self):
+        assert _percentile([], 50) is None
+        assert _percentile([100], 95) == 100
+        assert _percentile([100, 200, 300, 400], 50) == 250
+        assert _percentile(list(range(0, 101)), 95) == 95
+
+    @pytest.mark.asyncio
+    async def test_cold_and_warm_samples(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, html="<html></html>")
+
+        checker = PerformanceChecker(
+            cold_samples=2, warm_samples=3, transport=httpx.MockTransport(handler)
+        )
+        result = await checker.measure_ttfb("https://example.com/")
+
+        assert len(requests) == 5
+        assert len(result.cold_samples_ms) == 2
+        assert len(result.warm_samples_ms) == 3
+        assert result.error is None
+        assert result.warm_ttfb_ms is not None
+        assert result.to_dict()["samples"] == 5
+
+    @pytest.mark.asyncio
+    async def test_samples_run_concurrently_within_bound(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, html="<html></html>")
+
+        checker = PerformanceChecker(
+            cold_samples=1,
+            warm_samples=0,
+            concurrency=3,
+            transport=httpx.MockTransport(handler),
+        )
+        urls = [f"https://example.com/{i}" for i in range(6)]
+        results = await checker.measure_multiple(urls, sample_size=6)
+
+        assert list(results) == urls
+        assert peak == 3
+        assert all(r.ttfb_ms >= 50 for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_failed_cold_samples_report_error(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        checker = PerformanceChecker(transport=httpx.MockTransport(handler))
+        result = await checker.measure_ttfb("https://example.com/")
+
+        assert result.error is not None and result.error.startswith("Connection failed")
+        assert result.level == "critical"
+        assert result.cold_samples_ms == []
+
+    @pytest.mark.asyncio
+    async def test_site_result_reports_percentiles(self):
+        def handler(request):
+            return httpx.Response(200, html="<html></html>")
+
+        checker = PerformanceChecker(transport=httpx.MockTransport(handler))
+        with patch("worker.crawler.performance.PerformanceChecker", return_value=checker):
+            result = await measure_site_ttfb(["https://example.com/", "https://example.com/about"])
+
+        assert result.pages_measured == 2
+        assert result.p50_ttfb_ms is not None and result.p95_ttfb_ms is not None
+        assert result.warm_p50_ttfb_ms is not None
+        assert result.p50_ttfb_ms <= result.p95_ttfb_ms
+
+
 class TestLlmsTxt:
     """Tests for llms.txt detection."""
 
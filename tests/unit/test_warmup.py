@@ -0,0 +1,64 @@
+"""Tests for worker warm-up."""
+
+import gc
+from unittest.mock import MagicMock, patch
+
+from worker.embeddings import models
+from worker.warmup import warm_up
+
+
+class TestWarmUp:
+    """Tests for warm_up."""
+
+    def teardown_method(self) -> None:
+        gc.unfreeze()
+
+    def test_loads_modules_and_model(self) -> None:
+        models._model_cache.pop("mock", None)
+
+        report = warm_up(modules=["json"], model_name="mock", load_calibration=False)
+
+        assert "json" in report.module_seconds
+        assert report.model_name == "mock"
+        assert "mock" in models._model_cache
+        assert report.errors == []
+        assert gc.get_freeze_count() > 0
+
+    def test_failures_are_recorded_not_raised(self) -> None:
+        report = warm_up(
+            modules=["json", "worker.does_not_exist"],
+            model_name="no-such-model",
+            load_calibration=False,
+        )
+
+        assert list(report.module_seconds) == ["json"]
+        assert len(report.errors) == 2
+        assert report.to_dict()["model_name"] == "no-such-model"
+
+    def test_skips_model_when_disabled(self) -> None:
+        with patch("worker.embeddings.models.get_model") as get_model:
+            report = warm_up(modules=[], load_model=False, load_calibration=False)
+
+        get_model.assert_not_called()
+        assert report.model_name is None
+
+
+class TestJobTiming:
+    """Tests for per-job timing in the worker."""
+
+    def test_records_job_duration(self) -> None:
+        from worker.main import JobTimingMixin
+
+        class BaseWorker:
+            def execute_job(self, job, queue) -> None:
+                pass
+
+        class Worker(JobTimingMixin, BaseWorker):
+            pass
+
+        job = MagicMock(id="job-1", func_name="worker.tasks.audit.run_audit_sync")
+        with patch("api.metrics.record_job_duration") as record:
+            Worker().execute_job(job, MagicMock())
+
+        record.assert_called_once()
+        assert record.call_args.args[0] == "worker.tasks.audit.run_audit_sync"
@@ -6,9 +6,12 @@ This module provides weight and threshold optimization without ML infrastructure
 - Holdout validation to prevent overfitting
 """
 
+import asyncio
 import itertools
+import os
 import uuid
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
@@ -224,6 +227,36 @@ def _split_by_domain(
     return training_samples, holdout_samples, training_domains, holdout_domains
 
 
+def _optimizer_workers(workers: int | None) -> int:
+    """Resolve the evaluation thread count (None = from settings, 0 = one per CPU)."""
+    if workers is None:
+        from api.config import get_settings
+
+        workers = get_settings().calibration_optimizer_workers
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+async def _load_weight_samples(
+    window_days: int,
+    site_type: str | None = None,
+) -> list[CalibrationSample]:
+    """Load labelled samples with pillar scores, oldest first."""
+    window_start = datetime.now(UTC) - timedelta(days=window_days)
+
+    async with async_session_maker() as db:
+        query = (
+            select(CalibrationSample)
+            .where(CalibrationSample.created_at >= window_start)
+            .where(CalibrationSample.outcome_match != OutcomeMatch.UNKNOWN.value)
+            .where(CalibrationSample.pillar_scores.isnot(None))
+        )
+        if site_type:
+            query = query.where(CalibrationSample.site_type == site_type)
+        query = query.order_by(CalibrationSample.created_at)
+        samples_result = await db.execute(query)
+        return list(samples_result.scalars().all())
+
+
 async def optimize_pillar_weights(
     window_days: int = 60,
     min_samples: int = 200,
@@ -234,6 +267,7 @@ async def optimize_pillar_weights(
     use_bias_adjusted: bool = True,  # Deprecated: MCC is now always used  # noqa: ARG001
     max_weight_change: float = 10.0,
     site_type: str | None = None,
+    workers: int | None = None,
 ) -> OptimizationResult:
     """
     Optimize pillar weights using grid search over historical samples.
@@ -258,297 +292,300 @@ async def optimize_pillar_weights(
         use_bias_adjusted: Deprecated, MCC is always used
         max_weight_change: Maximum change per pillar from defaults (default 10%)
         site_type: Optional filter to train weights only for a specific site type
+        workers: Threads for the vectorized evaluation (default: from settings)
 
     Returns:
         OptimizationResult with best weights and metrics
     """
-    result = OptimizationResult(min_improvement_threshold=min_improvement)
-
-    window_start = datetime.now(UTC) - timedelta(days=window_days)
-
-    async with async_session_maker() as db:
-        # Load calibration samples with pillar scores
-        query = (
-            select(CalibrationSample)
-            .where(CalibrationSample.created_at >= window_start)
-            .where(CalibrationSample.outcome_match != OutcomeMatch.UNKNOWN.value)
-            .where(CalibrationSample.pillar_scores.isnot(None))
-        )
-        if site_type:
-            query = query.where(CalibrationSample.site_type == site_type)
-        query = query.order_by(CalibrationSample.created_at)
-        samples_result = await db.execute(query)
-        all_samples = list(samples_result.scalars().all())
+    all_samples = await _load_weight_samples(window_days, site_type)
+    # The grid search is CPU-bound; keep it off the event loop
+    return await asyncio.to_thread(
+        _optimize_weights_for_samples,
+        all_samples,
+        min_samples=min_samples,
+        holdout_pct=holdout_pct,
+        min_improvement=min_improvement,
+        step=step,
+        coarse_then_fine=coarse_then_fine,
+        max_weight_change=max_weight_change,
+        workers=_optimizer_workers(workers),
+    )
 
-        # Filter for samples with sufficient pillar coverage
-        # We need at least 70% of the weight to be populated (avoid samples missing retrieval+coverage)
-        pillar_keys = list(DEFAULT_WEIGHTS.keys())
-        min_weight_coverage = 70.0  # Require 70% of weight to be covered
 
-        def get_weight_coverage(sample: CalibrationSample) -> float:
-            """Calculate the percentage of total weight covered by non-null pillars."""
-            covered_weight = 0.0
-            for pillar in pillar_keys:
-                if sample.pillar_scores and sample.pillar_scores.get(pillar) is not None:
-                    covered_weight += DEFAULT_WEIGHTS[pillar]
-            return covered_weight
+def _optimize_weights_for_samples(
+    all_samples: list[CalibrationSample],
+    min_samples: int = 200,
+    holdout_pct: float = 0.2,
+    min_improvement: float = 0.02,
+    step: float = WEIGHT_STEP,
+    coarse_then_fine: bool = True,
+    max_weight_change: float = 10.0,
+    workers: int = 1,
+) -> OptimizationResult:
+    """Grid search behind ``optimize_pillar_weights`` on already-loaded samples."""
+    result = OptimizationResult(min_improvement_threshold=min_improvement)
 
-        samples = [s for s in all_samples if get_weight_coverage(s) >= min_weight_coverage]
+    # Filter for samples with sufficient pillar coverage
+    # We need at least 70% of the weight to be populated (avoid samples missing retrieval+coverage)
+    pillar_keys = list(DEFAULT_WEIGHTS.keys())
+    min_weight_coverage = 70.0  # Require 70% of weight to be covered
+
+    def get_weight_coverage(sample: CalibrationSample) -> float:
+        """Calculate the percentage of total weight covered by non-null pillars."""
+        covered_weight = 0.0
+        for pillar in pillar_keys:
+            if sample.pillar_scores and sample.pillar_scores.get(pillar) is not None:
+                covered_weight += DEFAULT_WEIGHTS[pillar]
+        return covered_weight
+
+    samples = [s for s in all_samples if get_weight_coverage(s) >= min_weight_coverage]
+
+    logger.info(
+        "samples_filtered_for_weight_coverage",
+        total=len(all_samples),
+        with_70pct_coverage=len(samples),
+        filtered=len(all_samples) - len(samples),
+        min_weight_coverage=min_weight_coverage,
+    )
 
-        logger.info(
-            "samples_filtered_for_weight_coverage",
-            total=len(all_samples),
-            with_70pct_coverage=len(samples),
-            filtered=len(all_samples) - len(samples),
-            min_weight_coverage=min_weight_coverage,
+    if len(samples) < min_samples:
+        result.errors.append(
+            f"Insufficient complete samples: {len(samples)} < {min_samples} required"
         )
-
-        if len(samples) < min_samples:
-            result.errors.append(
-                f"Insufficient complete samples: {len(samples)} < {min_samples} required"
-            )
-            logger.warning(
-                "weight_optimization_skipped_insufficient_samples",
-                samples=len(samples),
-                min_required=min_samples,
-            )
-            return result
-
-        # Domain-stratified split
-        training_samples, holdout_samples, training_domains, holdout_domains = _split_by_domain(
-            samples, holdout_pct
+        logger.warning(
+            "weight_optimization_skipped_insufficient_samples",
+            samples=len(samples),
+            min_required=min_samples,
         )
+        return result
 
-        result.training_sample_count = len(training_samples)
-        result.holdout_sample_count = len(holdout_samples)
-        result.training_domains = len(training_domains)
-        result.holdout_domains = len(holdout_domains)
-
-        # Check we have enough domains for meaningful optimization
-        # With too few domains, the optimizer memorizes domain identity instead of
-        # learning generalizable scoring patterns. Minimum: 10 train + 3 holdout.
-        min_train_domains = 10
-        min_holdout_domains = 3
-        if len(training_domains) < min_train_domains:
-            result.errors.append(
-                f"Insufficient domain diversity: {len(training_domains)} training domains "
-                f"(need {min_train_domains}+). Use expert-set weights or site-type baselines."
-            )
-            logger.warning(
-                "weight_optimization_skipped_low_domain_diversity",
-                training_domains=len(training_domains),
-                min_required=min_train_domains,
-            )
-            return result
-        if len(holdout_domains) < min_holdout_domains:
-            result.errors.append(
-                f"Insufficient holdout domains: {len(holdout_domains)} "
-                f"(need {min_holdout_domains}+). Cannot validate reliably."
-            )
-            logger.warning(
-                "weight_optimization_skipped_low_holdout_domains",
-                holdout_domains=len(holdout_domains),
-                min_required=min_holdout_domains,
-            )
-            return result
+    # Domain-stratified split
+    training_samples, holdout_samples, training_domains, holdout_domains = _split_by_domain(
+        samples, holdout_pct
+    )
 
-        logger.info(
-            "weight_optimization_starting",
-            total_samples=len(samples),
-            training_samples=len(training_samples),
-            holdout_samples=len(holdout_samples),
+    result.training_sample_count = len(training_samples)
+    result.holdout_sample_count = len(holdout_samples)
+    result.training_domains = len(training_domains)
+    result.holdout_domains = len(holdout_domains)
+
+    # Check we have enough domains for meaningful optimization
+    # With too few domains, the optimizer memorizes domain identity instead of
+    # learning generalizable scoring patterns. Minimum: 10 train + 3 holdout.
+    min_train_domains = 10
+    min_holdout_domains = 3
+    if len(training_domains) < min_train_domains:
+        result.errors.append(
+            f"Insufficient domain diversity: {len(training_domains)} training domains "
+            f"(need {min_train_domains}+). Use expert-set weights or site-type baselines."
+        )
+        logger.warning(
+            "weight_optimization_skipped_low_domain_diversity",
             training_domains=len(training_domains),
+            min_required=min_train_domains,
+        )
+        return result
+    if len(holdout_domains) < min_holdout_domains:
+        result.errors.append(
+            f"Insufficient holdout domains: {len(holdout_domains)} "
+            f"(need {min_holdout_domains}+). Cannot validate reliably."
+        )
+        logger.warning(
+            "weight_optimization_skipped_low_holdout_domains",
             holdout_domains=len(holdout_domains),
-            scoring_metric="mcc",
-            max_weight_change=max_weight_change,
+            min_required=min_holdout_domains,
         )
+        return result
 
-        # Calculate baseline metrics with default weights
-        baseline_metrics = _calculate_weighted_metrics(training_samples, DEFAULT_WEIGHTS)
-        result.baseline_accuracy = baseline_metrics.accuracy
-        result.baseline_score = baseline_metrics.mcc  # Use MCC as primary scoring metric
-        result.baseline_over_rate = baseline_metrics.over_rate
-        result.baseline_under_rate = baseline_metrics.under_rate
-
-        # Use MCC for optimization (robust to class imbalance)
-        best_score = baseline_metrics.mcc
-
-        best_weights = DEFAULT_WEIGHTS.copy()
-        best_metrics = baseline_metrics
-        best_threshold = 50
-        best_primacy_weight = 0.0
-        total_combinations_tested = 0
-
-        # Primacy weight search values (independent bonus, not part of sum-to-100)
-        # Check if any samples have source_primacy data
-        has_primacy_data = any(
-            s.pillar_scores and s.pillar_scores.get("source_primacy") is not None
-            for s in training_samples
+    logger.info(
+        "weight_optimization_starting",
+        total_samples=len(samples),
+        training_samples=len(training_samples),
+        holdout_samples=len(holdout_samples),
+        training_domains=len(training_domains),
+        holdout_domains=len(holdout_domains),
+        scoring_metric="mcc",
+        max_weight_change=max_weight_change,
+        workers=workers,
+    )
+
+    training = SampleMatrix.from_samples(training_samples)
+
+    # Calculate baseline metrics with default weights
+    baseline_metrics = _evaluate_weights(training, DEFAULT_WEIGHTS)
+    result.baseline_accuracy = baseline_metrics.accuracy
+    result.baseline_score = baseline_metrics.mcc  # Use MCC as primary scoring metric
+    result.baseline_over_rate = baseline_metrics.over_rate
+    result.baseline_under_rate = baseline_metrics.under_rate
+
+    # Use MCC for optimization (robust to class imbalance)
+    best_score = baseline_metrics.mcc
+
+    best_weights = DEFAULT_WEIGHTS.copy()
+    best_metrics = baseline_metrics
+    best_threshold = 50
+    best_primacy_weight = 0.0
+    total_combinations_tested = 0
+
+    # Primacy weight search values (independent bonus, not part of sum-to-100)
+    # Check if any samples have source_primacy data
+    has_primacy_data = any(
+        s.pillar_scores and s.pillar_scores.get("source_primacy") is not None
+        for s in training_samples
+    )
+    primacy_weights_to_test = [0, 5, 10, 15, 20] if has_primacy_data else [0]
+
+    # Phase 1: Coarse search (or single pass if coarse_then_fine=False)
+    # Note: step=10 produces 0 combos for 7 pillars (no 7-tuple from {5,15,25,35} sums to 100)
+    # Use step=5 for coarse with wider constraint radius, then refine with smaller step
+    coarse_step = 5.0 if coarse_then_fine else step
+    if max_weight_change < 35:
+        combinations = _generate_constrained_combinations(
+            DEFAULT_WEIGHTS, max_change=max_weight_change, step=coarse_step
         )
-        primacy_weights_to_test = [0, 5, 10, 15, 20] if has_primacy_data else [0]
-
-        # Phase 1: Coarse search (or single pass if coarse_then_fine=False)
-        # Note: step=10 produces 0 combos for 7 pillars (no 7-tuple from {5,15,25,35} sums to 100)
-        # Use step=5 for coarse with wider constraint radius, then refine with smaller step
-        coarse_step = 5.0 if coarse_then_fine else step
-        if max_weight_change < 35:
-            combinations = _generate_constrained_combinations(
-                DEFAULT_WEIGHTS, max_change=max_weight_change, step=coarse_step
-            )
-        else:
-            combinations = generate_weight_combinations(step=coarse_step)
-
-        total_combinations_tested = len(combinations)
-
-        # Search over findability thresholds jointly with weights
-        thresholds_to_test = [30, 35, 40, 45, 50, 55, 60]
-
-        for weights in combinations:
-            for threshold in thresholds_to_test:
-                for pw in primacy_weights_to_test:
-                    metrics = _calculate_weighted_metrics(
-                        training_samples,
-                        weights,
-                        threshold=threshold,
-                        primacy_weight=pw,
-                    )
-
-                    score = metrics.mcc
-
-                    if score > best_score:
-                        best_score = score
-                        best_weights = weights.copy()
-                        best_metrics = metrics
-                        best_threshold = threshold
-                        best_primacy_weight = pw
-
-        # Phase 2: Fine search around best coarse result
-        if coarse_then_fine:
-            fine_step = min(step, 2.0)  # Use step=2 for fine refinement
-            fine_radius = max(coarse_step, 10.0)  # Search ±10 around best
-            fine_combinations = _generate_fine_search_combinations(
-                best_weights, step=fine_step, radius=fine_radius
-            )
-            total_combinations_tested += len(fine_combinations)
+    else:
+        combinations = generate_weight_combinations(step=coarse_step)
 
-            # Fine threshold search around best threshold
-            fine_thresholds = list(
-                range(max(20, best_threshold - 10), min(70, best_threshold + 11), 2)
-            )
+    total_combinations_tested = len(combinations)
 
-            # Fine primacy weight search around best
-            if has_primacy_data:
-                fine_primacy = list(
-                    range(
-                        max(0, int(best_primacy_weight) - 5),
-                        min(25, int(best_primacy_weight) + 6),
-                        2,
-                    )
-                )
-            else:
-                fine_primacy = [0]
+    # Search over findability thresholds jointly with weights
+    thresholds_to_test = [30, 35, 40, 45, 50, 55, 60]
 
-            logger.info(
-                "fine_search_starting",
-                center_weights=best_weights,
-                center_threshold=best_threshold,
-                center_primacy_weight=best_primacy_weight,
-                fine_combinations=len(fine_combinations),
-                fine_thresholds=fine_thresholds,
-                fine_primacy=fine_primacy,
+    coarse = _grid_search(
+        training,
+        combinations,
+        thresholds_to_test,
+        primacy_weights_to_test,
+        workers=workers,
+    )
+    if coarse is not None and coarse.score > best_score:
+        best_score = coarse.score
+        best_weights = coarse.weights.copy()
+        best_metrics = coarse.metrics
+        best_threshold = coarse.threshold
+        best_primacy_weight = coarse.primacy_weight
+
+    # Phase 2: Fine search around best coarse result
+    if coarse_then_fine:
+        fine_step = min(step, 2.0)  # Use step=2 for fine refinement
+        fine_radius = max(coarse_step, 10.0)  # Search ±10 around best
+        fine_combinations = _generate_fine_search_combinations(
+            best_weights, step=fine_step, radius=fine_radius
+        )
+        total_combinations_tested += len(fine_combinations)
+
+        # Fine threshold search around best threshold
+        fine_thresholds = list(range(max(20, best_threshold - 10), min(70, best_threshold + 11), 2))
+
+        # Fine primacy weight search around best
+        if has_primacy_data:
+            fine_primacy = list(
+                range(
+                    max(0, int(best_primacy_weight) - 5),
+                    min(25, int(best_primacy_weight) + 6),
+                    2,
+                )
             )
+        else:
+            fine_primacy = [0]
 
-            for weights in fine_combinations:
-                for threshold in fine_thresholds:
-                    for pw in fine_primacy:
-                        metrics = _calculate_weighted_metrics(
-                            training_samples,
-                            weights,
-                            threshold=threshold,
-                            primacy_weight=pw,
-                        )
-
-                        score = metrics.mcc
-
-                        if score > best_score:
-                            best_score = score
-                            best_weights = weights.copy()
-                            best_metrics = metrics
-                            best_threshold = threshold
-                            best_primacy_weight = pw
-
-        result.combinations_tested = total_combinations_tested
-
-        result.best_score = best_score
-        result.best_accuracy = best_metrics.accuracy
-        result.best_over_rate = best_metrics.over_rate
-        result.best_under_rate = best_metrics.under_rate
-        result.best_weights = best_weights
-        result.best_threshold = best_threshold
-        result.best_primacy_weight = best_primacy_weight
-
-        result.improvement = best_score - baseline_metrics.mcc
-
-        result.is_improvement = result.improvement > 0
+        logger.info(
+            "fine_search_starting",
+            center_weights=best_weights,
+            center_threshold=best_threshold,
+            center_primacy_weight=best_primacy_weight,
+            fine_combinations=len(fine_combinations),
+            fine_thresholds=fine_thresholds,
+            fine_primacy=fine_primacy,
+        )
 
-        # Validate on holdout set using best threshold + primacy weight
-        if holdout_samples:
-            holdout_metrics = _calculate_weighted_metrics(
-                holdout_samples,
+        fine = _grid_search(
+            training,
+            fine_combinations,
+            fine_thresholds,
+            fine_primacy,
+            workers=workers,
+        )
+        if fine is not None and fine.score > best_score:
+            best_score = fine.score
+            best_weights = fine.weights.copy()
+            best_metrics = fine.metrics
+            best_threshold = fine.threshold
+            best_primacy_weight = fine.primacy_weight
+
+    result.combinations_tested = total_combinations_tested
+
+    result.best_score = best_score
+    result.best_accuracy = best_metrics.accuracy
+    result.best_over_rate = best_metrics.over_rate
+    result.best_under_rate = best_metrics.under_rate
+    result.best_weights = best_weights
+    result.best_threshold = best_threshold
+    result.best_primacy_weight = best_primacy_weight
+
+    result.improvement = best_score - baseline_metrics.mcc
+
+    result.is_improvement = result.improvement > 0
+
+    # Validate on holdout set using best threshold + primacy weight
+    if holdout_samples:
+        holdout_metrics = _evaluate_weights(
+            SampleMatrix.from_samples(holdout_samples),
+            best_weights,
+            threshold=best_threshold,
+            primacy_weight=best_primacy_weight,
+        )
+        result.holdout_accuracy = holdout_metrics.accuracy
+        result.holdout_score = holdout_metrics.bias_adjusted_score
+    else:
+        result.holdout_accuracy = result.best_accuracy
+        result.holdout_score = result.best_score
+
+    # Compute per-domain accuracy on both training and holdout
+    all_domains = SampleMatrix.from_samples(samples)
+    for domain_set, label in [
+        (training_domains, "training"),
+        (holdout_domains, "holdout"),
+    ]:
+        for domain in domain_set:
+            domain_mask = all_domains.domains == domain
+            if not domain_mask.any():
+                continue
+            dm = _evaluate_weights(
+                all_domains.subset(domain_mask),
                 best_weights,
                 threshold=best_threshold,
                 primacy_weight=best_primacy_weight,
             )
-            result.holdout_accuracy = holdout_metrics.accuracy
-            result.holdout_score = holdout_metrics.bias_adjusted_score
-        else:
-            result.holdout_accuracy = result.best_accuracy
-            result.holdout_score = result.best_score
-
-        # Compute per-domain accuracy on both training and holdout
-        for domain_set, label in [
-            (training_domains, "training"),
-            (holdout_domains, "holdout"),
-        ]:
-            for domain in domain_set:
-                domain_samp = [s for s in samples if str(s.site_id) == domain]
-                if not domain_samp:
-                    continue
-                dm = _calculate_weighted_metrics(
-                    domain_samp,
-                    best_weights,
-                    threshold=best_threshold,
-                    primacy_weight=best_primacy_weight,
-                )
-                result.domain_accuracy[f"{label}:{domain[:8]}"] = {
-                    "set": label,
-                    "samples": dm.total,
-                    "accuracy": round(dm.accuracy, 4),
-                    "over_rate": round(dm.over_rate, 4),
-                    "under_rate": round(dm.under_rate, 4),
-                }
-
-        # Check if improvement is sufficient
-        result.improvement_sufficient = result.improvement >= min_improvement
+            result.domain_accuracy[f"{label}:{domain[:8]}"] = {
+                "set": label,
+                "samples": dm.total,
+                "accuracy": round(dm.accuracy, 4),
+                "over_rate": round(dm.over_rate, 4),
+                "under_rate": round(dm.under_rate, 4),
+            }
 
-        logger.info(
-            "weight_optimization_completed",
-            baseline_accuracy=result.baseline_accuracy,
-            baseline_score=result.baseline_score,
-            best_accuracy=result.best_accuracy,
-            best_score=result.best_score,
-            best_threshold=result.best_threshold,
-            best_primacy_weight=result.best_primacy_weight,
-            improvement=result.improvement,
-            holdout_accuracy=result.holdout_accuracy,
-            holdout_score=result.holdout_score,
-            best_over_rate=result.best_over_rate,
-            best_under_rate=result.best_under_rate,
-            improvement_sufficient=result.improvement_sufficient,
-            best_weights=result.best_weights,
-        )
+    # Check if improvement is sufficient
+    result.improvement_sufficient = result.improvement >= min_improvement
+
+    logger.info(
+        "weight_optimization_completed",
+        baseline_accuracy=result.baseline_accuracy,
+        baseline_score=result.baseline_score,
+        best_accuracy=result.best_accuracy,
+        best_score=result.best_score,
+        best_threshold=result.best_threshold,
+        best_primacy_weight=result.best_primacy_weight,
+        improvement=result.improvement,
+        holdout_accuracy=result.holdout_accuracy,
+        holdout_score=result.holdout_score,
+        best_over_rate=result.best_over_rate,
+        best_under_rate=result.best_under_rate,
+        improvement_sufficient=result.improvement_sufficient,
+        best_weights=result.best_weights,
+    )
 
-        return result
+    return result
 
 
 def _generate_constrained_combinations(
@@ -702,23 +739,278 @@ def _prepare_sample_matrices(
                  calibration. obs_cited has ~68% positive / 32% negative.)
         primacy_scores: (N,) array of source_primacy scores (0-100, 0 if missing)
     """
-    n = len(samples)
-    p = len(pillar_order)
-    pillar_matrix = np.zeros((n, p), dtype=np.float64)
-    actuals = np.zeros(n, dtype=bool)
-    primacy_scores = np.zeros(n, dtype=np.float64)
+    matrix = SampleMatrix.from_samples(samples, pillar_order)
+    return matrix.pillar_scores, matrix.actuals, matrix.primacy
+
+
+@dataclass
+class SampleMatrix:
+    """Calibration samples as arrays for vectorized evaluation."""
+
+    pillar_order: list[str]
+    pillar_scores: np.ndarray  # (N, P), missing scores as 0.0
+    present: np.ndarray  # (N, P) bool, pillar score was not None
+    actuals: np.ndarray  # (N,) obs_cited
+    primacy: np.ndarray  # (N,) source_primacy, missing as 0.0
+    has_scores: np.ndarray  # (N,) bool, sample has pillar_scores
+    domains: np.ndarray  # (N,) site ID strings
+
+    @classmethod
+    def from_samples(
+        cls, samples: list[CalibrationSample], pillar_order: list[str] | None = None
+    ) -> "SampleMatrix":
+        pillar_order = pillar_order or list(DEFAULT_WEIGHTS.keys())
+        n, p = len(samples), len(pillar_order)
+        matrix = cls(
+            pillar_order=pillar_order,
+            pillar_scores=np.zeros((n, p), dtype=np.float64),
+            present=np.zeros((n, p), dtype=bool),
+            actuals=np.zeros(n, dtype=bool),
+            primacy=np.zeros(n, dtype=np.float64),
+            has_scores=np.zeros(n, dtype=bool),
+            domains=np.array([str(getattr(s, "site_id", "")) for s in samples], dtype=object),
+        )
+        for i, sample in enumerate(samples):
+            if not sample.pillar_scores:
+                continue
+            matrix.has_scores[i] = True
+            for j, pillar in enumerate(pillar_order):
+                val = sample.pillar_scores.get(pillar)
+                if val is not None:
+                    matrix.pillar_scores[i, j] = val
+                    matrix.present[i, j] = True
+            matrix.actuals[i] = sample.obs_cited
+            ps = sample.pillar_scores.get("source_primacy")
+            matrix.primacy[i] = ps if ps is not None else 0.0
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.actuals)
+
+    def subset(self, mask: np.ndarray) -> "SampleMatrix":
+        """Rows selected by a boolean mask."""
+        return SampleMatrix(
+            pillar_order=self.pillar_order,
+            pillar_scores=self.pillar_scores[mask],
+            present=self.present[mask],
+            actuals=self.actuals[mask],
+            primacy=self.primacy[mask],
+            has_scores=self.has_scores[mask],
+            domains=self.domains[mask],
+        )
+
+    def eligible(self, pillars: list[str]) -> np.ndarray:
+        """Samples with at least 70% of default weight covered by ``pillars``.
+
+        Mirrors the per-sample skip in ``_calculate_weighted_metrics``.
+        """
+        coverage = np.zeros(len(self), dtype=np.float64)
+        for pillar in pillars:
+            if pillar in self.pillar_order:
+                coverage += self.present[:, self.pillar_order.index(pillar)] * DEFAULT_WEIGHTS.get(
+                    pillar, 0.0
+                )
+        return self.has_scores & (coverage >= 70.0)
+
+    def columns(self, pillars: list[str]) -> np.ndarray:
+        """Pillar scores in the given order (unknown pillars as zeros)."""
+        out = np.zeros((len(self), len(pillars)), dtype=np.float64)
+        for j, pillar in enumerate(pillars):
+            if pillar in self.pillar_order:
+                out[:, j] = self.pillar_scores[:, self.pillar_order.index(pillar)]
+        return out
 
-    for i, sample in enumerate(samples):
-        if not sample.pillar_scores:
-            continue
-        for j, pillar in enumerate(pillar_order):
-            val = sample.pillar_scores.get(pillar)
-            pillar_matrix[i, j] = val if val is not None else 0.0
-        actuals[i] = sample.obs_cited
-        ps = sample.pillar_scores.get("source_primacy")
-        primacy_scores[i] = ps if ps is not None else 0.0
 
-    return pillar_matrix, actuals, primacy_scores
+# Weighted scores (combinations x samples) held in memory per evaluation chunk
+EVAL_CHUNK_ELEMENTS = 2_000_000
+
+
+def _confusion_counts(
+    pillar_matrix: np.ndarray,
+    actuals: np.ndarray,
+    primacy_scores: np.ndarray | None,
+    weight_array: np.ndarray,
+    thresholds: list[int],
+    primacy_weights: list[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    False positives and false negatives for every combination in a chunk.
+
+    Scores are accumulated pillar by pillar in column order, exactly as
+    ``_calculate_weighted_metrics`` does, so threshold comparisons agree
+    with the scalar path to the last bit.
+
+    Returns:
+        fp, fn: (C, T, W) arrays for C combinations, T thresholds and W
+        primacy weights
+    """
+    n_combos = weight_array.shape[0]
+    base = np.zeros((n_combos, pillar_matrix.shape[0]), dtype=np.float64)
+    for j in range(pillar_matrix.shape[1]):
+        base += pillar_matrix[:, j] * weight_array[:, j : j + 1]
+
+    fp = np.zeros((n_combos, len(thresholds), len(primacy_weights)), dtype=np.int64)
+    fn = np.zeros_like(fp)
+    for k, pw in enumerate(primacy_weights):
+        if pw > 0 and primacy_scores is not None:
+            scores = base + primacy_scores * (pw / 100.0)
+        else:
+            scores = base
+        positive = scores[:, actuals]
+        negative = scores[:, ~actuals]
+        for t, threshold in enumerate(thresholds):
+            fp[:, t, k] = (negative >= threshold).sum(axis=1)
+            fn[:, t, k] = (positive < threshold).sum(axis=1)
+    return fp, fn
+
+
+def _mcc(tp: np.ndarray, tn: np.ndarray, fp: np.ndarray, fn: np.ndarray) -> np.ndarray:
+    """Vectorized Matthews Correlation Coefficient (0 where undefined)."""
+    numerator = (tp * tn - fp * fn).astype(np.float64)
+    denominator = (
+        (tp + fp).astype(np.float64)
+        * (tp + fn).astype(np.float64)
+        * (tn + fp).astype(np.float64)
+        * (tn + fn).astype(np.float64)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = numerator / np.sqrt(denominator)
+    return np.where(denominator > 0, scores, 0.0)
+
+
+@dataclass
+class GridSearchResult:
+    """Best configuration found by ``_grid_search``."""
+
+    weights: dict[str, float]
+    threshold: int
+    primacy_weight: float
+    metrics: AccuracyMetrics
+
+    @property
+    def score(self) -> float:
+        return self.metrics.mcc
+
+
+def _grid_search_arrays(
+    pillar_matrix: np.ndarray,
+    actuals: np.ndarray,
+    weight_combos: list[dict[str, float]],
+    pillar_order: list[str],
+    thresholds: list[int],
+    primacy_scores: np.ndarray | None = None,
+    primacy_weights: list[float] | None = None,
+    chunk_elements: int = EVAL_CHUNK_ELEMENTS,
+    workers: int = 1,
+) -> GridSearchResult | None:
+    """
+    Find the combination x threshold x primacy weight with the highest MCC.
+
+    Combinations are scored in chunks of at most ``chunk_elements`` weighted
+    scores, so memory stays bounded however many combinations and samples
+    there are. Chunks run on ``workers`` threads (numpy releases the GIL).
+    Ties go to the first candidate in (combination, threshold, primacy
+    weight) order, matching a nested loop with a strict ``>`` comparison.
+
+    Returns:
+        GridSearchResult, or None if there are no samples or combinations
+    """
+    n_samples = pillar_matrix.shape[0]
+    if n_samples == 0 or not weight_combos or not thresholds:
+        return None
+
+    pw_list = list(primacy_weights) if primacy_weights else [0.0]
+    weight_array = (
+        np.array([[w.get(p, 0.0) for p in pillar_order] for w in weight_combos], dtype=np.float64)
+        / 100.0
+    )
+    n_positive = int(actuals.sum())
+    n_negative = n_samples - n_positive
+
+    chunk_size = max(1, chunk_elements // n_samples)
+    starts = list(range(0, len(weight_combos), chunk_size))
+
+    def evaluate(start: int) -> tuple[float, int, tuple[int, int, int, int]]:
+        fp, fn = _confusion_counts(
+            pillar_matrix,
+            actuals,
+            primacy_scores,
+            weight_array[start : start + chunk_size],
+            thresholds,
+            pw_list,
+        )
+        tp = n_positive - fn
+        tn = n_negative - fp
+        scores = _mcc(tp, tn, fp, fn)
+        flat = int(np.argmax(scores))  # First maximum in C order
+        idx = np.unravel_index(flat, scores.shape)
+        counts = (int(tp[idx]), int(tn[idx]), int(fp[idx]), int(fn[idx]))
+        return float(scores.flat[flat]), start * scores[0].size + flat, counts
+
+    if workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunk_results = list(pool.map(evaluate, starts))
+    else:
+        chunk_results = [evaluate(start) for start in starts]
+
+    best_score, best_flat, (tp, tn, fp, fn) = chunk_results[0]
+    for score, flat, counts in chunk_results[1:]:
+        if score > best_score:
+            best_score, best_flat, (tp, tn, fp, fn) = score, flat, counts
+
+    combo, rest = divmod(best_flat, len(thresholds) * len(pw_list))
+    t, k = divmod(rest, len(pw_list))
+    return GridSearchResult(
+        weights=weight_combos[combo],
+        threshold=thresholds[t],
+        primacy_weight=pw_list[k],
+        metrics=AccuracyMetrics(
+            accuracy=(tp + tn) / n_samples,
+            over_rate=fp / n_samples,
+            under_rate=fn / n_samples,
+            correct=tp + tn,
+            over=fp,
+            under=fn,
+            total=n_samples,
+            true_positives=tp,
+            true_negatives=tn,
+        ),
+    )
+
+
+def _grid_search(
+    matrix: SampleMatrix,
+    weight_combos: list[dict[str, float]],
+    thresholds: list[int],
+    primacy_weights: list[float] | None = None,
+    workers: int = 1,
+) -> GridSearchResult | None:
+    """``_grid_search_arrays`` over the samples eligible for these weights."""
+    if not weight_combos:
+        return None
+    pillars = list(weight_combos[0])
+    mask = matrix.eligible(pillars)
+    return _grid_search_arrays(
+        matrix.columns(pillars)[mask],
+        matrix.actuals[mask],
+        weight_combos,
+        pillars,
+        thresholds,
+        primacy_scores=matrix.primacy[mask],
+        primacy_weights=primacy_weights,
+        workers=workers,
+    )
+
+
+def _evaluate_weights(
+    matrix: SampleMatrix,
+    weights: dict[str, float],
+    threshold: int = 50,
+    primacy_weight: float = 0.0,
+) -> AccuracyMetrics:
+    """Vectorized equivalent of ``_calculate_weighted_metrics``."""
+    result = _grid_search(matrix, [weights], [threshold], [primacy_weight])
+    return result.metrics if result is not None else AccuracyMetrics()
 
 
 def _batch_evaluate(
@@ -729,6 +1021,7 @@ def _batch_evaluate(
     thresholds: list[int],
     primacy_scores: np.ndarray | None = None,
     primacy_weights: list[float] | None = None,
+    workers: int = 1,
 ) -> tuple[dict[str, float], int, float, AccuracyMetrics, float]:
     """
     Vectorized evaluation of all weight+threshold combinations.
@@ -741,101 +1034,24 @@ def _batch_evaluate(
         thresholds: Findability thresholds to test
         primacy_scores: Optional (N,) array of source primacy scores (0-100)
         primacy_weights: Optional list of primacy bonus weights to search over
+        workers: Threads to evaluate chunks on
 
     Returns:
         best_weights, best_threshold, best_score, best_metrics, best_primacy_weight
     """
-    n_samples = pillar_matrix.shape[0]
-    if n_samples == 0:
+    result = _grid_search_arrays(
+        pillar_matrix,
+        actuals,
+        weight_combos,
+        pillar_order,
+        thresholds,
+        primacy_scores=primacy_scores,
+        primacy_weights=primacy_weights,
+        workers=workers,
+    )
+    if result is None:
         return DEFAULT_WEIGHTS.copy(), 50, 0.0, AccuracyMetrics(), 0.0
-
-    # Convert weight combos to numpy array (C, P)
-    weight_array = (
-        np.array(
-            [[w[p] for p in pillar_order] for w in weight_combos],
-            dtype=np.float64,
-        )
-        / 100.0
-    )  # Normalize to 0-1
-
-    # Compute all weighted scores: (C, N) = (C, P) @ (P, N)
-    base_scores = weight_array @ pillar_matrix.T  # (C, N)
-
-    # Primacy weights to test (default: just 0)
-    pw_list = primacy_weights if primacy_weights else [0.0]
-    has_primacy = primacy_scores is not None and any(pw > 0 for pw in pw_list)
-
-    best_score = -1.0
-    best_weights = weight_combos[0]
-    best_threshold = thresholds[0]
-    best_metrics = AccuracyMetrics()
-    best_pw = 0.0
-
-    for pw in pw_list:
-        if has_primacy and pw > 0:
-            # Add primacy bonus: (C, N) + (1, N) broadcast
-            primacy_bonus = primacy_scores * (pw / 100.0)  # type: ignore[operator]
-            all_scores = base_scores + primacy_bonus[np.newaxis, :]  # type: ignore[index]
-        else:
-            all_scores = base_scores
-
-        # Pre-compute positive/negative counts for MCC
-        n_positive = int(actuals.sum())
-        n_negative = n_samples - n_positive
-
-        for threshold in thresholds:
-            # Predictions: (C, N) boolean
-            predictions = all_scores >= threshold
-
-            # Compare to actuals (broadcast)
-            actuals_row = actuals[np.newaxis, :]  # (1, N)
-            over_mask = predictions & ~actuals_row  # FP
-            under_mask = ~predictions & actuals_row  # FN
-
-            fp = over_mask.sum(axis=1)  # (C,)
-            fn = under_mask.sum(axis=1)
-            tp = n_positive - fn  # TP = total positives - false negatives
-            tn = n_negative - fp  # TN = total negatives - false positives
-
-            accuracy = (tp + tn) / n_samples
-            over_rate = fp / n_samples
-            under_rate = fn / n_samples
-
-            # Matthews Correlation Coefficient (vectorized)
-            # MCC = (TP*TN - FP*FN) / sqrt((TP+FP)*(TP+FN)*(TN+FP)*(TN+FN))
-            numerator = (tp * tn - fp * fn).astype(np.float64)
-            denom_parts = (
-                (tp + fp).astype(np.float64)
-                * (tp + fn).astype(np.float64)
-                * (tn + fp).astype(np.float64)
-                * (tn + fn).astype(np.float64)
-            )
-            # Avoid division by zero (happens when all predictions are same class)
-            denom = np.sqrt(np.maximum(denom_parts, 1e-10))
-            scores = numerator / denom
-            # Clamp MCC to [-1, 1] (numerical precision)
-            scores = np.clip(scores, -1.0, 1.0)
-
-            # Find best in this threshold
-            best_idx = np.argmax(scores)
-            if scores[best_idx] > best_score:
-                best_score = float(scores[best_idx])
-                best_weights = weight_combos[best_idx]
-                best_threshold = threshold
-                best_pw = pw
-                best_metrics = AccuracyMetrics(
-                    accuracy=float(accuracy[best_idx]),
-                    over_rate=float(over_rate[best_idx]),
-                    under_rate=float(under_rate[best_idx]),
-                    correct=int(tp[best_idx] + tn[best_idx]),
-                    over=int(fp[best_idx]),
-                    under=int(fn[best_idx]),
-                    total=n_samples,
-                    true_positives=int(tp[best_idx]),
-                    true_negatives=int(tn[best_idx]),
-                )
-
-    return best_weights, best_threshold, best_score, best_metrics, best_pw
+    return result.weights, result.threshold, result.score, result.metrics, result.primacy_weight
 
 
 def _calculate_weighted_metrics(
@@ -1007,28 +1223,23 @@ async def optimize_answerability_thresholds(
             for v in _frange(MIN_PARTIALLY_ANSWERABLE, MAX_PARTIALLY_ANSWERABLE, THRESHOLD_STEP)
         ]
 
-        combinations_tested = 0
+        # Constraint: partially < fully
+        pairs = [(f, p) for f in fully_values for p in partially_values if p < f]
+        accuracies = _threshold_accuracies(*_answerability_arrays(training_samples), pairs)
+
+        combinations_tested = len(pairs)
         best_accuracy = result.baseline_accuracy
         best_thresholds = default_thresholds.copy()
 
-        for fully in fully_values:
-            for partially in partially_values:
-                # Constraint: partially < fully
-                if partially >= fully:
-                    continue
-
-                thresholds = {
-                    "fully_answerable": fully,
-                    "partially_answerable": partially,
+        if pairs:
+            best = int(np.argmax(accuracies))  # First maximum, as a strict > loop
+            if accuracies[best] > best_accuracy:
+                best_accuracy = float(accuracies[best])
+                best_thresholds = {
+                    "fully_answerable": pairs[best][0],
+                    "partially_answerable": pairs[best][1],
                 }
 
-                accuracy = _calculate_threshold_accuracy(training_samples, thresholds)
-                combinations_tested += 1
-
-                if accuracy > best_accuracy:
-                    best_accuracy = accuracy
-                    best_thresholds = thresholds.copy()
-
         result.combinations_tested = combinations_tested
         result.best_accuracy = best_accuracy
         result.best_thresholds = best_thresholds
@@ -1114,6 +1325,46 @@ def _calculate_threshold_accuracy(
     return correct / total if total > 0 else 0.0
 
 
+def _answerability_arrays(samples: list[CalibrationSample]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Similarity scores and actual answerability levels as arrays.
+
+    Levels are 0 (not), 1 (partially) and 2 (fully answerable), using the
+    same outcome mapping as ``_calculate_threshold_accuracy``.
+    """
+    scores = np.array([s.sim_score for s in samples], dtype=np.float64)
+    levels = np.array(
+        [2 if s.obs_cited else 1 if s.obs_mentioned else 0 for s in samples], dtype=np.int8
+    )
+    return scores, levels
+
+
+def _threshold_accuracies(
+    scores: np.ndarray,
+    levels: np.ndarray,
+    pairs: list[tuple[float, float]],
+) -> np.ndarray:
+    """
+    Vectorized ``_calculate_threshold_accuracy`` for many threshold pairs.
+
+    Args:
+        scores: (N,) similarity scores
+        levels: (N,) actual answerability levels from ``_answerability_arrays``
+        pairs: (fully, partially) threshold pairs
+
+    Returns:
+        (len(pairs),) accuracies, with adjacent predictions scoring 0.5
+    """
+    if len(scores) == 0 or not pairs:
+        return np.zeros(len(pairs), dtype=np.float64)
+    fully = np.array([f for f, _ in pairs], dtype=np.float64)[:, None]
+    partially = np.array([p for _, p in pairs], dtype=np.float64)[:, None]
+    predicted = (scores >= partially).astype(np.int8) + (scores >= fully)
+    distance = np.abs(predicted - levels)
+    credit = (distance == 0).sum(axis=1) + 0.5 * (distance == 1).sum(axis=1)
+    return credit / len(scores)
+
+
 def _are_adjacent(pred: str, actual: str) -> bool:
     """Check if two answerability levels are adjacent."""
     levels = ["not_answerable", "partially_answerable", "fully_answerable"]
@@ -1184,11 +1435,13 @@ async def validate_config_improvement(
         # Get config weights
         config_weights = config.weights
 
+        matrix = SampleMatrix.from_samples(samples)
+
         # Calculate accuracy with config weights
-        config_accuracy = _calculate_weighted_accuracy(samples, config_weights)
+        config_accuracy = _evaluate_weights(matrix, config_weights).accuracy
 
         # Calculate baseline accuracy
-        baseline_accuracy = _calculate_weighted_accuracy(samples, DEFAULT_WEIGHTS)
+        baseline_accuracy = _evaluate_weights(matrix, DEFAULT_WEIGHTS).accuracy
 
         improvement = config_accuracy - baseline_accuracy
 
@@ -1209,17 +1462,20 @@ async def optimize_per_site_type(
     site_types: list[str] | None = None,
     min_samples: int = 50,
     window_days: int = 90,
+    workers: int | None = None,
 ) -> dict[str, OptimizationResult]:
     """
     Train separate weight profiles for each site type.
 
-    Runs optimize_pillar_weights for each site type that has enough samples.
-    Site types with too few samples fall back to the global weights.
+    Runs the pillar weight optimization for each site type that has enough
+    samples. Samples are loaded once and partitioned by site type. Site
+    types with too few samples fall back to the global weights.
 
     Args:
         site_types: Optional list of site types to train. If None, trains all.
         min_samples: Minimum samples per site type (lower than global since subsets)
         window_days: Number of days to look back
+        workers: Threads for the vectorized evaluation (default: from settings)
 
     Returns:
         Dict mapping site_type -> OptimizationResult
@@ -1227,16 +1483,23 @@ async def optimize_per_site_type(
     from worker.extraction.site_type import SiteType
 
     types_to_train = site_types or [st.value for st in SiteType if st != SiteType.MIXED]
+    workers = _optimizer_workers(workers)
+
+    samples_by_type: dict[str, list[CalibrationSample]] = {}
+    for sample in await _load_weight_samples(window_days):
+        if sample.site_type:
+            samples_by_type.setdefault(sample.site_type, []).append(sample)
 
     results: dict[str, OptimizationResult] = {}
 
     for st in types_to_train:
         logger.info("optimizing_site_type_weights", site_type=st)
-        result = await optimize_pillar_weights(
-            window_days=window_days,
+        result = await asyncio.to_thread(
+            _optimize_weights_for_samples,
+            samples_by_type.get(st, []),
             min_samples=min_samples,
-            site_type=st,
             coarse_then_fine=True,
+            workers=workers,
         )
         results[st] = result
 
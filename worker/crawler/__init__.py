@@ -43,6 +43,7 @@ __all__ = [
     "RenderDelta",
     "RenderMode",
     "RendererConfig",
+    "RenderMetrics",
     "detect_render_mode",
     # Storage
     "CrawlStorage",
@@ -1,100 +1,221 @@
-"""Crawl result caching using Redis."""
-
-import json
+"""Crawl result caching using Redis.
+
+A cached crawl is split across two keys so that metadata queries and
+selective page loads do not transfer the whole crawl:
+
+- ``crawl:cache:<domain>`` holds a small orjson manifest: the crawl's
+  metadata plus one entry (URL, sizes) per page.
+- ``crawl:cache:<domain>:pages:<version>`` is a hash with one compressed
+  entry per page, keyed by its index in the manifest.
+
+Each write uses a fresh version, so a reader that fetched the previous
+manifest never mixes its pages with the new crawl's. Page entries are
+fetched with pipelined ``HMGET`` calls, and (de)serialization runs in a
+worker thread to keep the event loop free.
+"""
+
+import asyncio
+import uuid
+import zlib
+from collections.abc import Iterable
 from dataclasses import asdict
 from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 import structlog
 
-from worker.crawler.crawler import CrawlPage, CrawlResult
-from worker.redis import get_redis_connection as get_redis
+from worker.crawler.crawler import CrawlPage, CrawlResult, PageCallback
+from worker.redis import get_async_redis_connection_bytes as get_redis
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 logger = structlog.get_logger(__name__)
 
 # Default cache TTL: 24 hours
 DEFAULT_CACHE_TTL_SECONDS = 86400
 
+# Page entries fetched per HMGET; all batches go out in one pipeline
+PAGE_BATCH_SIZE = 64
+
+# How long a replaced crawl's pages stay readable for in-flight loads
+STALE_PAGES_TTL_SECONDS = 60
+
+# One-byte codec prefix on every page entry
+_CODEC_ZSTD = b"z"
+_CODEC_ZLIB = b"d"
+
+
+def _compress(data: bytes) -> bytes:
+    if ZSTD_AVAILABLE:
+        return _CODEC_ZSTD + zstandard.ZstdCompressor(level=3).compress(data)
+    return _CODEC_ZLIB + zlib.compress(data, 6)
+
+
+def _decompress(data: bytes) -> bytes:
+    codec, payload = data[:1], data[1:]
+    if codec == _CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Cache entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+def _encode_pages(pages: list[CrawlPage]) -> list[bytes]:
+    """Serialize and compress pages (runs in a worker thread)."""
+    return [_compress(orjson.dumps(asdict(page))) for page in pages]
+
+
+def _decode_pages(entries: list[bytes]) -> list[CrawlPage]:
+    """Decompress and deserialize page entries (runs in a worker thread)."""
+    pages = []
+    for entry in entries:
+        p = orjson.loads(_decompress(entry))
+        pages.append(
+            CrawlPage(
+                url=p["url"],
+                final_url=p["final_url"],
+                title=p.get("title"),
+                html=p["html"],
+                content_type=p.get("content_type"),
+                status_code=p["status_code"],
+                depth=p["depth"],
+                fetch_time_ms=p["fetch_time_ms"],
+                fetched_at=datetime.fromisoformat(p["fetched_at"]),
+                links_found=p["links_found"],
+                surface=p.get("surface", "marketing"),
+                etag=p.get("etag"),
+                last_modified=p.get("last_modified"),
+            )
+        )
+    return pages
+
 
 class CrawlCache:
     """
     Cache for crawl results using Redis.
 
-    Stores complete crawl results by domain, allowing reuse
-    across audit runs within the TTL window.
+    Stores crawl results by domain, allowing reuse across audit runs
+    within the TTL window. Pages can be loaded selectively by URL.
     """
 
-    def __init__(self, ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS):
+    def __init__(self, ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS, redis: Any = None):
         """
         Initialize the cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default: 24 hours)
+            redis: Async Redis client (default: the worker's shared client)
         """
         self.ttl_seconds = ttl_seconds
         self._prefix = "crawl:cache:"
+        self._redis = redis
+
+    def _client(self) -> Any:
+        return self._redis if self._redis is not None else get_redis()
 
     def _cache_key(self, domain: str) -> str:
-        """Generate cache key for a domain."""
+        """Generate the manifest key for a domain."""
         return f"{self._prefix}{domain.lower()}"
 
-    async def get(self, domain: str) -> CrawlResult | None:
+    def _pages_key(self, domain: str, version: str) -> str:
+        """Generate the page hash key for one cached version of a domain."""
+        return f"{self._cache_key(domain)}:pages:{version}"
+
+    async def get_manifest(self, domain: str) -> dict | None:
+        """
+        Get the cached crawl's manifest (metadata and page list, no HTML).
+
+        Args:
+            domain: The domain to look up
+
+        Returns:
+            Manifest dict, or None if not cached. An entry written before
+            the manifest format (no ``version``, pages inline) counts as not
+            cached, so the next ``set`` overwrites it.
+        """
+        data = await self._client().get(self._cache_key(domain))
+        if not data:
+            return None
+        manifest = orjson.loads(data)
+        if not isinstance(manifest, dict) or "version" not in manifest:
+            logger.info("cache_legacy_entry_ignored", domain=domain)
+            return None
+        return manifest
+
+    async def _load_pages(
+        self, domain: str, version: str, indices: list[int]
+    ) -> list[CrawlPage] | None:
+        """Fetch and decode page entries; None if any entry is missing."""
+        key = self._pages_key(domain, version)
+        fields = [str(i) for i in indices]
+        async with self._client().pipeline(transaction=False) as pipe:
+            for start in range(0, len(fields), PAGE_BATCH_SIZE):
+                pipe.hmget(key, fields[start : start + PAGE_BATCH_SIZE])
+            batches = await pipe.execute()
+
+        entries = [entry for batch in batches for entry in batch]
+        if any(entry is None for entry in entries):
+            return None
+        return await asyncio.to_thread(_decode_pages, entries)
+
+    async def get(self, domain: str, urls: Iterable[str] | None = None) -> CrawlResult | None:
         """
         Get cached crawl result for a domain.
 
         Args:
             domain: The domain to look up
+            urls: Only load these pages (default: all pages). Crawl metadata
+                is unchanged, so a partial result's counters still describe
+                the full crawl.
 
         Returns:
             CrawlResult if found and valid, None otherwise
         """
         try:
-            redis = get_redis()
-            key = self._cache_key(domain)
-            data = redis.get(key)
-
-            if not data:
+            manifest = await self.get_manifest(domain)
+            if manifest is None:
                 logger.debug("cache_miss", domain=domain)
                 return None
 
-            # Parse cached data
-            cached = json.loads(data)
-
-            # Reconstruct CrawlResult
-            pages = [
-                CrawlPage(
-                    url=p["url"],
-                    final_url=p["final_url"],
-                    title=p.get("title"),
-                    html=p["html"],
-                    content_type=p.get("content_type"),
-                    status_code=p["status_code"],
-                    depth=p["depth"],
-                    fetch_time_ms=p["fetch_time_ms"],
-                    fetched_at=datetime.fromisoformat(p["fetched_at"]),
-                    links_found=p["links_found"],
-                )
-                for p in cached["pages"]
-            ]
+            entries = manifest["pages"]
+            if urls is None:
+                indices = list(range(len(entries)))
+            else:
+                wanted = set(urls)
+                indices = [i for i, entry in enumerate(entries) if entry["url"] in wanted]
+
+            pages = await self._load_pages(domain, manifest["version"], indices)
+            if pages is None:
+                # Expired or replaced between reading the manifest and the pages
+                logger.info("cache_incomplete", domain=domain)
+                return None
 
             result = CrawlResult(
-                domain=cached["domain"],
-                start_url=cached["start_url"],
+                domain=manifest["domain"],
+                start_url=manifest["start_url"],
                 pages=pages,
-                urls_discovered=cached["urls_discovered"],
-                urls_crawled=cached["urls_crawled"],
-                urls_skipped=cached["urls_skipped"],
-                urls_failed=cached["urls_failed"],
-                started_at=datetime.fromisoformat(cached["started_at"]),
-                completed_at=datetime.fromisoformat(cached["completed_at"]),
-                duration_seconds=cached["duration_seconds"],
-                robots_respected=cached["robots_respected"],
-                max_depth_reached=cached["max_depth_reached"],
+                urls_discovered=manifest["urls_discovered"],
+                urls_crawled=manifest["urls_crawled"],
+                urls_skipped=manifest["urls_skipped"],
+                urls_failed=manifest["urls_failed"],
+                started_at=datetime.fromisoformat(manifest["started_at"]),
+                completed_at=datetime.fromisoformat(manifest["completed_at"]),
+                duration_seconds=manifest["duration_seconds"],
+                robots_respected=manifest["robots_respected"],
+                max_depth_reached=manifest["max_depth_reached"],
             )
 
             logger.info(
                 "cache_hit",
                 domain=domain,
                 pages=len(pages),
+                pages_cached=len(entries),
                 age_seconds=int((datetime.now(UTC) - result.completed_at).total_seconds()),
             )
             return result
@@ -114,21 +235,26 @@ class CrawlCache:
             True if cached successfully, False otherwise
         """
         try:
-            redis = get_redis()
+            redis = self._client()
             key = self._cache_key(result.domain)
+            version = uuid.uuid4().hex[:12]
+            pages_key = self._pages_key(result.domain, version)
 
-            # Serialize pages with datetime handling
-            pages_data = []
-            for page in result.pages:
-                page_dict = asdict(page)
-                page_dict["fetched_at"] = page.fetched_at.isoformat()
-                pages_data.append(page_dict)
+            encoded = await asyncio.to_thread(_encode_pages, result.pages)
 
-            # Build cache data
-            cache_data = {
+            manifest = {
+                "version": version,
                 "domain": result.domain,
                 "start_url": result.start_url,
-                "pages": pages_data,
+                "pages": [
+                    {
+                        "url": page.url,
+                        "status_code": page.status_code,
+                        "html_size": len(page.html),
+                        "stored_size": len(entry),
+                    }
+                    for page, entry in zip(result.pages, encoded, strict=True)
+                ],
                 "urls_discovered": result.urls_discovered,
                 "urls_crawled": result.urls_crawled,
                 "urls_skipped": result.urls_skipped,
@@ -141,12 +267,34 @@ class CrawlCache:
                 "cached_at": datetime.now(UTC).isoformat(),
             }
 
-            redis.setex(key, self.ttl_seconds, json.dumps(cache_data))
+            previous = await self.get_manifest(result.domain)
+
+            async with redis.pipeline(transaction=True) as pipe:
+                for start in range(0, len(encoded), PAGE_BATCH_SIZE):
+                    pipe.hset(
+                        pages_key,
+                        mapping={
+                            str(i): entry
+                            for i, entry in enumerate(
+                                encoded[start : start + PAGE_BATCH_SIZE], start=start
+                            )
+                        },
+                    )
+                pipe.expire(pages_key, self.ttl_seconds)
+                pipe.set(key, orjson.dumps(manifest), ex=self.ttl_seconds)
+                if previous is not None:
+                    # Let loads that already read the old manifest finish
+                    pipe.expire(
+                        self._pages_key(result.domain, previous["version"]),
+                        STALE_PAGES_TTL_SECONDS,
+                    )
+                await pipe.execute()
 
             logger.info(
                 "cache_set",
                 domain=result.domain,
                 pages=len(result.pages),
+                stored_bytes=sum(len(entry) for entry in encoded),
                 ttl_seconds=self.ttl_seconds,
             )
             return True
@@ -166,9 +314,11 @@ class CrawlCache:
             True if invalidated, False otherwise
         """
         try:
-            redis = get_redis()
-            key = self._cache_key(domain)
-            deleted = redis.delete(key)
+            manifest = await self.get_manifest(domain)
+            keys = [self._cache_key(domain)]
+            if manifest is not None:
+                keys.append(self._pages_key(domain, manifest["version"]))
+            deleted = await self._client().delete(*keys)
             logger.info("cache_invalidated", domain=domain, deleted=bool(deleted))
             return bool(deleted)
         except Exception as e:
@@ -186,23 +336,24 @@ class CrawlCache:
             Dict with cache info or None if not cached
         """
         try:
-            redis = get_redis()
             key = self._cache_key(domain)
-            ttl = redis.ttl(key)
+            async with self._client().pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                data, ttl = await pipe.execute()
 
-            if ttl <= 0:
+            if not data or ttl <= 0:
                 return None
 
-            data = redis.get(key)
-            if not data:
+            manifest = orjson.loads(data)
+            if not isinstance(manifest, dict) or "version" not in manifest:
                 return None
-
-            cached = json.loads(data)
             return {
-                "domain": cached["domain"],
-                "pages_count": len(cached["pages"]),
-                "cached_at": cached.get("cached_at"),
-                "completed_at": cached["completed_at"],
+                "domain": manifest["domain"],
+                "pages_count": len(manifest["pages"]),
+                "stored_bytes": sum(p["stored_size"] for p in manifest["pages"]),
+                "cached_at": manifest.get("cached_at"),
+                "completed_at": manifest["completed_at"],
                 "ttl_remaining_seconds": ttl,
             }
 
@@ -222,6 +373,7 @@ async def get_cached_or_crawl(
     user_agent: str = "FindableBot/1.0",
     use_cache: bool = True,
     force_refresh: bool = False,
+    page_callback: PageCallback | None = None,
 ) -> CrawlResult:
     """
     Get crawl result from cache or perform fresh crawl.
@@ -233,6 +385,8 @@ async def get_cached_or_crawl(
         user_agent: User agent string
         use_cache: Whether to use cache (default: True)
         force_refresh: Force a fresh crawl even if cached (default: False)
+        page_callback: Awaited with each page of a fresh crawl as it is crawled
+            (not called for cached results)
 
     Returns:
         CrawlResult from cache or fresh crawl
@@ -256,6 +410,7 @@ async def get_cached_or_crawl(
         max_pages=max_pages,
         max_depth=max_depth,
         user_agent=user_agent,
+        page_callback=page_callback,
     )
 
     # Cache the result if caching is enabled
@@ -1,13 +1,14 @@
 """BFS web crawler with configurable limits."""
 
-from collections import deque
-from collections.abc import Callable
+import asyncio
+import hashlib
+import heapq
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
 import structlog
-from bs4 import BeautifulSoup
 
 from worker.crawler.fetcher import Fetcher
 from worker.crawler.robots import RobotsChecker
@@ -17,6 +18,8 @@ from worker.crawler.url import (
     is_internal_url,
     normalize_url,
 )
+from worker.extraction.document import PageDocument
+from worker.http_pool import HTTPClientPool
 
 logger = structlog.get_logger(__name__)
 
@@ -56,6 +59,11 @@ def classify_surface(url: str) -> str:
     return "marketing"
 
 
+def hash_html(html: str) -> str:
+    """Content hash used to detect unchanged pages between crawls."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+
+
 @dataclass
 class CrawlPage:
     """A crawled page with metadata."""
@@ -72,6 +80,48 @@ class CrawlPage:
     links_found: int
     surface: str = "marketing"  # "docs" | "marketing"
 
+    # HTTP validators for conditional re-crawls
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False  # Served from the previous crawl after a 304
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of ``html`` (see ``hash_html``)."""
+        return hash_html(self.html)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for re-fetching this page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def document(self) -> PageDocument:
+        """Parsed-once view of ``html`` shared by the per-page analyzers."""
+        document: PageDocument | None = getattr(self, "_document", None)
+        if document is None or document.html is not self.html:
+            document = PageDocument(self.html, self.final_url)
+            self._document = document
+        return document
+
+    @document.setter
+    def document(self, document: PageDocument) -> None:
+        self._document = document
+
+    def release_html(self) -> None:
+        """Drop the HTML and parsed DOM once nothing needs them (frees memory)."""
+        self.html = ""
+        self.__dict__.pop("_document", None)
+
+
+# Receives each page as soon as it is crawled (see Crawler.crawl)
+PageCallback = Callable[[CrawlPage], Awaitable[None]]
+
 
 @dataclass
 class CrawlResult:
@@ -95,6 +145,9 @@ class CrawlResult:
     marketing_pages_crawled: int = 0
     docs_surface_detected: bool = False
 
+    # Pages reused from the previous crawl after a 304 Not Modified
+    pages_not_modified: int = 0
+
     @property
     def success_rate(self) -> float:
         """Calculate crawl success rate."""
@@ -121,6 +174,34 @@ class CrawlConfig:
     priority_paths: list[str] | None = None
 
 
+class CrawlFrontier:
+    """Priority frontier of URLs waiting to be fetched.
+
+    URLs are ordered by depth and then by insertion order, so draining the
+    frontier one URL at a time reproduces a BFS crawl while a pool of
+    workers can pull from it concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, str]] = []
+        self._counter = 0
+
+    def push(self, url: str, depth: int) -> int:
+        """Add a URL and return its dispatch sequence number."""
+        seq = self._counter
+        self._counter += 1
+        heapq.heappush(self._heap, (depth, seq, url))
+        return seq
+
+    def pop(self) -> tuple[str, int, int]:
+        """Remove the next URL, returning (url, depth, seq)."""
+        depth, seq, url = heapq.heappop(self._heap)
+        return url, depth, seq
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
 # Default priority paths for better findability coverage
 DEFAULT_PRIORITY_PATHS = [
     "/about",
@@ -149,29 +230,44 @@ DEFAULT_PRIORITY_PATHS = [
 
 
 class Crawler:
-    """BFS web crawler."""
+    """BFS web crawler.
+
+    Pages are fetched by ``config.concurrency`` workers pulling from a shared
+    :class:`CrawlFrontier`. Per-host politeness is still enforced by
+    ``Fetcher._rate_limit`` (honouring the robots.txt crawl-delay), so the
+    speedup comes from overlapping network latency rather than hitting a
+    host harder than ``min_delay`` allows.
+
+    When ``previous_pages`` (URL -> page from an earlier crawl) is given,
+    those URLs are fetched conditionally and a 304 reuses the stored HTML.
+    """
 
-    def __init__(self, config: CrawlConfig):
+    def __init__(
+        self,
+        config: CrawlConfig,
+        http_pool: HTTPClientPool | None = None,
+        previous_pages: Mapping[str, CrawlPage] | None = None,
+    ):
         self.config = config
+        self.http_pool = http_pool
+        self.previous_pages = previous_pages or {}
         self.fetcher = Fetcher(
             user_agent=config.user_agent,
             timeout=config.timeout,
             min_delay_between_requests=config.min_delay,
+            http_pool=http_pool,
         )
         self.robots = RobotsChecker(
             user_agent=config.user_agent,
             respect_robots=config.respect_robots,
+            http_pool=http_pool,
         )
 
-    def _extract_links(self, html: str, base_url: str) -> list[str]:
-        """Extract and normalize links from HTML."""
+    def _extract_links(self, document: PageDocument, base_url: str) -> list[str]:
+        """Extract and normalize links from a parsed page."""
         links = []
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            for a_tag in soup.find_all("a", href=True):
-                href = a_tag["href"]
-
+            for href in document.hrefs:
                 # Skip javascript, mailto, tel links
                 if href.startswith(("javascript:", "mailto:", "tel:", "#")):
                     continue
@@ -186,28 +282,114 @@ class Crawler:
 
         return links
 
-    def _extract_title(self, html: str) -> str | None:
-        """Extract page title from HTML."""
+    def _extract_title(self, document: PageDocument) -> str | None:
+        """Extract page title from a parsed page."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            title_tag = soup.find("title")
-            if title_tag and title_tag.string:  # type: ignore[union-attr]
-                return title_tag.string.strip()[:500]  # type: ignore[union-attr, no-any-return]
+            return document.title
         except Exception:
-            pass
-        return None
+            return None
+
+    async def _crawl_url(self, url: str, depth: int) -> tuple[CrawlPage, list[str]] | str:
+        """
+        Fetch and parse a single frontier URL.
+
+        Returns:
+            (page, links) on success, otherwise "skipped" or "failed"
+        """
+        # Check depth limit
+        if depth > self.config.max_depth:
+            return "skipped"
+
+        # Check robots.txt
+        if not await self.robots.is_allowed(url):
+            logger.debug("robots_disallowed", url=url)
+            return "skipped"
+
+        # Get crawl delay from robots.txt
+        crawl_delay = self.robots.get_crawl_delay(url)
+
+        # Fetch the page, conditionally if it was seen in the previous crawl
+        previous = self.previous_pages.get(url)
+        validators = previous.validators if previous else {}
+        if validators:
+            result = await self.fetcher.fetch(url, crawl_delay, validators=validators)
+        else:
+            result = await self.fetcher.fetch(url, crawl_delay)
+
+        if result.not_modified and previous is not None:
+            html, final_url, content_type = (
+                previous.html,
+                previous.final_url,
+                previous.content_type,
+            )
+            etag = result.etag or previous.etag
+            last_modified = result.last_modified or previous.last_modified
+        else:
+            if not result.success:
+                logger.debug(
+                    "fetch_failed",
+                    url=url,
+                    status=result.status_code,
+                    error=result.error,
+                )
+                return "failed"
+
+            # Skip non-HTML responses
+            if not result.is_html or not result.html:
+                return "skipped"
+
+            html, final_url, content_type = result.html, result.final_url, result.content_type
+            etag, last_modified = result.etag, result.last_modified
+
+        # Parse once; the document travels with the page to the analyzers
+        document = PageDocument(html, final_url)
+        title = self._extract_title(document)
+        links = self._extract_links(document, final_url)
+
+        # Create page record with surface classification
+        page = CrawlPage(
+            url=url,
+            final_url=final_url,
+            title=title,
+            html=html,
+            content_type=content_type,
+            status_code=200,
+            depth=depth,
+            fetch_time_ms=result.fetch_time_ms,
+            fetched_at=result.fetched_at,
+            links_found=len(links),
+            surface=classify_surface(final_url),
+            etag=etag,
+            last_modified=last_modified,
+            not_modified=result.not_modified,
+        )
+        page.document = document
+
+        logger.debug(
+            "page_crawled",
+            url=url,
+            title=title[:50] if title else None,
+            depth=depth,
+            links=len(links),
+        )
+
+        return page, links
 
     async def crawl(
         self,
         start_url: str,
         progress_callback: Callable[[int, int], None] | None = None,
+        page_callback: PageCallback | None = None,
     ) -> CrawlResult:
         """
-        Perform a BFS crawl starting from the given URL.
+        Perform a concurrent BFS crawl starting from the given URL.
 
         Args:
             start_url: The URL to start crawling from
             progress_callback: Optional callback(pages_crawled, total_discovered)
+            page_callback: Awaited with each page as soon as it is crawled
+                (in completion order). The fetching worker waits for it, so
+                a callback that blocks (e.g. on a full queue) slows the crawl.
 
         Returns:
             CrawlResult with all crawled pages and statistics
@@ -229,18 +411,18 @@ class Crawler:
             domain=base_domain,
             max_pages=self.config.max_pages,
             max_depth=self.config.max_depth,
+            concurrency=self.config.concurrency,
         )
 
         # Initialize crawl state
-        pages: list[CrawlPage] = []
-        queue: deque[tuple[str, int]] = deque()  # (url, depth)
+        crawled: list[tuple[int, CrawlPage]] = []  # (dispatch seq, page)
+        frontier = CrawlFrontier()
         seen: set[str] = set()
         failed: set[str] = set()
         skipped: set[str] = set()
-        max_depth_reached = 0
 
         # Add start URL to queue
-        queue.append((normalized_start, 0))
+        frontier.push(normalized_start, 0)
         seen.add(normalized_start)
 
         # Seed queue with priority paths (depth 0 so they're crawled early)
@@ -255,7 +437,7 @@ class Crawler:
                 and priority_url not in seen
                 and is_internal_url(priority_url, base_domain)
             ):
-                queue.append((priority_url, 0))
+                frontier.push(priority_url, 0)
                 seen.add(priority_url)
                 priority_count += 1
 
@@ -285,6 +467,7 @@ class Crawler:
                     sitemap_urls=sitemap_urls,
                     user_agent=self.config.user_agent,
                     max_urls=min(100, self.config.max_pages * 2),
+                    http_pool=self.http_pool,
                 )
 
                 sitemap_count = 0
@@ -295,7 +478,7 @@ class Crawler:
                         and normalized not in seen
                         and is_internal_url(normalized, base_domain)
                     ):
-                        queue.append((normalized, 0))  # Depth 0 for priority
+                        frontier.push(normalized, 0)  # Depth 0 for priority
                         seen.add(normalized)
                         sitemap_count += 1
 
@@ -312,93 +495,86 @@ class Crawler:
                 url=normalized_start,
             )
 
-        while queue and len(pages) < self.config.max_pages:
-            url, depth = queue.popleft()
-
-            # Check depth limit
-            if depth > self.config.max_depth:
-                skipped.add(url)
-                continue
-
-            # Check robots.txt
-            if not await self.robots.is_allowed(url):
-                logger.debug("robots_disallowed", url=url)
-                skipped.add(url)
-                continue
-
-            # Get crawl delay from robots.txt
-            crawl_delay = self.robots.get_crawl_delay(url)
-
-            # Fetch the page
-            result = await self.fetcher.fetch(url, crawl_delay)
-
-            if not result.success:
-                logger.debug(
-                    "fetch_failed",
-                    url=url,
-                    status=result.status_code,
-                    error=result.error,
-                )
-                failed.add(url)
-                continue
-
-            # Skip non-HTML responses
-            if not result.is_html or not result.html:
-                skipped.add(url)
-                continue
-
-            # Extract page info
-            title = self._extract_title(result.html)
-            links = self._extract_links(result.html, result.final_url)
-
-            # Create page record with surface classification
-            page = CrawlPage(
-                url=url,
-                final_url=result.final_url,
-                title=title,
-                html=result.html,
-                content_type=result.content_type,
-                status_code=result.status_code,
-                depth=depth,
-                fetch_time_ms=result.fetch_time_ms,
-                fetched_at=result.fetched_at,
-                links_found=len(links),
-                surface=classify_surface(result.final_url),
-            )
-            pages.append(page)
-
-            # Track max depth
-            if depth > max_depth_reached:
-                max_depth_reached = depth
-
-            # Report progress
-            if progress_callback:
-                progress_callback(len(pages), len(seen))
-
-            logger.debug(
-                "page_crawled",
-                url=url,
-                title=title[:50] if title else None,
-                depth=depth,
-                links=len(links),
-            )
-
-            # Add new links to queue
-            for link in links:
-                if link in seen:
-                    continue
-
-                # Check if internal
-                if not self.config.follow_external_links and not is_internal_url(link, base_domain):
-                    continue
-
-                # Check depth of new URL
-                link_depth = depth + 1
-                if link_depth > self.config.max_depth:
-                    continue
-
-                seen.add(link)
-                queue.append((link, link_depth))
+        max_pages = self.config.max_pages
+        in_flight = 0
+        state_changed = asyncio.Condition()
+
+        def is_done() -> bool:
+            return len(crawled) >= max_pages or (not frontier and in_flight == 0)
+
+        def can_dispatch() -> bool:
+            # Never have more fetches outstanding than pages still wanted,
+            # so the crawl stops at exactly max_pages like the serial BFS.
+            return bool(frontier) and len(crawled) + in_flight < max_pages
+
+        async def worker() -> None:
+            nonlocal in_flight
+
+            while True:
+                async with state_changed:
+                    await state_changed.wait_for(lambda: is_done() or can_dispatch())
+                    if is_done():
+                        state_changed.notify_all()
+                        return
+                    url, depth, seq = frontier.pop()
+                    in_flight += 1
+
+                try:
+                    outcome = await self._crawl_url(url, depth)
+                except Exception as e:
+                    logger.warning("crawl_worker_error", url=url, error=str(e))
+                    outcome = "failed"
+
+                accepted: CrawlPage | None = None
+                async with state_changed:
+                    in_flight -= 1
+
+                    if isinstance(outcome, str):
+                        if outcome == "failed":
+                            failed.add(url)
+                        else:
+                            skipped.add(url)
+                    elif len(crawled) < max_pages:
+                        page, links = outcome
+                        crawled.append((seq, page))
+                        accepted = page
+
+                        # Report progress
+                        if progress_callback:
+                            progress_callback(len(crawled), len(seen))
+
+                        # Add new links to queue
+                        for link in links:
+                            if link in seen:
+                                continue
+
+                            # Check if internal
+                            if not self.config.follow_external_links and not is_internal_url(
+                                link, base_domain
+                            ):
+                                continue
+
+                            # Check depth of new URL
+                            link_depth = depth + 1
+                            if link_depth > self.config.max_depth:
+                                continue
+
+                            seen.add(link)
+                            frontier.push(link, link_depth)
+
+                    state_changed.notify_all()
+
+                # Outside the lock: a slow consumer holds back this worker only
+                if accepted is not None and page_callback is not None:
+                    await page_callback(accepted)
+
+        concurrency = max(1, self.config.concurrency)
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        # Keep pages in dispatch (BFS) order regardless of completion order
+        crawled.sort(key=lambda item: item[0])
+        pages = [page for _, page in crawled]
+        max_depth_reached = max((p.depth for p in pages), default=0)
 
         completed_at = datetime.now(UTC)
         duration = (completed_at - started_at).total_seconds()
@@ -416,6 +592,7 @@ class Crawler:
             duration_seconds=round(duration, 2),
             docs_pages=docs_count,
             marketing_pages=marketing_count,
+            pages_not_modified=sum(1 for p in pages if p.not_modified),
         )
 
         return CrawlResult(
@@ -434,6 +611,7 @@ class Crawler:
             docs_pages_crawled=docs_count,
             marketing_pages_crawled=marketing_count,
             docs_surface_detected=docs_count > 0,
+            pages_not_modified=sum(1 for p in pages if p.not_modified),
         )
 
 
@@ -443,6 +621,9 @@ async def crawl_site(
     max_depth: int = 3,
     user_agent: str = "FindableBot/1.0",
     progress_callback: Callable[[int, int], None] | None = None,
+    concurrency: int = 5,
+    previous_pages: Mapping[str, CrawlPage] | None = None,
+    page_callback: PageCallback | None = None,
 ) -> CrawlResult:
     """
     Convenience function to crawl a site.
@@ -453,6 +634,9 @@ async def crawl_site(
         max_depth: Maximum link depth
         user_agent: User agent string
         progress_callback: Optional progress callback
+        concurrency: Number of concurrent fetch workers
+        previous_pages: Pages from an earlier crawl to re-fetch conditionally
+        page_callback: Awaited with each page as soon as it is crawled
 
     Returns:
         CrawlResult with crawled pages
@@ -461,6 +645,7 @@ async def crawl_site(
         max_pages=max_pages,
         max_depth=max_depth,
         user_agent=user_agent,
+        concurrency=concurrency,
     )
-    crawler = Crawler(config)
-    return await crawler.crawl(url, progress_callback)
+    crawler = Crawler(config, previous_pages=previous_pages)
+    return await crawler.crawl(url, progress_callback, page_callback)
@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 import httpx
 import structlog
 
+from worker.http_pool import HTTPClientPool, get_http_pool
+
 logger = structlog.get_logger(__name__)
 
 
@@ -23,11 +25,20 @@ class FetchResult:
     fetch_time_ms: int
     fetched_at: datetime
 
+    # Validators for conditional re-fetches
+    etag: str | None = None
+    last_modified: str | None = None
+
     @property
     def success(self) -> bool:
         """Check if fetch was successful."""
         return self.status_code == 200 and self.html is not None
 
+    @property
+    def not_modified(self) -> bool:
+        """Check if a conditional request found the page unchanged."""
+        return self.status_code == 304
+
     @property
     def is_html(self) -> bool:
         """Check if response is HTML."""
@@ -46,8 +57,10 @@ class Fetcher:
         max_retries: int = 2,
         retry_delay: float = 1.0,
         min_delay_between_requests: float = 0.5,
+        http_pool: HTTPClientPool | None = None,
     ):
         self.user_agent = user_agent
+        self.http_pool = http_pool
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
@@ -62,20 +75,29 @@ class Fetcher:
         return parsed.netloc.lower()
 
     async def _rate_limit(self, domain: str, crawl_delay: float | None = None) -> None:
-        """Apply rate limiting per domain."""
+        """Apply rate limiting per domain.
+
+        The next request slot for the domain is reserved before sleeping, so
+        concurrent callers are spaced ``delay`` apart instead of all waking
+        at the same time.
+        """
         delay = crawl_delay or self.min_delay
+        now = asyncio.get_event_loop().time()
 
+        slot = now
         if domain in self._last_request_time:
-            elapsed = asyncio.get_event_loop().time() - self._last_request_time[domain]
-            if elapsed < delay:
-                await asyncio.sleep(delay - elapsed)
+            slot = max(now, self._last_request_time[domain] + delay)
+
+        self._last_request_time[domain] = slot
 
-        self._last_request_time[domain] = asyncio.get_event_loop().time()
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def fetch(
         self,
         url: str,
         crawl_delay: float | None = None,
+        validators: dict[str, str] | None = None,
     ) -> FetchResult:
         """
         Fetch a URL with retries.
@@ -83,6 +105,9 @@ class Fetcher:
         Args:
             url: The URL to fetch
             crawl_delay: Optional crawl delay from robots.txt
+            validators: Conditional request headers (``If-None-Match`` /
+                ``If-Modified-Since``); an unchanged page returns a 304
+                result without HTML
 
         Returns:
             FetchResult with response data or error
@@ -95,21 +120,20 @@ class Fetcher:
                 # Apply rate limiting
                 await self._rate_limit(domain, crawl_delay)
 
-                async with httpx.AsyncClient(
+                pool = self.http_pool or get_http_pool()
+                response = await pool.get(
+                    url,
                     timeout=self.timeout,
                     follow_redirects=True,
-                    max_redirects=5,
-                ) as client:
-                    response = await client.get(
-                        url,
-                        headers={
-                            "User-Agent": self.user_agent,
-                            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                            "Accept-Language": "en-US,en;q=0.5",
-                            "Accept-Encoding": "gzip, deflate",
-                            "Connection": "keep-alive",
-                        },
-                    )
+                    headers={
+                        "User-Agent": self.user_agent,
+                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                        "Accept-Language": "en-US,en;q=0.5",
+                        "Accept-Encoding": "gzip, deflate",
+                        "Connection": "keep-alive",
+                        **(validators or {}),
+                    },
+                )
 
                 fetch_time = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
                 content_type = response.headers.get("content-type", "")
@@ -128,6 +152,8 @@ class Fetcher:
                     error=None,
                     fetch_time_ms=fetch_time,
                     fetched_at=start_time,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
                 )
 
             except httpx.TimeoutException:
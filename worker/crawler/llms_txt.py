@@ -11,9 +11,10 @@ import re
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 
-import httpx
 import structlog
 
+from worker.http_pool import HTTPClientPool, get_http_pool
+
 logger = structlog.get_logger(__name__)
 
 
@@ -85,8 +86,9 @@ class LlmsTxtResult:
 class LlmsTxtChecker:
     """Checks for and validates llms.txt files."""
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, http_pool: HTTPClientPool | None = None):
         self.timeout = timeout
+        self.http_pool = http_pool
 
     async def check(self, url: str) -> LlmsTxtResult:
         """
@@ -143,20 +145,21 @@ class LlmsTxtChecker:
     async def _fetch_llms_txt(self, url: str) -> str | None:
         """Fetch llms.txt content."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "FindableBot/1.0"},
-                    follow_redirects=True,
-                )
+            pool = self.http_pool or get_http_pool()
+            response = await pool.get(
+                url,
+                headers={"User-Agent": "FindableBot/1.0"},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
 
-                if response.status_code == 200:
-                    content_type = response.headers.get("content-type", "")
-                    # llms.txt should be plain text or markdown
-                    if "text/" in content_type or not content_type:
-                        return response.text
-                    return None
+            if response.status_code == 200:
+                content_type = response.headers.get("content-type", "")
+                # llms.txt should be plain text or markdown
+                if "text/" in content_type or not content_type:
+                    return response.text
                 return None
+            return None
 
         except Exception:
             return None
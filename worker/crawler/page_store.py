@@ -0,0 +1,368 @@
+"""Content-addressed, compressed store for crawled page HTML.
+
+Pages are stored once per unique content hash, however many crawls
+reference them. Compressed blobs are appended to segment files, and a
+SQLite index maps each hash to ``(segment, offset, length)``. Reads slice
+the blob out of a memory-mapped segment, so loading a page is one index
+lookup and one decompress.
+
+Blobs are compressed with zstd when the optional ``zstandard`` package is
+installed, otherwise with zlib. The codec is recorded per blob, so a
+store stays readable if the package is added or removed later.
+
+Unreferenced blobs are reclaimed by :meth:`PageBlobStore.collect_garbage`,
+which drops them from the index and rewrites segments that are mostly
+dead.
+"""
+
+import mmap
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+
+@dataclass
+class GarbageCollectionResult:
+    """Outcome of a garbage collection pass."""
+
+    blobs_removed: int = 0
+    segments_rewritten: int = 0
+    bytes_reclaimed: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "blobs_removed": self.blobs_removed,
+            "segments_rewritten": self.segments_rewritten,
+            "bytes_reclaimed": self.bytes_reclaimed,
+        }
+
+
+class PageBlobStore:
+    """Deduplicated, compressed blob store with memory-mapped reads."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        compression_level: int = 3,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            path: Directory holding segments and the index
+            segment_max_bytes: Start a new segment once the active one is this large
+            compression_level: zstd (or zlib) compression level
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.compression_level = compression_level
+
+        self._lock = threading.Lock()
+        self._maps: dict[int, mmap.mmap] = {}
+        self._conn = sqlite3.connect(
+            self.path / "index.sqlite3",
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " hash TEXT PRIMARY KEY,"
+            " segment INTEGER NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " codec TEXT NOT NULL,"
+            " touched_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_blobs_segment ON blobs(segment)")
+
+        if ZSTD_AVAILABLE:
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.path / f"segment_{segment:06d}.seg"
+
+    def _compress(self, data: bytes) -> tuple[bytes, str]:
+        if ZSTD_AVAILABLE:
+            return self._compressor.compress(data), CODEC_ZSTD
+        return zlib.compress(data, min(self.compression_level, 9)), CODEC_ZLIB
+
+    def _decompress(self, data: bytes, codec: str) -> bytes:
+        if codec == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Blob is zstd-compressed but zstandard is not installed")
+            return self._decompressor.decompress(data)
+        return zlib.decompress(data)
+
+    def _active_segment(self) -> tuple[int, int]:
+        """Return (segment, size) of the segment new blobs are appended to."""
+        row = self._conn.execute("SELECT MAX(segment) FROM blobs").fetchone()
+        segment = row[0] if row[0] is not None else 0
+        existing = sorted(self.path.glob("segment_*.seg"))
+        if existing:
+            segment = max(segment, int(existing[-1].stem.split("_")[1]))
+        path = self._segment_path(segment)
+        size = path.stat().st_size if path.exists() else 0
+        if size >= self.segment_max_bytes:
+            segment, size = segment + 1, 0
+        return segment, size
+
+    def _append(self, blobs: list[tuple[str, bytes, int, str]]) -> None:
+        """Append compressed blobs to segments and index them.
+
+        Must be called inside a write transaction, which serializes
+        appends between processes.
+        """
+        segment, size = self._active_segment()
+        now = time.time()
+        rows = []
+        handle = self._segment_path(segment).open("ab")
+        try:
+            for content_hash, data, raw_size, codec in blobs:
+                if size and size + len(data) > self.segment_max_bytes:
+                    handle.close()
+                    segment, size = segment + 1, 0
+                    handle = self._segment_path(segment).open("ab")
+                handle.write(data)
+                rows.append((content_hash, segment, size, len(data), raw_size, codec, now))
+                size += len(data)
+            handle.flush()
+        finally:
+            handle.close()
+
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO blobs"
+            " (hash, segment, offset, length, size, codec, touched_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def put_many(self, items: dict[str, str]) -> int:
+        """
+        Store texts by content hash, skipping hashes already stored.
+
+        Args:
+            items: Mapping of content hash to text
+
+        Returns:
+            Number of new blobs written
+        """
+        if not items:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                known = self._existing(list(items))
+                # Touch reused blobs so a concurrent GC pass keeps them
+                self._conn.executemany(
+                    "UPDATE blobs SET touched_at = ? WHERE hash = ?",
+                    [(time.time(), h) for h in known],
+                )
+                new = [(h, text) for h, text in items.items() if h not in known]
+                blobs = []
+                for content_hash, text in new:
+                    raw = text.encode("utf-8")
+                    data, codec = self._compress(raw)
+                    blobs.append((content_hash, data, len(raw), codec))
+                if blobs:
+                    self._append(blobs)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(blobs)
+
+    def put(self, content_hash: str, text: str) -> bool:
+        """Store one text; returns True if it was not stored already."""
+        return self.put_many({content_hash: text}) == 1
+
+    def _existing(self, hashes: list[str]) -> set[str]:
+        found: set[str] = set()
+        for start in range(0, len(hashes), 500):
+            batch = hashes[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            found.update(
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT hash FROM blobs WHERE hash IN ({placeholders})", batch
+                )
+            )
+        return found
+
+    def __contains__(self, content_hash: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM blobs WHERE hash = ?", (content_hash,)
+            ).fetchone()
+        return row is not None
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """Memory-map a segment, remapping if it grew past ``end``."""
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with self._segment_path(segment).open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def get(self, content_hash: str) -> str | None:
+        """
+        Load a text by content hash.
+
+        Args:
+            content_hash: The content hash
+
+        Returns:
+            The text, or None if not stored
+        """
+        return self.get_many([content_hash]).get(content_hash)
+
+    def get_many(self, hashes: Iterable[str]) -> dict[str, str]:
+        """Load several texts by content hash (missing hashes are omitted)."""
+        wanted = list(dict.fromkeys(hashes))
+        found: dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(wanted), 500):
+                batch = wanted[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT hash, segment, offset, length, codec FROM blobs"
+                    f" WHERE hash IN ({placeholders}) ORDER BY segment, offset",
+                    batch,
+                ).fetchall()
+                for content_hash, segment, offset, length, codec in rows:
+                    mapped = self._map(segment, offset + length)
+                    data = mapped[offset : offset + length]
+                    found[content_hash] = self._decompress(data, codec).decode("utf-8")
+        return found
+
+    def stored_size(self, hashes: Iterable[str]) -> int:
+        """Compressed bytes used by the given blobs."""
+        wanted = list(dict.fromkeys(hashes))
+        total = 0
+        with self._lock:
+            for start in range(0, len(wanted), 500):
+                batch = wanted[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                row = self._conn.execute(
+                    f"SELECT COALESCE(SUM(length), 0) FROM blobs WHERE hash IN ({placeholders})",
+                    batch,
+                ).fetchone()
+                total += int(row[0])
+        return total
+
+    def collect_garbage(
+        self,
+        live_hashes: set[str],
+        grace_seconds: float = 3600.0,
+        rewrite_threshold: float = 0.5,
+    ) -> GarbageCollectionResult:
+        """
+        Remove blobs no longer referenced and compact mostly-dead segments.
+
+        Args:
+            live_hashes: Hashes still referenced by a manifest
+            grace_seconds: Keep unreferenced blobs written or reused more
+                recently than this, since a crawl may have stored its blobs
+                but not yet its manifest
+            rewrite_threshold: Rewrite a segment once this fraction of its
+                bytes is dead
+
+        Returns:
+            GarbageCollectionResult
+        """
+        result = GarbageCollectionResult()
+        cutoff = time.time() - grace_seconds
+        rewritten: list[int] = []
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute("SELECT hash, touched_at FROM blobs").fetchall()
+                dead = [h for h, touched in rows if h not in live_hashes and touched < cutoff]
+                for start in range(0, len(dead), 500):
+                    batch = dead[start : start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    self._conn.execute(f"DELETE FROM blobs WHERE hash IN ({placeholders})", batch)
+                result.blobs_removed = len(dead)
+
+                live_bytes = dict(
+                    self._conn.execute(
+                        "SELECT segment, SUM(length) FROM blobs GROUP BY segment"
+                    ).fetchall()
+                )
+                active, _ = self._active_segment()
+                for path in sorted(self.path.glob("segment_*.seg")):
+                    segment = int(path.stem.split("_")[1])
+                    if segment == active:
+                        continue
+                    size = path.stat().st_size
+                    live = live_bytes.get(segment, 0)
+                    if size and (size - live) / size >= rewrite_threshold:
+                        self._rewrite_segment(segment)
+                        rewritten.append(segment)
+                        result.segments_rewritten += 1
+                        result.bytes_reclaimed += size - live
+
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            # Only delete segments once the index no longer points at them
+            for segment in rewritten:
+                stale = self._maps.pop(segment, None)
+                if stale is not None:
+                    stale.close()
+                self._segment_path(segment).unlink(missing_ok=True)
+
+        logger.info("page_store_gc_completed", **result.to_dict())
+        return result
+
+    def _rewrite_segment(self, segment: int) -> None:
+        """Move a segment's live blobs to the active segment."""
+        rows = self._conn.execute(
+            "SELECT hash, offset, length, size, codec FROM blobs WHERE segment = ?",
+            (segment,),
+        ).fetchall()
+        if rows:
+            mapped = self._map(segment, max(offset + length for _, offset, length, _, _ in rows))
+            blobs = [
+                (content_hash, mapped[offset : offset + length], size, codec)
+                for content_hash, offset, length, size, codec in rows
+            ]
+            self._conn.execute("DELETE FROM blobs WHERE segment = ?", (segment,))
+            self._append(blobs)
+
+    def close(self) -> None:
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._conn.close()
@@ -2,10 +2,17 @@
 
 Measures Time to First Byte (TTFB) which is critical for AI crawlers
 that have strict timeout constraints (often 1-5 seconds).
+
+Each URL is sampled several times. Cold samples open a fresh connection
+(DNS, TCP and TLS included, as for a crawler's first request) and are what
+the score is based on; warm samples reuse a kept-alive connection, so
+they show the server's own response time. Samples across URLs run
+concurrently, bounded by ``PerformanceChecker.concurrency``.
 """
 
+import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
 import httpx
@@ -37,11 +44,34 @@ class TTFBResult:
     connect_time_ms: int | None = None
     tls_time_ms: int | None = None
     error: str | None = None
+    cold_samples_ms: list[int] = field(default_factory=list)  # New connection per sample
+    warm_samples_ms: list[int] = field(default_factory=list)  # Kept-alive connection
+
+    @property
+    def p95_ttfb_ms(self) -> int | None:
+        return _percentile(self.cold_samples_ms, 95)
+
+    @property
+    def warm_ttfb_ms(self) -> int | None:
+        """Median TTFB without connection setup (server time)."""
+        return _percentile(self.warm_samples_ms, 50)
+
+    @property
+    def connection_overhead_ms(self) -> int | None:
+        """Median cost of DNS, TCP and TLS setup (cold minus warm)."""
+        warm = self.warm_ttfb_ms
+        if warm is None or not self.cold_samples_ms:
+            return None
+        return max(0, self.ttfb_ms - warm)
 
     def to_dict(self) -> dict:
         return {
             "url": self.url,
             "ttfb_ms": self.ttfb_ms,
+            "p95_ttfb_ms": self.p95_ttfb_ms,
+            "warm_ttfb_ms": self.warm_ttfb_ms,
+            "connection_overhead_ms": self.connection_overhead_ms,
+            "samples": len(self.cold_samples_ms) + len(self.warm_samples_ms),
             "score": round(self.score, 2),
             "level": self.level,
             "dns_time_ms": self.dns_time_ms,
@@ -63,6 +93,17 @@ class TTFBResult:
         return self.ttfb_ms >= TTFB_THRESHOLDS["critical"]
 
 
+def _percentile(values: list[int], pct: float) -> int | None:
+    """Linearly interpolated percentile, or None without values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return round(ordered[low] + (ordered[high] - ordered[low]) * (rank - low))
+
+
 def _calculate_ttfb_score(ttfb_ms: int) -> tuple[float, str]:
     """
     Calculate score and level from TTFB.
@@ -103,15 +144,99 @@ class PerformanceChecker:
         self,
         timeout: float = 10.0,
         user_agent: str = "FindableBot/1.0 (Performance Check)",
+        cold_samples: int = 2,
+        warm_samples: int = 3,
+        concurrency: int = 4,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
+        """
+        Set up the checker.
+
+        Args:
+            timeout: Request timeout in seconds
+            user_agent: User-Agent header for the requests
+            cold_samples: Samples per URL on a new connection each
+            warm_samples: Samples per URL on a kept-alive connection
+            concurrency: Most connections sampling at once (across URLs)
+            transport: Transport for the sampling clients (e.g. in tests)
+        """
         self.timeout = timeout
         self.user_agent = user_agent
+        self.cold_samples = max(1, cold_samples)
+        self.warm_samples = max(0, warm_samples)
+        self.concurrency = max(1, concurrency)
+        self.transport = transport
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+    async def _timed_get(self, client: httpx.AsyncClient, url: str) -> tuple[int, bool]:
+        """
+        Time one request to its first byte.
+
+        Returns:
+            Tuple of (ttfb_ms, whether a new connection was opened)
+        """
+        opened = False
+
+        async def trace(event_name: str, _info: dict) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+
+        start = time.perf_counter()
+        async with client.stream(
+            "GET",
+            url,
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept": "text/html,application/xhtml+xml",
+            },
+            follow_redirects=True,
+            extensions={"trace": trace},
+        ) as response:
+            # Time to first byte is when headers are received
+            ttfb_ms = int((time.perf_counter() - start) * 1000)
+
+            # Read the body so the connection can be reused
+            _ = await response.aread()
+
+        return ttfb_ms, opened
+
+    async def _sample_connection(self, url: str, warm_samples: int) -> tuple[list[int], list[int]]:
+        """
+        Sample a URL on one fresh connection: a cold request, then warm ones.
+
+        Each connection uses its own client rather than the shared keep-alive
+        pool, so the first request always includes DNS, TCP and TLS time.
+
+        Returns:
+            Tuple of (cold_ms, warm_ms) samples
+        """
+        cold: list[int] = []
+        warm: list[int] = []
+        async with (
+            self._slots,
+            httpx.AsyncClient(timeout=self.timeout, transport=self.transport) as client,
+        ):
+            for i in range(1 + warm_samples):
+                try:
+                    ttfb_ms, opened = await self._timed_get(client, url)
+                except Exception:
+                    # The cold sample's failure is the URL's error
+                    if i == 0:
+                        raise
+                    break
+                # A warm request that had to reconnect is a cold sample
+                (cold if i == 0 or opened else warm).append(ttfb_ms)
+        return cold, warm
 
     async def measure_ttfb(self, url: str) -> TTFBResult:
         """
         Measure Time to First Byte for a URL.
 
         Uses streaming to capture the exact moment the first byte arrives.
+        ``cold_samples`` connections sample the URL concurrently; the first
+        also takes the ``warm_samples``. ``ttfb_ms`` (and the score) is the
+        median cold sample, as a crawler's first request sees it.
 
         Args:
             url: The URL to measure
@@ -126,57 +251,61 @@ class PerformanceChecker:
             level="critical",
         )
 
-        try:
-            start = time.perf_counter()
-
-            async with (
-                httpx.AsyncClient(timeout=self.timeout) as client,
-                client.stream(
-                    "GET",
-                    url,
-                    headers={
-                        "User-Agent": self.user_agent,
-                        "Accept": "text/html,application/xhtml+xml",
-                    },
-                    follow_redirects=True,
-                ) as response,
-            ):
-                # Time to first byte is when headers are received
-                first_byte_time = time.perf_counter()
-                ttfb_ms = int((first_byte_time - start) * 1000)
-
-                # Read a small chunk to ensure connection is established
-                _ = await response.aread()
-
-            result.ttfb_ms = ttfb_ms
-            result.score, result.level = _calculate_ttfb_score(ttfb_ms)
-
-            logger.info(
-                "ttfb_measured",
-                url=url,
-                ttfb_ms=ttfb_ms,
-                score=result.score,
-                level=result.level,
-            )
-
-        except httpx.TimeoutException:
+        outcomes = await asyncio.gather(
+            *(
+                self._sample_connection(url, self.warm_samples if i == 0 else 0)
+                for i in range(self.cold_samples)
+            ),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if not isinstance(outcome, BaseException):
+                result.cold_samples_ms.extend(outcome[0])
+                result.warm_samples_ms.extend(outcome[1])
+
+        if not result.cold_samples_ms:
+            error = next(o for o in outcomes if isinstance(o, BaseException))
+            if not isinstance(error, Exception):
+                raise error
+            self._record_error(result, error)
+            return result
+
+        ttfb_ms = _percentile(result.cold_samples_ms, 50) or 0
+        result.ttfb_ms = ttfb_ms
+        result.score, result.level = _calculate_ttfb_score(ttfb_ms)
+
+        logger.info(
+            "ttfb_measured",
+            url=url,
+            ttfb_ms=ttfb_ms,
+            p95_ttfb_ms=result.p95_ttfb_ms,
+            warm_ttfb_ms=result.warm_ttfb_ms,
+            samples=len(result.cold_samples_ms) + len(result.warm_samples_ms),
+            score=result.score,
+            level=result.level,
+        )
+
+        return result
+
+    def _record_error(self, result: TTFBResult, error: Exception) -> None:
+        """Record why every cold sample of a URL failed."""
+        url = result.url
+        if isinstance(error, httpx.TimeoutException):
             result.ttfb_ms = int(self.timeout * 1000)
             result.score = 0
             result.level = "critical"
             result.error = f"Request timed out after {self.timeout}s"
             logger.warning("ttfb_timeout", url=url, timeout=self.timeout)
 
-        except httpx.ConnectError as e:
-            result.error = f"Connection failed: {e}"
+        elif isinstance(error, httpx.ConnectError):
+            result.error = f"Connection failed: {error}"
             result.level = "critical"
-            logger.warning("ttfb_connect_error", url=url, error=str(e))
+            logger.warning("ttfb_connect_error", url=url, error=str(error))
 
-        except Exception as e:
-            result.error = str(e)
+        else:
+            result.error = str(error)
             result.level = "critical"
-            logger.warning("ttfb_error", url=url, error=str(e))
-
-        return result
+            logger.warning("ttfb_error", url=url, error=str(error))
 
     async def measure_multiple(
         self,
@@ -184,7 +313,7 @@ class PerformanceChecker:
         sample_size: int = 5,
     ) -> dict[str, TTFBResult]:
         """
-        Measure TTFB for multiple URLs.
+        Measure TTFB for multiple URLs concurrently.
 
         Args:
             urls: List of URLs to measure
@@ -196,11 +325,8 @@ class PerformanceChecker:
         # Sample if too many URLs
         sampled = urls[:sample_size] if len(urls) > sample_size else urls
 
-        results = {}
-        for url in sampled:
-            results[url] = await self.measure_ttfb(url)
-
-        return results
+        results = await asyncio.gather(*(self.measure_ttfb(url) for url in sampled))
+        return dict(zip(sampled, results, strict=True))
 
 
 @dataclass
@@ -215,6 +341,10 @@ class SitePerformanceResult:
     level: str
     pages_measured: int
     page_results: list[TTFBResult]
+    p50_ttfb_ms: int | None = None  # Over all cold samples
+    p95_ttfb_ms: int | None = None
+    warm_p50_ttfb_ms: int | None = None  # Over all warm samples
+    warm_p95_ttfb_ms: int | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -222,6 +352,10 @@ class SitePerformanceResult:
             "avg_ttfb_ms": self.avg_ttfb_ms,
             "min_ttfb_ms": self.min_ttfb_ms,
             "max_ttfb_ms": self.max_ttfb_ms,
+            "p50_ttfb_ms": self.p50_ttfb_ms,
+            "p95_ttfb_ms": self.p95_ttfb_ms,
+            "warm_p50_ttfb_ms": self.warm_p50_ttfb_ms,
+            "warm_p95_ttfb_ms": self.warm_p95_ttfb_ms,
             "score": round(self.score, 2),
             "level": self.level,
             "pages_measured": self.pages_measured,
@@ -233,6 +367,7 @@ async def measure_site_ttfb(
     urls: list[str],
     timeout: float = 10.0,
     sample_size: int = 5,
+    concurrency: int = 4,
 ) -> SitePerformanceResult:
     """
     Measure TTFB for a site (samples multiple pages).
@@ -241,6 +376,7 @@ async def measure_site_ttfb(
         urls: List of URLs on the site
         timeout: Request timeout
         sample_size: Number of pages to sample
+        concurrency: Most connections sampling at once
 
     Returns:
         SitePerformanceResult with aggregated metrics
@@ -259,7 +395,7 @@ async def measure_site_ttfb(
 
     domain = urlparse(urls[0]).netloc
 
-    checker = PerformanceChecker(timeout=timeout)
+    checker = PerformanceChecker(timeout=timeout, concurrency=concurrency)
     url_results = await checker.measure_multiple(urls, sample_size)
 
     results = list(url_results.values())
@@ -280,6 +416,8 @@ async def measure_site_ttfb(
     ttfb_values = [r.ttfb_ms for r in valid_results]
     avg_ttfb = int(sum(ttfb_values) / len(ttfb_values))
     score, level = _calculate_ttfb_score(avg_ttfb)
+    cold = [ms for r in valid_results for ms in r.cold_samples_ms]
+    warm = [ms for r in valid_results for ms in r.warm_samples_ms]
 
     return SitePerformanceResult(
         domain=domain,
@@ -290,6 +428,10 @@ async def measure_site_ttfb(
         level=level,
         pages_measured=len(results),
         page_results=results,
+        p50_ttfb_ms=_percentile(cold, 50),
+        p95_ttfb_ms=_percentile(cold, 95),
+        warm_p50_ttfb_ms=_percentile(warm, 50),
+        warm_p95_ttfb_ms=_percentile(warm, 95),
     )
 
 
@@ -2,16 +2,33 @@
 
 This module determines whether a site requires JavaScript rendering
 by comparing static vs. rendered content.
+
+``PageRenderer`` keeps one Chromium browser with a pool of reusable
+browser contexts, so sample pages render concurrently (one per context)
+without relaunching the browser per URL. Images, fonts and media are
+blocked while rendering since they do not change the page's text.
 """
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from enum import StrEnum
 from types import TracebackType
 from typing import TYPE_CHECKING
 
+import structlog
+
 try:
-    from playwright.async_api import Browser, Page, async_playwright
+    from playwright.async_api import (
+        Browser,
+        BrowserContext,
+        Page,
+        Playwright,
+        Route,
+        async_playwright,
+    )
     from playwright.async_api import TimeoutError as PlaywrightTimeout
 
     PLAYWRIGHT_AVAILABLE = True
@@ -22,7 +39,9 @@ from worker.crawler.fetcher import Fetcher
 from worker.extraction.cleaner import clean_html
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, Page
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route
+
+logger = structlog.get_logger(__name__)
 
 
 class RenderMode(StrEnum):
@@ -62,6 +81,8 @@ class RendererConfig:
     timeout: int = 30000  # ms total timeout
     viewport_width: int = 1280
     viewport_height: int = 720
+    contexts: int = 3  # Browser contexts in the pool (concurrent renders)
+    block_resource_types: tuple[str, ...] = ("image", "font", "media")  # Aborted while rendering
 
     # Sample pages for delta detection
     sample_count: int = 3  # Number of pages to sample
@@ -83,8 +104,49 @@ def _jaccard_similarity(text1: str, text2: str) -> float:
     return len(intersection) / len(union)
 
 
+@dataclass
+class RenderMetrics:
+    """Counters describing how the renderer has been used."""
+
+    renders: int = 0
+    errors: int = 0
+    requests_blocked: int = 0
+    render_seconds: float = 0.0  # Summed over renders
+    max_render_seconds: float = 0.0
+    context_wait_seconds: float = 0.0  # Time spent waiting for a free context
+    in_use: int = 0
+    peak_in_use: int = 0
+
+    @property
+    def mean_render_seconds(self) -> float:
+        return self.render_seconds / self.renders if self.renders else 0.0
+
+    def utilization(self, contexts: int, elapsed_seconds: float) -> float:
+        """Fraction of the pool's context time spent rendering."""
+        if contexts <= 0 or elapsed_seconds <= 0:
+            return 0.0
+        return min(1.0, self.render_seconds / (contexts * elapsed_seconds))
+
+    def to_dict(self) -> dict:
+        return {
+            "renders": self.renders,
+            "errors": self.errors,
+            "requests_blocked": self.requests_blocked,
+            "mean_render_seconds": round(self.mean_render_seconds, 3),
+            "max_render_seconds": round(self.max_render_seconds, 3),
+            "context_wait_seconds": round(self.context_wait_seconds, 3),
+            "peak_in_use": self.peak_in_use,
+        }
+
+
 class PageRenderer:
-    """Renders pages using Playwright headless browser."""
+    """Renders pages using Playwright headless browser.
+
+    One browser is launched on ``start`` with ``config.contexts`` reusable
+    contexts; each ``render_page`` call borrows a context for the length
+    of the render, so up to that many pages render at once. Keep a started
+    renderer around to reuse the browser across detections.
+    """
 
     def __init__(self, config: RendererConfig | None = None):
         if not PLAYWRIGHT_AVAILABLE:
@@ -92,7 +154,12 @@ class PageRenderer:
                 "Playwright not installed. Install with: pip install playwright && playwright install"
             )
         self.config = config or RendererConfig()
+        self.metrics = RenderMetrics()
+        self._playwright: Playwright | None = None
         self._browser: Browser | None = None
+        self._contexts: list[BrowserContext] = []
+        self._idle: asyncio.Queue[BrowserContext] | None = None
+        self._started_at = 0.0
         self._lock = asyncio.Lock()
 
     async def __aenter__(self) -> "PageRenderer":
@@ -109,19 +176,104 @@ class PageRenderer:
         """Async context manager exit."""
         await self.stop()
 
+    @property
+    def pool_size(self) -> int:
+        return max(1, self.config.contexts)
+
     async def start(self) -> None:
-        """Start the browser."""
+        """Start the Playwright driver, the browser and its contexts."""
         async with self._lock:
-            if self._browser is None:
-                pw = await async_playwright().start()
-                self._browser = await pw.chromium.launch(headless=True)
+            if self._browser is not None:
+                return
+            self._playwright = await async_playwright().start()
+            try:
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                self._idle = asyncio.Queue()
+                for _ in range(self.pool_size):
+                    context = await self._new_context()
+                    self._contexts.append(context)
+                    self._idle.put_nowait(context)
+            except BaseException:
+                await self._close()
+                raise
+            self._started_at = time.perf_counter()
 
     async def stop(self) -> None:
-        """Stop the browser."""
+        """Close the contexts and the browser, then stop the driver."""
         async with self._lock:
-            if self._browser:
+            if self._browser is not None:
+                logger.info(
+                    "page_renderer_stopped",
+                    contexts=self.pool_size,
+                    utilization=round(self.utilization, 3),
+                    **self.metrics.to_dict(),
+                )
+            await self._close()
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of context time spent rendering since ``start``."""
+        if not self._started_at:
+            return 0.0
+        elapsed = time.perf_counter() - self._started_at
+        return self.metrics.utilization(self.pool_size, elapsed)
+
+    async def _close(self) -> None:
+        for context in self._contexts:
+            with suppress(Exception):
+                await context.close()
+        self._contexts = []
+        self._idle = None
+        if self._browser is not None:
+            try:
                 await self._browser.close()
+            finally:
                 self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            finally:
+                self._playwright = None
+        self._started_at = 0.0
+
+    async def _new_context(self) -> "BrowserContext":
+        assert self._browser is not None
+        context = await self._browser.new_context(
+            viewport={
+                "width": self.config.viewport_width,
+                "height": self.config.viewport_height,
+            }
+        )
+        if self.config.block_resource_types:
+            await context.route("**/*", self._route)
+        return context
+
+    async def _route(self, route: "Route") -> None:
+        """Abort requests for resources that cannot change the page text."""
+        if route.request.resource_type in self.config.block_resource_types:
+            self.metrics.requests_blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def _context(self) -> AsyncIterator["BrowserContext"]:
+        """Borrow an idle context, waiting while all are rendering."""
+        if self._idle is None:
+            await self.start()
+        idle = self._idle
+        assert idle is not None
+
+        wait_start = time.perf_counter()
+        context = await idle.get()
+        self.metrics.context_wait_seconds += time.perf_counter() - wait_start
+        self.metrics.in_use += 1
+        self.metrics.peak_in_use = max(self.metrics.peak_in_use, self.metrics.in_use)
+        try:
+            yield context
+        finally:
+            self.metrics.in_use -= 1
+            idle.put_nowait(context)
 
     async def render_page(self, url: str) -> tuple[str, str | None]:
         """
@@ -133,40 +285,41 @@ class PageRenderer:
         Returns:
             Tuple of (html_content, error_message)
         """
-        if not self._browser:
-            await self.start()
-
-        page: Page | None = None
-        try:
-            page = await self._browser.new_page(  # type: ignore[union-attr]
-                viewport={
-                    "width": self.config.viewport_width,
-                    "height": self.config.viewport_height,
-                }
-            )
-
-            # Navigate and wait for network idle
-            await page.goto(
-                url,
-                timeout=self.config.timeout,
-                wait_until="networkidle",
-            )
-
-            # Additional wait for JS execution
-            await page.wait_for_timeout(self.config.wait_for_load)
-
-            # Get rendered HTML
-            html = await page.content()
-
-            return html, None
-
-        except PlaywrightTimeout:
-            return "", f"Timeout rendering {url}"
-        except Exception as e:
-            return "", f"Error rendering {url}: {str(e)}"
-        finally:
-            if page:
-                await page.close()
+        async with self._context() as context:
+            start = time.perf_counter()
+            page: Page | None = None
+            error: str | None = None
+            try:
+                page = await context.new_page()
+
+                # Navigate and wait for network idle
+                await page.goto(
+                    url,
+                    timeout=self.config.timeout,
+                    wait_until="networkidle",
+                )
+
+                # Additional wait for JS execution
+                await page.wait_for_timeout(self.config.wait_for_load)
+
+                # Get rendered HTML
+                return await page.content(), None
+
+            except PlaywrightTimeout:
+                error = f"Timeout rendering {url}"
+                return "", error
+            except Exception as e:
+                error = f"Error rendering {url}: {str(e)}"
+                return "", error
+            finally:
+                if page:
+                    await page.close()
+                seconds = time.perf_counter() - start
+                self.metrics.renders += 1
+                self.metrics.errors += error is not None
+                self.metrics.render_seconds += seconds
+                self.metrics.max_render_seconds = max(self.metrics.max_render_seconds, seconds)
+                logger.debug("page_rendered", url=url, seconds=round(seconds, 3), error=error)
 
 
 class RenderDeltaDetector:
@@ -176,16 +329,36 @@ class RenderDeltaDetector:
         self,
         config: RendererConfig | None = None,
         fetcher: Fetcher | None = None,
+        renderer: PageRenderer | None = None,
     ):
+        """
+        Set up the detector.
+
+        Args:
+            config: Thresholds and renderer settings
+            fetcher: Fetcher for the static content
+            renderer: A started, long-lived renderer to share; without one,
+                each detection starts (and stops) its own
+        """
         self.config = config or RendererConfig()
         self.fetcher = fetcher
+        self.renderer = renderer
+
+    @asynccontextmanager
+    async def _renderer(self) -> AsyncIterator[PageRenderer]:
+        if self.renderer is not None:
+            yield self.renderer
+            return
+        async with PageRenderer(self.config) as renderer:
+            yield renderer
 
-    async def detect_delta(self, url: str) -> RenderDelta:
+    async def detect_delta(self, url: str, renderer: PageRenderer | None = None) -> RenderDelta:
         """
         Compare static vs rendered content for a single URL.
 
         Args:
             url: URL to test
+            renderer: Renderer to use (defaults to the detector's)
 
         Returns:
             RenderDelta with comparison results
@@ -212,7 +385,10 @@ class RenderDeltaDetector:
         static_text = static_cleaned.main_content
 
         # Render with Playwright
-        async with PageRenderer(self.config) as renderer:
+        if renderer is None:
+            async with self._renderer() as renderer:
+                rendered_html, error = await renderer.render_page(url)
+        else:
             rendered_html, error = await renderer.render_page(url)
 
         if error or not rendered_html:
@@ -274,21 +450,29 @@ class RenderDeltaDetector:
         if not urls:
             return RenderMode.STATIC, []
 
-        # Sample up to config.sample_count pages
+        # Sample up to config.sample_count pages, rendered concurrently on
+        # the renderer's context pool
         sample_urls = urls[: self.config.sample_count]
 
-        deltas: list[RenderDelta] = []
-        needs_rendering_count = 0
+        start = time.perf_counter()
+        async with self._renderer() as renderer:
+            results = await asyncio.gather(
+                *(self.detect_delta(url, renderer) for url in sample_urls),
+                return_exceptions=True,
+            )
 
-        for url in sample_urls:
-            try:
-                delta = await self.detect_delta(url)
-                deltas.append(delta)
-                if delta.needs_rendering:
-                    needs_rendering_count += 1
-            except Exception:
-                # Skip failed URLs
-                continue
+            # Skip failed URLs
+            deltas = [r for r in results if isinstance(r, RenderDelta)]
+            needs_rendering_count = sum(1 for delta in deltas if delta.needs_rendering)
+            logger.info(
+                "render_delta_sampled",
+                urls=len(sample_urls),
+                failed=len(results) - len(deltas),
+                needs_rendering=needs_rendering_count,
+                duration_seconds=round(time.perf_counter() - start, 2),
+                utilization=round(renderer.utilization, 3),
+                **renderer.metrics.to_dict(),
+            )
 
         if not deltas:
             return RenderMode.STATIC, []
@@ -304,6 +488,7 @@ async def detect_render_mode(
     url: str,
     additional_urls: list[str] | None = None,
     config: RendererConfig | None = None,
+    renderer: PageRenderer | None = None,
 ) -> tuple[RenderMode, list[RenderDelta]]:
     """
     Convenience function to detect render mode for a site.
@@ -312,6 +497,8 @@ async def detect_render_mode(
         url: Primary URL to test
         additional_urls: Additional URLs to sample
         config: Renderer configuration
+        renderer: A started renderer to reuse (otherwise one is started and
+            stopped for this detection)
 
     Returns:
         Tuple of (render_mode, delta_results)
@@ -321,6 +508,6 @@ async def detect_render_mode(
         return RenderMode.STATIC, []
 
     urls = [url] + (additional_urls or [])
-    detector = RenderDeltaDetector(config=config)
+    detector = RenderDeltaDetector(config=config, renderer=renderer)
 
     return await detector.detect_site_mode(urls)
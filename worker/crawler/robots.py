@@ -5,7 +5,7 @@ import re
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 
-import httpx
+from worker.http_pool import HTTPClientPool, get_http_pool
 
 try:
     import structlog
@@ -150,10 +150,12 @@ class RobotsChecker:
         user_agent: str,
         timeout: float = 10.0,
         respect_robots: bool = True,
+        http_pool: HTTPClientPool | None = None,
     ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.respect_robots = respect_robots
+        self.http_pool = http_pool
         self._cache: dict[str, RobotsParser] = {}
 
     async def _fetch_robots(self, base_url: str) -> RobotsParser:
@@ -161,18 +163,19 @@ class RobotsChecker:
         robots_url = urljoin(base_url, "/robots.txt")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    robots_url,
-                    headers={"User-Agent": self.user_agent},
-                    follow_redirects=True,
-                )
-
-                if response.status_code == 200:
-                    return RobotsParser.parse(response.text, self.user_agent)
-                else:
-                    # No robots.txt or error - allow all
-                    return RobotsParser()
+            pool = self.http_pool or get_http_pool()
+            response = await pool.get(
+                robots_url,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+
+            if response.status_code == 200:
+                return RobotsParser.parse(response.text, self.user_agent)
+            else:
+                # No robots.txt or error - allow all
+                return RobotsParser()
 
         except Exception as e:
             logger.warning(
@@ -11,6 +11,7 @@ import httpx
 import structlog
 
 from worker.crawler.robots import RobotsParser
+from worker.http_pool import HTTPClientPool, get_http_pool
 
 logger = structlog.get_logger(__name__)
 
@@ -468,8 +469,9 @@ class RobotsTxtAIResult:
 class AIRobotsChecker:
     """Checks robots.txt for AI crawler access."""
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, http_pool: HTTPClientPool | None = None):
         self.timeout = timeout
+        self.http_pool = http_pool
 
     async def check(self, url: str) -> RobotsTxtAIResult:
         """
@@ -669,24 +671,25 @@ class AIRobotsChecker:
     async def _fetch_robots_txt(self, robots_url: str) -> str | None:
         """Fetch robots.txt content."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    robots_url,
-                    headers={"User-Agent": "FindableBot/1.0"},
-                    follow_redirects=True,
-                )
+            pool = self.http_pool or get_http_pool()
+            response = await pool.get(
+                robots_url,
+                headers={"User-Agent": "FindableBot/1.0"},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
 
-                if response.status_code == 200:
-                    return response.text
-                elif response.status_code == 404:
-                    return None
-                else:
-                    logger.warning(
-                        "robots_txt_fetch_non_200",
-                        url=robots_url,
-                        status=response.status_code,
-                    )
-                    return None
+            if response.status_code == 200:
+                return response.text
+            elif response.status_code == 404:
+                return None
+            else:
+                logger.warning(
+                    "robots_txt_fetch_non_200",
+                    url=robots_url,
+                    status=response.status_code,
+                )
+                return None
 
         except httpx.TimeoutException:
             logger.warning("robots_txt_fetch_timeout", url=robots_url)
@@ -5,9 +5,10 @@ import gzip
 from dataclasses import dataclass
 from xml.etree import ElementTree as ET
 
-import httpx
 import structlog
 
+from worker.http_pool import HTTPClientPool, get_http_pool
+
 logger = structlog.get_logger(__name__)
 
 # XML namespaces for sitemap
@@ -44,11 +45,13 @@ class SitemapParser:
         timeout: float = 30.0,
         max_urls: int = 1000,
         max_sitemaps: int = 10,
+        http_pool: HTTPClientPool | None = None,
     ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.max_urls = max_urls
         self.max_sitemaps = max_sitemaps
+        self.http_pool = http_pool
 
     async def fetch_and_parse(self, sitemap_urls: list[str]) -> SitemapResult:
         """
@@ -67,31 +70,30 @@ class SitemapParser:
         errors: list[str] = []
         sitemaps_processed = 0
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for sitemap_url in sitemap_urls[: self.max_sitemaps]:
-                try:
-                    urls, nested_sitemaps = await self._fetch_sitemap(client, sitemap_url)
-                    all_urls.extend(urls)
-                    sitemaps_processed += 1
-
-                    # Process nested sitemaps (from sitemap index)
-                    for nested_url in nested_sitemaps[: self.max_sitemaps - sitemaps_processed]:
-                        if sitemaps_processed >= self.max_sitemaps:
-                            break
-                        try:
-                            nested_urls, _ = await self._fetch_sitemap(client, nested_url)
-                            all_urls.extend(nested_urls)
-                            sitemaps_processed += 1
-                        except Exception as e:
-                            errors.append(f"{nested_url}: {str(e)}")
-
-                    # Stop if we have enough URLs
-                    if len(all_urls) >= self.max_urls:
-                        all_urls = all_urls[: self.max_urls]
+        for sitemap_url in sitemap_urls[: self.max_sitemaps]:
+            try:
+                urls, nested_sitemaps = await self._fetch_sitemap(sitemap_url)
+                all_urls.extend(urls)
+                sitemaps_processed += 1
+
+                # Process nested sitemaps (from sitemap index)
+                for nested_url in nested_sitemaps[: self.max_sitemaps - sitemaps_processed]:
+                    if sitemaps_processed >= self.max_sitemaps:
                         break
+                    try:
+                        nested_urls, _ = await self._fetch_sitemap(nested_url)
+                        all_urls.extend(nested_urls)
+                        sitemaps_processed += 1
+                    except Exception as e:
+                        errors.append(f"{nested_url}: {str(e)}")
+
+                # Stop if we have enough URLs
+                if len(all_urls) >= self.max_urls:
+                    all_urls = all_urls[: self.max_urls]
+                    break
 
-                except Exception as e:
-                    errors.append(f"{sitemap_url}: {str(e)}")
+            except Exception as e:
+                errors.append(f"{sitemap_url}: {str(e)}")
 
         logger.info(
             "sitemap_parsing_complete",
@@ -106,18 +108,18 @@ class SitemapParser:
             errors=errors,
         )
 
-    async def _fetch_sitemap(
-        self, client: httpx.AsyncClient, url: str
-    ) -> tuple[list[SitemapURL], list[str]]:
+    async def _fetch_sitemap(self, url: str) -> tuple[list[SitemapURL], list[str]]:
         """
         Fetch and parse a single sitemap.
 
         Returns:
             Tuple of (urls, nested_sitemap_urls)
         """
-        response = await client.get(
+        pool = self.http_pool or get_http_pool()
+        response = await pool.get(
             url,
             headers={"User-Agent": self.user_agent},
+            timeout=self.timeout,
             follow_redirects=True,
         )
 
@@ -214,6 +216,7 @@ async def fetch_sitemap_urls(
     sitemap_urls: list[str],
     user_agent: str = "FindableBot/1.0",
     max_urls: int = 500,
+    http_pool: HTTPClientPool | None = None,
 ) -> list[str]:
     """
     Convenience function to fetch URLs from sitemaps.
@@ -222,6 +225,7 @@ async def fetch_sitemap_urls(
         sitemap_urls: List of sitemap URLs (usually from robots.txt)
         user_agent: User agent string
         max_urls: Maximum URLs to return
+        http_pool: Optional shared HTTP pool (defaults to the per-loop pool)
 
     Returns:
         List of URL strings from the sitemaps
@@ -229,7 +233,7 @@ async def fetch_sitemap_urls(
     if not sitemap_urls:
         return []
 
-    parser = SitemapParser(user_agent=user_agent, max_urls=max_urls)
+    parser = SitemapParser(user_agent=user_agent, max_urls=max_urls, http_pool=http_pool)
     result = await parser.fetch_and_parse(sitemap_urls)
 
     # Sort by priority if available, highest first
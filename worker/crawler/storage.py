@@ -1,7 +1,12 @@
-"""Storage for crawled pages."""
+"""Storage for crawled pages.
+
+Each crawl is a small JSON manifest; page HTML lives in a shared
+content-addressed ``PageBlobStore``, so a page that did not change between
+crawls is stored once.
+"""
 
-import hashlib
 import json
+import shutil
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -10,7 +15,8 @@ from typing import Any
 
 import structlog
 
-from worker.crawler.crawler import CrawlPage, CrawlResult
+from worker.crawler.crawler import CrawlPage, CrawlResult, hash_html
+from worker.crawler.page_store import GarbageCollectionResult, PageBlobStore
 
 logger = structlog.get_logger(__name__)
 
@@ -38,6 +44,9 @@ class StoredPage:
     fetch_time_ms: int
     fetched_at: str  # ISO format
     links_found: int
+    surface: str = "marketing"
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 @dataclass
@@ -59,18 +68,23 @@ class CrawlManifest:
     max_depth_reached: int
 
 
+BLOBS_DIR = "_blobs"
+
+
 class CrawlStorage:
     """Storage manager for crawled pages."""
 
-    def __init__(self, base_path: Path | str):
+    def __init__(self, base_path: Path | str, page_store: PageBlobStore | None = None):
         """
         Initialize storage.
 
         Args:
             base_path: Base directory for storing crawl data
+            page_store: Blob store for page HTML (default: one under base_path)
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.page_store = page_store or PageBlobStore(self.base_path / BLOBS_DIR)
 
     def _get_crawl_dir(self, crawl_id: str) -> Path:
         """Get the directory for a specific crawl."""
@@ -78,7 +92,7 @@ class CrawlStorage:
 
     def _hash_content(self, content: str) -> str:
         """Create a hash of content for deduplication."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        return hash_html(content)
 
     def _page_to_stored(self, page: CrawlPage, page_id: str) -> StoredPage:
         """Convert CrawlPage to StoredPage."""
@@ -95,38 +109,41 @@ class CrawlStorage:
             fetch_time_ms=page.fetch_time_ms,
             fetched_at=page.fetched_at.isoformat(),
             links_found=page.links_found,
+            surface=page.surface,
+            etag=page.etag,
+            last_modified=page.last_modified,
         )
 
-    def store_crawl(self, result: CrawlResult) -> str:
+    def store_crawl(self, result: CrawlResult, crawl_id: str | None = None) -> str:
         """
         Store a crawl result.
 
         Args:
             result: The CrawlResult to store
+            crawl_id: ID to store under, replacing any crawl already stored
+                with that ID (default: a new random ID)
 
         Returns:
             The crawl ID
         """
-        crawl_id = str(uuid.uuid4())
-        crawl_dir = self._get_crawl_dir(crawl_id)
+        crawl_id = crawl_id or str(uuid.uuid4())
+        final_dir = self._get_crawl_dir(crawl_id)
+        # Write beside the final location and swap in, so readers never
+        # see a half-written crawl
+        crawl_dir = self._get_crawl_dir(f"{crawl_id}.tmp-{uuid.uuid4().hex[:8]}")
         crawl_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create pages directory
-        pages_dir = crawl_dir / "pages"
-        pages_dir.mkdir(exist_ok=True)
+        stored_pages = [
+            self._page_to_stored(page, f"page_{i:04d}") for i, page in enumerate(result.pages)
+        ]
 
-        stored_pages: list[StoredPage] = []
-
-        for i, page in enumerate(result.pages):
-            page_id = f"page_{i:04d}"
-
-            # Store HTML
-            html_path = pages_dir / f"{page_id}.html"
-            html_path.write_text(page.html, encoding="utf-8")
-
-            # Create stored page record
-            stored = self._page_to_stored(page, page_id)
-            stored_pages.append(stored)
+        # Store HTML by content hash before the manifest that references it
+        new_blobs = self.page_store.put_many(
+            {
+                stored.html_hash: page.html
+                for stored, page in zip(stored_pages, result.pages, strict=True)
+            }
+        )
 
         # Create manifest
         manifest = CrawlManifest(
@@ -149,15 +166,24 @@ class CrawlStorage:
         manifest_path = crawl_dir / "manifest.json"
         manifest_dict = asdict(manifest)
         manifest_path.write_text(
-            json.dumps(manifest_dict, indent=2, default=_serialize_datetime),
+            json.dumps(manifest_dict, separators=(",", ":"), default=_serialize_datetime),
             encoding="utf-8",
         )
 
+        if final_dir.exists():
+            old_dir = crawl_dir.with_name(f"{crawl_id}.old-{uuid.uuid4().hex[:8]}")
+            final_dir.rename(old_dir)
+            crawl_dir.rename(final_dir)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        else:
+            crawl_dir.rename(final_dir)
+
         logger.info(
             "crawl_stored",
             crawl_id=crawl_id,
             pages=len(stored_pages),
-            path=str(crawl_dir),
+            new_blobs=new_blobs,
+            path=str(final_dir),
         )
 
         return crawl_id
@@ -194,16 +220,80 @@ class CrawlStorage:
         Returns:
             HTML content or None if not found
         """
+        # Crawls stored before the blob store kept one file per page
         html_path = self._get_crawl_dir(crawl_id) / "pages" / f"{page_id}.html"
-        if not html_path.exists():
+        if html_path.exists():
+            return html_path.read_text(encoding="utf-8")
+
+        manifest = self.load_manifest(crawl_id)
+        if manifest is None:
+            return None
+        stored = next((p for p in manifest.pages if p.page_id == page_id), None)
+        if stored is None:
+            return None
+        return self.page_store.get(stored.html_hash)
+
+    def load_crawl(self, crawl_id: str) -> CrawlResult | None:
+        """
+        Load a stored crawl, including page HTML.
+
+        Args:
+            crawl_id: The crawl ID
+
+        Returns:
+            CrawlResult or None if not found
+        """
+        manifest = self.load_manifest(crawl_id)
+        if manifest is None:
             return None
 
-        return html_path.read_text(encoding="utf-8")
+        blobs = self.page_store.get_many(p.html_hash for p in manifest.pages)
+        pages: list[CrawlPage] = []
+        for stored in manifest.pages:
+            html = blobs.get(stored.html_hash)
+            if html is None:
+                html = self.load_page_html(crawl_id, stored.page_id)
+            if html is None:
+                continue
+            pages.append(
+                CrawlPage(
+                    url=stored.url,
+                    final_url=stored.final_url,
+                    title=stored.title,
+                    html=html,
+                    content_type=stored.content_type,
+                    status_code=stored.status_code,
+                    depth=stored.depth,
+                    fetch_time_ms=stored.fetch_time_ms,
+                    fetched_at=datetime.fromisoformat(stored.fetched_at),
+                    links_found=stored.links_found,
+                    surface=stored.surface,
+                    etag=stored.etag,
+                    last_modified=stored.last_modified,
+                )
+            )
+
+        return CrawlResult(
+            domain=manifest.domain,
+            start_url=manifest.start_url,
+            pages=pages,
+            urls_discovered=manifest.urls_discovered,
+            urls_crawled=manifest.urls_crawled,
+            urls_skipped=manifest.urls_skipped,
+            urls_failed=manifest.urls_failed,
+            started_at=datetime.fromisoformat(manifest.started_at),
+            completed_at=datetime.fromisoformat(manifest.completed_at),
+            duration_seconds=manifest.duration_seconds,
+            robots_respected=manifest.robots_respected,
+            max_depth_reached=manifest.max_depth_reached,
+        )
 
     def list_crawls(self) -> list[str]:
         """List all stored crawl IDs."""
         crawls = []
         for path in self.base_path.iterdir():
+            if ".tmp-" in path.name or ".old-" in path.name:
+                continue
             if path.is_dir() and (path / "manifest.json").exists():
                 crawls.append(path.name)
         return sorted(crawls)
@@ -222,15 +312,31 @@ class CrawlStorage:
         if not crawl_dir.exists():
             return False
 
-        import shutil
-
         shutil.rmtree(crawl_dir)
 
+        # Page blobs are shared between crawls; collect_garbage reclaims them
         logger.info("crawl_deleted", crawl_id=crawl_id)
         return True
 
+    def collect_garbage(self, grace_seconds: float = 3600.0) -> GarbageCollectionResult:
+        """
+        Reclaim page blobs that no stored crawl references.
+
+        Args:
+            grace_seconds: Keep blobs touched more recently than this
+
+        Returns:
+            GarbageCollectionResult
+        """
+        live: set[str] = set()
+        for crawl_id in self.list_crawls():
+            manifest = self.load_manifest(crawl_id)
+            if manifest is not None:
+                live.update(p.html_hash for p in manifest.pages)
+        return self.page_store.collect_garbage(live, grace_seconds=grace_seconds)
+
     def get_total_size(self, crawl_id: str) -> int:
-        """Get total storage size for a crawl in bytes."""
+        """Get total storage size for a crawl in bytes (compressed pages + manifest)."""
         crawl_dir = self._get_crawl_dir(crawl_id)
         if not crawl_dir.exists():
             return 0
@@ -239,4 +345,8 @@ class CrawlStorage:
         for path in crawl_dir.rglob("*"):
             if path.is_file():
                 total += path.stat().st_size
+
+        manifest = self.load_manifest(crawl_id)
+        if manifest is not None:
+            total += self.page_store.stored_size(p.html_hash for p in manifest.pages)
         return total
@@ -3,17 +3,27 @@
 # Lazy imports to avoid requiring all dependencies at import time
 # Use explicit imports when needed:
 # from worker.embeddings.embedder import Embedder, EmbedderConfig
+# from worker.embeddings.cache import EmbeddingCache, get_embedding_cache
 # from worker.embeddings.models import EmbeddingModel, get_model
+# from worker.embeddings.service import EmbeddingServiceClient, get_embedding_model
 
 __all__ = [
     # Embedder
     "Embedder",
     "EmbedderConfig",
     "EmbeddingResult",
+    # Cache
+    "EmbeddingCache",
+    "EmbeddingCacheConfig",
+    "get_embedding_cache",
     # Models
     "EmbeddingModel",
     "get_model",
     "list_models",
+    # Embedding service
+    "EmbeddingServer",
+    "EmbeddingServiceClient",
+    "get_embedding_model",
     # Storage
     "EmbeddingStore",
     "StoredEmbedding",
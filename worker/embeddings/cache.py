@@ -0,0 +1,403 @@
+"""Tiered embedding cache shared across runs and workers.
+
+Lookups go through three tiers, keyed by (model, content hash):
+
+1. An in-process LRU of recently used vectors. It holds database hits
+   promoted by :meth:`EmbeddingCache.prefetch` for the rest of the job.
+   Under the default forking RQ worker (``worker_fork_jobs=True``) each
+   job runs in a fresh child process, so this tier does not outlive the
+   job; only with ``worker_fork_jobs=False`` does it carry across jobs.
+2. A local on-disk store shared by every worker process on the host: a
+   SQLite file opened with memory-mapped I/O, holding float32 vectors as
+   blobs with least-recently-used eviction.
+3. The ``embeddings`` table, queried by ``(model_name, content_hash)``.
+   This tier is async, so it is filled ahead of embedding via
+   :meth:`EmbeddingCache.prefetch`.
+
+Hits from a slower tier are promoted into the faster ones, so re-audits
+only embed chunks whose content changed.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import structlog
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class EmbeddingCacheConfig:
+    """Configuration for the tiered embedding cache."""
+
+    memory_max_entries: int = 50_000
+    disk_path: str | None = None  # Directory for the disk tier; None disables it
+    disk_max_entries: int = 500_000
+    disk_evict_fraction: float = 0.1  # Share of entries dropped when the disk tier is full
+    disk_mmap_bytes: int = 256 * 1024 * 1024
+    database_lookup: bool = True
+
+
+@dataclass
+class EmbeddingCacheMetrics:
+    """Hit/miss counters for the embedding cache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    database_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits + self.database_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "database_hits": self.database_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "stores": self.stores,
+            "memory_evictions": self.memory_evictions,
+            "disk_evictions": self.disk_evictions,
+        }
+
+
+class DiskEmbeddingStore:
+    """
+    Bounded on-disk vector store backed by a memory-mapped SQLite file.
+
+    SQLite handles locking between worker processes; WAL mode lets
+    readers proceed while another process writes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 500_000,
+        evict_fraction: float = 0.1,
+        mmap_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.evict_fraction = evict_fraction
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path / "embeddings.sqlite3",
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors ("
+            " key TEXT PRIMARY KEY,"
+            " vector BLOB NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_vectors_last_used ON vectors(last_used)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()
+        return int(row[0])
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Load the vectors stored for ``keys`` and mark them as used."""
+        found: dict[str, np.ndarray] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM vectors WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).copy()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE vectors SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]) -> int:
+        """Store vectors, evicting the least recently used if full.
+
+        Returns:
+            Number of entries evicted
+        """
+        if not items:
+            return 0
+
+        now = time.time()
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items.items()
+        ]
+        evicted = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO vectors (key, vector, last_used) VALUES (?, ?, ?)",
+                    rows,
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+                if count > self.max_entries:
+                    target = int(self.max_entries * (1 - self.evict_fraction))
+                    evicted = count - target
+                    self._conn.execute(
+                        "DELETE FROM vectors WHERE key IN ("
+                        " SELECT key FROM vectors ORDER BY last_used LIMIT ?)",
+                        (evicted,),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM vectors")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """Memory → disk → database embedding cache keyed by (model, content hash)."""
+
+    def __init__(self, config: EmbeddingCacheConfig | None = None):
+        self.config = config or EmbeddingCacheConfig()
+        self.metrics = EmbeddingCacheMetrics()
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: DiskEmbeddingStore | None = None
+
+        if self.config.disk_path:
+            try:
+                self._disk = DiskEmbeddingStore(
+                    self.config.disk_path,
+                    max_entries=self.config.disk_max_entries,
+                    evict_fraction=self.config.disk_evict_fraction,
+                    mmap_bytes=self.config.disk_mmap_bytes,
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    "embedding_disk_cache_unavailable", path=self.config.disk_path, error=str(e)
+                )
+
+    def __len__(self) -> int:
+        """Number of entries in the in-process tier."""
+        return len(self._memory)
+
+    @staticmethod
+    def _key(model: str, content_hash: str) -> str:
+        return f"{model}:{content_hash}"
+
+    def _remember(self, items: dict[str, np.ndarray]) -> None:
+        """Insert into the in-process LRU, evicting the oldest entries."""
+        with self._lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.config.memory_max_entries:
+                self._memory.popitem(last=False)
+                self.metrics.memory_evictions += 1
+
+    def _lookup_local(self, keys: list[str]) -> tuple[dict[str, np.ndarray], list[str]]:
+        """Look keys up in memory then disk. Returns (found, missing)."""
+        found: dict[str, np.ndarray] = {}
+        missing: list[str] = []
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+        self.metrics.memory_hits += len(found)
+
+        if missing and self._disk is not None:
+            from_disk = self._disk.get_many(missing)
+            if from_disk:
+                self.metrics.disk_hits += len(from_disk)
+                self._remember(from_disk)
+                found.update(from_disk)
+                missing = [key for key in missing if key not in from_disk]
+
+        return found, missing
+
+    def get_many(self, model: str, content_hashes: list[str]) -> dict[str, np.ndarray]:
+        """
+        Look up embeddings in the memory and disk tiers.
+
+        Args:
+            model: Model identifier
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Mapping of content hash to embedding for the hashes found
+        """
+        keys = [self._key(model, h) for h in dict.fromkeys(content_hashes)]
+        found, missing = self._lookup_local(keys)
+        self.metrics.misses += len(missing)
+
+        prefix = len(model) + 1
+        return {key[prefix:]: vector for key, vector in found.items()}
+
+    def put_many(self, model: str, embeddings: dict[str, np.ndarray]) -> None:
+        """Store embeddings in the memory and disk tiers."""
+        if not embeddings:
+            return
+        items = {self._key(model, h): v for h, v in embeddings.items()}
+        self._remember(items)
+        self.metrics.stores += len(items)
+
+        if self._disk is not None:
+            try:
+                self.metrics.disk_evictions += self._disk.put_many(items)
+            except sqlite3.Error as e:
+                logger.warning("embedding_disk_cache_write_failed", error=str(e))
+
+    async def prefetch(
+        self,
+        session: AsyncSession,
+        model: str,
+        content_hashes: list[str],
+    ) -> int:
+        """
+        Promote embeddings already stored in the database into the cache.
+
+        Hashes found in memory or on disk are not queried.
+
+        Args:
+            session: Database session
+            model: Model identifier, as stored in ``embeddings.model_name``
+            content_hashes: Content hashes that are about to be embedded
+
+        Returns:
+            Number of embeddings loaded from the database
+        """
+        if not self.config.database_lookup or not content_hashes:
+            return 0
+
+        keys = [self._key(model, h) for h in dict.fromkeys(content_hashes)]
+        with self._lock:
+            keys = [key for key in keys if key not in self._memory]
+        if self._disk is not None and keys:
+            # Promote disk hits now so they are not fetched from the database
+            _, keys = self._lookup_local(keys)
+        if not keys:
+            return 0
+
+        prefix = len(model) + 1
+        rows = await _select_embeddings(session, model, [key[prefix:] for key in keys])
+        loaded = {self._key(model, h): vector for h, vector in rows.items()}
+        if loaded:
+            self.metrics.database_hits += len(loaded)
+            self._remember(loaded)
+            if self._disk is not None:
+                try:
+                    self.metrics.disk_evictions += self._disk.put_many(loaded)
+                except sqlite3.Error as e:
+                    logger.warning("embedding_disk_cache_write_failed", error=str(e))
+
+        logger.debug(
+            "embedding_cache_prefetched", model=model, requested=len(keys), loaded=len(loaded)
+        )
+        return len(loaded)
+
+    def clear(self) -> None:
+        """Clear the in-process tier (the shared disk tier is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+
+async def _select_embeddings(
+    session: AsyncSession,
+    model: str,
+    content_hashes: list[str],
+    batch_size: int = 1000,
+) -> dict[str, np.ndarray]:
+    """Fetch stored vectors by (model_name, content_hash)."""
+    from sqlalchemy import bindparam, text
+
+    query = text(
+        """
+        SELECT DISTINCT ON (content_hash) content_hash, embedding::text
+        FROM embeddings
+        WHERE model_name = :model_name
+          AND content_hash IN :content_hashes
+          AND embedding IS NOT NULL
+    """
+    ).bindparams(bindparam("content_hashes", expanding=True))
+
+    found: dict[str, np.ndarray] = {}
+    for start in range(0, len(content_hashes), batch_size):
+        batch = content_hashes[start : start + batch_size]
+        result = await session.execute(query, {"model_name": model, "content_hashes": batch})
+        for content_hash, vector in result.fetchall():
+            found[content_hash] = np.asarray(json.loads(vector), dtype=np.float32)
+    return found
+
+
+# Process-wide cache shared by every audit run in this worker
+_shared_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache configured from settings."""
+    global _shared_cache
+    if _shared_cache is None:
+        from api.config import get_settings
+
+        settings = get_settings()
+        disk_path = None
+        if settings.embedding_cache_disk_enabled:
+            disk_path = settings.embedding_cache_dir or str(
+                Path(tempfile.gettempdir()) / "findable-embeddings"
+            )
+        _shared_cache = EmbeddingCache(
+            EmbeddingCacheConfig(
+                memory_max_entries=settings.embedding_cache_memory_entries,
+                disk_path=disk_path,
+                disk_max_entries=settings.embedding_cache_disk_entries,
+            )
+        )
+    return _shared_cache
@@ -3,15 +3,17 @@
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import numpy as np
 
 from worker.chunking.chunker import Chunk, ChunkedPage
-from worker.embeddings.models import (
-    DEFAULT_MODEL,
-    EmbeddingModelProtocol,
-    get_model,
-)
+from worker.embeddings.cache import EmbeddingCache, EmbeddingCacheConfig
+from worker.embeddings.models import DEFAULT_MODEL, EmbeddingModelProtocol
+from worker.embeddings.service import get_embedding_model
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @dataclass
@@ -81,33 +83,52 @@ class EmbedderConfig:
 
 
 class Embedder:
-    """Generates embeddings for chunks."""
+    """Generates embeddings for chunks.
+
+    Embeddings are cached by content hash. By default the cache is private
+    to this embedder; pass a shared ``EmbeddingCache`` (see
+    ``get_embedding_cache``) to reuse embeddings across runs and workers.
+    """
 
     def __init__(
         self,
         config: EmbedderConfig | None = None,
         model: EmbeddingModelProtocol | None = None,
+        cache: EmbeddingCache | None = None,
     ):
         self.config = config or EmbedderConfig()
-        self._model = model or get_model(self.config.model_name)
-        self._cache: dict[str, np.ndarray] = {}
+        self._model = model or get_embedding_model(self.config.model_name)
+        if cache is None:
+            cache = EmbeddingCache(EmbeddingCacheConfig(database_lookup=False))
+        self._cache = cache
 
     @property
     def model_name(self) -> str:
         """Get model name."""
         return self._model.model_info.name
 
+    @property
+    def model_id(self) -> str:
+        """Get the full model identifier (stored as ``embeddings.model_name``)."""
+        return self._model.model_info.model_id
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions."""
         return self._model.dimensions
 
-    def embed_texts(self, texts: list[str]) -> list[np.ndarray]:
+    def embed_texts(
+        self,
+        texts: list[str],
+        content_hashes: list[str] | None = None,
+    ) -> list[np.ndarray]:
         """
         Embed a list of texts.
 
         Args:
             texts: List of text strings
+            content_hashes: Cache keys for the texts (defaults to a hash of
+                each text)
 
         Returns:
             List of embedding arrays
@@ -118,12 +139,14 @@ class Embedder:
         # Check cache for already embedded texts
         results: list[np.ndarray | None] = [None] * len(texts)
         texts_to_embed: list[tuple[int, str]] = []
+        keys = content_hashes or [self._cache_key(text) for text in texts]
+        new_embeddings: dict[str, np.ndarray] = {}
 
         if self.config.cache_embeddings:
+            cached = self._cache.get_many(self.model_id, keys)
             for i, text in enumerate(texts):
-                cache_key = self._cache_key(text)
-                if cache_key in self._cache:
-                    results[i] = self._cache[cache_key]
+                if keys[i] in cached:
+                    results[i] = cached[keys[i]]
                 else:
                     texts_to_embed.append((i, text))
         else:
@@ -136,7 +159,7 @@ class Embedder:
                 batch_texts = [t for _, t in batch]
                 batch_embeddings = self._model.embed(batch_texts)
 
-                for j, (original_idx, text) in enumerate(batch):
+                for j, (original_idx, _) in enumerate(batch):
                     embedding = batch_embeddings[j]
 
                     if self.config.normalize:
@@ -146,12 +169,30 @@ class Embedder:
 
                     results[original_idx] = embedding
 
-                    if self.config.cache_embeddings:
-                        cache_key = self._cache_key(text)
-                        self._cache[cache_key] = embedding
+                    new_embeddings[keys[original_idx]] = embedding
+
+        if self.config.cache_embeddings:
+            self._cache.put_many(self.model_id, new_embeddings)
 
         return [r for r in results if r is not None]
 
+    async def prefetch(self, session: "AsyncSession", content_hashes: list[str]) -> int:
+        """
+        Load embeddings already stored in the database into the cache.
+
+        Call before ``embed_pages`` so unchanged chunks are not re-embedded.
+
+        Args:
+            session: Database session
+            content_hashes: Content hashes of the chunks about to be embedded
+
+        Returns:
+            Number of embeddings loaded from the database
+        """
+        if not self.config.cache_embeddings:
+            return 0
+        return await self._cache.prefetch(session, self.model_id, content_hashes)
+
     def embed_query(self, query: str) -> np.ndarray:
         """
         Embed a query for similarity search.
@@ -171,6 +212,33 @@ class Embedder:
 
         return embedding
 
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """
+        Embed several queries at once.
+
+        Uses the model's batched ``embed_queries`` when it has one.
+
+        Args:
+            queries: Query texts
+
+        Returns:
+            Query embeddings as a (n_queries x dimensions) array
+        """
+        if not queries:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+
+        batch_embed = getattr(self._model, "embed_queries", None)
+        if batch_embed is not None:
+            embeddings = np.asarray(batch_embed(queries))
+        else:
+            embeddings = np.stack([self._model.embed_query(q) for q in queries])
+
+        if self.config.normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms > 0, norms, 1)
+
+        return embeddings
+
     def embed_chunks(self, chunks: list[Chunk]) -> list[EmbeddingResult]:
         """
         Embed a list of chunks.
@@ -185,7 +253,13 @@ class Embedder:
             return []
 
         texts = [chunk.content for chunk in chunks]
-        embeddings = self.embed_texts(texts)
+        embeddings = self.embed_texts(
+            texts,
+            content_hashes=[
+                chunk.content_hash or self._cache_key(t)
+                for chunk, t in zip(chunks, texts, strict=True)
+            ],
+        )
 
         results: list[EmbeddingResult] = []
         for chunk, embedding in zip(chunks, embeddings, strict=True):
@@ -236,15 +310,18 @@ class Embedder:
         """
         return [self.embed_page(page) for page in chunked_pages]
 
+    @property
+    def cache(self) -> EmbeddingCache:
+        """The embedding cache used by this embedder."""
+        return self._cache
+
     def clear_cache(self) -> None:
-        """Clear the embedding cache."""
+        """Clear the in-process embedding cache."""
         self._cache.clear()
 
     def _cache_key(self, text: str) -> str:
-        """Generate cache key for text."""
-        # Include model name in key so different models don't collide
-        content = f"{self.model_name}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Generate cache key for text (the cache namespaces keys by model)."""
+        return hashlib.md5(text.encode()).hexdigest()
 
 
 def embed_content(
@@ -151,19 +151,25 @@ class SentenceTransformerModel:
 
     def embed_query(self, query: str) -> np.ndarray:
         """Generate embedding for a query."""
+        return self.embed_queries([query])[0]  # type: ignore[no-any-return]
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Generate embeddings for several queries in one encode call."""
         # BGE and E5 models need special prefixes for queries
         if "bge" in self._model_info.model_id.lower():
-            query = f"Represent this sentence for searching relevant passages: {query}"
+            queries = [
+                f"Represent this sentence for searching relevant passages: {q}" for q in queries
+            ]
         elif "e5" in self._model_info.model_id.lower():
-            query = f"query: {query}"
+            queries = [f"query: {q}" for q in queries]
 
-        embedding = self._model.encode(
-            [query],
+        embeddings = self._model.encode(
+            queries,
             normalize_embeddings=True,
             show_progress_bar=False,
         )
 
-        return np.array(embedding[0])
+        return np.array(embeddings)
 
 
 class MockEmbeddingModel:
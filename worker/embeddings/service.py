@@ -0,0 +1,532 @@
+"""Local embedding service with dynamic batching.
+
+Worker processes on a host can share one embedding model instead of each
+loading its own copy and running small, under-filled batches. The service
+owns the model and serves embed requests over a Unix socket or localhost
+TCP. Requests from all clients are coalesced into batches of up to
+``max_batch_size`` texts, waiting at most ``max_wait_ms`` for a batch to
+fill.
+
+Run it with::
+
+    python -m worker.embeddings.service --address unix:///tmp/findable-embed.sock
+
+and point workers at it with ``EMBEDDING_SERVICE_ADDRESS``. ``Embedder``
+then uses an ``EmbeddingServiceClient`` (see ``get_embedding_model``), and
+falls back to a local model if the service is unreachable.
+
+Wire format: every message is a 4-byte big-endian length followed by the
+payload. Requests are one orjson frame. Responses are an orjson header
+frame, followed by a frame of raw float32 vectors for embed requests.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import orjson
+import structlog
+
+from worker.embeddings.models import (
+    DEFAULT_MODEL,
+    MODELS,
+    EmbeddingModelProtocol,
+    ModelInfo,
+    get_model,
+)
+
+logger = structlog.get_logger(__name__)
+
+_FRAME_HEADER = struct.Struct("!I")
+
+KIND_DOCUMENT = "document"
+KIND_QUERY = "query"
+
+
+def parse_address(address: str) -> tuple[int, Any]:
+    """
+    Parse a service address into a socket family and address.
+
+    Accepts ``unix:///path``, a bare filesystem path, ``tcp://host:port``
+    or ``host:port``.
+    """
+    if address.startswith("unix://"):
+        return socket.AF_UNIX, address[len("unix://") :]
+    if address.startswith("/"):
+        return socket.AF_UNIX, address
+    host, _, port = address.removeprefix("tcp://").rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+@dataclass
+class EmbeddingServiceConfig:
+    """Configuration for the embedding service."""
+
+    address: str = "unix:///tmp/findable-embed.sock"
+    model_name: str = DEFAULT_MODEL
+    max_batch_size: int = 128  # Texts per model call
+    max_wait_ms: float = 10.0  # Longest a request waits for its batch to fill
+
+
+@dataclass
+class EmbeddingServiceMetrics:
+    """Throughput and queue-depth counters for the service."""
+
+    requests: int = 0
+    texts: int = 0
+    batches: int = 0
+    max_batch_texts: int = 0
+    queue_depth: int = 0  # Texts waiting for a batch
+    max_queue_depth: int = 0
+    busy_seconds: float = 0.0  # Time spent in the model
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.texts / self.batches if self.batches else 0.0
+
+    @property
+    def texts_per_second(self) -> float:
+        """Model throughput while busy."""
+        return self.texts / self.busy_seconds if self.busy_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "mean_batch_size": round(self.mean_batch_size, 2),
+            "max_batch_texts": self.max_batch_texts,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "texts_per_second": round(self.texts_per_second, 1),
+            "errors": self.errors,
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+        }
+
+
+@dataclass
+class _Request:
+    texts: list[str]
+    kind: str
+    future: asyncio.Future
+
+
+def _embed_queries(model: EmbeddingModelProtocol, queries: list[str]) -> np.ndarray:
+    embed_queries = getattr(model, "embed_queries", None)
+    if embed_queries is not None:
+        return np.asarray(embed_queries(queries))
+    return np.stack([model.embed_query(q) for q in queries])
+
+
+class DynamicBatcher:
+    """Coalesces concurrent embed requests into batched model calls."""
+
+    def __init__(
+        self,
+        model: EmbeddingModelProtocol,
+        max_batch_size: int = 128,
+        max_wait_ms: float = 10.0,
+        metrics: EmbeddingServiceMetrics | None = None,
+    ):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.metrics = metrics if metrics is not None else EmbeddingServiceMetrics()
+        self._queue: asyncio.Queue[_Request] = asyncio.Queue()
+
+    async def submit(self, texts: list[str], kind: str = KIND_DOCUMENT) -> np.ndarray:
+        """Queue texts for the next batch and wait for their embeddings."""
+        if not texts:
+            return np.zeros((0, self.model.dimensions), dtype=np.float32)
+        future = asyncio.get_running_loop().create_future()
+        self.metrics.requests += 1
+        self.metrics.queue_depth += len(texts)
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+        await self._queue.put(_Request(texts, kind, future))
+        return await future  # type: ignore[no-any-return]
+
+    async def _collect(self) -> list[_Request]:
+        """Wait for a request, then gather more until the batch is full or due."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        size = len(batch[0].texts)
+        deadline = loop.time() + self.max_wait
+        while size < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    async def _run_batch(self, batch: list[_Request]) -> None:
+        for kind in (KIND_DOCUMENT, KIND_QUERY):
+            requests = [r for r in batch if r.kind == kind]
+            if not requests:
+                continue
+            texts = [text for r in requests for text in r.texts]
+            self.metrics.queue_depth -= len(texts)
+
+            started = time.perf_counter()
+            try:
+                if kind == KIND_QUERY:
+                    vectors = await asyncio.to_thread(_embed_queries, self.model, texts)
+                else:
+                    vectors = await asyncio.to_thread(self.model.embed, texts)
+            except Exception as e:
+                self.metrics.errors += 1
+                for r in requests:
+                    if not r.future.done():
+                        r.future.set_exception(e)
+                continue
+            duration = time.perf_counter() - started
+
+            self.metrics.batches += 1
+            self.metrics.texts += len(texts)
+            self.metrics.busy_seconds += duration
+            self.metrics.max_batch_texts = max(self.metrics.max_batch_texts, len(texts))
+            _record_batch(len(texts), duration, self.metrics.queue_depth)
+
+            vectors = np.asarray(vectors, dtype=np.float32)
+            offset = 0
+            for r in requests:
+                if not r.future.done():
+                    r.future.set_result(vectors[offset : offset + len(r.texts)])
+                offset += len(r.texts)
+
+    async def run(self) -> None:
+        """Process batches until cancelled."""
+        while True:
+            batch = await self._collect()
+            await self._run_batch(batch)
+
+
+def _record_batch(texts: int, duration: float, queue_depth: int) -> None:
+    try:
+        from api.metrics import record_embedding_batch
+
+        record_embedding_batch(texts, duration, queue_depth)
+    except Exception:
+        pass
+
+
+class EmbeddingServer:
+    """Serves a ``DynamicBatcher`` over a Unix socket or localhost TCP."""
+
+    def __init__(
+        self,
+        config: EmbeddingServiceConfig | None = None,
+        model: EmbeddingModelProtocol | None = None,
+    ):
+        self.config = config or EmbeddingServiceConfig()
+        self.model = model or get_model(self.config.model_name)
+        self.batcher = DynamicBatcher(
+            self.model,
+            max_batch_size=self.config.max_batch_size,
+            max_wait_ms=self.config.max_wait_ms,
+        )
+        self._server: asyncio.AbstractServer | None = None
+        self._batch_task: asyncio.Task | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def metrics(self) -> EmbeddingServiceMetrics:
+        return self.batcher.metrics
+
+    @property
+    def address(self) -> str:
+        """The bound address (resolves port 0 to the actual port)."""
+        family, addr = parse_address(self.config.address)
+        if family == socket.AF_INET and self._server is not None:
+            host, port = self._server.sockets[0].getsockname()[:2]
+            return f"tcp://{host}:{port}"
+        return self.config.address
+
+    async def start(self) -> None:
+        """Start accepting connections."""
+        family, addr = parse_address(self.config.address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(addr):
+                os.unlink(addr)
+            self._server = await asyncio.start_unix_server(self._handle, path=addr)
+        else:
+            self._server = await asyncio.start_server(self._handle, host=addr[0], port=addr[1])
+        self._batch_task = asyncio.create_task(self.batcher.run())
+        logger.info(
+            "embedding_service_started",
+            address=self.address,
+            model=self.model.model_info.model_id,
+            max_batch_size=self.config.max_batch_size,
+            max_wait_ms=self.config.max_wait_ms,
+        )
+
+    async def close(self) -> None:
+        """Stop accepting connections and stop batching."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+        family, addr = parse_address(self.config.address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            while True:
+                await asyncio.sleep(60)
+                logger.info("embedding_service_stats", **self.metrics.to_dict())
+        finally:
+            await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    (length,) = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+                    request = orjson.loads(await reader.readexactly(length))
+                except asyncio.IncompleteReadError:
+                    return
+
+                body = b""
+                try:
+                    header, body = await self._dispatch(request)
+                except Exception as e:
+                    header = {"ok": False, "error": str(e)}
+
+                frames = [orjson.dumps(header)]
+                if body:
+                    frames.append(body)
+                writer.write(b"".join(_FRAME_HEADER.pack(len(f)) + f for f in frames))
+                await writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, request: dict) -> tuple[dict, bytes]:
+        op = request.get("op")
+        info = self.model.model_info
+        if op == "info":
+            return {"ok": True, "model_id": info.model_id, "dimensions": info.dimensions}, b""
+        if op == "stats":
+            return {"ok": True, **self.metrics.to_dict()}, b""
+        if op == "embed":
+            model_id = request.get("model_id")
+            if model_id and model_id != info.model_id:
+                raise ValueError(f"Service runs {info.model_id}, not {model_id}")
+            kind = KIND_QUERY if request.get("kind") == KIND_QUERY else KIND_DOCUMENT
+            vectors = await self.batcher.submit(list(request["texts"]), kind)
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            return {"ok": True, "shape": list(vectors.shape)}, vectors.tobytes()
+        raise ValueError(f"Unknown op: {op}")
+
+
+class EmbeddingServiceError(RuntimeError):
+    """The embedding service returned an error or could not be reached."""
+
+
+class EmbeddingServiceClient:
+    """
+    ``EmbeddingModelProtocol`` implementation backed by the embedding service.
+
+    Blocking and thread-safe. The connection is opened lazily and reopened
+    after a fork, so a client created before forking is safe to use in the
+    child.
+    """
+
+    def __init__(self, address: str, model_name: str = DEFAULT_MODEL, timeout: float = 120.0):
+        if model_name not in MODELS:
+            raise ValueError(f"Unknown model: {model_name}. Available: {list(MODELS.keys())}")
+        self.address = address
+        self.timeout = timeout
+        self._model_info = MODELS[model_name]
+        self._sock: socket.socket | None = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @property
+    def dimensions(self) -> int:
+        """Return embedding dimensions."""
+        return self._model_info.dimensions
+
+    @property
+    def model_info(self) -> ModelInfo:
+        """Return model info."""
+        return self._model_info
+
+    def _connect(self) -> socket.socket:
+        if self._sock is not None and self._pid != os.getpid():
+            # Inherited from the parent; leave the parent's connection alone
+            self._sock.close()
+            self._sock = None
+        if self._sock is None:
+            family, addr = parse_address(self.address)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(min(self.timeout, 5.0))
+                sock.connect(addr)
+                sock.settimeout(self.timeout)
+            except OSError:
+                sock.close()
+                raise
+            self._sock, self._pid = sock, os.getpid()
+        return self._sock
+
+    def _recv_frame(self, sock: socket.socket) -> bytes:
+        (length,) = _FRAME_HEADER.unpack(self._recv_exactly(sock, _FRAME_HEADER.size))
+        return self._recv_exactly(sock, length)
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("Embedding service closed the connection")
+            buf.extend(chunk)
+        return bytes(buf)
+
+    def _request(self, payload: dict, expect_body: bool = False) -> tuple[dict, bytes]:
+        data = orjson.dumps(payload)
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    sock = self._connect()
+                    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+                    header = orjson.loads(self._recv_frame(sock))
+                    body = self._recv_frame(sock) if expect_body and header.get("ok") else b""
+                    break
+                except OSError as e:
+                    self.close_connection()
+                    if attempt:
+                        raise EmbeddingServiceError(f"Embedding service unreachable: {e}") from e
+        if not header.get("ok"):
+            raise EmbeddingServiceError(header.get("error", "Embedding service error"))
+        return header, body
+
+    def _embed(self, texts: list[str], kind: str) -> np.ndarray:
+        header, body = self._request(
+            {"op": "embed", "kind": kind, "texts": texts, "model_id": self._model_info.model_id},
+            expect_body=True,
+        )
+        return np.frombuffer(body, dtype=np.float32).reshape(header["shape"])
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for texts."""
+        if not texts:
+            return np.array([])
+        return self._embed(texts, KIND_DOCUMENT)
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Generate embedding for a query."""
+        return self.embed_queries([query])[0]  # type: ignore[no-any-return]
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Generate embeddings for several queries in one request."""
+        return self._embed(queries, KIND_QUERY)
+
+    def stats(self) -> dict:
+        """Service metrics (throughput, batch sizes, queue depth)."""
+        header, _ = self._request({"op": "stats"})
+        header.pop("ok", None)
+        return header
+
+    def ping(self) -> bool:
+        """Check the service is up and serves this client's model."""
+        try:
+            header, _ = self._request({"op": "info"})
+        except EmbeddingServiceError:
+            return False
+        return bool(header.get("model_id") == self._model_info.model_id)
+
+    def close_connection(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+_clients: dict[tuple[str, str], EmbeddingServiceClient] = {}
+
+
+def get_embedding_model(model_name: str | None = None) -> EmbeddingModelProtocol:
+    """
+    Get the embedding model to use in this process.
+
+    Returns a client for the shared embedding service when
+    ``embedding_service_address`` is set and the service is reachable,
+    otherwise a local model from ``get_model``.
+
+    Args:
+        model_name: Model name from MODELS registry, or None for default
+
+    Returns:
+        Embedding model instance
+    """
+    from api.config import get_settings
+
+    model_name = model_name or DEFAULT_MODEL
+    address = get_settings().embedding_service_address
+    if address:
+        client = _clients.get((address, model_name))
+        if client is None:
+            client = EmbeddingServiceClient(address, model_name)
+        if client.ping():
+            _clients[(address, model_name)] = client
+            return client
+        logger.warning("embedding_service_unavailable", address=address, model=model_name)
+
+    return get_model(model_name)
+
+
+def main() -> None:
+    """Run the embedding service."""
+    from api.config import get_settings
+    from api.logging import setup_logging
+
+    settings = get_settings()
+    setup_logging()
+
+    parser = argparse.ArgumentParser(description="Findable local embedding service")
+    parser.add_argument("--address", default=settings.embedding_service_address)
+    parser.add_argument("--model", default=DEFAULT_MODEL, choices=sorted(MODELS))
+    parser.add_argument("--max-batch-size", type=int, default=settings.embedding_service_max_batch)
+    parser.add_argument("--max-wait-ms", type=float, default=settings.embedding_service_max_wait_ms)
+    parser.add_argument("--metrics-port", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.metrics_port:
+        from prometheus_client import start_http_server
+
+        start_http_server(args.metrics_port)
+
+    config = EmbeddingServiceConfig(
+        address=args.address or EmbeddingServiceConfig.address,
+        model_name=args.model,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    asyncio.run(EmbeddingServer(config).serve_forever())
+
+
+if __name__ == "__main__":
+    main()
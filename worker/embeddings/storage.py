@@ -1,17 +1,40 @@
 """pgvector storage for embeddings."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 
 # Type hints for SQLAlchemy without requiring import
 from typing import TYPE_CHECKING, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import numpy as np
+import structlog
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = structlog.get_logger(__name__)
+
+# Columns written for each embedding row, in insert order
+_COLUMNS = (
+    "id",
+    "chunk_id",
+    "page_id",
+    "site_id",
+    "content",
+    "content_hash",
+    "embedding",
+    "model_name",
+    "dimensions",
+    "chunk_index",
+    "chunk_type",
+    "heading_context",
+    "position_ratio",
+    "source_url",
+    "page_title",
+)
+
 
 @dataclass
 class StoredEmbedding:
@@ -98,6 +121,31 @@ class EmbeddingStoreConfig:
     distance_metric: str = "cosine"  # cosine, l2, or inner_product
     lists: int = 100  # For ivfflat: number of lists
     ef_construction: int = 64  # For hnsw: construction parameter
+    bulk_batch_size: int = 500  # Rows per multi-row INSERT statement
+    copy_min_rows: int = 2000  # Use COPY at or above this many rows (0 = never)
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk embedding write."""
+
+    rows: int
+    method: str  # "insert" or "copy"
+    duration_seconds: float
+    ids: dict[tuple[UUID, str], UUID] = field(default_factory=dict)  # (site_id, hash) -> id
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "rows": self.rows,
+            "method": self.method,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
 
 
 class EmbeddingStore:
@@ -222,26 +270,156 @@ class EmbeddingStore:
         Returns:
             List of stored embedding IDs
         """
-        ids: list[UUID] = []
-
-        for emb in embeddings:
-            emb_id = await self.store_embedding(
-                session=session,
-                chunk_id=emb["chunk_id"],
-                page_id=emb["page_id"],
-                site_id=emb["site_id"],
-                content=emb["content"],
-                content_hash=emb["content_hash"],
-                embedding=emb["embedding"],
-                model_name=emb["model_name"],
-                chunk_index=emb.get("chunk_index", 0),
-                chunk_type=emb.get("chunk_type", "text"),
-                heading_context=emb.get("heading_context"),
-                position_ratio=emb.get("position_ratio", 0.0),
+        result = await self.store_embeddings_bulk(session, embeddings, method="insert")
+        return [result.ids[(emb["site_id"], emb["content_hash"])] for emb in embeddings]
+
+    async def store_embeddings_bulk(
+        self,
+        session: "AsyncSession",
+        embeddings: list[dict[str, Any]],
+        method: str = "auto",
+    ) -> BulkWriteResult:
+        """
+        Upsert many embeddings with as few round-trips as possible.
+
+        Rows are upserted on (content_hash, site_id); when the same pair
+        appears more than once the last row wins. Two write paths exist:
+
+        - ``insert``: multi-row ``INSERT ... ON CONFLICT`` statements of
+          ``bulk_batch_size`` rows each.
+        - ``copy``: binary ``COPY`` into a temporary table (vectors as
+          ``real[]``) merged with one ``INSERT ... SELECT``. Requires the
+          asyncpg driver; falls back to ``insert`` if it fails.
+
+        Args:
+            session: Database session
+            embeddings: Embedding dicts with the same fields as
+                ``store_embedding`` arguments
+            method: "insert", "copy", or "auto" (COPY from
+                ``copy_min_rows`` rows)
+
+        Returns:
+            BulkWriteResult with the stored IDs and throughput
+        """
+        start = time.perf_counter()
+        rows = list(
+            {
+                (emb["site_id"], emb["content_hash"]): self._bulk_row(emb) for emb in embeddings
+            }.values()
+        )
+        ids = {(row["site_id"], row["content_hash"]): row["id"] for row in rows}
+
+        if method == "auto":
+            use_copy = 0 < self.config.copy_min_rows <= len(rows)
+            method = "copy" if use_copy else "insert"
+
+        if rows and method == "copy":
+            try:
+                async with session.begin_nested():
+                    ids.update(await self._copy_rows(session, rows))
+            except Exception as e:
+                logger.warning("embeddings_copy_failed", rows=len(rows), error=str(e))
+                method = "insert"
+
+        if rows and method == "insert":
+            for batch_start in range(0, len(rows), self.config.bulk_batch_size):
+                batch = rows[batch_start : batch_start + self.config.bulk_batch_size]
+                ids.update(await self._insert_rows(session, batch))
+
+        result = BulkWriteResult(
+            rows=len(rows),
+            method=method,
+            duration_seconds=time.perf_counter() - start,
+            ids=ids,
+        )
+        logger.info("embeddings_bulk_stored", **result.to_dict())
+        return result
+
+    @staticmethod
+    def _bulk_row(emb: dict[str, Any]) -> dict[str, Any]:
+        """Normalize an embedding dict into a full row."""
+        embedding = emb["embedding"]
+        embedding_list = embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+        return {
+            "id": emb.get("id") or uuid4(),
+            "chunk_id": emb["chunk_id"],
+            "page_id": emb["page_id"],
+            "site_id": emb["site_id"],
+            "content": emb["content"],
+            "content_hash": emb["content_hash"],
+            "embedding": embedding_list,
+            "model_name": emb["model_name"],
+            "dimensions": len(embedding_list),
+            "chunk_index": emb.get("chunk_index", 0),
+            "chunk_type": emb.get("chunk_type", "text"),
+            "heading_context": emb.get("heading_context"),
+            "position_ratio": emb.get("position_ratio", 0.0),
+            "source_url": emb.get("source_url"),
+            "page_title": emb.get("page_title"),
+        }
+
+    def _upsert_sql(self, source: str) -> str:
+        """Build the upsert statement for rows produced by ``source``."""
+        return f"""
+            INSERT INTO {self.config.table_name} (
+                {", ".join(_COLUMNS)}, created_at
             )
-            ids.append(emb_id)
+            {source}
+            ON CONFLICT (content_hash, site_id) DO UPDATE SET
+                embedding = EXCLUDED.embedding,
+                model_name = EXCLUDED.model_name,
+                updated_at = NOW()
+            RETURNING id, site_id, content_hash
+        """
+
+    async def _insert_rows(
+        self,
+        session: "AsyncSession",
+        rows: list[dict[str, Any]],
+    ) -> dict[tuple[UUID, str], UUID]:
+        """Upsert rows with a single multi-row INSERT."""
+        from sqlalchemy import text
 
-        return ids
+        params: dict[str, Any] = {}
+        values: list[str] = []
+        for i, row in enumerate(rows):
+            for column in _COLUMNS:
+                value = row[column]
+                params[f"{column}_{i}"] = str(value) if column == "embedding" else value
+            values.append("(" + ", ".join(f":{c}_{i}" for c in _COLUMNS) + ", NOW())")
+
+        result = await session.execute(
+            text(self._upsert_sql("VALUES " + ",\n".join(values))), params
+        )
+        return {(site_id, content_hash): id_ for id_, site_id, content_hash in result.fetchall()}
+
+    async def _copy_rows(
+        self,
+        session: "AsyncSession",
+        rows: list[dict[str, Any]],
+    ) -> dict[tuple[UUID, str], UUID]:
+        """Load rows with binary COPY into a temp table, then upsert them."""
+        from sqlalchemy import text
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        if not hasattr(driver, "copy_records_to_table"):
+            raise TypeError("COPY requires the asyncpg driver")
+
+        await session.execute(text(CREATE_LOAD_TABLE_SQL))
+        await driver.copy_records_to_table(
+            "_embedding_load",
+            records=[tuple(row[c] for c in _COLUMNS) for row in rows],
+            columns=list(_COLUMNS),
+        )
+        select = ", ".join("embedding::vector" if c == "embedding" else c for c in _COLUMNS)
+        result = await session.execute(
+            text(self._upsert_sql(f"SELECT {select}, NOW() FROM _embedding_load"))
+        )
+        stored = {(site_id, content_hash): id_ for id_, site_id, content_hash in result.fetchall()}
+        await session.execute(text("TRUNCATE _embedding_load"))
+        return stored
 
     async def search_similar(
         self,
@@ -442,6 +620,8 @@ CREATE TABLE IF NOT EXISTS embeddings (
 CREATE INDEX IF NOT EXISTS idx_embeddings_site_id ON embeddings(site_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_page_id ON embeddings(page_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_content_hash ON embeddings(content_hash);
+CREATE INDEX IF NOT EXISTS idx_embeddings_model_content_hash
+    ON embeddings(model_name, content_hash);
 
 -- Create vector index for similarity search (IVFFlat)
 CREATE INDEX IF NOT EXISTS idx_embeddings_vector ON embeddings
@@ -449,6 +629,27 @@ USING ivfflat (embedding vector_cosine_ops)
 WITH (lists = 100);
 """
 
+# Staging table for COPY-based bulk loads (vectors as real[], cast on merge)
+CREATE_LOAD_TABLE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS _embedding_load (
+    id UUID,
+    chunk_id UUID,
+    page_id UUID,
+    site_id UUID,
+    content TEXT,
+    content_hash VARCHAR(64),
+    embedding REAL[],
+    model_name VARCHAR(100),
+    dimensions INTEGER,
+    chunk_index INTEGER,
+    chunk_type VARCHAR(50),
+    heading_context TEXT,
+    position_ratio FLOAT,
+    source_url TEXT,
+    page_title TEXT
+) ON COMMIT DROP
+"""
+
 # Alternative HNSW index (better recall, more memory)
 CREATE_HNSW_INDEX_SQL = """
 CREATE INDEX IF NOT EXISTS idx_embeddings_vector_hnsw ON embeddings
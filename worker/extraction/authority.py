@@ -12,6 +12,9 @@ from urllib.parse import urlparse
 import structlog
 from bs4 import BeautifulSoup, Tag
 
+from worker.extraction.document import PageDocument
+from worker.extraction.matcher import MultiPatternMatcher
+
 logger = structlog.get_logger(__name__)
 
 
@@ -148,6 +151,17 @@ DATE_PATTERNS = [
     r"\b((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})\b",
 ]
 
+# Matchers keyed by pattern string: they find which patterns occur, and
+# only those are enumerated with finditer/findall
+_ORIGINAL_DATA_MATCHER = MultiPatternMatcher(
+    {p: p for p in ORIGINAL_DATA_PATTERNS}, flags=re.IGNORECASE
+)
+_AUTHOR_BYLINE_MATCHER = MultiPatternMatcher(
+    {p: p for p in AUTHOR_BYLINE_PATTERNS}, flags=re.IGNORECASE
+)
+_CREDENTIAL_MATCHER = MultiPatternMatcher({p: p for p in CREDENTIAL_PATTERNS}, flags=re.IGNORECASE)
+_DATE_MATCHER = MultiPatternMatcher({p: p for p in DATE_PATTERNS}, flags=re.IGNORECASE)
+
 
 @dataclass
 class AuthorInfo:
@@ -350,7 +364,13 @@ class AuthorityAnalyzer:
             "stale": 180,
         }
 
-    def analyze(self, html: str, url: str, main_content: str = "") -> AuthorityAnalysis:
+    def analyze(
+        self,
+        html: str,
+        url: str,
+        main_content: str = "",
+        document: PageDocument | None = None,
+    ) -> AuthorityAnalysis:
         """
         Analyze authority signals in HTML content.
 
@@ -358,15 +378,17 @@ class AuthorityAnalyzer:
             html: Full HTML content
             url: Page URL
             main_content: Extracted main content text (optional)
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             AuthorityAnalysis with complete authority evaluation
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = PageDocument.ensure(html, url, document)
+        soup = document.soup
         result = AuthorityAnalysis(url=url)
 
         # Use main_content if provided, otherwise extract text
-        text_content = main_content or soup.get_text(separator=" ", strip=True)
+        text_content = main_content or document.text
 
         # Analyze author attribution
         self._analyze_authors(soup, text_content, result)
@@ -425,8 +447,8 @@ class AuthorityAnalyzer:
                     authors.append(author)
 
         # Also look for byline patterns in text
-        for pattern in AUTHOR_BYLINE_PATTERNS:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
+        for pattern in _AUTHOR_BYLINE_MATCHER.matching_ids(text_content):
+            matches = _AUTHOR_BYLINE_MATCHER.pattern(pattern).finditer(text_content)
             for match in matches:
                 name = match.group(1).strip()
                 if name and len(name) < 50 and name not in [a.name for a in authors]:
@@ -619,8 +641,8 @@ class AuthorityAnalyzer:
         # Check full text if author areas are sparse
         text_to_check = author_text if len(author_text) > 50 else text_content[:2000]
 
-        for pattern in CREDENTIAL_PATTERNS:
-            matches = re.findall(pattern, text_to_check, re.IGNORECASE)
+        for pattern in _CREDENTIAL_MATCHER.matching_ids(text_to_check):
+            matches = _CREDENTIAL_MATCHER.pattern(pattern).findall(text_to_check)
             credentials.extend(matches)
 
         # Deduplicate
@@ -711,8 +733,8 @@ class AuthorityAnalyzer:
         """Analyze markers indicating original research or data."""
         markers = []
 
-        for pattern in ORIGINAL_DATA_PATTERNS:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
+        for pattern in _ORIGINAL_DATA_MATCHER.matching_ids(text_content):
+            matches = _ORIGINAL_DATA_MATCHER.pattern(pattern).finditer(text_content)
             for match in matches:
                 # Get surrounding context
                 start = max(0, match.start() - 50)
@@ -788,8 +810,9 @@ class AuthorityAnalyzer:
                             )
 
         # Also look for date patterns in text
-        for pattern in DATE_PATTERNS:
-            matches = re.finditer(pattern, text_content[:2000], re.IGNORECASE)
+        date_text = text_content[:2000]
+        for pattern in _DATE_MATCHER.matching_ids(date_text):
+            matches = _DATE_MATCHER.pattern(pattern).finditer(date_text)
             for match in matches:
                 date_str = match.group(1) if match.groups() else match.group(0)
                 parsed = self._parse_date(date_str)
@@ -929,7 +952,12 @@ class AuthorityAnalyzer:
         return min(100, score)
 
 
-def analyze_authority(html: str, url: str, main_content: str = "") -> AuthorityAnalysis:
+def analyze_authority(
+    html: str,
+    url: str,
+    main_content: str = "",
+    document: PageDocument | None = None,
+) -> AuthorityAnalysis:
     """
     Convenience function to analyze authority signals.
 
@@ -937,9 +965,10 @@ def analyze_authority(html: str, url: str, main_content: str = "") -> AuthorityA
         html: Full HTML content
         url: Page URL
         main_content: Extracted main content text (optional)
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         AuthorityAnalysis with complete authority evaluation
     """
     analyzer = AuthorityAnalyzer()
-    return analyzer.analyze(html, url, main_content)
+    return analyzer.analyze(html, url, main_content, document=document)
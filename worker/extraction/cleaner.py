@@ -3,7 +3,9 @@
 import re
 from dataclasses import dataclass
 
-from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from bs4 import Comment, NavigableString, Tag
+
+from worker.extraction.document import PageDocument, parse_html
 
 # Tags that typically contain boilerplate content
 BOILERPLATE_TAGS = frozenset(
@@ -181,18 +183,24 @@ def _extract_text_from_tag(tag: Tag, preserve_structure: bool = True) -> str:
     return " ".join(parts)
 
 
-def clean_html(html: str, remove_boilerplate: bool = True) -> CleanedHTML:
+def clean_html(
+    html: str,
+    remove_boilerplate: bool = True,
+    document: PageDocument | None = None,
+) -> CleanedHTML:
     """
     Clean HTML and extract text content.
 
     Args:
         html: Raw HTML string
         remove_boilerplate: Whether to remove boilerplate elements
+        document: Optional pre-parsed page (cleaning works on a private copy)
 
     Returns:
         CleanedHTML with extracted text and statistics
     """
-    soup = BeautifulSoup(html, "html.parser")
+    # Cleaning decomposes tags, so never touch a shared DOM
+    soup = PageDocument.ensure(html, document=document).mutable_soup()
 
     # Remove unwanted tags completely
     for tag_name in REMOVE_TAGS:
@@ -238,6 +246,9 @@ def clean_html(html: str, remove_boilerplate: bool = True) -> CleanedHTML:
         else:
             # Fall back to removing boilerplate from body
             for tag in soup.find_all(True):
+                # Descendants of a removed element are already gone
+                if tag.decomposed:
+                    continue
                 if _is_boilerplate_element(tag):
                     tag.decompose()
                     boilerplate_removed += 1
@@ -264,7 +275,7 @@ def extract_visible_text(html: str) -> str:
     This is a simpler extraction that just gets readable text
     without trying to identify main content.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
 
     # Remove non-visible elements
     for tag in soup.find_all(REMOVE_TAGS):
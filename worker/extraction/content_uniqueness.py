@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 
 import structlog
 
+from worker.extraction.matcher import MultiPatternMatcher
+
 logger = structlog.get_logger(__name__)
 
 
@@ -345,6 +347,30 @@ _PRIMARY_RESEARCH_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"\bour\s+experience\b", re.IGNORECASE),
 ]
 
+# Prefiltered matchers: only patterns whose literal text occurs in a
+# paragraph/page are run
+_GENERIC_PHRASE_MATCHER = MultiPatternMatcher(
+    dict(zip(GENERIC_MARKETING_PHRASES, _GENERIC_PHRASE_PATTERNS, strict=True))
+)
+_PROPRIETARY_MATCHER = MultiPatternMatcher(
+    {
+        "pricing": _PRICING_PATTERNS,
+        "specs": _SPEC_PATTERNS,
+        "research": _RESEARCH_PATTERNS,
+        "statistics": _STAT_PATTERNS,
+        "code": _CODE_PATTERNS,
+        "api_docs": _API_DOC_PATTERNS,
+    }
+)
+_FIRST_PARTY_MATCHER = MultiPatternMatcher(
+    {
+        "author_bylines": _AUTHOR_BYLINE_PATTERNS,
+        "publication_dates": _PUB_DATE_PATTERNS,
+        "case_studies": _CASE_STUDY_PATTERNS,
+        "primary_research": _PRIMARY_RESEARCH_PATTERNS,
+    }
+)
+
 
 # ---------------------------------------------------------------------------
 # Result dataclass
@@ -422,15 +448,6 @@ def _score_proprietary_data(
         "api_docs": 0,
     }
 
-    pattern_groups: list[tuple[str, list[re.Pattern[str]]]] = [
-        ("pricing", _PRICING_PATTERNS),
-        ("specs", _SPEC_PATTERNS),
-        ("research", _RESEARCH_PATTERNS),
-        ("statistics", _STAT_PATTERNS),
-        ("code", _CODE_PATTERNS),
-        ("api_docs", _API_DOC_PATTERNS),
-    ]
-
     for content in pages_content:
         if not content:
             continue
@@ -439,15 +456,12 @@ def _score_proprietary_data(
         total_paragraphs += len(paragraphs)
 
         for para in paragraphs:
-            found_any = False
-            for category, patterns in pattern_groups:
-                for pattern in patterns:
-                    if pattern.search(para):
-                        category_counts[category] += 1
-                        found_any = True
-                        break  # one match per category per paragraph is enough
-
-            if found_any:
+            # One match per category per paragraph is enough
+            categories = _PROPRIETARY_MATCHER.matching_ids(para)
+            for category in categories:
+                category_counts[category] += 1
+
+            if categories:
                 paragraphs_with_markers += 1
 
     # Score = proportion of paragraphs containing at least one proprietary marker
@@ -501,34 +515,15 @@ def _score_first_party(
         if not content:
             continue
 
-        # Author bylines
-        for pattern in _AUTHOR_BYLINE_PATTERNS:
-            if pattern.search(content):
-                marker_counts["author_bylines"] += 1
-                break  # one per page
-
-        # Publication dates
-        for pattern in _PUB_DATE_PATTERNS:
-            if pattern.search(content):
-                marker_counts["publication_dates"] += 1
-                break
+        # Author bylines, publication dates, case studies / success stories and
+        # primary research framing: one per page each
+        for marker in _FIRST_PARTY_MATCHER.matching_ids(content):
+            marker_counts[marker] += 1
 
         # Original images (check for local asset paths or domain-matching src)
         if _ORIGINAL_IMAGE_PATTERN.search(content) or domain_img_pattern.search(content):
             marker_counts["original_images"] += 1
 
-        # Case studies / success stories
-        for pattern in _CASE_STUDY_PATTERNS:
-            if pattern.search(content):
-                marker_counts["case_studies"] += 1
-                break
-
-        # Primary research framing
-        for pattern in _PRIMARY_RESEARCH_PATTERNS:
-            if pattern.search(content):
-                marker_counts["primary_research"] += 1
-                break
-
     # Also check URLs for case study / research indicators
     for url in page_urls:
         url_lower = url.lower()
@@ -576,13 +571,11 @@ def _score_generic_phrasing(
         content_lower = content.lower()
         total_sentences += _count_sentences(content)
 
-        for idx, pattern in enumerate(_GENERIC_PHRASE_PATTERNS):
-            matches = pattern.findall(content_lower)
-            count = len(matches)
-            if count > 0:
-                total_generic_hits += count
-                phrase = GENERIC_MARKETING_PHRASES[idx]
-                top_phrases[phrase] = top_phrases.get(phrase, 0) + count
+        # Count only the phrases the combined pass found at all
+        for phrase in _GENERIC_PHRASE_MATCHER.matching_ids(content_lower):
+            count = len(_GENERIC_PHRASE_MATCHER.pattern(phrase).findall(content_lower))
+            total_generic_hits += count
+            top_phrases[phrase] = top_phrases.get(phrase, 0) + count
 
     if total_sentences == 0:
         return 100.0, {"total_sentences": 0, "generic_hits": 0, "top_phrases": {}}
@@ -0,0 +1,208 @@
+"""Parsed-once HTML document shared by the per-page analyzers.
+
+A page used to be parsed by BeautifulSoup separately in the crawler,
+cleaner, metadata extractor and every structure/schema/authority/JS check.
+``PageDocument`` parses the HTML at most once and lazily derives the views
+those modules need (DOM, title, text, headings, links, JSON-LD).
+
+The shared ``soup`` must be treated as read-only. Consumers that modify
+the tree (e.g. ``clean_html`` decomposing boilerplate) must work on
+``mutable_soup()`` instead.
+
+The tree builder is pluggable. ``lxml`` (libxml2) builds the same
+BeautifulSoup tree several times faster than the pure-Python
+``html.parser``, but repairs malformed markup differently, which can shift
+scores on such pages. ``html.parser`` therefore stays the default until
+the scoring calibration is re-checked on lxml; ``set_default_parser``
+switches it (the worker applies the ``html_parser_backend`` setting). A
+document keeps its backend when pickled to a pool worker. ``select`` and
+``xpath`` query the page with CSS selectors or XPath, the latter on a
+separate lxml tree.
+"""
+
+import copy
+import json
+from functools import cached_property
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
+
+try:
+    import lxml.etree
+    import lxml.html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# BeautifulSoup tree builders, fastest first
+PARSER_BACKENDS = ("lxml", "html.parser")
+
+HTML_PARSER = "html.parser"
+
+# Attributes computed lazily and dropped by release() / pickling
+_CACHED_VIEWS = ("soup", "tree", "title", "text", "headings", "hrefs", "json_ld")
+
+
+def available_parsers() -> list[str]:
+    """Parser backends that are installed, fastest first."""
+    return [name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None]
+
+
+_default_parser = HTML_PARSER
+
+
+def get_default_parser() -> str:
+    """The backend new documents parse with."""
+    return _default_parser
+
+
+def set_default_parser(name: str) -> str:
+    """
+    Choose the backend new documents parse with.
+
+    Args:
+        name: One of ``PARSER_BACKENDS``
+
+    Returns:
+        The backend in use: ``name``, or ``html.parser`` if it is not installed
+
+    Raises:
+        ValueError: If ``name`` is not a known backend
+    """
+    global _default_parser
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name!r} (expected {PARSER_BACKENDS})")
+    _default_parser = name if name in available_parsers() else HTML_PARSER
+    return _default_parser
+
+
+def parse_html(html: str, parser: str | None = None) -> BeautifulSoup:
+    """Parse HTML into a new BeautifulSoup tree with the given (or default) backend."""
+    return BeautifulSoup(html, parser or _default_parser)
+
+
+class PageDocument:
+    """A page's HTML with a lazily parsed DOM and derived views."""
+
+    def __init__(self, html: str, url: str = "", parser: str | None = None):
+        self.html = html
+        self.url = url
+        self.parser = parser or _default_parser
+
+    @classmethod
+    def ensure(
+        cls, html: str, url: str = "", document: "PageDocument | None" = None
+    ) -> "PageDocument":
+        """Return ``document`` if given, otherwise wrap ``html``."""
+        if document is not None:
+            return document
+        return cls(html, url)
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """The parsed DOM (shared, do not modify)."""
+        return parse_html(self.html, self.parser)
+
+    def mutable_soup(self) -> BeautifulSoup:
+        """A private copy of the DOM that the caller may modify."""
+        if "soup" in self.__dict__:
+            return copy.copy(self.soup)
+        return parse_html(self.html, self.parser)
+
+    def select(self, selector: str) -> list[Tag]:
+        """Elements matching a CSS selector, in document order."""
+        return list(self.soup.select(selector))
+
+    def select_one(self, selector: str) -> Tag | None:
+        """The first element matching a CSS selector."""
+        return self.soup.select_one(selector)
+
+    @cached_property
+    def tree(self) -> "lxml.html.HtmlElement":
+        """The page as an lxml element tree (parsed separately from ``soup``)."""
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required for XPath queries")
+        # lxml rejects str input with an XML encoding declaration, so parse
+        # UTF-8 bytes and pin the encoding over any declared charset
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        try:
+            return lxml.html.document_fromstring(
+                self.html.encode("utf-8", "replace"), parser=parser
+            )
+        except lxml.etree.ParserError:
+            # Empty, whitespace or comment-only documents have no root element
+            return lxml.html.document_fromstring("<html></html>")
+
+    def xpath(self, expression: str) -> list[Any]:
+        """Evaluate an XPath expression against ``tree``."""
+        return self.tree.xpath(expression)
+
+    @cached_property
+    def title(self) -> str | None:
+        """Text of the <title> tag, truncated to 500 chars."""
+        title_tag = self.soup.find("title")
+        if title_tag and title_tag.string:  # type: ignore[union-attr]
+            return title_tag.string.strip()[:500]  # type: ignore[union-attr]
+        return None
+
+    @cached_property
+    def text(self) -> str:
+        """All document text, space separated."""
+        return self.soup.get_text(separator=" ", strip=True)
+
+    @cached_property
+    def headings(self) -> dict[str, list[str]]:
+        """Non-empty heading texts by level (h1-h6), truncated to 200 chars."""
+        headings: dict[str, list[str]] = {}
+        for level in range(1, 7):
+            tag_name = f"h{level}"
+            found = []
+            for tag in self.soup.find_all(tag_name):
+                text = tag.get_text(strip=True)
+                if text:
+                    found.append(text[:200])
+            if found:
+                headings[tag_name] = found
+        return headings
+
+    @cached_property
+    def hrefs(self) -> list[str]:
+        """Raw href values of all <a href> tags in document order."""
+        return [str(a["href"]) for a in self.soup.find_all("a", href=True)]
+
+    @cached_property
+    def json_ld(self) -> list[Any]:
+        """Parsed JSON-LD blocks; invalid blocks are skipped."""
+        blocks = []
+        for script in self.soup.find_all("script", type="application/ld+json"):
+            try:
+                blocks.append(json.loads(script.string or ""))
+            except (json.JSONDecodeError, TypeError):
+                continue
+        return blocks
+
+    @property
+    def is_parsed(self) -> bool:
+        return "soup" in self.__dict__
+
+    def release(self) -> None:
+        """Drop the parsed DOM and derived views to free memory."""
+        for name in _CACHED_VIEWS:
+            self.__dict__.pop(name, None)
+
+    def __getstate__(self) -> dict:
+        # Only the source is pickled; workers re-parse on demand.
+        return {"html": self.html, "url": self.url, "parser": self.parser}
+
+    def __setstate__(self, state: dict) -> None:
+        self.html = state["html"]
+        self.url = state["url"]
+        self.parser = state.get("parser") or _default_parser
+
+    def __repr__(self) -> str:
+        return (
+            f"PageDocument(url={self.url!r}, size={len(self.html)}, "
+            f"parser={self.parser!r}, parsed={self.is_parsed})"
+        )
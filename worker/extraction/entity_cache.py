@@ -0,0 +1,299 @@
+"""Shared cache for entity recognition lookups.
+
+Entity signals (Wikipedia, Wikidata, RDAP domain age, web presence) change
+over weeks, not between audits, yet each audit of a brand otherwise makes
+six or more serial external requests. Results are cached per source,
+keyed by brand name or domain, so repeated audits, monitoring snapshots
+and calibration runs of the same site reuse them.
+
+Each source has its own TTL, and "not found" answers use a shorter one so
+a brand that gains a Wikipedia page is noticed quickly. After the TTL an
+entry is still served for ``stale_seconds`` while a background task
+refreshes it (stale-while-revalidate), so audits never wait on a refresh.
+
+A lookup that only partly succeeded (say the page was found but its
+citation count request failed) raises ``PartialLookup``: the partial
+result is used for this audit but never cached, so one flaky request
+doesn't pin degraded signals for a whole TTL.
+
+Entries live in Redis so every worker shares them. ``MemorySignalBackend``
+is a local stand-in for tests and scripts. Backend errors are logged and
+treated as misses; they never fail an audit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+import types
+import typing
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any, Protocol, TypeVar
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+DAY_SECONDS = 24 * 60 * 60
+
+# How long a lookup result is fresh, per source
+SOURCE_TTL_SECONDS = {
+    "wikipedia": 7 * DAY_SECONDS,
+    "wikidata": 7 * DAY_SECONDS,
+    "domain": 30 * DAY_SECONDS,
+    "web_presence": DAY_SECONDS,
+}
+DEFAULT_TTL_SECONDS = DAY_SECONDS
+NEGATIVE_TTL_SECONDS = DAY_SECONDS  # "Not found" answers are rechecked sooner
+DEFAULT_STALE_SECONDS = 3 * DAY_SECONDS
+
+
+class PartialLookup(Exception):
+    """A lookup result that is usable but incomplete, so must not be cached."""
+
+    def __init__(self, value: Any, reason: str):
+        super().__init__(reason)
+        self.value = value
+
+
+class SignalCacheBackend(Protocol):
+    """Key-value storage for cached signals."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored value, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """Store a value that expires after ``ttl_seconds``."""
+        ...
+
+
+class RedisSignalBackend:
+    """Backend on the worker's shared async Redis client."""
+
+    def __init__(self, redis: Any = None):
+        self._redis = redis
+
+    def _client(self) -> Any:
+        if self._redis is not None:
+            return self._redis
+        from worker.redis import get_async_redis_connection_bytes
+
+        return get_async_redis_connection_bytes()
+
+    async def get(self, key: str) -> bytes | None:
+        data: bytes | None = await self._client().get(key)
+        return data
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        await self._client().set(key, value, ex=ttl_seconds)
+
+
+class MemorySignalBackend:
+    """In-process backend for tests and local scripts."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.data: dict[str, tuple[bytes, float]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if self.clock() >= expires_at:
+            del self.data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self.data[key] = (value, self.clock() + ttl_seconds)
+
+
+def _is_datetime(annotation: Any) -> bool:
+    if annotation is datetime:
+        return True
+    if isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        return datetime in typing.get_args(annotation)
+    return False
+
+
+def signals_from_dict(cls: type[T], data: dict[str, Any]) -> T:
+    """
+    Rebuild a signals dataclass from its cached dict.
+
+    ISO strings are parsed back into datetimes, and keys the dataclass no
+    longer has are dropped, so entries survive added or removed fields.
+    """
+    hints = typing.get_type_hints(cls)
+    kwargs = {}
+    for f in dataclasses.fields(cls):  # type: ignore[arg-type]
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if isinstance(value, str) and _is_datetime(hints.get(f.name)):
+            value = datetime.fromisoformat(value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+class EntitySignalCache:
+    """Per-source TTL cache for entity lookups with stale-while-revalidate."""
+
+    def __init__(
+        self,
+        backend: SignalCacheBackend | None = None,
+        ttl_seconds: dict[str, int] | None = None,
+        negative_ttl_seconds: int = NEGATIVE_TTL_SECONDS,
+        stale_seconds: int = DEFAULT_STALE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (default: shared Redis)
+            ttl_seconds: Freshness per source (default: ``SOURCE_TTL_SECONDS``)
+            negative_ttl_seconds: Freshness of "not found" answers
+            stale_seconds: How long an expired entry is still served while refreshing
+            clock: Time source, for tests
+        """
+        self.backend = backend if backend is not None else RedisSignalBackend()
+        self.ttl_seconds = {**SOURCE_TTL_SECONDS, **(ttl_seconds or {})}
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.clock = clock
+        self._prefix = "entity:signals:"
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+
+    def _key(self, source: str, key: str) -> str:
+        return f"{self._prefix}{source}:{key.strip().lower()}"
+
+    async def _read(self, cache_key: str) -> dict[str, Any] | None:
+        try:
+            data = await self.backend.get(cache_key)
+            return orjson.loads(data) if data else None
+        except Exception as e:
+            logger.warning("entity_cache_read_failed", key=cache_key, error=str(e))
+            return None
+
+    async def _write(
+        self,
+        source: str,
+        cache_key: str,
+        value: Any,
+        found: Callable[[Any], bool] | None,
+    ) -> None:
+        positive = found is None or found(value)
+        ttl = self.ttl_seconds.get(source, DEFAULT_TTL_SECONDS)
+        if not positive:
+            ttl = min(ttl, self.negative_ttl_seconds)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            value = dataclasses.asdict(value)
+        entry = {"fetched_at": self.clock(), "ttl": ttl, "value": value}
+        try:
+            await self.backend.set(cache_key, orjson.dumps(entry), ttl + self.stale_seconds)
+        except Exception as e:
+            logger.warning("entity_cache_write_failed", key=cache_key, error=str(e))
+
+    async def _fetch_and_store(
+        self,
+        source: str,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[T]],
+        found: Callable[[T], bool] | None,
+    ) -> T:
+        try:
+            value = await fetch()
+        except PartialLookup as e:
+            logger.info("entity_cache_partial_not_stored", key=cache_key, reason=str(e))
+            return e.value  # type: ignore[no-any-return]
+        await self._write(source, cache_key, value, found)
+        return value
+
+    def _refresh(
+        self,
+        source: str,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        found: Callable[[Any], bool] | None,
+    ) -> None:
+        """Refresh a stale entry in the background, once per key."""
+        if cache_key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_and_store(source, cache_key, fetch, found)
+            except Exception as e:
+                logger.info("entity_cache_refresh_failed", key=cache_key, error=str(e))
+            finally:
+                self._refreshing.pop(cache_key, None)
+
+        self._refreshing[cache_key] = asyncio.create_task(refresh())
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for background refreshes started by this cache."""
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+    async def get_or_fetch(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cls: type[T] | None = None,
+        found: Callable[[T], bool] | None = None,
+    ) -> T:
+        """
+        Return a cached lookup result, fetching it on a miss.
+
+        Errors raised by ``fetch`` propagate and nothing is cached. A
+        ``PartialLookup`` value is returned but not cached either.
+
+        Args:
+            source: Source name, selecting the TTL (e.g. "wikipedia")
+            key: Brand name or domain (case-insensitive)
+            fetch: Performs the live lookup
+            cls: Signals dataclass the result is rebuilt into (None = plain JSON)
+            found: Whether a result is a positive answer; negatives get the
+                shorter negative TTL
+
+        Returns:
+            The fresh, stale or newly fetched result
+        """
+        cache_key = self._key(source, key)
+        entry = await self._read(cache_key)
+        if entry is not None:
+            value = entry["value"]
+            if cls is not None:
+                value = signals_from_dict(cls, value)
+            age = self.clock() - entry["fetched_at"]
+            if age >= entry["ttl"]:
+                self._refresh(source, cache_key, fetch, found)
+            return value  # type: ignore[no-any-return]
+
+        return await self._fetch_and_store(source, cache_key, fetch, found)
+
+
+_cache: EntitySignalCache | None = None
+
+
+def get_entity_signal_cache() -> EntitySignalCache | None:
+    """The shared entity signal cache, or None if disabled in settings."""
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    from api.config import get_settings
+
+    settings = get_settings()
+    if not settings.entity_cache_enabled:
+        return None
+    _cache = EntitySignalCache(stale_seconds=settings.entity_cache_stale_seconds)
+    return _cache
@@ -17,14 +17,20 @@ Signals measured:
 import asyncio
 import logging
 import re
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import TypeVar
 from urllib.parse import quote
 
 import httpx
 
+from worker.extraction.entity_cache import EntitySignalCache, PartialLookup
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # =============================================================================
 # Data Classes
@@ -537,7 +543,10 @@ class WikipediaClient:
                 )
 
         # Get citation count with separate query
-        signals.citation_count = await self._get_citation_count(title)
+        try:
+            signals.citation_count = await self._get_citation_count(title)
+        except Exception as e:
+            raise PartialLookup(signals, f"citation count failed: {e}") from e
 
         return signals
 
@@ -550,17 +559,14 @@ class WikipediaClient:
             "format": "json",
         }
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+        async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
+            response = await client.get(self.BASE_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
 
-                wikitext = data.get("parse", {}).get("wikitext", {}).get("*", "")
-                # Count <ref> tags as proxy for citations
-                return len(re.findall(r"<ref", wikitext, re.IGNORECASE))
-        except Exception:
-            return 0
+            wikitext = data.get("parse", {}).get("wikitext", {}).get("*", "")
+            # Count <ref> tags as proxy for citations
+            return len(re.findall(r"<ref", wikitext, re.IGNORECASE))
 
 
 class WikidataClient:
@@ -679,12 +685,15 @@ class DomainAgeClient:
             signals.is_country_tld = len(signals.tld) == 2 and signals.tld not in ["ai", "io", "co"]
 
         # Try RDAP lookup
+        rdap_error: str | None = None
         rdap_url = self.RDAP_SERVERS.get(signals.tld)
         if rdap_url:
             try:
                 async with httpx.AsyncClient(timeout=self.timeout) as client:
                     response = await client.get(f"{rdap_url}{domain}")
-                    if response.status_code == 200:
+                    if response.status_code == 429 or response.status_code >= 500:
+                        rdap_error = f"RDAP returned {response.status_code}"
+                    elif response.status_code == 200:
                         data = response.json()
                         signals.is_registered = True
 
@@ -714,6 +723,7 @@ class DomainAgeClient:
                                             break
             except Exception as e:
                 logger.warning(f"RDAP lookup failed for {domain}: {e}")
+                rdap_error = f"RDAP lookup failed: {e}"
 
         # Fallback: assume registered if we can resolve DNS
         if not signals.is_registered:
@@ -724,6 +734,8 @@ class DomainAgeClient:
             except Exception:
                 pass
 
+        if rdap_error:
+            raise PartialLookup(signals, rdap_error)
         return signals
 
 
@@ -734,25 +746,24 @@ class WebPresenceClient:
         self.timeout = timeout
 
     async def estimate_search_results(self, brand_name: str) -> int:
-        """Estimate number of search results for a brand."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Use DuckDuckGo instant answer API as a free proxy
-                response = await client.get(
-                    "https://api.duckduckgo.com/",
-                    params={"q": brand_name, "format": "json", "no_html": 1},
-                )
+        """Estimate number of search results for a brand.
 
-                if response.status_code == 200:
-                    data = response.json()
-                    # If DDG has an abstract, brand is known
-                    if data.get("Abstract"):
-                        return 1_000_000  # Placeholder - known brand
-                    elif data.get("RelatedTopics"):
-                        return 100_000  # Some presence
-        except Exception as e:
-            logger.warning(f"Search estimate failed for {brand_name}: {e}")
+        Raises on request failure, so an outage is not mistaken for "unknown brand".
+        """
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            # Use DuckDuckGo instant answer API as a free proxy
+            response = await client.get(
+                "https://api.duckduckgo.com/",
+                params={"q": brand_name, "format": "json", "no_html": 1},
+            )
+            response.raise_for_status()
+            data = response.json()
 
+        # If DDG has an abstract, brand is known
+        if data.get("Abstract"):
+            return 1_000_000  # Placeholder - known brand
+        elif data.get("RelatedTopics"):
+            return 100_000  # Some presence
         return 0
 
     async def check_news_presence(self, _brand_name: str) -> tuple[int, list[str]]:
@@ -774,18 +785,23 @@ class EntityRecognitionAnalyzer:
         analyzer = EntityRecognitionAnalyzer()
         result = await analyzer.analyze("stripe.com", "Stripe")
         print(result.normalized_score)  # 0-100
+
+    Pass a ``cache`` (see ``get_entity_signal_cache``) to reuse lookup
+    results across audits instead of querying every source each time.
     """
 
     def __init__(
         self,
         timeout: float = 10.0,
         skip_web_presence: bool = False,
+        cache: EntitySignalCache | None = None,
     ):
         self.wikipedia = WikipediaClient(timeout=timeout)
         self.wikidata = WikidataClient(timeout=timeout)
         self.domain_client = DomainAgeClient(timeout=timeout)
         self.web_presence = WebPresenceClient(timeout=timeout)
         self.skip_web_presence = skip_web_presence
+        self.cache = cache
 
     async def analyze(
         self,
@@ -862,14 +878,14 @@ class EntityRecognitionAnalyzer:
 
         Measures how consistently the brand is echoed in the content.
         """
-        from bs4 import BeautifulSoup
+        from worker.extraction.document import parse_html
 
         reinforcement = EntityReinforcementSignals(brand_name=brand_name)
 
         # Parse HTML if provided
         soup = None
         if html_content:
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = parse_html(html_content)
 
         # Get text content
         text = main_text or ""
@@ -951,14 +967,53 @@ class EntityRecognitionAnalyzer:
 
         result.reinforcement = reinforcement
 
+    async def _cached(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cls: type[T] | None = None,
+        found: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Run a lookup through the signal cache, if one is configured."""
+        if self.cache is None:
+            try:
+                return await fetch()
+            except PartialLookup as e:
+                return e.value  # type: ignore[no-any-return]
+        return await self.cache.get_or_fetch(source, key, fetch, cls=cls, found=found)
+
+    async def _fetch_wikipedia(self, brand_name: str) -> WikipediaSignals:
+        title = await self.wikipedia.search_entity(brand_name)
+        if title:
+            return await self.wikipedia.get_page_info(title)
+        return WikipediaSignals()
+
+    async def _fetch_wikidata(self, brand_name: str) -> WikidataSignals:
+        entity_id = await self.wikidata.search_entity(brand_name)
+        if entity_id:
+            return await self.wikidata.get_entity_info(entity_id)
+        return WikidataSignals()
+
+    async def _fetch_web_presence(self, brand_name: str) -> dict:
+        results_estimate = await self.web_presence.estimate_search_results(brand_name)
+        mentions, sources = await self.web_presence.check_news_presence(brand_name)
+        return {
+            "results_estimate": results_estimate,
+            "news_mentions": mentions,
+            "news_sources": sources,
+        }
+
     async def _check_wikipedia(self, brand_name: str, result: EntityRecognitionResult) -> None:
         """Check Wikipedia presence."""
         try:
-            title = await self.wikipedia.search_entity(brand_name)
-            if title:
-                result.wikipedia = await self.wikipedia.get_page_info(title)
-            else:
-                result.wikipedia = WikipediaSignals()
+            result.wikipedia = await self._cached(
+                "wikipedia",
+                brand_name,
+                lambda: self._fetch_wikipedia(brand_name),
+                cls=WikipediaSignals,
+                found=lambda s: s.has_page,
+            )
         except Exception as e:
             logger.error(f"Wikipedia check failed for {brand_name}: {e}")
             result.errors.append(f"Wikipedia: {str(e)}")
@@ -967,11 +1022,13 @@ class EntityRecognitionAnalyzer:
     async def _check_wikidata(self, brand_name: str, result: EntityRecognitionResult) -> None:
         """Check Wikidata entity presence."""
         try:
-            entity_id = await self.wikidata.search_entity(brand_name)
-            if entity_id:
-                result.wikidata = await self.wikidata.get_entity_info(entity_id)
-            else:
-                result.wikidata = WikidataSignals()
+            result.wikidata = await self._cached(
+                "wikidata",
+                brand_name,
+                lambda: self._fetch_wikidata(brand_name),
+                cls=WikidataSignals,
+                found=lambda s: s.has_entity,
+            )
         except Exception as e:
             logger.error(f"Wikidata check failed for {brand_name}: {e}")
             result.errors.append(f"Wikidata: {str(e)}")
@@ -980,7 +1037,18 @@ class EntityRecognitionAnalyzer:
     async def _check_domain(self, domain: str, result: EntityRecognitionResult) -> None:
         """Check domain registration signals."""
         try:
-            result.domain_signals = await self.domain_client.get_domain_info(domain)
+            signals = await self._cached(
+                "domain",
+                domain,
+                lambda: self.domain_client.get_domain_info(domain),
+                cls=DomainSignals,
+                found=lambda s: s.creation_date is not None,
+            )
+            if signals.creation_date is not None:
+                # A cached entry can be weeks old; age it to today
+                age = datetime.now(UTC) - signals.creation_date
+                signals.domain_age_years = age.days / 365.25
+            result.domain_signals = signals
         except Exception as e:
             logger.error(f"Domain check failed for {domain}: {e}")
             result.errors.append(f"Domain: {str(e)}")
@@ -989,13 +1057,16 @@ class EntityRecognitionAnalyzer:
     async def _check_web_presence(self, brand_name: str, result: EntityRecognitionResult) -> None:
         """Check web presence signals."""
         try:
-            result.web_presence.brand_name = brand_name
-            result.web_presence.google_results_estimate = (
-                await self.web_presence.estimate_search_results(brand_name)
+            presence = await self._cached(
+                "web_presence",
+                brand_name,
+                lambda: self._fetch_web_presence(brand_name),
+                found=lambda p: p["results_estimate"] > 0,
             )
-            mentions, sources = await self.web_presence.check_news_presence(brand_name)
-            result.web_presence.news_mentions_30d = mentions
-            result.web_presence.news_sources = sources
+            result.web_presence.brand_name = brand_name
+            result.web_presence.google_results_estimate = presence["results_estimate"]
+            result.web_presence.news_mentions_30d = presence["news_mentions"]
+            result.web_presence.news_sources = presence["news_sources"]
         except Exception as e:
             logger.error(f"Web presence check failed for {brand_name}: {e}")
             result.errors.append(f"Web presence: {str(e)}")
@@ -1011,6 +1082,7 @@ async def get_entity_recognition_score(
     domain: str,
     brand_name: str | None = None,
     fast_mode: bool = False,
+    cache: EntitySignalCache | None = None,
 ) -> tuple[float, dict]:
     """
     Convenience function to get entity recognition score for Findable Score integration.
@@ -1019,10 +1091,11 @@ async def get_entity_recognition_score(
         domain: The domain to analyze
         brand_name: Optional brand name override
         fast_mode: Skip slow checks (web presence)
+        cache: Optional signal cache to reuse earlier lookups
 
     Returns:
         Tuple of (normalized_score, details_dict)
     """
-    analyzer = EntityRecognitionAnalyzer(skip_web_presence=fast_mode)
+    analyzer = EntityRecognitionAnalyzer(skip_web_presence=fast_mode, cache=cache)
     result = await analyzer.analyze(domain, brand_name)
     return result.normalized_score, result.to_dict()
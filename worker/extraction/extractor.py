@@ -99,10 +99,13 @@ class ContentExtractor:
             return None
 
         try:
+            document = page.document
+
             # Clean HTML and extract text
             cleaned = clean_html(
                 page.html,
                 remove_boilerplate=self.config.remove_boilerplate,
+                document=document,
             )
 
             # Check minimum content length
@@ -120,7 +123,7 @@ class ContentExtractor:
 
             # Extract metadata
             if self.config.extract_metadata:
-                metadata = extract_metadata(page.html, page.url)
+                metadata = extract_metadata(page.html, page.url, document=document)
             else:
                 metadata = PageMetadata()
 
@@ -157,6 +160,20 @@ class ContentExtractor:
         Args:
             crawl: CrawlResult from crawler
 
+        Returns:
+            ExtractionResult with all extracted pages
+        """
+        return self.summarize(crawl.domain, [self.extract_page(page) for page in crawl.pages])
+
+    @staticmethod
+    def summarize(domain: str, extracted_pages: list[ExtractedPage | None]) -> ExtractionResult:
+        """
+        Build an ExtractionResult from per-page extraction outcomes.
+
+        Args:
+            domain: Crawled domain
+            extracted_pages: One entry per crawled page, None where extraction failed
+
         Returns:
             ExtractionResult with all extracted pages
         """
@@ -165,8 +182,7 @@ class ContentExtractor:
         total_words = 0
         all_schema_types: set[str] = set()
 
-        for page in crawl.pages:
-            extracted = self.extract_page(page)
+        for extracted in extracted_pages:
             if extracted:
                 pages.append(extracted)
                 total_words += extracted.word_count
@@ -177,7 +193,7 @@ class ContentExtractor:
         avg_words = total_words / len(pages) if pages else 0
 
         return ExtractionResult(
-            domain=crawl.domain,
+            domain=domain,
             pages=pages,
             total_pages=len(pages),
             total_words=total_words,
@@ -8,7 +8,8 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 
 import structlog
-from bs4 import BeautifulSoup
+
+from worker.extraction.document import PageDocument
 
 logger = structlog.get_logger(__name__)
 
@@ -148,17 +149,18 @@ class HeadingAnalyzer:
         self.penalize_skip = penalize_skip
         self.penalize_duplicate = penalize_duplicate
 
-    def analyze(self, html: str) -> HeadingAnalysis:
+    def analyze(self, html: str, document: PageDocument | None = None) -> HeadingAnalysis:
         """
         Analyze heading hierarchy in HTML.
 
         Args:
             html: HTML content to analyze
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             HeadingAnalysis with hierarchy validation and score
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = PageDocument.ensure(html, document=document).soup
         result = HeadingAnalysis()
 
         # Extract all headings in document order
@@ -337,15 +339,16 @@ class HeadingAnalyzer:
         return result
 
 
-def analyze_headings(html: str) -> HeadingAnalysis:
+def analyze_headings(html: str, document: PageDocument | None = None) -> HeadingAnalysis:
     """
     Convenience function to analyze heading hierarchy.
 
     Args:
         html: HTML content to analyze
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         HeadingAnalysis with hierarchy validation and score
     """
     analyzer = HeadingAnalyzer()
-    return analyzer.analyze(html)
+    return analyzer.analyze(html, document=document)
@@ -11,7 +11,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
-from bs4 import BeautifulSoup
+
+from worker.extraction.document import parse_html
 
 logger = structlog.get_logger(__name__)
 
@@ -146,7 +147,7 @@ class ImageAnalyzer:
         Returns:
             ImageAnalysis with alt text scoring
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         result = ImageAnalysis()
 
         # Find main content area
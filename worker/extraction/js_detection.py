@@ -5,12 +5,15 @@ Sites that render content client-side will appear empty to these crawlers.
 This module detects whether a page's main content requires JS to render.
 """
 
+import copy
 import re
 from dataclasses import dataclass, field
 
 import structlog
 from bs4 import BeautifulSoup
 
+from worker.extraction.document import PageDocument
+
 logger = structlog.get_logger(__name__)
 
 
@@ -129,7 +132,9 @@ class JSDetectionResult:
 class JSDetector:
     """Detects JavaScript rendering dependencies in HTML."""
 
-    def detect(self, html: str, url: str = "") -> JSDetectionResult:
+    def detect(
+        self, html: str, url: str = "", document: PageDocument | None = None
+    ) -> JSDetectionResult:
         """
         Analyze HTML to determine if content requires JavaScript.
 
@@ -142,6 +147,7 @@ class JSDetector:
         Args:
             html: The HTML content to analyze
             url: Optional URL for logging
+            document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             JSDetectionResult with dependency analysis
@@ -161,7 +167,7 @@ class JSDetector:
             return result
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = PageDocument.ensure(html, url, document).soup
 
             # Get content lengths
             result.content_length = len(html)
@@ -211,9 +217,10 @@ class JSDetector:
                 text = element.get_text(separator=" ", strip=True)
                 return len(text)
 
-        # Fallback to body
+        # Fallback to body (copied, the shared document must not be modified)
         body = soup.find("body")
         if body:
+            body = copy.copy(body)
             # Remove script/style/nav/footer
             for tag in body.find_all(["script", "style", "nav", "footer", "header"]):  # type: ignore[union-attr]
                 tag.decompose()
@@ -325,19 +332,22 @@ class JSDetector:
         result.issues = issues
 
 
-def detect_js_dependency(html: str, url: str = "") -> JSDetectionResult:
+def detect_js_dependency(
+    html: str, url: str = "", document: PageDocument | None = None
+) -> JSDetectionResult:
     """
     Convenience function to detect JavaScript dependency.
 
     Args:
         html: The HTML content to analyze
         url: Optional URL for logging
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         JSDetectionResult with dependency analysis
     """
     detector = JSDetector()
-    return detector.detect(html, url)
+    return detector.detect(html, url, document=document)
 
 
 def needs_rendering(html: str, threshold: float = 50.0) -> bool:
@@ -11,7 +11,8 @@ from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import structlog
-from bs4 import BeautifulSoup
+
+from worker.extraction.document import PageDocument
 
 logger = structlog.get_logger(__name__)
 
@@ -119,7 +120,13 @@ class LinkAnalyzer:
         self.optimal_max = optimal_max
         self.min_anchor_length = min_anchor_length
 
-    def analyze(self, html: str, url: str, word_count: int = 0) -> LinkAnalysis:
+    def analyze(
+        self,
+        html: str,
+        url: str,
+        word_count: int = 0,
+        document: PageDocument | None = None,
+    ) -> LinkAnalysis:
         """
         Analyze internal linking in HTML.
 
@@ -127,11 +134,12 @@ class LinkAnalyzer:
             html: HTML content to analyze
             url: Page URL for determining internal vs external
             word_count: Word count for density calculation
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             LinkAnalysis with link metrics and score
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = PageDocument.ensure(html, url, document).soup
         result = LinkAnalysis()
 
         # Extract domain from URL
@@ -365,7 +373,12 @@ class LinkAnalyzer:
         return max(0, score), issues
 
 
-def analyze_links(html: str, url: str, word_count: int = 0) -> LinkAnalysis:
+def analyze_links(
+    html: str,
+    url: str,
+    word_count: int = 0,
+    document: PageDocument | None = None,
+) -> LinkAnalysis:
     """
     Convenience function to analyze internal linking.
 
@@ -373,9 +386,10 @@ def analyze_links(html: str, url: str, word_count: int = 0) -> LinkAnalysis:
         html: HTML content to analyze
         url: Page URL for determining internal vs external
         word_count: Word count for density calculation
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         LinkAnalysis with link metrics and score
     """
     analyzer = LinkAnalyzer()
-    return analyzer.analyze(html, url, word_count)
+    return analyzer.analyze(html, url, word_count, document=document)
@@ -0,0 +1,262 @@
+"""Multi-pattern matching for signal and phrase scanners.
+
+Scanners such as content uniqueness, authority and the simulation's
+signal evaluation test dozens of regexes against the same text, most of
+which do not match. ``MultiPatternMatcher`` compiles a fixed set of named
+patterns once, at import, and answers "which of these match?" for a text.
+
+Rather than running every regex, each pattern is analysed when the
+matcher is built to find literal text any match must contain (e.g.
+``"founded"`` for ``founded\\s+by``, or ``"press" | "news"`` for an
+alternation). The text is lowercased once per call and each literal is
+checked with a plain substring test, which is far cheaper than a regex
+search; only patterns whose literals are present are actually run.
+Patterns consisting of a single literal are answered by the substring
+test alone.
+
+A single combined alternation was measured slower than separate searches
+with CPython's ``re``, as it loses the engine's literal-prefix scanning,
+so it is not used. Results are exact: the prefilter only skips patterns
+that cannot match (case-insensitive folding of non-ASCII text included).
+"""
+
+from __future__ import annotations
+
+import re
+import re._parser as sre_parse  # type: ignore[import-not-found]
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+PatternLike = str | re.Pattern[str]
+
+# Non-ASCII characters that match ASCII letters under re.IGNORECASE
+_ASCII_FOLDS = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+_LITERAL = sre_parse.LITERAL
+_SKIPPED = (sre_parse.AT,)  # Zero-width: literals on either side are adjacent
+_REPEATS = tuple(
+    op
+    for op in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+# A prefilter: the lowered text must contain at least one of these literals
+Requirement = tuple[str, ...]
+
+
+def _fold(text: str) -> str:
+    """Lowercase text so ASCII literals can be found with a substring test."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_ASCII_FOLDS).lower()
+
+
+def _better(a: Requirement | None, b: Requirement | None) -> Requirement | None:
+    """The more selective requirement (longest shortest literal, then fewest)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    key_a = (min(map(len, a)), -len(a))
+    key_b = (min(map(len, b)), -len(b))
+    return a if key_a >= key_b else b
+
+
+def _requirement(items: Sequence[tuple]) -> Requirement | None:
+    """Best literal requirement for a parsed regex sequence, if any."""
+    best: Requirement | None = None
+    run: list[str] = []
+
+    def flush() -> None:
+        nonlocal best
+        if run:
+            best = _better(best, ("".join(run),))
+            run.clear()
+
+    for op, av in items:
+        if op is _LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if op in _SKIPPED:
+            continue
+        flush()
+        if op is sre_parse.SUBPATTERN:
+            best = _better(best, _requirement(av[-1]))
+        elif getattr(sre_parse, "ATOMIC_GROUP", None) is op:
+            best = _better(best, _requirement(av))
+        elif op in _REPEATS and av[0] >= 1:
+            best = _better(best, _requirement(av[2]))
+        elif op is sre_parse.BRANCH:
+            branches = [_requirement(branch) for branch in av[1]]
+            if all(branches):
+                best = _better(best, tuple(dict.fromkeys(lit for b in branches for lit in b)))
+    flush()
+    return best
+
+
+def _analyse(pattern: re.Pattern[str]) -> _Entry:
+    """Build a pattern's prefilter; patterns that cannot be analysed are always run."""
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return _Entry(pattern, None, None)
+    requirement = _requirement(parsed.data)
+    literal = None
+    if (
+        requirement is not None
+        and all(op is _LITERAL for op, _ in parsed.data)
+        and len(parsed.data) == len(requirement[0])
+        and not pattern.flags & re.ASCII
+    ):
+        literal = "".join(chr(av) for _, av in parsed.data)
+    return _Entry(pattern, requirement, literal)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """One compiled pattern with its prefilter."""
+
+    pattern: re.Pattern[str]
+    requirement: Requirement | None
+    literal: str | None  # Set if the pattern is exactly this text: no regex needed
+
+    def possible(self, folded: str) -> bool:
+        return self.requirement is None or any(lit in folded for lit in self.requirement)
+
+    def matches(self, text: str, folded: str) -> bool:
+        if not self.possible(folded):
+            return False
+        if self.literal is None:
+            return self.pattern.search(text) is not None
+        if self.pattern.flags & re.IGNORECASE:
+            return True  # The prefilter was the literal itself
+        return self.literal in text
+
+
+class MultiPatternMatcher:
+    """A fixed set of named patterns, matched with literal prefiltering."""
+
+    def __init__(
+        self,
+        patterns: Mapping[str, PatternLike | Sequence[PatternLike]],
+        flags: int = 0,
+    ):
+        """
+        Compile the matcher.
+
+        Args:
+            patterns: Pattern(s) per id, in priority order. Strings are
+                compiled with ``flags``; compiled patterns keep their own.
+            flags: Flags for patterns given as strings
+        """
+        self.ids: tuple[str, ...] = tuple(patterns)
+        self._entries: dict[str, tuple[_Entry, ...]] = {}
+        for id_ in self.ids:
+            spec = patterns[id_]
+            items = [spec] if isinstance(spec, str | re.Pattern) else list(spec)
+            if not items:
+                raise ValueError(f"No patterns for {id_!r}")
+            entries = []
+            for item in items:
+                compiled = re.compile(item, flags) if isinstance(item, str) else item
+                entries.append(_analyse(compiled))
+            self._entries[id_] = tuple(entries)
+
+        # Case-insensitive literal sets (e.g. URL fragments) reduce to substring tests
+        self._literals: dict[str, tuple[str, ...]] | None = None
+        self._all_literals: tuple[str, ...] = ()
+        if all(
+            e.literal is not None and e.pattern.flags & re.IGNORECASE
+            for entries in self._entries.values()
+            for e in entries
+        ):
+            self._literals = {
+                id_: tuple(e.literal.lower() for e in entries)  # type: ignore[union-attr]
+                for id_, entries in self._entries.items()
+            }
+            self._all_literals = tuple(lit for lits in self._literals.values() for lit in lits)
+
+    @classmethod
+    def from_literals(
+        cls, literals: Mapping[str, str] | Iterable[str], ignore_case: bool = False
+    ) -> MultiPatternMatcher:
+        """Matcher for plain substrings (ids default to the literals themselves)."""
+        if not isinstance(literals, Mapping):
+            literals = {literal: literal for literal in literals}
+        flags = re.IGNORECASE if ignore_case else 0
+        return cls({id_: re.escape(text) for id_, text in literals.items()}, flags=flags)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def pattern(self, id_: str) -> re.Pattern[str]:
+        """The (first) compiled pattern for an id."""
+        return self._entries[id_][0].pattern
+
+    def _ids(self, ids: Iterable[str] | None) -> Iterable[str]:
+        if ids is None:
+            return self.ids
+        wanted = set(ids)
+        unknown = wanted.difference(self._entries)
+        if unknown:
+            raise KeyError(f"Unknown pattern ids: {sorted(unknown)}")
+        return [id_ for id_ in self.ids if id_ in wanted]
+
+    def matching_ids(self, text: str, ids: Iterable[str] | None = None) -> list[str]:
+        """
+        Ids with at least one matching pattern.
+
+        Args:
+            text: Text to scan
+            ids: Only consider these ids (default: all)
+
+        Returns:
+            Matching ids, in this matcher's order
+        """
+        folded = _fold(text)
+        if self._literals is not None:
+            return [
+                id_ for id_ in self._ids(ids) if any(lit in folded for lit in self._literals[id_])
+            ]
+        return [
+            id_
+            for id_ in self._ids(ids)
+            if any(e.matches(text, folded) for e in self._entries[id_])
+        ]
+
+    def matches_any(self, text: str) -> bool:
+        """Whether any pattern matches, stopping at the first that does."""
+        folded = _fold(text)
+        if self._literals is not None:
+            return any(map(folded.__contains__, self._all_literals))
+        return any(
+            entry.matches(text, folded) for entries in self._entries.values() for entry in entries
+        )
+
+    def first_matches(
+        self, text: str, ids: Iterable[str] | None = None
+    ) -> dict[str, re.Match[str]]:
+        """
+        First match per id: the leftmost match of its first matching pattern.
+
+        Args:
+            text: Text to scan
+            ids: Only consider these ids (default: all)
+
+        Returns:
+            Matches keyed by id, in this matcher's order
+        """
+        folded = _fold(text)
+        found: dict[str, re.Match[str]] = {}
+        for id_ in self._ids(ids):
+            for entry in self._entries[id_]:
+                if entry.possible(folded):
+                    match = entry.pattern.search(text)
+                    if match:
+                        found[id_] = match
+                        break
+        return found
@@ -1,12 +1,13 @@
 """Metadata extraction from HTML pages."""
 
-import json
 import re
 from dataclasses import dataclass, field
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from worker.extraction.document import PageDocument
+
 
 @dataclass
 class PageMetadata:
@@ -88,14 +89,13 @@ def _get_meta_content(
     return None
 
 
-def _extract_schema_types(soup: BeautifulSoup) -> list[str]:
+def _extract_schema_types(document: PageDocument) -> list[str]:
     """Extract schema.org types from JSON-LD and microdata."""
     types: set[str] = set()
 
     # JSON-LD
-    for script in soup.find_all("script", type="application/ld+json"):
+    for data in document.json_ld:
         try:
-            data = json.loads(script.string or "")
             if isinstance(data, dict):
                 if "@type" in data:
                     t = data["@type"]
@@ -111,11 +111,11 @@ def _extract_schema_types(soup: BeautifulSoup) -> list[str]:
                                 types.update(t)
                             else:
                                 types.add(t)
-        except (json.JSONDecodeError, TypeError):
+        except TypeError:
             pass
 
     # Microdata itemtype
-    for tag in soup.find_all(attrs={"itemtype": True}):
+    for tag in document.soup.find_all(attrs={"itemtype": True}):
         itemtype = tag.get("itemtype", "")
         if "schema.org" in itemtype:
             # Extract type from URL like "https://schema.org/Article"
@@ -126,21 +126,10 @@ def _extract_schema_types(soup: BeautifulSoup) -> list[str]:
     return sorted(types)
 
 
-def _extract_headings(soup: BeautifulSoup) -> dict[str, list[str]]:
+def _extract_headings(document: PageDocument) -> dict[str, list[str]]:
     """Extract all headings organized by level."""
-    headings: dict[str, list[str]] = {}
-
-    for level in range(1, 7):
-        tag_name = f"h{level}"
-        found = []
-        for tag in soup.find_all(tag_name):
-            text = tag.get_text(strip=True)
-            if text:
-                found.append(text[:200])  # Limit length
-        if found:
-            headings[tag_name] = found
-
-    return headings
+    # Copy so callers can't mutate the document's cached view
+    return {level: list(texts) for level, texts in document.headings.items()}
 
 
 def _count_words(text: str) -> int:
@@ -158,18 +147,22 @@ def _is_internal_link(href: str, base_domain: str) -> bool:
     return base_domain.lower() in href.lower()
 
 
-def extract_metadata(html: str, url: str | None = None) -> PageMetadata:
+def extract_metadata(
+    html: str, url: str | None = None, document: PageDocument | None = None
+) -> PageMetadata:
     """
     Extract metadata from HTML.
 
     Args:
         html: HTML content
         url: Optional page URL for resolving relative links
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         PageMetadata with extracted information
     """
-    soup = BeautifulSoup(html, "html.parser")
+    document = PageDocument.ensure(html, url or "", document)
+    soup = document.soup
     metadata = PageMetadata()
 
     # Extract domain for link classification
@@ -238,11 +231,10 @@ def extract_metadata(html: str, url: str | None = None) -> PageMetadata:
         metadata.favicon = href  # type: ignore[assignment]
 
     # Headings
-    metadata.headings = _extract_headings(soup)
+    metadata.headings = _extract_headings(document)
 
     # Count links
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"]
+    for href in document.hrefs:
         if _is_internal_link(href, base_domain):
             metadata.links_internal += 1
         else:
@@ -252,10 +244,9 @@ def extract_metadata(html: str, url: str | None = None) -> PageMetadata:
     metadata.images = len(soup.find_all("img"))
 
     # Word count
-    text = soup.get_text(separator=" ", strip=True)
-    metadata.word_count = _count_words(text)
+    metadata.word_count = _count_words(document.text)
 
     # Schema.org types
-    metadata.schema_types = _extract_schema_types(soup)
+    metadata.schema_types = _extract_schema_types(document)
 
     return metadata
@@ -11,6 +11,8 @@ from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
+from worker.extraction.document import PageDocument
+
 
 class PageType(StrEnum):
     """Types of web pages with different scoring expectations."""
@@ -175,13 +177,16 @@ PAGE_TYPE_CONTEXT = {
 class PageTypeDetector:
     """Detects the type of a web page."""
 
-    def detect(self, url: str, html: str | None = None) -> PageTypeResult:
+    def detect(
+        self, url: str, html: str | None = None, document: PageDocument | None = None
+    ) -> PageTypeResult:
         """
         Detect the type of a page from URL and optionally HTML content.
 
         Args:
             url: Page URL
             html: Optional HTML content for deeper analysis
+            document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             PageTypeResult with type, confidence, and context
@@ -211,16 +216,16 @@ class PageTypeDetector:
                     break
 
         # Boost confidence with HTML analysis
-        if html and page_type == PageType.UNKNOWN:
-            html_type, html_signals = self._analyze_html(html)
-            if html_type != PageType.UNKNOWN:
-                page_type = html_type
-                confidence = 0.6
-                signals.extend(html_signals)
-        elif html:
+        if html:
+            soup = PageDocument.ensure(html, url, document).soup
+            html_type, html_signals = self._analyze_html(soup)
+            if page_type == PageType.UNKNOWN:
+                if html_type != PageType.UNKNOWN:
+                    page_type = html_type
+                    confidence = 0.6
+                    signals.extend(html_signals)
             # Verify URL-based detection with HTML
-            html_type, html_signals = self._analyze_html(html)
-            if html_type == page_type:
+            elif html_type == page_type:
                 confidence = min(0.95, confidence + 0.2)
                 signals.extend(html_signals)
 
@@ -235,10 +240,9 @@ class PageTypeDetector:
             expected_gaps=context["expected_gaps"],  # type: ignore[arg-type]
         )
 
-    def _analyze_html(self, html: str) -> tuple[PageType, list[str]]:
-        """Analyze HTML content to detect page type."""
+    def _analyze_html(self, soup: BeautifulSoup) -> tuple[PageType, list[str]]:
+        """Analyze parsed HTML content to detect page type."""
         signals = []
-        soup = BeautifulSoup(html, "html.parser")
 
         # Check for FAQ indicators
         faq_indicators = soup.find_all(class_=re.compile(r"faq|question|accordion", re.I))
@@ -280,19 +284,22 @@ class PageTypeDetector:
         return PageType.UNKNOWN, signals
 
 
-def detect_page_type(url: str, html: str | None = None) -> PageTypeResult:
+def detect_page_type(
+    url: str, html: str | None = None, document: PageDocument | None = None
+) -> PageTypeResult:
     """
     Convenience function to detect page type.
 
     Args:
         url: Page URL
         html: Optional HTML content
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         PageTypeResult with type and context
     """
     detector = PageTypeDetector()
-    return detector.detect(url, html)
+    return detector.detect(url, html, document=document)
 
 
 def get_page_type_context(page_type: PageType) -> dict:
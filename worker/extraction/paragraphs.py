@@ -9,7 +9,8 @@ import re
 from dataclasses import dataclass, field
 
 import structlog
-from bs4 import BeautifulSoup
+
+from worker.extraction.document import parse_html
 
 logger = structlog.get_logger(__name__)
 
@@ -114,7 +115,7 @@ class ParagraphAnalyzer:
         Returns:
             ParagraphAnalysis with paragraph metrics
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         result = ParagraphAnalysis()
 
         # Find paragraphs in main content area
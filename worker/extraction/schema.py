@@ -12,6 +12,8 @@ from datetime import datetime
 import structlog
 from bs4 import BeautifulSoup
 
+from worker.extraction.document import PageDocument
+
 logger = structlog.get_logger(__name__)
 
 
@@ -233,18 +235,19 @@ class SchemaAnalyzer:
             # > 180 days = very_stale
         }
 
-    def analyze(self, html: str, url: str) -> SchemaAnalysis:
+    def analyze(self, html: str, url: str, document: PageDocument | None = None) -> SchemaAnalysis:
         """
         Analyze schema.org markup in HTML.
 
         Args:
             html: HTML content to analyze
             url: Page URL
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             SchemaAnalysis with complete schema evaluation
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = PageDocument.ensure(html, url, document).soup
         result = SchemaAnalysis(url=url)
 
         # Extract JSON-LD schemas
@@ -674,16 +677,17 @@ class SchemaAnalyzer:
         return max(0, min(100, score))
 
 
-def analyze_schema(html: str, url: str) -> SchemaAnalysis:
+def analyze_schema(html: str, url: str, document: PageDocument | None = None) -> SchemaAnalysis:
     """
     Convenience function to analyze schema.org markup.
 
     Args:
         html: HTML content to analyze
         url: Page URL
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         SchemaAnalysis with complete schema evaluation
     """
     analyzer = SchemaAnalyzer()
-    return analyzer.analyze(html, url)
+    return analyzer.analyze(html, url, document=document)
@@ -23,6 +23,7 @@ from urllib.parse import urlparse
 
 import structlog
 
+from worker.extraction.matcher import MultiPatternMatcher
 from worker.extraction.page_type import PageType, PageTypeResult
 from worker.extraction.site_type import SiteType
 
@@ -124,6 +125,45 @@ _DERIVATIVE_URL_PATTERNS = [
     "/how-to",
 ]
 
+# Self-referential paths (site talking about its own stuff)
+_OWN_TOPIC_URL_PATTERNS = [
+    "/docs",
+    "/api",
+    "/pricing",
+    "/features",
+    "/changelog",
+    "/getting-started",
+    "/quickstart",
+    "/integrations",
+    "/download",
+    "/install",
+]
+
+# External-topic paths (site talking about others' stuff)
+_EXTERNAL_TOPIC_URL_PATTERNS = [
+    "/alternatives",
+    "/vs-",
+    "/vs/",
+    "-vs-",
+    "/best-",
+    "/top-",
+    "/review",
+    "/comparison",
+    "/compare",
+]
+
+# Case-insensitive matchers over the lists above
+_PRIMARY_URL_MATCHER = MultiPatternMatcher.from_literals(_PRIMARY_URL_PATTERNS, ignore_case=True)
+_DERIVATIVE_URL_MATCHER = MultiPatternMatcher.from_literals(
+    _DERIVATIVE_URL_PATTERNS, ignore_case=True
+)
+_OWN_TOPIC_URL_MATCHER = MultiPatternMatcher.from_literals(
+    _OWN_TOPIC_URL_PATTERNS, ignore_case=True
+)
+_EXTERNAL_TOPIC_URL_MATCHER = MultiPatternMatcher.from_literals(
+    _EXTERNAL_TOPIC_URL_PATTERNS, ignore_case=True
+)
+
 
 def analyze_source_primacy(
     domain: str,
@@ -308,10 +348,10 @@ def _score_from_urls(page_urls: list[str]) -> PrimacySignal:
     derivative_count = 0
 
     for url in page_urls:
-        path = urlparse(url).path.lower()
-        if any(p in path for p in _PRIMARY_URL_PATTERNS):
+        path = urlparse(url).path
+        if _PRIMARY_URL_MATCHER.matches_any(path):
             primary_count += 1
-        if any(p in path for p in _DERIVATIVE_URL_PATTERNS):
+        if _DERIVATIVE_URL_MATCHER.matches_any(path):
             derivative_count += 1
 
     total = len(page_urls)
@@ -388,41 +428,11 @@ def _score_from_self_reference(_domain: str, page_urls: list[str]) -> PrimacySig
     external_topic_count = 0
 
     for url in page_urls:
-        path = urlparse(url).path.lower()
-
-        # Self-referential patterns (site talking about its own stuff)
-        if any(
-            p in path
-            for p in [
-                "/docs",
-                "/api",
-                "/pricing",
-                "/features",
-                "/changelog",
-                "/getting-started",
-                "/quickstart",
-                "/integrations",
-                "/download",
-                "/install",
-            ]
-        ):
-            own_topic_count += 1
+        path = urlparse(url).path
 
-        # External-topic patterns (site talking about others' stuff)
-        if any(
-            p in path
-            for p in [
-                "/alternatives",
-                "/vs-",
-                "/vs/",
-                "-vs-",
-                "/best-",
-                "/top-",
-                "/review",
-                "/comparison",
-                "/compare",
-            ]
-        ):
+        if _OWN_TOPIC_URL_MATCHER.matches_any(path):
+            own_topic_count += 1
+        if _EXTERNAL_TOPIC_URL_MATCHER.matches_any(path):
             external_topic_count += 1
 
     total = len(page_urls)
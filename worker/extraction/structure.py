@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 import structlog
 from bs4 import BeautifulSoup, Tag
 
+from worker.extraction.document import PageDocument
 from worker.extraction.headings import HeadingAnalysis, analyze_headings
 from worker.extraction.links import LinkAnalysis, analyze_links
 
@@ -285,6 +286,7 @@ class StructureAnalyzer:
         url: str,
         main_content: str = "",
         word_count: int = 0,
+        document: PageDocument | None = None,
     ) -> StructureAnalysis:
         """
         Analyze complete page structure.
@@ -294,18 +296,20 @@ class StructureAnalyzer:
             url: Page URL
             main_content: Extracted main content text
             word_count: Word count of content
+            document: Optional pre-parsed page to avoid re-parsing ``html``
 
         Returns:
             StructureAnalysis with all component analyses
         """
         result = StructureAnalysis(url=url)
-        soup = BeautifulSoup(html, "html.parser")
+        document = PageDocument.ensure(html, url, document)
+        soup = document.soup
 
         # Analyze headings
-        result.headings = analyze_headings(html)
+        result.headings = analyze_headings(html, document=document)
 
         # Analyze links
-        result.links = analyze_links(html, url, word_count)
+        result.links = analyze_links(html, url, word_count, document=document)
 
         # Analyze answer-first
         result.answer_first = self._analyze_answer_first(soup, main_content)
@@ -858,6 +862,7 @@ def analyze_structure(
     url: str,
     main_content: str = "",
     word_count: int = 0,
+    document: PageDocument | None = None,
 ) -> StructureAnalysis:
     """
     Convenience function to analyze page structure.
@@ -867,9 +872,10 @@ def analyze_structure(
         url: Page URL
         main_content: Extracted main content text
         word_count: Word count of content
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         StructureAnalysis with all component analyses
     """
     analyzer = StructureAnalyzer()
-    return analyzer.analyze(html, url, main_content, word_count)
+    return analyzer.analyze(html, url, main_content, word_count, document=document)
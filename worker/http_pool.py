@@ -0,0 +1,248 @@
+"""Shared pooled HTTP client for worker network I/O.
+
+Every crawler, technical check and observation provider used to open a
+fresh ``httpx.AsyncClient`` per request, paying a TCP+TLS handshake each
+time. ``HTTPClientPool`` wraps a single keep-alive client per event loop
+with per-host connection limits and pool metrics.
+
+Usage:
+    pool = get_http_pool()
+    response = await pool.request("GET", url, headers=..., timeout=10.0)
+
+    async with pool.stream("GET", url) as response:
+        ...
+
+    # At the end of a job (e.g. in run_audit)
+    await close_http_pool()
+
+    # Or, from a synchronous RQ entry point
+    return run_with_http_pool(run_snapshot(...))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class PoolConfig:
+    """Configuration for the shared HTTP client pool."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    max_connections_per_host: int = 8
+    keepalive_expiry: float = 30.0
+    default_timeout: float = 30.0
+    max_redirects: int = 5
+    http2: bool = True  # Only used when h2 is installed
+
+
+@dataclass
+class PoolMetrics:
+    """Counters describing how the pool has been used."""
+
+    requests: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    host_wait_seconds: float = 0.0
+    requests_by_host: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def connection_reuse_rate(self) -> float:
+        """Fraction of requests that did not open a new connection."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connection_reuse_rate": round(self.connection_reuse_rate, 3),
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "host_wait_seconds": round(self.host_wait_seconds, 3),
+            "requests_by_host": dict(self.requests_by_host),
+        }
+
+
+class HTTPClientPool:
+    """Keep-alive HTTP client shared by all worker call sites.
+
+    The underlying ``httpx.AsyncClient`` is bound to the event loop it was
+    created on, so use :func:`get_http_pool` rather than sharing an instance
+    across ``asyncio.run`` calls.
+    """
+
+    def __init__(
+        self,
+        config: PoolConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.config = config or PoolConfig()
+        self.metrics = PoolMetrics()
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.config.http2 and _http2_available()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.default_timeout,
+                max_redirects=self.config.max_redirects,
+                http2=self.http2_enabled,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+        return self._client
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.config.max_connections_per_host)
+        return self._host_slots[host]
+
+    async def _trace(self, event_name: str, _info: dict) -> None:
+        """httpcore trace hook used to count newly opened connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self.metrics.connections_opened += 1
+
+    @asynccontextmanager
+    async def _acquire(self, url: str) -> AsyncIterator[None]:
+        """Hold a per-host slot and track in-flight/request metrics."""
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slot(host)
+
+        wait_start = time.perf_counter()
+        async with slot:
+            self.metrics.host_wait_seconds += time.perf_counter() - wait_start
+            self.metrics.requests += 1
+            self.metrics.requests_by_host[host] += 1
+            self.metrics.in_flight += 1
+            self.metrics.peak_in_flight = max(self.metrics.peak_in_flight, self.metrics.in_flight)
+            try:
+                yield
+            except Exception:
+                self.metrics.errors += 1
+                raise
+            finally:
+                self.metrics.in_flight -= 1
+
+    def _with_trace(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions.setdefault("trace", self._trace)
+        kwargs["extensions"] = extensions
+        return kwargs
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool.
+
+        Accepts the same keyword arguments as ``httpx.AsyncClient.request``
+        (``headers``, ``json``, ``timeout``, ``follow_redirects`` ...).
+        """
+        async with self._acquire(url):
+            return await self.client.request(method, url, **self._with_trace(kwargs))
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Stream a response through the pool (see ``httpx.AsyncClient.stream``)."""
+        async with (
+            self._acquire(url),
+            self.client.stream(method, url, **self._with_trace(kwargs)) as response,
+        ):
+            yield response
+
+    async def aclose(self) -> None:
+        """Close pooled connections and log the pool metrics."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("http_pool_closed", **self.metrics.to_dict())
+        self._client = None
+
+
+# One pool per event loop: RQ jobs call asyncio.run() per job, and an
+# httpx client cannot be reused across loops.
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HTTPClientPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_pool(config: PoolConfig | None = None) -> HTTPClientPool:
+    """Get the shared pool for the running event loop.
+
+    ``config`` only applies when the pool is first created.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = HTTPClientPool(config)
+        _pools[loop] = pool
+    return pool
+
+
+async def close_http_pool() -> None:
+    """Close and forget the pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.aclose()
+
+
+T = TypeVar("T")
+
+
+def run_with_http_pool(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a job with ``asyncio.run`` and close its event loop's pool after.
+
+    The loop's async Redis client is closed too, since it dies with the loop.
+    """
+    from worker.redis import close_async_redis
+
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await close_http_pool()
+            await close_async_redis()
+
+    return asyncio.run(main())
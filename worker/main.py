@@ -4,8 +4,9 @@ import logging
 import os
 import platform
 import sys
+import time
 
-from rq import SimpleWorker, Worker
+from rq import Queue, SimpleWorker, Worker
 from rq.job import Job
 
 # Add project root to path
@@ -51,6 +52,65 @@ def on_job_failure(
     )
 
 
+class JobTimingMixin:
+    """Record each job's wall time, including the fork, from the worker process."""
+
+    def execute_job(self, job: Job, queue: Queue) -> None:
+        start = time.perf_counter()
+        try:
+            super().execute_job(job, queue)  # type: ignore[misc]
+        finally:
+            duration = time.perf_counter() - start
+            try:
+                from api.metrics import record_job_duration
+
+                record_job_duration(job.func_name or "unknown", duration)
+            except Exception:
+                pass
+            logging.info(
+                f"Job finished: {job.id} in {duration:.2f}s",
+                extra={"job_id": job.id, "func": job.func_name, "duration_seconds": duration},
+            )
+
+
+class TimedWorker(JobTimingMixin, Worker):
+    """Forking worker with per-job timing."""
+
+
+class TimedSimpleWorker(JobTimingMixin, SimpleWorker):
+    """Non-forking worker with per-job timing."""
+
+
+def warm_up_worker() -> None:
+    """Preload what jobs need so forked work horses inherit it."""
+    settings = get_settings()
+    from worker.warmup import PRELOAD_MODULES, warm_up
+
+    if settings.worker_preload_enabled:
+        report = warm_up(
+            modules=[*PRELOAD_MODULES, *settings.worker_preload_modules],
+            # Jobs embed through the shared service instead of a local model
+            load_model=not settings.embedding_service_address,
+            load_calibration=settings.calibration_enabled,
+        )
+    else:
+        report = warm_up(
+            modules=(), load_model=False, load_calibration=settings.calibration_enabled
+        )
+
+    try:
+        from api.metrics import record_worker_warmup
+
+        record_worker_warmup("modules", sum(report.module_seconds.values()))
+        record_worker_warmup("model", report.model_seconds)
+        record_worker_warmup("calibration", report.calibration_seconds)
+        record_worker_warmup("total", report.total_seconds)
+    except Exception as e:
+        logging.warning(f"Failed to record warm-up metrics: {e}")
+
+    logging.info("Worker warmed up", extra=report.to_dict())
+
+
 def run_worker() -> None:
     """Start the RQ worker."""
     settings = get_settings()
@@ -66,20 +126,20 @@ def run_worker() -> None:
 
     redis_conn = get_redis_connection_bytes()
 
-    # Load active calibration config for dynamic weights/thresholds
-    if settings.calibration_enabled:
-        try:
-            import asyncio
+    if settings.worker_metrics_port:
+        from prometheus_client import start_http_server
 
-            from worker.scoring.calculator_v2 import load_active_calibration_weights
+        start_http_server(settings.worker_metrics_port)
 
-            weights = asyncio.run(load_active_calibration_weights())
-            logging.info(
-                "Calibration config loaded",
-                extra={"weights": weights},
-            )
-        except Exception as e:
-            logging.warning(f"Failed to load calibration config, using defaults: {e}")
+    from worker.extraction.document import set_default_parser
+
+    logging.info(
+        "HTML parser backend", extra={"backend": set_default_parser(settings.html_parser_backend)}
+    )
+
+    # Load the embedding model, job modules and active calibration weights
+    # once, before any job is forked
+    warm_up_worker()
 
     # Initialize calibration schedules (drift detection)
     try:
@@ -95,8 +155,10 @@ def run_worker() -> None:
 
     queues = [QUEUE_HIGH, QUEUE_DEFAULT, QUEUE_LOW]
 
-    # Use SimpleWorker on Windows (no os.fork() support)
-    WorkerClass = SimpleWorker if platform.system() == "Windows" else Worker
+    # Use SimpleWorker on Windows (no os.fork() support), or when jobs should
+    # run in this long-lived, already warm process
+    fork = settings.worker_fork_jobs and platform.system() != "Windows"
+    WorkerClass = TimedWorker if fork else TimedSimpleWorker
 
     worker = WorkerClass(
         queues,
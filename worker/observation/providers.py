@@ -4,6 +4,7 @@ import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from worker.observation.models import (
@@ -14,6 +15,9 @@ from worker.observation.models import (
     UsageStats,
 )
 
+if TYPE_CHECKING:
+    from worker.http_pool import HTTPClientPool
+
 
 @dataclass
 class ProviderConfig:
@@ -35,8 +39,15 @@ class ObservationProvider(ABC):
 
     provider_type: ProviderType
 
-    def __init__(self, config: ProviderConfig):
+    def __init__(self, config: ProviderConfig, http_pool: "HTTPClientPool | None" = None):
         self.config = config
+        self.http_pool = http_pool
+
+    def _get_http_pool(self) -> "HTTPClientPool":
+        """Return the injected pool or the shared per-loop pool."""
+        from worker.http_pool import get_http_pool
+
+        return self.http_pool or get_http_pool()
 
     @abstractmethod
     async def observe(self, request: ObservationRequest) -> ObservationResponse:
@@ -91,8 +102,8 @@ class OpenRouterProvider(ObservationProvider):
 
     provider_type = ProviderType.OPENROUTER
 
-    def __init__(self, config: ProviderConfig):
-        super().__init__(config)
+    def __init__(self, config: ProviderConfig, http_pool: "HTTPClientPool | None" = None):
+        super().__init__(config, http_pool)
         if not config.base_url:
             config.base_url = "https://openrouter.ai/api/v1"
 
@@ -117,54 +128,54 @@ class OpenRouterProvider(ObservationProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
-                response = await client.post(
-                    f"{self.config.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-
-                latency_ms = (time.perf_counter() - start_time) * 1000
+            response = await self._get_http_pool().post(
+                f"{self.config.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.config.timeout_seconds,
+            )
 
-                if response.status_code != 200:
-                    error_body = response.text
-                    return ObservationResponse(
-                        request_id=request.id,
-                        provider=self.provider_type,
-                        model=request.model,
-                        content="",
-                        success=False,
-                        latency_ms=latency_ms,
-                        error=ProviderError(
-                            provider=self.provider_type,
-                            error_type="api_error",
-                            message=f"HTTP {response.status_code}: {error_body}",
-                            retryable=response.status_code >= 500,
-                        ),
-                    )
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                usage_data = data.get("usage", {})
-
-                usage = UsageStats(
-                    prompt_tokens=usage_data.get("prompt_tokens", 0),
-                    completion_tokens=usage_data.get("completion_tokens", 0),
-                    total_tokens=usage_data.get("total_tokens", 0),
-                )
-                usage.estimated_cost_usd = self._estimate_cost(request.model, usage)
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
+            if response.status_code != 200:
+                error_body = response.text
                 return ObservationResponse(
                     request_id=request.id,
                     provider=self.provider_type,
                     model=request.model,
-                    content=content,
-                    raw_response=data,
-                    usage=usage,
+                    content="",
+                    success=False,
                     latency_ms=latency_ms,
-                    success=True,
+                    error=ProviderError(
+                        provider=self.provider_type,
+                        error_type="api_error",
+                        message=f"HTTP {response.status_code}: {error_body}",
+                        retryable=response.status_code >= 500,
+                    ),
                 )
 
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            usage_data = data.get("usage", {})
+
+            usage = UsageStats(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+            )
+            usage.estimated_cost_usd = self._estimate_cost(request.model, usage)
+
+            return ObservationResponse(
+                request_id=request.id,
+                provider=self.provider_type,
+                model=request.model,
+                content=content,
+                raw_response=data,
+                usage=usage,
+                latency_ms=latency_ms,
+                success=True,
+            )
+
         except httpx.TimeoutException:
             latency_ms = (time.perf_counter() - start_time) * 1000
             return ObservationResponse(
@@ -215,16 +226,14 @@ class OpenRouterProvider(ObservationProvider):
 
     async def health_check(self) -> bool:
         """Check if OpenRouter is available."""
-        import httpx
-
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.config.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.config.api_key}"},
-                )
-                is_healthy: bool = response.status_code == 200
-                return is_healthy
+            response = await self._get_http_pool().get(
+                f"{self.config.base_url}/models",
+                headers={"Authorization": f"Bearer {self.config.api_key}"},
+                timeout=5.0,
+            )
+            is_healthy: bool = response.status_code == 200
+            return is_healthy
         except Exception:
             return False
 
@@ -234,8 +243,8 @@ class OpenAIProvider(ObservationProvider):
 
     provider_type = ProviderType.OPENAI
 
-    def __init__(self, config: ProviderConfig):
-        super().__init__(config)
+    def __init__(self, config: ProviderConfig, http_pool: "HTTPClientPool | None" = None):
+        super().__init__(config, http_pool)
         if not config.base_url:
             config.base_url = "https://api.openai.com/v1"
 
@@ -263,54 +272,54 @@ class OpenAIProvider(ObservationProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
-                response = await client.post(
-                    f"{self.config.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-
-                latency_ms = (time.perf_counter() - start_time) * 1000
+            response = await self._get_http_pool().post(
+                f"{self.config.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.config.timeout_seconds,
+            )
 
-                if response.status_code != 200:
-                    error_body = response.text
-                    return ObservationResponse(
-                        request_id=request.id,
-                        provider=self.provider_type,
-                        model=model,
-                        content="",
-                        success=False,
-                        latency_ms=latency_ms,
-                        error=ProviderError(
-                            provider=self.provider_type,
-                            error_type="api_error",
-                            message=f"HTTP {response.status_code}: {error_body}",
-                            retryable=response.status_code >= 500,
-                        ),
-                    )
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                usage_data = data.get("usage", {})
-
-                usage = UsageStats(
-                    prompt_tokens=usage_data.get("prompt_tokens", 0),
-                    completion_tokens=usage_data.get("completion_tokens", 0),
-                    total_tokens=usage_data.get("total_tokens", 0),
-                )
-                usage.estimated_cost_usd = self._estimate_cost(model, usage)
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
+            if response.status_code != 200:
+                error_body = response.text
                 return ObservationResponse(
                     request_id=request.id,
                     provider=self.provider_type,
                     model=model,
-                    content=content,
-                    raw_response=data,
-                    usage=usage,
+                    content="",
+                    success=False,
                     latency_ms=latency_ms,
-                    success=True,
+                    error=ProviderError(
+                        provider=self.provider_type,
+                        error_type="api_error",
+                        message=f"HTTP {response.status_code}: {error_body}",
+                        retryable=response.status_code >= 500,
+                    ),
                 )
 
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            usage_data = data.get("usage", {})
+
+            usage = UsageStats(
+                prompt_tokens=usage_data.get("prompt_tokens", 0),
+                completion_tokens=usage_data.get("completion_tokens", 0),
+                total_tokens=usage_data.get("total_tokens", 0),
+            )
+            usage.estimated_cost_usd = self._estimate_cost(model, usage)
+
+            return ObservationResponse(
+                request_id=request.id,
+                provider=self.provider_type,
+                model=model,
+                content=content,
+                raw_response=data,
+                usage=usage,
+                latency_ms=latency_ms,
+                success=True,
+            )
+
         except httpx.TimeoutException:
             latency_ms = (time.perf_counter() - start_time) * 1000
             return ObservationResponse(
@@ -361,16 +370,14 @@ class OpenAIProvider(ObservationProvider):
 
     async def health_check(self) -> bool:
         """Check if OpenAI is available."""
-        import httpx
-
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.config.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.config.api_key}"},
-                )
-                is_healthy: bool = response.status_code == 200
-                return is_healthy
+            response = await self._get_http_pool().get(
+                f"{self.config.base_url}/models",
+                headers={"Authorization": f"Bearer {self.config.api_key}"},
+                timeout=5.0,
+            )
+            is_healthy: bool = response.status_code == 200
+            return is_healthy
         except Exception:
             return False
 
@@ -472,6 +472,9 @@ async def run_observation(
     """
     Convenience function to run observations.
 
+    Closes the event loop's shared HTTP pool when done, so standalone
+    observation jobs don't leak keep-alive connections.
+
     Args:
         company_name: Company name
         domain: Domain to track
@@ -482,11 +485,18 @@ async def run_observation(
     Returns:
         ObservationRun with results
     """
+    from worker.http_pool import close_http_pool
+    from worker.redis import close_async_redis
+
     runner = ObservationRunner(config=config, progress_callback=progress_callback)
-    return await runner.run_observation(
-        site_id=None,
-        run_id=None,
-        company_name=company_name,
-        domain=domain,
-        questions=questions,
-    )
+    try:
+        return await runner.run_observation(
+            site_id=None,
+            run_id=None,
+            company_name=company_name,
+            domain=domain,
+            questions=questions,
+        )
+    finally:
+        await close_http_pool()
+        await close_async_redis()
@@ -0,0 +1,424 @@
+"""Run progress events over Redis pub/sub.
+
+Audit workers publish every progress update to one Redis channel and keep
+the latest event per run under a short-lived key. API processes run a
+single ``ProgressHub`` listener that fans events out to SSE and HTMX
+viewers, so status pages no longer poll the database.
+
+The database only receives coalesced checkpoints (see
+``ProgressCheckpointer``): status changes, errors and terminal states are
+written straight away, and progress ticks within a step at most every
+``run_progress_checkpoint_seconds``.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RUN_PROGRESS_CHANNEL = "run:progress"
+RUN_PROGRESS_KEY_PREFIX = "run:progress:"
+RUN_PROGRESS_TTL_SECONDS = 60 * 60
+
+TERMINAL_STATUSES = frozenset({"complete", "failed"})
+
+
+@dataclass
+class RunProgressEvent:
+    """Latest known state of a run."""
+
+    run_id: str
+    status: str
+    progress: dict = field(default_factory=dict)
+    error_message: str | None = None
+    report_id: str | None = None
+    ts: float = field(default_factory=time.time)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    @classmethod
+    def from_run(cls, run: Any) -> "RunProgressEvent":
+        """State of a ``Run`` row as last checkpointed in the database."""
+        return cls(
+            run_id=str(run.id),
+            status=run.status,
+            progress=run.progress or {},
+            error_message=run.error_message,
+            report_id=str(run.report_id) if run.report_id else None,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "status": self.status,
+            "progress": self.progress,
+            "error_message": self.error_message,
+            "report_id": self.report_id,
+            "ts": self.ts,
+        }
+
+    def to_bytes(self) -> bytes:
+        return orjson.dumps(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, data: bytes | str) -> "RunProgressEvent":
+        raw = orjson.loads(data)
+        return cls(
+            run_id=raw["run_id"],
+            status=raw["status"],
+            progress=raw.get("progress") or {},
+            error_message=raw.get("error_message"),
+            report_id=raw.get("report_id"),
+            ts=raw.get("ts", 0.0),
+        )
+
+
+def _bus_enabled() -> bool:
+    from api.config import get_settings
+
+    return get_settings().run_progress_bus_enabled
+
+
+def _redis(redis: Any | None) -> Any:
+    if redis is not None:
+        return redis
+    from worker.redis import get_async_redis_connection_bytes
+
+    return get_async_redis_connection_bytes()
+
+
+async def publish_run_progress(event: RunProgressEvent, redis: Any | None = None) -> bool:
+    """
+    Publish a progress event and store it as the run's latest state.
+
+    Best effort: a Redis failure is logged and reported, never raised.
+
+    Returns:
+        True if the event was published
+    """
+    if redis is None and not _bus_enabled():
+        return False
+    try:
+        client = _redis(redis)
+        data = event.to_bytes()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(f"{RUN_PROGRESS_KEY_PREFIX}{event.run_id}", data, ex=RUN_PROGRESS_TTL_SECONDS)
+            pipe.publish(RUN_PROGRESS_CHANNEL, data)
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning("run_progress_publish_failed", run_id=event.run_id, error=str(e))
+        return False
+
+
+async def get_run_progress(run_id: str, redis: Any | None = None) -> RunProgressEvent | None:
+    """Latest published event for a run, or None if unknown or Redis is down."""
+    if redis is None and not _bus_enabled():
+        return None
+    try:
+        data = await _redis(redis).get(f"{RUN_PROGRESS_KEY_PREFIX}{run_id}")
+    except Exception as e:
+        logger.warning("run_progress_read_failed", run_id=run_id, error=str(e))
+        return None
+    return RunProgressEvent.from_bytes(data) if data else None
+
+
+# ============================================================================
+# Worker side: coalesced database checkpoints
+# ============================================================================
+
+
+@dataclass
+class _RunCheckpoint:
+    status: str | None = None  # Status last written to the database
+    written_at: float = 0.0  # Monotonic time of the last write
+    progress: dict = field(default_factory=dict)  # Everything reported so far
+    pending: dict = field(default_factory=dict)  # Reported but not yet written
+
+
+class ProgressCheckpointer:
+    """
+    Decides which progress updates are written to the database.
+
+    Every update is merged into the run's in-memory progress (published to
+    viewers). Only checkpoints reach the database: a new status, a
+    terminal status, or the first update after ``interval_seconds``.
+    Pending progress is carried into the next checkpoint, so nothing is
+    lost, only delayed.
+    """
+
+    def __init__(self, interval_seconds: float = 5.0):
+        self.interval_seconds = interval_seconds
+        self._runs: dict[str, _RunCheckpoint] = {}
+
+    def update(self, run_id: str, status: str, progress: dict | None = None) -> dict:
+        """Merge an update and return the run's full progress."""
+        checkpoint = self._runs.setdefault(run_id, _RunCheckpoint())
+        if progress:
+            checkpoint.progress.update(progress)
+            checkpoint.pending.update(progress)
+            checkpoint.progress["current_step"] = status
+            checkpoint.pending["current_step"] = status
+        return dict(checkpoint.progress)
+
+    def is_due(self, run_id: str, status: str) -> bool:
+        """Whether this update should be written to the database now."""
+        checkpoint = self._runs.get(run_id)
+        if checkpoint is None or status in TERMINAL_STATUSES or status != checkpoint.status:
+            return True
+        return time.monotonic() - checkpoint.written_at >= self.interval_seconds
+
+    def take_pending(self, run_id: str) -> dict:
+        """Progress to write in this checkpoint."""
+        checkpoint = self._runs.get(run_id)
+        if checkpoint is None:
+            return {}
+        pending, checkpoint.pending = checkpoint.pending, {}
+        return pending
+
+    def mark_written(self, run_id: str, status: str) -> None:
+        if status in TERMINAL_STATUSES:
+            self._runs.pop(run_id, None)
+            return
+        checkpoint = self._runs.setdefault(run_id, _RunCheckpoint())
+        checkpoint.status = status
+        checkpoint.written_at = time.monotonic()
+
+    def discard(self, run_id: str) -> dict:
+        """Forget a run, returning progress that was never written."""
+        checkpoint = self._runs.pop(run_id, None)
+        return checkpoint.pending if checkpoint is not None else {}
+
+
+# ============================================================================
+# API side: one listener per process
+# ============================================================================
+
+
+class ProgressSubscription:
+    """Events for one run. Only the latest undelivered event is kept."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self._queue: asyncio.Queue[RunProgressEvent] = asyncio.Queue(maxsize=1)
+
+    def _deliver(self, event: RunProgressEvent) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()  # Superseded by the newer event
+        self._queue.put_nowait(event)
+
+    async def next(self, timeout: float) -> RunProgressEvent | None:
+        """Wait for the next event, or None after ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class ProgressHub:
+    """
+    Fans run progress events out to subscribers in this process.
+
+    One Redis subscription serves every viewer; the listener starts with
+    the first subscriber and reconnects after Redis errors. It never starts
+    while the bus is disabled.
+    """
+
+    def __init__(self, redis: Any | None = None, reconnect_delay: float = 1.0):
+        self._redis = redis
+        self.reconnect_delay = reconnect_delay
+        self._subscribers: dict[str, set[ProgressSubscription]] = {}
+        self._task: asyncio.Task | None = None
+        self._connected = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the bus is in use (an injected client, or the setting)."""
+        return self._redis is not None or _bus_enabled()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    async def latest(self, run_id: str) -> RunProgressEvent | None:
+        """Latest published event for a run."""
+        return await get_run_progress(run_id, self._redis)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def _ensure_listener(self) -> None:
+        # With the bus disabled nothing publishes, and Redis may not be
+        # there at all; a listener would only retry and log forever
+        if self._stopping or not self.enabled:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """Start the listener if needed and wait until it is subscribed."""
+        if not self.enabled:
+            return False
+        self._ensure_listener()
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    @asynccontextmanager
+    async def subscribe(self, run_id: str) -> AsyncIterator[ProgressSubscription]:
+        """Receive events for ``run_id`` while the context is open."""
+        subscription = ProgressSubscription(run_id)
+        self._subscribers.setdefault(run_id, set()).add(subscription)
+        self._ensure_listener()
+        try:
+            yield subscription
+        finally:
+            subs = self._subscribers.get(run_id)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscribers[run_id]
+
+    def dispatch(self, event: RunProgressEvent) -> None:
+        for subscription in self._subscribers.get(event.run_id, ()):
+            subscription._deliver(event)
+
+    async def _listen(self) -> None:
+        # The stop flag is checked on every iteration: a cancel can be
+        # swallowed by asyncio.wait_for in get_message when a message is
+        # already ready, so cancellation alone cannot stop the loop
+        while not self._stopping:
+            pubsub = None
+            try:
+                pubsub = _redis(self._redis).pubsub()
+                await pubsub.subscribe(RUN_PROGRESS_CHANNEL)
+                self._connected.set()
+                logger.info("run_progress_listener_started")
+                while not self._stopping:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None or message.get("type") != "message":
+                        continue
+                    try:
+                        self.dispatch(RunProgressEvent.from_bytes(message["data"]))
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        logger.warning("run_progress_bad_message")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("run_progress_listener_error", error=str(e))
+            finally:
+                self._connected.clear()
+                if pubsub is not None:
+                    with suppress(Exception):
+                        await pubsub.aclose()
+            if not self._stopping:
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def close(self) -> None:
+        """Stop the listener."""
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+def _changed(event: RunProgressEvent, last: RunProgressEvent | None) -> bool:
+    return last is None or (event.status, event.progress) != (last.status, last.progress)
+
+
+async def watch_run(
+    run_id: str,
+    initial: RunProgressEvent,
+    reload: Callable[[], Awaitable[RunProgressEvent | None]],
+    max_seconds: float = 600.0,
+    poll_interval: float = 2.0,
+    idle_check_seconds: float = 30.0,
+    hub: ProgressHub | None = None,
+) -> AsyncIterator[RunProgressEvent]:
+    """
+    Yield a run's state whenever it changes, until it completes or fails.
+
+    Events come from the progress hub. ``reload`` (a database read) is only
+    used when the bus is unavailable, every ``poll_interval`` seconds, and
+    otherwise once per ``idle_check_seconds`` without events, to notice
+    runs that ended without publishing (a crashed worker, say).
+
+    Args:
+        run_id: Run to watch
+        initial: State loaded from the database by the caller
+        reload: Loads the run's state from the database (None = gone)
+        max_seconds: Stop watching after this long
+        poll_interval: Database poll interval when the bus is unavailable
+        idle_check_seconds: Database check interval while events are quiet
+        hub: Hub to subscribe to (default: the process hub)
+    """
+    hub = hub or get_progress_hub()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_seconds
+    bus = hub.enabled
+
+    async with hub.subscribe(run_id) as subscription:
+        current = initial
+        if bus and not initial.is_terminal and await hub.wait_connected(timeout=1.0):
+            # The DB only has the last checkpoint; the bus has the latest tick
+            current = await hub.latest(run_id) or initial
+
+        last: RunProgressEvent | None = None
+        while True:
+            if _changed(current, last):
+                yield current
+                last = current
+            if current.is_terminal:
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+
+            if bus and hub.connected:
+                event = await subscription.next(min(idle_check_seconds, remaining))
+                if event is not None:
+                    current = event
+                    continue
+            else:
+                await asyncio.sleep(min(poll_interval, remaining))
+            if loop.time() >= deadline:
+                return
+
+            reloaded = await reload()
+            if reloaded is None:
+                return
+            if reloaded.is_terminal or not (bus and hub.connected):
+                current = reloaded
+
+
+_hub: ProgressHub | None = None
+
+
+def get_progress_hub() -> ProgressHub:
+    """The progress hub for this process."""
+    global _hub
+    if _hub is None:
+        _hub = ProgressHub()
+    return _hub
+
+
+async def close_progress_hub() -> None:
+    global _hub
+    if _hub is not None:
+        await _hub.close()
+        _hub = None
@@ -1,8 +1,11 @@
 """Redis connection utilities."""
 
+import asyncio
+import weakref
 from functools import lru_cache
 
 from redis import ConnectionPool, Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from api.config import get_settings
 
@@ -41,6 +44,35 @@ def get_redis_connection_bytes() -> Redis:
     return Redis(connection_pool=pool)
 
 
+# Async clients bind their connections to an event loop, so keep one per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRedis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_redis_connection_bytes() -> AsyncRedis:
+    """Get an async Redis client (no decode_responses) for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        settings = get_settings()
+        client = AsyncRedis.from_url(
+            str(settings.redis_url),
+            decode_responses=False,
+            max_connections=10,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_redis() -> None:
+    """Close and forget the async Redis client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
 # Queue names
 QUEUE_HIGH = "findable-high"
 QUEUE_DEFAULT = "findable-default"
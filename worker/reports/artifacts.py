@@ -0,0 +1,372 @@
+"""Rendered-artifact cache for public score pages.
+
+A completed run's score page and OG image never change, so they are
+rendered once (eagerly when the report is saved, or on the first request)
+and served from this cache afterwards without touching Postgres or PIL.
+
+Artifacts are content-addressed: each blob is stored under the SHA-256 of
+its bytes, and a small ref file maps ``(shareable_id, name)`` to that
+digest. The digest doubles as the HTTP ETag, so a conditional request can
+be answered from the ref alone.
+
+The local disk tier is always used and is bounded by
+``score_artifacts_max_bytes``: hits refresh a ref's mtime, and when the
+tier grows past its limit the least recently used refs (and blobs no
+longer referenced) are removed. When ``score_artifacts_s3_enabled`` is
+set, artifacts are also written to the S3-compatible bucket from the
+``storage_*`` settings and local misses are filled from it. Workers only
+render eagerly in that case, since the API cannot read a worker's disk.
+
+The score page embeds absolute URLs, so it is only cached when
+``public_base_url`` is configured; the client's Host header never picks
+the cache key.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+logger = structlog.get_logger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "web" / "templates"
+
+OG_IMAGE_ARTIFACT = "og.png"
+SCORE_PAGE_ARTIFACT = "score.html"
+S3_PREFIX = "score-artifacts"
+
+
+def public_base_url() -> str | None:
+    """Configured public site URL with a trailing slash, or None."""
+    from api.config import get_settings
+
+    base_url = get_settings().public_base_url
+    return base_url.rstrip("/") + "/" if base_url else None
+
+
+@dataclass
+class Artifact:
+    """A cached artifact and its ETag (the content digest)."""
+
+    data: bytes
+    digest: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+class ArtifactCache:
+    """Content-addressed artifact cache on local disk, optionally backed by S3."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_bytes: int = 512 * 1024 * 1024,
+        s3_client: Any | None = None,
+        bucket: str | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Local directory for blobs and refs
+            max_bytes: Local tier size before LRU eviction
+            s3_client: boto3 S3 client for the shared tier (None = local only)
+            bucket: Bucket for the shared tier
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._lock = threading.Lock()
+        self._bytes = sum(p.stat().st_size for p in self._blob_files())
+
+    def _blob_files(self) -> list[Path]:
+        return [p for p in (self.path / "blobs").glob("*/*") if not p.name.startswith(".tmp-")]
+
+    def _ref_files(self) -> list[Path]:
+        return [p for p in (self.path / "refs").glob("*/*") if not p.name.startswith(".tmp-")]
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.path / "blobs" / digest[:2] / digest
+
+    def _ref_path(self, shareable_id: str, name: str) -> Path:
+        return self.path / "refs" / shareable_id / name
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """Write atomically, so readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _put_local(self, shareable_id: str, name: str, digest: str, data: bytes) -> None:
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            self._write(blob, data)
+            with self._lock:
+                self._bytes += len(data)
+        self._write(self._ref_path(shareable_id, name), digest.encode())
+        if self._bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove least recently used refs until the local tier is under 90%
+        of ``max_bytes``, then delete blobs no ref points at.
+
+        Returns:
+            Number of blobs removed
+        """
+        with self._lock:
+            refs: list[tuple[float, Path, str]] = []
+            for ref in self._ref_files():
+                try:
+                    refs.append((ref.stat().st_mtime, ref, ref.read_text().strip()))
+                except OSError:
+                    continue
+            refs.sort()
+            sizes: dict[str, int] = {}
+            for blob in self._blob_files():
+                with contextlib.suppress(OSError):
+                    sizes[blob.name] = blob.stat().st_size
+
+            ref_counts = Counter(digest for _, _, digest in refs)
+            total = sum(size for digest, size in sizes.items() if ref_counts[digest])
+            target = int(self.max_bytes * 0.9)
+            for _, ref, digest in refs:
+                if total <= target:
+                    break
+                ref.unlink(missing_ok=True)
+                ref_counts[digest] -= 1
+                if not ref_counts[digest]:
+                    total -= sizes.get(digest, 0)
+
+            removed = 0
+            for digest in sizes:
+                if not ref_counts[digest]:
+                    self._blob_path(digest).unlink(missing_ok=True)
+                    removed += 1
+            self._bytes = total
+
+        if removed:
+            logger.info("score_artifacts_evicted", blobs=removed, bytes=self._bytes)
+        return removed
+
+    def put(self, shareable_id: str, name: str, data: bytes) -> Artifact:
+        """Store an artifact and point ``(shareable_id, name)`` at it."""
+        digest = hashlib.sha256(data).hexdigest()
+        self._put_local(shareable_id, name, digest, data)
+
+        if self._s3 is not None:
+            try:
+                self._s3.put_object(
+                    Bucket=self._bucket, Key=f"{S3_PREFIX}/blobs/{digest}", Body=data
+                )
+                self._s3.put_object(
+                    Bucket=self._bucket,
+                    Key=f"{S3_PREFIX}/refs/{shareable_id}/{name}",
+                    Body=digest.encode(),
+                )
+            except Exception as e:
+                logger.warning(
+                    "score_artifact_s3_put_failed", shareable_id=shareable_id, error=str(e)
+                )
+
+        return Artifact(data=data, digest=digest)
+
+    def digest(self, shareable_id: str, name: str) -> str | None:
+        """Digest of a locally cached artifact, without reading its blob."""
+        try:
+            return self._ref_path(shareable_id, name).read_text().strip() or None
+        except OSError:
+            return None
+
+    def get(self, shareable_id: str, name: str) -> Artifact | None:
+        """Load an artifact from disk, falling back to S3."""
+        digest = self.digest(shareable_id, name)
+        if digest is not None:
+            try:
+                data = self._blob_path(digest).read_bytes()
+            except OSError:
+                pass
+            else:
+                # Mark the ref as recently used for eviction
+                with contextlib.suppress(OSError):
+                    os.utime(self._ref_path(shareable_id, name))
+                return Artifact(data=data, digest=digest)
+        return self._get_s3(shareable_id, name)
+
+    def _get_s3(self, shareable_id: str, name: str) -> Artifact | None:
+        if self._s3 is None:
+            return None
+        try:
+            ref = self._s3.get_object(
+                Bucket=self._bucket, Key=f"{S3_PREFIX}/refs/{shareable_id}/{name}"
+            )
+            digest = ref["Body"].read().decode().strip()
+            blob = self._s3.get_object(Bucket=self._bucket, Key=f"{S3_PREFIX}/blobs/{digest}")
+            data = blob["Body"].read()
+        except Exception as e:
+            # NoSuchKey is the common case: not rendered yet
+            logger.debug("score_artifact_s3_miss", shareable_id=shareable_id, error=str(e))
+            return None
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            logger.warning("score_artifact_s3_corrupt", shareable_id=shareable_id, name=name)
+            return None
+        # Keep a local copy for the next request
+        self._put_local(shareable_id, name, digest, data)
+        return Artifact(data=data, digest=digest)
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+
+_env: Environment | None = None
+
+
+def _templates() -> Environment:
+    global _env
+    if _env is None:
+        _env = Environment(
+            loader=FileSystemLoader(str(TEMPLATES_DIR)),
+            autoescape=select_autoescape(["html", "xml"]),
+        )
+    return _env
+
+
+def score_page_context(
+    report_data: dict, domain: str, shareable_id: str, base_url: str
+) -> dict[str, Any]:
+    """Template context for ``public/score.html`` from a report's JSON."""
+    v2_score = report_data.get("score", {}).get("v2", {})
+
+    # Extract top 3 fixes
+    all_fixes = report_data.get("fixes", {}).get("items", [])
+    top_fixes = all_fixes[:3]
+
+    # Build OG meta tags
+    total_score = v2_score.get("total_score", 0)
+    level_label = v2_score.get("level_label", "Unknown")
+
+    return {
+        "domain": domain,
+        "score": round(total_score),
+        "level_label": level_label,
+        "pillars": v2_score.get("pillars", []),
+        "top_fixes": top_fixes,
+        "shareable_id": shareable_id,
+        "base_url": base_url,
+        "shareable_url": f"{base_url}score/{shareable_id}",
+        "og_title": f"Findable Score: {round(total_score)}/100 - {domain}",
+        "og_description": f"{domain} scored {round(total_score)}/100 on the Findable Score. Level: {level_label}.",
+    }
+
+
+def render_score_page(report_data: dict, domain: str, shareable_id: str, base_url: str) -> bytes:
+    """Render the public score page HTML."""
+    context = score_page_context(report_data, domain, shareable_id, base_url)
+    return _templates().get_template("public/score.html").render(context).encode()
+
+
+def render_og_image(report_data: dict, domain: str) -> bytes:
+    """Render the 1200x630 OG image PNG."""
+    # Lazy import to avoid heavy PIL import on startup
+    from worker.reports.og_image import generate_og_image
+
+    v2_score = report_data.get("score", {}).get("v2", {})
+    score = round(v2_score.get("total_score", 0))
+    level_label = v2_score.get("level_label", "Unknown")
+    return generate_og_image(score, domain, level_label)
+
+
+def publish_score_artifacts(
+    shareable_id: str,
+    report_data: dict,
+    domain: str,
+    cache: ArtifactCache | None = None,
+) -> None:
+    """
+    Render and cache a completed run's public artifacts.
+
+    Renders the OG image, and the score page when ``public_base_url`` is
+    configured. Without an explicit ``cache`` this only runs when the S3
+    tier is enabled: a worker's local disk is not visible to the API, so
+    the API renders on the first request instead.
+    """
+    if cache is None:
+        from api.config import get_settings
+
+        if not get_settings().score_artifacts_s3_enabled:
+            return
+        cache = get_artifact_cache()
+        if cache is None:
+            return
+
+    cache.put(shareable_id, OG_IMAGE_ARTIFACT, render_og_image(report_data, domain))
+
+    base_url = public_base_url()
+    if base_url:
+        cache.put(
+            shareable_id,
+            SCORE_PAGE_ARTIFACT,
+            render_score_page(report_data, domain, shareable_id, base_url),
+        )
+
+
+_cache: ArtifactCache | None = None
+
+
+def get_artifact_cache() -> ArtifactCache | None:
+    """The artifact cache from settings, or None if disabled."""
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    from api.config import get_settings
+
+    settings = get_settings()
+    if not settings.score_artifacts_enabled:
+        return None
+
+    s3_client = None
+    if settings.score_artifacts_s3_enabled:
+        import boto3
+
+        s3_client = boto3.client(
+            "s3",
+            endpoint_url=settings.storage_endpoint_url,
+            aws_access_key_id=settings.storage_access_key,
+            aws_secret_access_key=settings.storage_secret_key,
+            region_name=settings.storage_region,
+        )
+
+    path = settings.score_artifacts_dir or Path(tempfile.gettempdir()) / "findable-score-artifacts"
+    _cache = ArtifactCache(
+        path,
+        max_bytes=settings.score_artifacts_max_bytes,
+        s3_client=s3_client,
+        bucket=settings.storage_bucket_name,
+    )
+    return _cache
@@ -4,6 +4,7 @@
 # Use explicit imports when needed:
 # from worker.retrieval.retriever import HybridRetriever, RetrieverConfig
 # from worker.retrieval.bm25 import BM25Index
+# from worker.retrieval.vectors import VectorIndex
 
 __all__ = [
     # Retriever
@@ -13,6 +14,8 @@ __all__ = [
     # BM25
     "BM25Index",
     "BM25Config",
+    # Vector search
+    "VectorIndex",
     # Fusion
     "reciprocal_rank_fusion",
     "RRFConfig",
@@ -2,9 +2,12 @@
 
 import math
 import re
+from array import array
 from collections import Counter
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class BM25Config:
@@ -22,7 +25,7 @@ class BM25Document:
 
     doc_id: str
     content: str
-    tokens: list[str] = field(default_factory=list)
+    tokens: list[str] = field(default_factory=list)  # Not retained by BM25Index
     token_count: int = 0
     metadata: dict = field(default_factory=dict)
 
@@ -78,19 +81,41 @@ class BM25Index:
 
     BM25 is a bag-of-words ranking function that scores documents
     based on term frequency and inverse document frequency.
+
+    Storage is compact: terms are interned to integer ids, each term's
+    postings are two ``array("i")`` columns (document slot, term
+    frequency), and documents keep only their unique term ids rather than
+    a token list. Removal marks the document's slot as a tombstone;
+    postings are compacted once tombstones outnumber live documents.
+    Scoring accumulates per-term contributions into a numpy score vector.
     """
 
     def __init__(self, config: BM25Config | None = None):
         self.config = config or BM25Config()
 
-        # Document storage
+        # Document storage (tokens are not retained)
         self._documents: dict[str, BM25Document] = {}
 
-        # Inverted index: token -> list of (doc_id, term_freq)
-        self._inverted_index: dict[str, list[tuple[str, int]]] = {}
+        # Term dictionary: token -> term id
+        self._term_ids: dict[str, int] = {}
+
+        # Postings per term id: parallel arrays of document slots and term freqs
+        self._posting_slots: list[array] = []
+        self._posting_freqs: list[array] = []
+
+        # Document frequencies of live documents, per term id
+        self._doc_freqs: array = array("i")
 
-        # Document frequencies: token -> number of docs containing token
-        self._doc_freqs: dict[str, int] = {}
+        # Document slots: slot -> doc_id (None once tombstoned), doc_id -> slot
+        self._slot_ids: list[str | None] = []
+        self._slots: dict[str, int] = {}
+        self._slot_lengths: array = array("i")
+        self._slot_terms: list[array | None] = []  # unique term ids per slot
+        self._live = bytearray()  # 1 per live slot, 0 per tombstone
+        self._tombstones: int = 0
+
+        # Length norms k1 * (1 - b + b * dl / avgdl), rebuilt lazily
+        self._norms: np.ndarray | None = None
 
         # Statistics
         self._total_docs: int = 0
@@ -107,6 +132,55 @@ class BM25Index:
         """Average document length in tokens."""
         return self._avg_doc_length
 
+    def _term_id(self, token: str) -> int:
+        term_id = self._term_ids.get(token)
+        if term_id is None:
+            term_id = len(self._posting_slots)
+            self._term_ids[token] = term_id
+            self._posting_slots.append(array("i"))
+            self._posting_freqs.append(array("i"))
+            self._doc_freqs.append(0)
+        return term_id
+
+    def _update_stats(self) -> None:
+        self._avg_doc_length = (
+            self._total_tokens / self._total_docs if self._total_docs > 0 else 0.0
+        )
+        self._norms = None
+
+    def _index(self, doc_id: str, content: str, metadata: dict | None) -> None:
+        """Index one document without refreshing statistics."""
+        # Remove old version if exists
+        if doc_id in self._documents:
+            self._tombstone(doc_id)
+
+        tokens = tokenize(content, self.config)
+        token_counts = Counter(tokens)
+
+        slot = len(self._slot_ids)
+        terms = array("i")
+        for token, freq in token_counts.items():
+            term_id = self._term_id(token)
+            self._posting_slots[term_id].append(slot)
+            self._posting_freqs[term_id].append(freq)
+            self._doc_freqs[term_id] += 1
+            terms.append(term_id)
+
+        self._slot_ids.append(doc_id)
+        self._slots[doc_id] = slot
+        self._slot_lengths.append(len(tokens))
+        self._slot_terms.append(terms)
+        self._live.append(1)
+        self._documents[doc_id] = BM25Document(
+            doc_id=doc_id,
+            content=content,
+            token_count=len(tokens),
+            metadata=metadata or {},
+        )
+
+        self._total_docs += 1
+        self._total_tokens += len(tokens)
+
     def add_document(
         self,
         doc_id: str,
@@ -121,61 +195,49 @@ class BM25Index:
             content: Document text content
             metadata: Optional metadata
         """
-        # Tokenize
-        tokens = tokenize(content, self.config)
-        token_counts = Counter(tokens)
-
-        # Create document
-        doc = BM25Document(
-            doc_id=doc_id,
-            content=content,
-            tokens=tokens,
-            token_count=len(tokens),
-            metadata=metadata or {},
-        )
-
-        # Remove old version if exists
-        if doc_id in self._documents:
-            self.remove_document(doc_id)
-
-        # Store document
-        self._documents[doc_id] = doc
-
-        # Update inverted index
-        for token, freq in token_counts.items():
-            if token not in self._inverted_index:
-                self._inverted_index[token] = []
-                self._doc_freqs[token] = 0
-
-            self._inverted_index[token].append((doc_id, freq))
-            self._doc_freqs[token] += 1
-
-        # Update statistics
-        self._total_docs += 1
-        self._total_tokens += len(tokens)
-        self._avg_doc_length = self._total_tokens / self._total_docs
+        self._index(doc_id, content, metadata)
+        self._update_stats()
+        self._maybe_compact()
 
     def add_documents(
         self,
         documents: list[dict],
     ) -> None:
         """
-        Add multiple documents to the index.
+        Add multiple documents to the index in one pass.
+
+        Statistics and length norms are refreshed once for the whole batch.
 
         Args:
             documents: List of dicts with 'doc_id', 'content', and optional 'metadata'
         """
         for doc in documents:
-            self.add_document(
-                doc_id=doc["doc_id"],
-                content=doc["content"],
-                metadata=doc.get("metadata"),
-            )
+            self._index(doc["doc_id"], doc["content"], doc.get("metadata"))
+        self._update_stats()
+        self._maybe_compact()
+
+    def _tombstone(self, doc_id: str) -> None:
+        slot = self._slots.pop(doc_id)
+        doc = self._documents.pop(doc_id)
+
+        terms = self._slot_terms[slot]
+        for term_id in terms or ():
+            self._doc_freqs[term_id] -= 1
+
+        self._slot_ids[slot] = None
+        self._slot_terms[slot] = None
+        self._live[slot] = 0
+        self._tombstones += 1
+        self._total_docs -= 1
+        self._total_tokens -= doc.token_count
 
     def remove_document(self, doc_id: str) -> bool:
         """
         Remove a document from the index.
 
+        The document's postings stay in place as a tombstone until the
+        next compaction.
+
         Args:
             doc_id: Document ID to remove
 
@@ -185,33 +247,44 @@ class BM25Index:
         if doc_id not in self._documents:
             return False
 
-        doc = self._documents[doc_id]
+        self._tombstone(doc_id)
+        self._update_stats()
+        self._maybe_compact()
+        return True
 
-        # Update inverted index
-        token_counts = Counter(doc.tokens)
-        for token, _freq in token_counts.items():
-            if token in self._inverted_index:
-                self._inverted_index[token] = [
-                    (did, f) for did, f in self._inverted_index[token] if did != doc_id
-                ]
-                self._doc_freqs[token] -= 1
+    def _maybe_compact(self) -> None:
+        if self._tombstones and self._tombstones >= max(self._total_docs, 64):
+            self._compact()
 
-                # Clean up empty entries
-                if not self._inverted_index[token]:
-                    del self._inverted_index[token]
-                    del self._doc_freqs[token]
+    def _compact(self) -> None:
+        """Drop tombstoned slots from the postings and renumber live slots."""
+        remap = np.full(len(self._slot_ids), -1, dtype=np.intc)
+        live = [slot for slot, doc_id in enumerate(self._slot_ids) if doc_id is not None]
+        remap[live] = np.arange(len(live), dtype=np.intc)
 
-        # Update statistics
-        self._total_docs -= 1
-        self._total_tokens -= doc.token_count
-        self._avg_doc_length = (
-            self._total_tokens / self._total_docs if self._total_docs > 0 else 0.0
-        )
-
-        # Remove document
-        del self._documents[doc_id]
-
-        return True
+        for term_id, slots in enumerate(self._posting_slots):
+            if not slots:
+                continue
+            new_slots = remap[np.array(slots, dtype=np.intc)]
+            keep = new_slots >= 0
+            freqs = np.array(self._posting_freqs[term_id], dtype=np.intc)
+            self._posting_slots[term_id] = array("i", new_slots[keep].tolist())
+            self._posting_freqs[term_id] = array("i", freqs[keep].tolist())
+
+        self._slot_ids = [self._slot_ids[slot] for slot in live]
+        self._slot_lengths = array("i", (self._slot_lengths[slot] for slot in live))
+        self._slot_terms = [self._slot_terms[slot] for slot in live]
+        self._live = bytearray(b"\x01" * len(live))
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(self._slot_ids) if doc_id}
+        self._tombstones = 0
+        self._norms = None
+
+    def _length_norms(self) -> np.ndarray:
+        if self._norms is None:
+            lengths = np.array(self._slot_lengths, dtype=np.float64)
+            avgdl = self._avg_doc_length or 1.0
+            self._norms = self.config.k1 * (1 - self.config.b + self.config.b * lengths / avgdl)
+        return self._norms
 
     def search(
         self,
@@ -239,43 +312,44 @@ class BM25Index:
         if not query_tokens:
             return []
 
-        # Calculate scores for each document
-        scores: dict[str, float] = {}
+        norms = self._length_norms()
+        scores = np.zeros(len(self._slot_ids), dtype=np.float64)
+        k1_plus_1 = self.config.k1 + 1
 
-        for token in query_tokens:
-            if token not in self._inverted_index:
+        for token, count in Counter(query_tokens).items():
+            term_id = self._term_ids.get(token)
+            if term_id is None or self._doc_freqs[term_id] == 0:
                 continue
 
             # IDF: log((N - df + 0.5) / (df + 0.5))
-            df = self._doc_freqs[token]
+            df = self._doc_freqs[term_id]
             idf = math.log((self._total_docs - df + 0.5) / (df + 0.5) + 1.0)
 
-            # Score each document containing this token
-            for doc_id, tf in self._inverted_index[token]:
-                doc = self._documents[doc_id]
-                doc_length = doc.token_count
-
-                # BM25 term score
-                # (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * dl/avgdl))
-                numerator = tf * (self.config.k1 + 1)
-                denominator = tf + self.config.k1 * (
-                    1 - self.config.b + self.config.b * doc_length / self._avg_doc_length
-                )
-                term_score = idf * numerator / denominator
+            # BM25 term score for every document containing this token
+            # (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * dl/avgdl))
+            slots = np.array(self._posting_slots[term_id], dtype=np.intc)
+            tfs = np.array(self._posting_freqs[term_id], dtype=np.float64)
+            scores[slots] += count * idf * tfs * k1_plus_1 / (tfs + norms[slots])
 
-                if doc_id not in scores:
-                    scores[doc_id] = 0.0
-                scores[doc_id] += term_score
+        if self._tombstones:
+            scores *= np.array(self._live, dtype=np.float64)
 
-        # Sort by score
-        sorted_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Top documents by score; equal scores keep insertion order
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > limit:
+            top = np.argpartition(-scores[matched], limit - 1)[:limit]
+            matched = np.sort(matched[top])
+        ranked = matched[np.argsort(-scores[matched], kind="stable")][:limit]
 
         # Build results
         results: list[BM25Result] = []
-        for doc_id, score in sorted_docs[:limit]:
+        for slot in ranked:
+            score = float(scores[slot])
             if score < min_score:
                 continue
 
+            doc_id = self._slot_ids[slot]
+            assert doc_id is not None
             doc = self._documents[doc_id]
             results.append(
                 BM25Result(
@@ -289,14 +363,23 @@ class BM25Index:
         return results
 
     def get_document(self, doc_id: str) -> BM25Document | None:
-        """Get a document by ID."""
+        """Get a document by ID (without its tokens, which are not stored)."""
         return self._documents.get(doc_id)
 
     def clear(self) -> None:
         """Clear the entire index."""
         self._documents.clear()
-        self._inverted_index.clear()
-        self._doc_freqs.clear()
+        self._term_ids.clear()
+        self._posting_slots.clear()
+        self._posting_freqs.clear()
+        self._doc_freqs = array("i")
+        self._slot_ids.clear()
+        self._slots.clear()
+        self._slot_lengths = array("i")
+        self._slot_terms.clear()
+        self._live = bytearray()
+        self._tombstones = 0
+        self._norms = None
         self._total_docs = 0
         self._avg_doc_length = 0.0
         self._total_tokens = 0
@@ -307,5 +390,6 @@ class BM25Index:
             "total_documents": self._total_docs,
             "total_tokens": self._total_tokens,
             "avg_document_length": round(self._avg_doc_length, 2),
-            "vocabulary_size": len(self._inverted_index),
+            "vocabulary_size": sum(1 for df in self._doc_freqs if df > 0),
+            "tombstones": self._tombstones,
         }
@@ -8,6 +8,7 @@ import numpy as np
 from worker.embeddings.embedder import Embedder, EmbedderConfig
 from worker.embeddings.models import MODELS, MockEmbeddingModel
 from worker.retrieval.bm25 import BM25Config, BM25Index
+from worker.retrieval.vectors import VectorIndex
 
 if TYPE_CHECKING:
     pass
@@ -188,8 +189,10 @@ class HybridRetriever:
         # Initialize BM25 index
         self._bm25 = bm25_index or BM25Index(self.config.bm25_config)
 
-        # In-memory document store for hybrid search
+        # In-memory document store for hybrid search; embeddings live in
+        # the vector index rather than in the document dicts
         self._documents: dict[str, dict] = {}
+        self._vectors = VectorIndex()
 
     def add_document(
         self,
@@ -220,39 +223,74 @@ class HybridRetriever:
             embeddings = self._embedder.embed_texts([content])
             embedding = embeddings[0] if embeddings else None
 
-        # Store document
+        bm25_doc = self._store_document(
+            doc_id=doc_id,
+            content=content,
+            embedding=embedding,
+            source_url=source_url,
+            page_title=page_title,
+            heading_context=heading_context,
+            chunk_type=chunk_type,
+            metadata=metadata,
+        )
+
+        # Add to BM25 index
+        self._bm25.add_document(**bm25_doc)
+
+    def _store_document(
+        self,
+        doc_id: str,
+        content: str,
+        embedding: np.ndarray | None = None,
+        source_url: str | None = None,
+        page_title: str | None = None,
+        heading_context: str | None = None,
+        chunk_type: str = "text",
+        metadata: dict | None = None,
+    ) -> dict:
+        """Store a document and its embedding; return its BM25 entry."""
+        if embedding is not None:
+            self._vectors.add(doc_id, embedding)
+        else:
+            self._vectors.remove(doc_id)
         self._documents[doc_id] = {
             "content": content,
-            "embedding": embedding,
             "source_url": source_url,
             "page_title": page_title,
             "heading_context": heading_context,
             "chunk_type": chunk_type,
             "metadata": metadata or {},
         }
-
-        # Add to BM25 index
-        self._bm25.add_document(
-            doc_id=doc_id,
-            content=content,
-            metadata={
+        return {
+            "doc_id": doc_id,
+            "content": content,
+            "metadata": {
                 "source_url": source_url,
                 "page_title": page_title,
                 "heading_context": heading_context,
                 "chunk_type": chunk_type,
                 **(metadata or {}),
             },
-        )
+        }
 
     def add_documents(self, documents: list[dict]) -> None:
         """
         Add multiple documents.
 
+        Missing embeddings are computed in one batch and the BM25 index is
+        built in a single bulk pass.
+
         Args:
-            documents: List of document dicts
+            documents: List of document dicts (same keys as ``add_document``)
         """
-        for doc in documents:
-            self.add_document(**doc)
+        documents = [dict(doc) for doc in documents]
+        missing = [doc for doc in documents if doc.get("embedding") is None]
+        if missing:
+            embeddings = self._embedder.embed_texts([doc["content"] for doc in missing])
+            for doc, embedding in zip(missing, embeddings, strict=False):
+                doc["embedding"] = embedding
+
+        self._bm25.add_documents([self._store_document(**doc) for doc in documents])
 
     def search(
         self,
@@ -271,9 +309,48 @@ class HybridRetriever:
         """
         limit = limit or self.config.final_limit
 
-        # Vector search
         vector_results = self._vector_search(query)
+        return self._fuse(query, vector_results, limit)
+
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """
+        Perform hybrid search for several queries at once.
+
+        All queries are embedded together and scored against the document
+        matrix in one matrix-matrix product. Results are identical to
+        calling ``search`` for each query.
+
+        Args:
+            queries: Search queries
+            limit: Maximum results per query (default from config)
+
+        Returns:
+            One list of RetrievalResult objects per query
+        """
+        if not queries:
+            return []
+        limit = limit or self.config.final_limit
+
+        query_embeddings = self._embedder.embed_queries(queries)
+        vector_results = self._vectors.search_batch(
+            query_embeddings, self.config.vector_search_limit
+        )
+        return [
+            self._fuse(query, vector_ranked, limit)
+            for query, vector_ranked in zip(queries, vector_results, strict=True)
+        ]
 
+    def _fuse(
+        self,
+        query: str,
+        vector_ranked: list[tuple[str, float]],
+        limit: int,
+    ) -> list[RetrievalResult]:
+        """Combine vector results with BM25 results for a query."""
         # BM25 search
         bm25_results = self._bm25.search(
             query=query,
@@ -281,7 +358,6 @@ class HybridRetriever:
         )
 
         # Convert to ranked lists for RRF
-        vector_ranked = [(r[0], r[1]) for r in vector_results]
         bm25_ranked = [(r.doc_id, r.score) for r in bm25_results]
 
         # Reciprocal Rank Fusion
@@ -338,25 +414,8 @@ class HybridRetriever:
 
         Returns list of (doc_id, score) tuples.
         """
-        # Get query embedding
         query_embedding = self._embedder.embed_query(query)
-
-        # Calculate cosine similarity with all documents
-        results: list[tuple[str, float]] = []
-
-        for doc_id, doc in self._documents.items():
-            embedding = doc.get("embedding")
-            if embedding is None:
-                continue
-
-            # Cosine similarity
-            similarity = float(np.dot(query_embedding, embedding))
-            results.append((doc_id, similarity))
-
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        return results[: self.config.vector_search_limit]
+        return self._vectors.search(query_embedding, self.config.vector_search_limit)
 
     def remove_document(self, doc_id: str) -> bool:
         """Remove a document from both indexes."""
@@ -364,18 +423,21 @@ class HybridRetriever:
             return False
 
         del self._documents[doc_id]
+        self._vectors.remove(doc_id)
         self._bm25.remove_document(doc_id)
         return True
 
     def clear(self) -> None:
         """Clear all documents."""
         self._documents.clear()
+        self._vectors.clear()
         self._bm25.clear()
 
     def get_stats(self) -> dict:
         """Get retriever statistics."""
         return {
             "total_documents": len(self._documents),
+            "embedded_documents": len(self._vectors),
             "bm25_stats": self._bm25.get_stats(),
             "config": {
                 "vector_weight": self.config.rrf_config.vector_weight,
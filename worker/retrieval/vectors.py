@@ -0,0 +1,136 @@
+"""Matrix-backed vector index for dense retrieval."""
+
+import numpy as np
+
+
+class VectorIndex:
+    """
+    Document embeddings stored as rows of one contiguous float32 matrix.
+
+    Search is a single matrix-vector (or matrix-matrix for a batch of
+    queries) product followed by an ``argpartition`` top-k, instead of a
+    Python loop over documents. Embeddings are expected to be normalized,
+    so the dot product is the cosine similarity.
+    """
+
+    def __init__(self, dimensions: int | None = None, initial_capacity: int = 256):
+        self._dimensions = dimensions
+        self._initial_capacity = max(1, initial_capacity)
+        self._matrix: np.ndarray | None = None
+        self._ids: list[str] = []  # row -> doc_id
+        self._rows: dict[str, int] = {}  # doc_id -> row
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._rows
+
+    @property
+    def dimensions(self) -> int | None:
+        return self._dimensions
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the populated rows (n_docs x dimensions)."""
+        if self._matrix is None:
+            return np.empty((0, self._dimensions or 0), dtype=np.float32)
+        return self._matrix[: len(self._ids)]
+
+    def _ensure_capacity(self, needed: int) -> None:
+        dims = self._dimensions or 0
+        if self._matrix is None:
+            capacity = max(self._initial_capacity, needed)
+            self._matrix = np.zeros((capacity, dims), dtype=np.float32)
+        elif needed > self._matrix.shape[0]:
+            capacity = max(needed, self._matrix.shape[0] * 2)
+            grown = np.zeros((capacity, dims), dtype=np.float32)
+            grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+            self._matrix = grown
+
+    def add(self, doc_id: str, embedding: np.ndarray) -> None:
+        """Add or replace the embedding for a document."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self._dimensions is None:
+            self._dimensions = vector.shape[0]
+        elif vector.shape[0] != self._dimensions:
+            raise ValueError(
+                f"Embedding for {doc_id} has {vector.shape[0]} dimensions, "
+                f"expected {self._dimensions}"
+            )
+
+        row = self._rows.get(doc_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(doc_id)
+            self._rows[doc_id] = row
+        assert self._matrix is not None
+        self._matrix[row] = vector
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document, moving the last row into its slot."""
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return False
+        assert self._matrix is not None
+
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        return True
+
+    def clear(self) -> None:
+        self._matrix = None
+        self._ids.clear()
+        self._rows.clear()
+
+    def search(self, query: np.ndarray, limit: int) -> list[tuple[str, float]]:
+        """
+        Find the most similar documents to a query embedding.
+
+        Args:
+            query: Query embedding
+            limit: Maximum results
+
+        Returns:
+            List of (doc_id, score) sorted by score descending
+        """
+        return self.search_batch(np.asarray(query).reshape(1, -1), limit)[0]
+
+    def search_batch(self, queries: np.ndarray, limit: int) -> list[list[tuple[str, float]]]:
+        """
+        Find the most similar documents for several query embeddings at once.
+
+        Args:
+            queries: Query embeddings (n_queries x dimensions)
+            limit: Maximum results per query
+
+        Returns:
+            One list of (doc_id, score) per query, sorted by score descending
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_docs = len(self._ids)
+        if n_docs == 0 or limit <= 0:
+            return [[] for _ in range(queries.shape[0])]
+
+        scores = queries @ self.matrix.T  # (n_queries x n_docs)
+        k = min(limit, n_docs)
+
+        if k < n_docs:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            # Restore row order within the top-k so equal scores keep insertion order
+            top.sort(axis=1)
+        else:
+            top = np.broadcast_to(np.arange(n_docs), (scores.shape[0], n_docs))
+
+        results: list[list[tuple[str, float]]] = []
+        for row_scores, candidates in zip(scores, top, strict=True):
+            candidate_scores = row_scores[candidates]
+            order = np.argsort(-candidate_scores, kind="stable")
+            results.append([(self._ids[candidates[i]], float(candidate_scores[i])) for i in order])
+        return results
@@ -9,14 +9,17 @@ Thresholds and weights can be dynamically loaded from the active CalibrationConf
 from __future__ import annotations
 
 import hashlib
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 import structlog
 
+from worker.extraction.matcher import MultiPatternMatcher
 from worker.questions.generator import GeneratedQuestion, QuestionSource
 from worker.questions.universal import QuestionCategory, QuestionDifficulty
 from worker.retrieval.retriever import HybridRetriever, RetrievalResult
@@ -27,6 +30,146 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+# Pattern matchers for common signal types, tried in order per signal
+SIGNAL_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    # Contact signals - strict patterns to avoid false positives
+    "email": [re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")],
+    # Phone: require at least 7 digits total, avoid matching decimals like "99.99%"
+    "phone": [
+        re.compile(
+            r"(?<![0-9.])(?:\+?1[-.\s]?)?(?:\([0-9]{3}\)|[0-9]{3})[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}(?![0-9%])"
+        )
+    ],
+    "address": [
+        re.compile(
+            r"\d+\s+[\w\s]+(?:street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln|way|court|ct)",
+            re.I,
+        )
+    ],
+    "contact form": [
+        re.compile(r"contact\s*(?:us|form|page)?", re.I),
+        re.compile(r"get\s*in\s*touch", re.I),
+    ],
+    # Identity signals
+    "business description": [
+        re.compile(
+            r"(?:we\s+(?:are|help|provide|offer|build|create|make|deliver)|(?:is\s+a|leading|platform|solution|service|company|tool))",
+            re.I,
+        )
+    ],
+    "industry": [
+        re.compile(
+            r"(?:automation|software|saas|technology|platform|integration|workflow|productivity|enterprise|business)",
+            re.I,
+        )
+    ],
+    "primary activity": [
+        re.compile(
+            r"(?:helps?\s+(?:you|teams?|businesses?|companies?|organizations?))|(?:enables?\s+)|(?:allows?\s+)",
+            re.I,
+        )
+    ],
+    # Founder/history signals
+    "founder": [re.compile(r"(?:founded\s+by|co-?founder|ceo|chief\s+executive)", re.I)],
+    "founding year": [
+        re.compile(r"(?:founded|established|started|launched|since)\s*(?:in\s*)?(19|20)\d{2}", re.I)
+    ],
+    "founding": [re.compile(r"(?:founded|established|started|launched|began)", re.I)],
+    # Location signals
+    "headquarters": [re.compile(r"(?:headquarter|hq|based\s+in|located\s+in|office\s+in)", re.I)],
+    "operating regions": [
+        re.compile(r"(?:worldwide|global|international|countries|regions)", re.I)
+    ],
+    "office": [re.compile(r"(?:office|location|branch)\s*(?:in|at)?", re.I)],
+    # Offering signals
+    "product": [
+        re.compile(r"(?:product|feature|tool|app|application|platform|solution|service)", re.I)
+    ],
+    "service": [re.compile(r"(?:service|offering|solution|support|consulting)", re.I)],
+    "feature": [re.compile(r"(?:feature|capability|function|ability)", re.I)],
+    "description": [re.compile(r"(?:enables?|allows?|helps?|provides?|offers?|delivers?)", re.I)],
+    # Pricing signals
+    "pricing": [
+        re.compile(
+            r"(?:pricing|price|cost|\$\d+|free\s+(?:tier|plan|trial)|per\s+(?:month|year|user))",
+            re.I,
+        )
+    ],
+    "tier": [re.compile(r"(?:plan|tier|package|edition|version)\s*(?:s)?", re.I)],
+    # Customer signals
+    "customer": [re.compile(r"(?:customer|client|user|team|organization|company|business)", re.I)],
+    "segment": [
+        re.compile(
+            r"(?:small\s+business|enterprise|startup|agency|freelancer|developer|marketer)",
+            re.I,
+        )
+    ],
+    "use case": [re.compile(r"(?:use\s+case|workflow|automation|integration|scenario)", re.I)],
+    "vertical": [re.compile(r"(?:industry|sector|vertical|market)", re.I)],
+    # Problem/solution signals
+    "pain point": [re.compile(r"(?:challenge|problem|issue|struggle|difficulty|pain)", re.I)],
+    "solution": [re.compile(r"(?:solution|solve|fix|address|resolve|help)", re.I)],
+    "outcome": [re.compile(r"(?:result|outcome|benefit|improvement|save|increase|reduce)", re.I)],
+    # Trust signals
+    "client": [re.compile(r"(?:customer|client|partner|user)\s*(?:s)?", re.I)],
+    "case stud": [re.compile(r"(?:case\s+stud|success\s+stor|testimonial)", re.I)],
+    "testimonial": [re.compile(r"(?:testimonial|review|quote|said|says)", re.I)],
+    "logo": [re.compile(r"(?:trusted\s+by|used\s+by|powering|serving)", re.I)],
+    "partnership": [re.compile(r"(?:partner|integration|connect|work\s+with)", re.I)],
+    # Recognition signals
+    "award": [re.compile(r"(?:award|winner|recognized|honored|best|top)", re.I)],
+    "certification": [
+        re.compile(r"(?:certified|certification|compliance|soc\s*2|gdpr|hipaa|iso)", re.I)
+    ],
+    "recognition": [re.compile(r"(?:recognized|featured|mentioned|covered|press)", re.I)],
+    "press": [re.compile(r"(?:press|news|media|article|coverage|featured\s+in)", re.I)],
+    # Track record signals
+    "years": [re.compile(r"(?:\d+\s*\+?\s*years?|since\s+\d{4}|established\s+\d{4})", re.I)],
+    "growth": [
+        re.compile(
+            r"(?:growth|growing|scale|expanded|million|billion|\d+[kmb]\+?\s*(?:user|customer|company))",
+            re.I,
+        )
+    ],
+    "success": [re.compile(r"(?:success|achievement|milestone|accomplish)", re.I)],
+    "count": [
+        re.compile(
+            r"(?:\d+[,\d]*\s*(?:\+\s*)?(?:user|customer|client|company|team|business))",
+            re.I,
+        )
+    ],
+    # Differentiation signals
+    "unique": [re.compile(r"(?:unique|only|first|exclusive|proprietary|patented)", re.I)],
+    "advantage": [re.compile(r"(?:advantage|benefit|better|faster|easier|simpler)", re.I)],
+    "proprietary": [re.compile(r"(?:proprietary|patent|exclusive|innovative)", re.I)],
+    "differentiating": [re.compile(r"(?:different|unique|stand\s*out|unlike|versus|vs)", re.I)],
+    # Value prop signals
+    "value": [re.compile(r"(?:value|benefit|advantage|why\s+choose|reason)", re.I)],
+    "benefit": [re.compile(r"(?:benefit|advantage|improve|enhance|boost|save)", re.I)],
+    "selling point": [re.compile(r"(?:why|benefit|advantage|feature|capability)", re.I)],
+    # Mission/vision signals
+    "mission": [re.compile(r"(?:mission|purpose|goal|aim|strive)", re.I)],
+    "vision": [re.compile(r"(?:vision|future|believe|dream|aspire)", re.I)],
+    "core value": [re.compile(r"(?:value|principle|believe|commitment|culture)", re.I)],
+    "purpose": [re.compile(r"(?:purpose|why|reason|mission|passion)", re.I)],
+    # Getting started signals
+    "signup": [
+        re.compile(r"(?:sign\s*up|register|create\s+account|get\s+started|start\s+free)", re.I)
+    ],
+    "getting started": [re.compile(r"(?:get\s*(?:ting)?\s*started|begin|start|onboard)", re.I)],
+    "trial": [re.compile(r"(?:free\s+trial|try\s+(?:it\s+)?free|demo|test\s+drive)", re.I)],
+    "demo": [re.compile(r"(?:demo|demonstration|tour|walkthrough|preview)", re.I)],
+}
+
+_SIGNAL_MATCHER = MultiPatternMatcher(SIGNAL_PATTERNS)
+
+
+@lru_cache(maxsize=1024)
+def _signal_pattern_keys(signal_lower: str) -> tuple[str, ...]:
+    """Signal pattern keys that apply to a signal, in the order they are tried."""
+    return tuple(key for key in SIGNAL_PATTERNS if key in signal_lower)
+
+
 # Coverage bucket mapping: question category → bucket name
 ENTITY_FACTS_CATEGORIES = {
     QuestionCategory.IDENTITY,
@@ -397,10 +540,27 @@ class SimulationRunner:
         started_at = datetime.utcnow()
         start_time = time.perf_counter()
 
+        # Retrieve for all questions at once (one batched vector search).
+        # Retrievers without search_batch are queried one question at a time.
+        retrieval_start = time.perf_counter()
+        search_batch = getattr(self.retriever, "search_batch", None)
+        if search_batch is not None:
+            retrieved = search_batch(
+                [q.question for q in questions],
+                limit=self.config.chunks_per_question,
+            )
+        else:
+            retrieved = [
+                self.retriever.search(query=q.question, limit=self.config.chunks_per_question)
+                for q in questions
+            ]
+        retrieval_time = (time.perf_counter() - retrieval_start) * 1000
+        per_question_time = retrieval_time / len(questions) if questions else 0.0
+
         question_results: list[QuestionResult] = []
 
-        for question in questions:
-            result = self._evaluate_question(question)
+        for question, results in zip(questions, retrieved, strict=True):
+            result = self._evaluate_question(question, results, per_question_time)
             question_results.append(result)
 
         # Calculate aggregate scores
@@ -446,20 +606,31 @@ class SimulationRunner:
             completed_at=completed_at,
         )
 
-    def _evaluate_question(self, question: GeneratedQuestion) -> QuestionResult:
-        """Evaluate a single question against retrieved content."""
+    def _evaluate_question(
+        self,
+        question: GeneratedQuestion,
+        results: list[RetrievalResult] | None = None,
+        retrieval_time: float = 0.0,
+    ) -> QuestionResult:
+        """Evaluate a single question against retrieved content.
+
+        ``results`` may be supplied when retrieval was already done in a
+        batch (see ``run``); otherwise the question is retrieved here.
+        """
         import time
 
         # Retrieve relevant content
-        retrieval_start = time.perf_counter()
-        results = self.retriever.search(
-            query=question.question,
-            limit=self.config.chunks_per_question,
-        )
+        if results is None:
+            retrieval_start = time.perf_counter()
+            results = self.retriever.search(
+                query=question.question,
+                limit=self.config.chunks_per_question,
+            )
+            retrieval_time = (time.perf_counter() - retrieval_start) * 1000
+
         # Filter by min_score if configured
         if self.config.min_relevance_score > 0:
             results = [r for r in results if r.score >= self.config.min_relevance_score]
-        retrieval_time = (time.perf_counter() - retrieval_start) * 1000
 
         # Build context from results
         context = self._build_context(results)
@@ -555,8 +726,6 @@ class SimulationRunner:
         context: RetrievedContext,
     ) -> list[SignalMatch]:
         """Evaluate which expected signals are present in context."""
-        import re
-
         if not expected_signals:
             return []
 
@@ -564,160 +733,10 @@ class SimulationRunner:
         content = context.content_preview
         content_lower = content.lower()
 
-        # Pattern matchers for common signal types
-        signal_patterns: dict[str, list[re.Pattern]] = {
-            # Contact signals - strict patterns to avoid false positives
-            "email": [re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")],
-            # Phone: require at least 7 digits total, avoid matching decimals like "99.99%"
-            "phone": [
-                re.compile(
-                    r"(?<![0-9.])(?:\+?1[-.\s]?)?(?:\([0-9]{3}\)|[0-9]{3})[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}(?![0-9%])"
-                )
-            ],
-            "address": [
-                re.compile(
-                    r"\d+\s+[\w\s]+(?:street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln|way|court|ct)",
-                    re.I,
-                )
-            ],
-            "contact form": [
-                re.compile(r"contact\s*(?:us|form|page)?", re.I),
-                re.compile(r"get\s*in\s*touch", re.I),
-            ],
-            # Identity signals
-            "business description": [
-                re.compile(
-                    r"(?:we\s+(?:are|help|provide|offer|build|create|make|deliver)|(?:is\s+a|leading|platform|solution|service|company|tool))",
-                    re.I,
-                )
-            ],
-            "industry": [
-                re.compile(
-                    r"(?:automation|software|saas|technology|platform|integration|workflow|productivity|enterprise|business)",
-                    re.I,
-                )
-            ],
-            "primary activity": [
-                re.compile(
-                    r"(?:helps?\s+(?:you|teams?|businesses?|companies?|organizations?))|(?:enables?\s+)|(?:allows?\s+)",
-                    re.I,
-                )
-            ],
-            # Founder/history signals
-            "founder": [re.compile(r"(?:founded\s+by|co-?founder|ceo|chief\s+executive)", re.I)],
-            "founding year": [
-                re.compile(
-                    r"(?:founded|established|started|launched|since)\s*(?:in\s*)?(19|20)\d{2}", re.I
-                )
-            ],
-            "founding": [re.compile(r"(?:founded|established|started|launched|began)", re.I)],
-            # Location signals
-            "headquarters": [
-                re.compile(r"(?:headquarter|hq|based\s+in|located\s+in|office\s+in)", re.I)
-            ],
-            "operating regions": [
-                re.compile(r"(?:worldwide|global|international|countries|regions)", re.I)
-            ],
-            "office": [re.compile(r"(?:office|location|branch)\s*(?:in|at)?", re.I)],
-            # Offering signals
-            "product": [
-                re.compile(
-                    r"(?:product|feature|tool|app|application|platform|solution|service)", re.I
-                )
-            ],
-            "service": [re.compile(r"(?:service|offering|solution|support|consulting)", re.I)],
-            "feature": [re.compile(r"(?:feature|capability|function|ability)", re.I)],
-            "description": [
-                re.compile(r"(?:enables?|allows?|helps?|provides?|offers?|delivers?)", re.I)
-            ],
-            # Pricing signals
-            "pricing": [
-                re.compile(
-                    r"(?:pricing|price|cost|\$\d+|free\s+(?:tier|plan|trial)|per\s+(?:month|year|user))",
-                    re.I,
-                )
-            ],
-            "tier": [re.compile(r"(?:plan|tier|package|edition|version)\s*(?:s)?", re.I)],
-            # Customer signals
-            "customer": [
-                re.compile(r"(?:customer|client|user|team|organization|company|business)", re.I)
-            ],
-            "segment": [
-                re.compile(
-                    r"(?:small\s+business|enterprise|startup|agency|freelancer|developer|marketer)",
-                    re.I,
-                )
-            ],
-            "use case": [
-                re.compile(r"(?:use\s+case|workflow|automation|integration|scenario)", re.I)
-            ],
-            "vertical": [re.compile(r"(?:industry|sector|vertical|market)", re.I)],
-            # Problem/solution signals
-            "pain point": [
-                re.compile(r"(?:challenge|problem|issue|struggle|difficulty|pain)", re.I)
-            ],
-            "solution": [re.compile(r"(?:solution|solve|fix|address|resolve|help)", re.I)],
-            "outcome": [
-                re.compile(r"(?:result|outcome|benefit|improvement|save|increase|reduce)", re.I)
-            ],
-            # Trust signals
-            "client": [re.compile(r"(?:customer|client|partner|user)\s*(?:s)?", re.I)],
-            "case stud": [re.compile(r"(?:case\s+stud|success\s+stor|testimonial)", re.I)],
-            "testimonial": [re.compile(r"(?:testimonial|review|quote|said|says)", re.I)],
-            "logo": [re.compile(r"(?:trusted\s+by|used\s+by|powering|serving)", re.I)],
-            "partnership": [re.compile(r"(?:partner|integration|connect|work\s+with)", re.I)],
-            # Recognition signals
-            "award": [re.compile(r"(?:award|winner|recognized|honored|best|top)", re.I)],
-            "certification": [
-                re.compile(r"(?:certified|certification|compliance|soc\s*2|gdpr|hipaa|iso)", re.I)
-            ],
-            "recognition": [re.compile(r"(?:recognized|featured|mentioned|covered|press)", re.I)],
-            "press": [re.compile(r"(?:press|news|media|article|coverage|featured\s+in)", re.I)],
-            # Track record signals
-            "years": [
-                re.compile(r"(?:\d+\s*\+?\s*years?|since\s+\d{4}|established\s+\d{4})", re.I)
-            ],
-            "growth": [
-                re.compile(
-                    r"(?:growth|growing|scale|expanded|million|billion|\d+[kmb]\+?\s*(?:user|customer|company))",
-                    re.I,
-                )
-            ],
-            "success": [re.compile(r"(?:success|achievement|milestone|accomplish)", re.I)],
-            "count": [
-                re.compile(
-                    r"(?:\d+[,\d]*\s*(?:\+\s*)?(?:user|customer|client|company|team|business))",
-                    re.I,
-                )
-            ],
-            # Differentiation signals
-            "unique": [re.compile(r"(?:unique|only|first|exclusive|proprietary|patented)", re.I)],
-            "advantage": [re.compile(r"(?:advantage|benefit|better|faster|easier|simpler)", re.I)],
-            "proprietary": [re.compile(r"(?:proprietary|patent|exclusive|innovative)", re.I)],
-            "differentiating": [
-                re.compile(r"(?:different|unique|stand\s*out|unlike|versus|vs)", re.I)
-            ],
-            # Value prop signals
-            "value": [re.compile(r"(?:value|benefit|advantage|why\s+choose|reason)", re.I)],
-            "benefit": [re.compile(r"(?:benefit|advantage|improve|enhance|boost|save)", re.I)],
-            "selling point": [re.compile(r"(?:why|benefit|advantage|feature|capability)", re.I)],
-            # Mission/vision signals
-            "mission": [re.compile(r"(?:mission|purpose|goal|aim|strive)", re.I)],
-            "vision": [re.compile(r"(?:vision|future|believe|dream|aspire)", re.I)],
-            "core value": [re.compile(r"(?:value|principle|believe|commitment|culture)", re.I)],
-            "purpose": [re.compile(r"(?:purpose|why|reason|mission|passion)", re.I)],
-            # Getting started signals
-            "signup": [
-                re.compile(
-                    r"(?:sign\s*up|register|create\s+account|get\s+started|start\s+free)", re.I
-                )
-            ],
-            "getting started": [
-                re.compile(r"(?:get\s*(?:ting)?\s*started|begin|start|onboard)", re.I)
-            ],
-            "trial": [re.compile(r"(?:free\s+trial|try\s+(?:it\s+)?free|demo|test\s+drive)", re.I)],
-            "demo": [re.compile(r"(?:demo|demonstration|tour|walkthrough|preview)", re.I)],
-        }
+        # Match every pattern any expected signal needs in one prefiltered scan
+        relevant = {signal: _signal_pattern_keys(signal.lower()) for signal in expected_signals}
+        needed = {key for keys in relevant.values() for key in keys}
+        pattern_matches = _SIGNAL_MATCHER.first_matches(content, ids=needed) if needed else {}
 
         for signal in expected_signals:
             signal_lower = signal.lower()
@@ -726,20 +745,16 @@ class SimulationRunner:
             evidence = None
 
             # First try pattern matching for known signal types
-            for pattern_key, patterns in signal_patterns.items():
-                if pattern_key in signal_lower:
-                    for pattern in patterns:
-                        match = pattern.search(content)
-                        if match:
-                            found = True
-                            confidence = 1.0
-                            # Extract evidence with context
-                            start = max(0, match.start() - 30)
-                            end = min(len(content), match.end() + 30)
-                            evidence = content[start:end]
-                            break
-                    if found:
-                        break
+            for pattern_key in relevant[signal]:
+                match = pattern_matches.get(pattern_key)
+                if match:
+                    found = True
+                    confidence = 1.0
+                    # Extract evidence with context
+                    start = max(0, match.start() - 30)
+                    end = min(len(content), match.end() + 30)
+                    evidence = content[start:end]
+                    break
 
             # Fallback: check for exact or fuzzy text match
             if not found:
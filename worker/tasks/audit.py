@@ -1,6 +1,9 @@
 """Audit run background task."""
 
+import asyncio
 import uuid
+from collections import Counter
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
 import structlog
@@ -10,49 +13,25 @@ from sqlalchemy import select
 from api.config import SCORE_BAND_CONSERVATIVE, SCORE_BAND_GENEROUS, get_settings
 from api.database import async_session_maker
 from api.models import Report, Run, Site
-from worker.chunking.chunker import SemanticChunker
+from api.models.run import shareable_id_for
 from worker.crawler.cache import get_cached_or_crawl
-from worker.crawler.crawler import crawl_site
-from worker.embeddings.embedder import Embedder
-from worker.embeddings.storage import EmbeddingStore
-from worker.extraction.entity_recognition import (
-    EntityRecognitionAnalyzer,
-    EntityRecognitionResult,
-)
-from worker.extraction.extractor import ContentExtractor
-from worker.extraction.site_type import SiteType, SiteTypeResult, detect_site_type
-from worker.fixes.generator import FixGenerator
-from worker.observation.comparison import compare_simulation_observation
-from worker.observation.runner import ObservationRunner, RunConfig
-from worker.questions.generator import QuestionGenerator, SiteContext
-from worker.reports.assembler import assemble_report
-from worker.retrieval.retriever import HybridRetriever
-from worker.scoring.authority import AuthoritySignalsScore
-from worker.scoring.calculator import ScoreCalculator
-from worker.scoring.schema import SchemaRichnessScore
-from worker.scoring.structure import StructureQualityScore
-from worker.scoring.technical import TechnicalReadinessScore
-from worker.simulation.runner import SimulationRunner
-from worker.tasks.authority_check import (
-    aggregate_authority_scores,
-    generate_authority_fixes,
-    run_authority_checks_sync,
-)
-from worker.tasks.calibration import collect_calibration_samples
-from worker.tasks.schema_check import (
-    aggregate_schema_scores,
-    generate_schema_fixes,
-    run_schema_checks_sync,
-)
-from worker.tasks.structure_check import (
-    aggregate_structure_scores,
-    generate_structure_fixes,
-    run_structure_checks_sync,
-)
-from worker.tasks.technical_check import generate_technical_fixes, run_technical_checks_parallel
+from worker.crawler.crawler import CrawlResult, PageCallback, crawl_site
+from worker.embeddings.cache import get_embedding_cache
+from worker.http_pool import close_http_pool
+from worker.progress import ProgressCheckpointer, RunProgressEvent, publish_run_progress
+from worker.redis import close_async_redis
+from worker.reports.artifacts import publish_score_artifacts
+from worker.tasks.audit_graph import AUDIT_STATUSES, AuditContext, build_audit_graph
+from worker.tasks.incremental import AuditBaseline, get_audit_baseline_store
+from worker.tasks.page_analysis import PageAnalysisConfig
+from worker.tasks.page_stream import PageStreamConfig
+from worker.tasks.stage_graph import Stage
 
 logger = structlog.get_logger(__name__)
 
+# Progress not yet written to the database, per run in this process
+_progress_checkpoints = ProgressCheckpointer()
+
 
 async def update_run_status(
     run_id: uuid.UUID,
@@ -62,13 +41,33 @@ async def update_run_status(
     max_retries: int = 3,
 ) -> None:
     """
-    Update run status in database with optimistic locking.
+    Publish a run status update and checkpoint it to the database.
+
+    Every update goes to viewers over the progress bus. The database write
+    is skipped for progress ticks within the same step until the checkpoint
+    interval has passed; the skipped progress is written with the next
+    checkpoint. If publishing fails, every update is written.
 
     Uses SQLAlchemy's version_id_col for conflict detection.
     Retries on StaleDataError (concurrent update detected).
     """
     from sqlalchemy.orm.exc import StaleDataError
 
+    key = str(run_id)
+    full_progress = _progress_checkpoints.update(key, status, progress)
+    published = await publish_run_progress(
+        RunProgressEvent(
+            run_id=key,
+            status=status,
+            progress=full_progress,
+            error_message=error_message,
+        )
+    )
+    _progress_checkpoints.interval_seconds = get_settings().run_progress_checkpoint_seconds
+    if published and not error_message and not _progress_checkpoints.is_due(key, status):
+        return
+    pending = _progress_checkpoints.take_pending(key)
+
     for attempt in range(max_retries):
         try:
             async with async_session_maker() as db:
@@ -77,14 +76,14 @@ async def update_run_status(
 
                 if not run:
                     logger.error("run_not_found", run_id=str(run_id))
+                    _progress_checkpoints.discard(key)
                     return
 
                 run.status = status
 
-                if progress:
+                if pending:
                     current_progress = run.progress or {}
-                    current_progress.update(progress)
-                    current_progress["current_step"] = status
+                    current_progress.update(pending)
                     run.progress = current_progress
 
                 if status == "crawling" and not run.started_at:
@@ -97,6 +96,7 @@ async def update_run_status(
                     run.error_message = error_message
 
                 await db.commit()
+                _progress_checkpoints.mark_written(key, status)
                 logger.info("run_status_updated", run_id=str(run_id), status=status)
                 return
 
@@ -109,8 +109,6 @@ async def update_run_status(
                     attempt=attempt + 1,
                 )
                 # Brief pause before retry
-                import asyncio
-
                 await asyncio.sleep(0.1 * (attempt + 1))
             else:
                 logger.error(
@@ -122,6 +120,44 @@ async def update_run_status(
                 raise
 
 
+class RunStatusReporter:
+    """
+    Publishes a run's status and progress while its stage graph runs.
+
+    Several stages run at once; the run shows the earliest step not yet
+    finished and never moves back to a step it has already left. Progress
+    from any stage is published under the status currently shown.
+    """
+
+    def __init__(self, run_id: uuid.UUID, stages: Iterable[Stage]):
+        self.run_id = run_id
+        self.status = "queued"
+        # Unfinished stages per status
+        self._unfinished = Counter(stage.status for stage in stages if stage.status)
+
+    async def stage_started(self, stage: Stage) -> None:  # noqa: ARG002 - Listener signature
+        await self._advance()
+
+    async def stage_finished(self, stage: Stage) -> None:
+        if stage.status:
+            self._unfinished[stage.status] -= 1
+            await self._advance()
+
+    async def _advance(self) -> None:
+        remaining = [status for status, count in self._unfinished.items() if count > 0]
+        if not remaining:
+            return
+        earliest = min(remaining, key=AUDIT_STATUSES.index)
+        shown = AUDIT_STATUSES.index(self.status) if self.status in AUDIT_STATUSES else -1
+        if AUDIT_STATUSES.index(earliest) <= shown:
+            return
+        self.status = earliest
+        await update_run_status(self.run_id, earliest, {})
+
+    async def update(self, progress: dict) -> None:
+        await update_run_status(self.run_id, self.status, progress)
+
+
 def run_audit_sync(run_id: str, site_id: str) -> dict:
     """
     Synchronous wrapper for audit task.
@@ -129,8 +165,6 @@ def run_audit_sync(run_id: str, site_id: str) -> dict:
     This is the entry point for RQ which requires sync functions.
     It calls the async implementation.
     """
-    import asyncio
-
     from api.database import reset_engine
 
     # Reset database connections before each job to ensure fresh connections
@@ -184,1000 +218,109 @@ async def run_audit(run_id: uuid.UUID, site_id: uuid.UUID) -> dict:
             domain = site.domain
             company_name = site.name or domain
 
+            run_result = await db.execute(select(Run.config).where(Run.id == run_id))
+            run_config = run_result.scalar_one_or_none() or {}
+
+        # Incremental runs (monitoring) reuse unchanged pages from the last audit
+        baseline_store = get_audit_baseline_store() if settings.audit_incremental_enabled else None
+        baseline: AuditBaseline | None = None
+        if baseline_store and run_config.get("incremental"):
+            baseline = baseline_store.load(site_id)
+            if baseline is None:
+                # Expected once per site; repeated misses mean workers don't
+                # share AUDIT_BASELINE_DIR or it was wiped by a redeploy
+                logger.warning(
+                    "incremental_audit_no_baseline",
+                    site_id=str(site_id),
+                    baseline_dir=str(baseline_store.storage.base_path),
+                )
+            logger.info(
+                "incremental_audit",
+                baseline_found=baseline is not None,
+                baseline_pages=len(baseline.crawl.pages) if baseline else 0,
+            )
+
         # Update job metadata
         if job:
             job.meta["domain"] = domain
             job.meta["run_id"] = str(run_id)
             job.save_meta()
 
-        # =========================================================
-        # Step 0: Technical Readiness Check (v2)
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "technical_check",
-            {"checking": "robots.txt, TTFB, llms.txt, JS dependency"},
-        )
-
-        logger.info("technical_check_starting", domain=domain)
-
         start_url = f"https://{domain}"
-        technical_score: TechnicalReadinessScore | None = None
-
-        try:
-            technical_score = await run_technical_checks_parallel(
-                url=start_url,
-                html=None,  # Will check JS after extraction
-                timeout=10.0,
-            )
 
-            logger.info(
-                "technical_check_completed",
-                score=technical_score.total_score,
-                level=technical_score.level,
-                critical_issues=len(technical_score.critical_issues),
-            )
-
-            await update_run_status(
-                run_id,
-                "technical_check",
-                {
-                    "technical_score": technical_score.total_score,
-                    "technical_level": technical_score.level,
-                    "critical_issues": technical_score.critical_issues,
-                },
-            )
-
-            # Log warning if critical issues found but continue
-            if technical_score.critical_issues:
-                logger.warning(
-                    "technical_critical_issues",
-                    domain=domain,
-                    issues=technical_score.critical_issues,
+        async def crawl(page_callback: PageCallback | None) -> CrawlResult:
+            await reporter.update({"pages_total": settings.crawler_max_pages})
+            # Incremental runs skip the cache: conditional requests against
+            # the baseline are cheap and always current.
+            if baseline is not None:
+                return await crawl_site(
+                    url=start_url,
+                    max_pages=settings.crawler_max_pages,
+                    max_depth=settings.crawler_max_depth,
+                    previous_pages=baseline.pages_by_url,
+                    page_callback=page_callback,
                 )
-
-        except Exception as e:
-            logger.warning(
-                "technical_check_failed",
-                domain=domain,
-                error=str(e),
-            )
-            # Continue with audit even if technical check fails
-
-        # =========================================================
-        # Step 1: Crawling
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "crawling",
-            {"pages_crawled": 0, "pages_total": settings.crawler_max_pages},
-        )
-
-        logger.info("crawl_starting", domain=domain, max_pages=settings.crawler_max_pages)
-
-        # Progress callback for crawl updates
-        async def crawl_progress(pages_crawled: int, total_discovered: int) -> None:
-            await update_run_status(
-                run_id,
-                "crawling",
-                {"pages_crawled": pages_crawled, "urls_discovered": total_discovered},
-            )
-
-        # Perform the crawl (with optional caching)
-        if settings.crawler_cache_enabled:
-            crawl_result = await get_cached_or_crawl(
-                url=start_url,
-                max_pages=settings.crawler_max_pages,
-                max_depth=settings.crawler_max_depth,
-                use_cache=True,
-            )
-        else:
-            crawl_result = await crawl_site(
+            if settings.crawler_cache_enabled:
+                return await get_cached_or_crawl(
+                    url=start_url,
+                    max_pages=settings.crawler_max_pages,
+                    max_depth=settings.crawler_max_depth,
+                    use_cache=True,
+                    page_callback=page_callback,
+                )
+            return await crawl_site(
                 url=start_url,
                 max_pages=settings.crawler_max_pages,
                 max_depth=settings.crawler_max_depth,
+                page_callback=page_callback,
             )
 
-        logger.info(
-            "crawl_completed",
-            pages_crawled=len(crawl_result.pages),
-            urls_discovered=crawl_result.urls_discovered,
-            duration_seconds=crawl_result.duration_seconds,
-        )
-
-        await update_run_status(
-            run_id,
-            "crawling",
-            {
-                "pages_crawled": len(crawl_result.pages),
-                "urls_discovered": crawl_result.urls_discovered,
-            },
-        )
-
-        # =========================================================
-        # Step 2: Extracting
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "extracting",
-            {"pages_to_extract": len(crawl_result.pages)},
-        )
-
-        logger.info("extraction_starting", pages=len(crawl_result.pages))
-
-        extractor = ContentExtractor()
-        extraction_result = extractor.extract_crawl(crawl_result)
-
-        logger.info(
-            "extraction_completed",
-            pages_extracted=extraction_result.total_pages,
-            total_words=extraction_result.total_words,
-            errors=extraction_result.extraction_errors,
-        )
-
-        await update_run_status(
-            run_id,
-            "extracting",
-            {
-                "pages_extracted": extraction_result.total_pages,
-                "total_words": extraction_result.total_words,
-            },
-        )
-
-        # =========================================================
-        # Step 2.5: Update Technical Score with JS Detection
-        # =========================================================
-        if technical_score and crawl_result.pages:
-            from worker.extraction.js_detection import detect_js_dependency
-
-            # Check JS dependency on homepage HTML
-            homepage_html = None
-            for page in crawl_result.pages:
-                if page.html:
-                    homepage_html = page.html
-                    break
-
-            if homepage_html:
-                try:
-                    js_result = detect_js_dependency(homepage_html, start_url)
-
-                    # Update technical score with JS result
-                    from worker.scoring.technical import calculate_technical_score
-
-                    technical_score = calculate_technical_score(
-                        robots_result=technical_score.robots_result,
-                        ttfb_result=technical_score.ttfb_result,
-                        llms_txt_result=technical_score.llms_txt_result,
-                        js_result=js_result,
-                        is_https=technical_score.is_https,
-                    )
-
-                    logger.info(
-                        "technical_js_detection_complete",
-                        js_dependent=js_result.likely_js_dependent,
-                        framework=js_result.framework_detected,
-                        updated_score=technical_score.total_score,
-                    )
-                except Exception as e:
-                    logger.warning("js_detection_failed", error=str(e))
-
-        # =========================================================
-        # Step 2.6: Site Content Type Classification
-        # =========================================================
-        site_type_result: SiteTypeResult | None = None
-
-        try:
-            page_urls = [page.url for page in crawl_result.pages]
-            page_htmls = [page.html for page in crawl_result.pages]
-
-            site_type_result = detect_site_type(
-                domain=domain,
-                page_urls=page_urls,
-                page_htmls=page_htmls,  # type: ignore[arg-type]
-            )
-
-            logger.info(
-                "site_type_detected",
-                domain=domain,
-                site_type=site_type_result.site_type.value,
-                confidence=site_type_result.confidence,
-                citation_baseline=site_type_result.citation_baseline,
-            )
-
-        except Exception as e:
-            logger.warning(
-                "site_type_detection_failed",
-                domain=domain,
-                error=str(e),
-            )
-            # Continue with audit even if site type detection fails
-
-        # =========================================================
-        # Step 2.75: Semantic Structure Analysis (v2)
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "structure_analysis",
-            {"analyzing": "headings, answer-first, FAQ, links, formats"},
-        )
-
-        logger.info("structure_analysis_starting", pages=len(crawl_result.pages))
-
-        structure_score: StructureQualityScore | None = None
-
-        try:
-            # Analyze structure of each page
-            page_scores = []
-            for i, page in enumerate(crawl_result.pages):
-                if page.html and i < len(extraction_result.pages):
-                    extracted = extraction_result.pages[i]
-                    page_score = run_structure_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                        main_content=extracted.main_content,
-                        word_count=extracted.word_count,
-                    )
-                    page_scores.append(page_score)
-
-            # Aggregate into site-level score
-            if page_scores:
-                structure_score = aggregate_structure_scores(page_scores)
-
-                logger.info(
-                    "structure_analysis_completed",
-                    total_score=structure_score.total_score,
-                    level=structure_score.level,
-                    pages_analyzed=len(page_scores),
-                )
-
-                await update_run_status(
-                    run_id,
-                    "structure_analysis",
-                    {
-                        "structure_score": structure_score.total_score,
-                        "structure_level": structure_score.level,
-                        "pages_analyzed": len(page_scores),
-                    },
-                )
-
-        except Exception as e:
-            logger.warning(
-                "structure_analysis_failed",
-                error=str(e),
-            )
-            # Continue with audit even if structure analysis fails
-
-        # =========================================================
-        # Step 2.85: Schema Richness Analysis (v2)
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "schema_analysis",
-            {"analyzing": "FAQPage, Article, Organization, HowTo, validation"},
-        )
-
-        logger.info("schema_analysis_starting", pages=len(crawl_result.pages))
-
-        schema_score: SchemaRichnessScore | None = None
-
-        try:
-            # Analyze schema of each page
-            schema_page_scores = []
-            for page in crawl_result.pages:
-                if page.html:
-                    page_schema_score = run_schema_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                    )
-                    schema_page_scores.append(page_schema_score)
-
-            # Aggregate into site-level score
-            if schema_page_scores:
-                schema_score = aggregate_schema_scores(schema_page_scores)
-
-                logger.info(
-                    "schema_analysis_completed",
-                    total_score=schema_score.total_score,
-                    level=schema_score.level,
-                    pages_analyzed=len(schema_page_scores),
-                )
-
-                await update_run_status(
-                    run_id,
-                    "schema_analysis",
-                    {
-                        "schema_score": schema_score.total_score,
-                        "schema_level": schema_score.level,
-                        "pages_analyzed": len(schema_page_scores),
-                    },
-                )
-
-        except Exception as e:
-            logger.warning(
-                "schema_analysis_failed",
-                error=str(e),
-            )
-            # Continue with audit even if schema analysis fails
-
-        # =========================================================
-        # Step 2.9: Authority Signals Analysis (v2)
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "authority_analysis",
-            {"analyzing": "author, credentials, citations, freshness, original data"},
-        )
-
-        logger.info("authority_analysis_starting", pages=len(crawl_result.pages))
-
-        authority_score: AuthoritySignalsScore | None = None
-
-        try:
-            # Analyze authority signals of each page
-            authority_page_scores = []
-            for i, page in enumerate(crawl_result.pages):
-                if page.html and i < len(extraction_result.pages):
-                    extracted = extraction_result.pages[i]
-                    page_authority_score = run_authority_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                        main_content=extracted.main_content,
-                    )
-                    authority_page_scores.append(page_authority_score)
-
-            # Aggregate into site-level score
-            if authority_page_scores:
-                authority_score = aggregate_authority_scores(authority_page_scores)
-
-                logger.info(
-                    "authority_analysis_completed",
-                    total_score=authority_score.total_score,
-                    level=authority_score.level,
-                    pages_analyzed=len(authority_page_scores),
-                )
-
-                await update_run_status(
-                    run_id,
-                    "authority_analysis",
-                    {
-                        "authority_score": authority_score.total_score,
-                        "authority_level": authority_score.level,
-                        "pages_analyzed": len(authority_page_scores),
-                    },
-                )
-
-        except Exception as e:
-            logger.warning(
-                "authority_analysis_failed",
-                error=str(e),
-            )
-            # Continue with audit even if authority analysis fails
-
-        # =========================================================
-        # Step 2.95: Entity Recognition Analysis (v2)
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "entity_recognition",
-            {"analyzing": "Wikipedia, Wikidata, domain age, web presence"},
-        )
-
-        logger.info("entity_recognition_starting", domain=domain, company_name=company_name)
-
-        entity_recognition_result: EntityRecognitionResult | None = None
-
-        try:
-            analyzer = EntityRecognitionAnalyzer(
-                timeout=15.0,  # Give external APIs time
-                skip_web_presence=False,  # Include all signals
-            )
-            entity_recognition_result = await analyzer.analyze(
-                domain=domain,
-                brand_name=company_name,
-            )
-
-            logger.info(
-                "entity_recognition_completed",
-                total_score=entity_recognition_result.total_score,
-                normalized_score=entity_recognition_result.normalized_score,
-                has_wikipedia=entity_recognition_result.wikipedia.has_page,
-                has_wikidata=entity_recognition_result.wikidata.has_entity,
-                domain_age_years=entity_recognition_result.domain_signals.domain_age_years,
-            )
-
-            await update_run_status(
-                run_id,
-                "entity_recognition",
-                {
-                    "entity_recognition_score": entity_recognition_result.normalized_score,
-                    "has_wikipedia": entity_recognition_result.wikipedia.has_page,
-                    "has_wikidata": entity_recognition_result.wikidata.has_entity,
-                },
-            )
-
-        except Exception as e:
-            logger.warning(
-                "entity_recognition_failed",
-                domain=domain,
-                error=str(e),
-            )
-            # Continue with audit even if entity recognition fails
-
-        # =========================================================
-        # Step 3: Chunking
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "chunking",
-            {"chunks_created": 0},
-        )
-
-        logger.info("chunking_starting", pages=extraction_result.total_pages)
-
-        chunker = SemanticChunker()
-        chunked_pages = []
-        total_chunks = 0
-
-        for page in extraction_result.pages:  # type: ignore[assignment]
-            chunked_page = chunker.chunk_text(
-                text=page.main_content,  # type: ignore[attr-defined]
-                url=page.url,
-                title=page.title,
-            )
-            chunked_pages.append(chunked_page)
-            total_chunks += chunked_page.total_chunks
-
-        logger.info("chunking_completed", total_chunks=total_chunks)
-
-        await update_run_status(
-            run_id,
-            "chunking",
-            {"chunks_created": total_chunks},
-        )
-
         # =========================================================
-        # Step 4: Embedding
+        # Steps 0-10: technical check through report assembly, as a
+        # stage graph. Independent stages overlap (see audit_graph).
         # =========================================================
-        await update_run_status(
-            run_id,
-            "embedding",
-            {"chunks_to_embed": total_chunks},
+        # Observation makes real AI calls; only when enabled and requested
+        include_observation = settings.observation_enabled and bool(
+            run_config.get("include_observation", False)
         )
-
-        logger.info("embedding_starting", chunks=total_chunks)
-
-        embedder = Embedder()
-        embedded_pages = embedder.embed_pages(chunked_pages)
-
-        total_embeddings = sum(len(ep.embeddings) for ep in embedded_pages)
-        logger.info("embedding_completed", total_embeddings=total_embeddings)
-
-        await update_run_status(
-            run_id,
-            "embedding",
-            {"chunks_embedded": total_embeddings},
-        )
-
-        # =========================================================
-        # Step 5: Persist Embeddings + Build Retriever Index
-        # =========================================================
-        logger.info("indexing_starting", pages=len(embedded_pages))
-
-        retriever = HybridRetriever(embedder=embedder)
-        embedding_store = EmbeddingStore()
-
-        # Persist embeddings to database for future reuse
-        async with async_session_maker() as db:
-            for page_idx, ep in enumerate(embedded_pages):
-                # Generate a stable page_id from URL hash
-                page_id = uuid.uuid5(uuid.NAMESPACE_URL, ep.url)
-
-                for emb_result in ep.embeddings:
-                    chunk = chunked_pages[page_idx].chunks[emb_result.chunk_index]
-
-                    # Store embedding in database
-                    await embedding_store.store_embedding(
-                        session=db,
-                        chunk_id=uuid.uuid5(page_id, emb_result.content_hash),
-                        page_id=page_id,
-                        site_id=site_id,
-                        content=chunk.content,
-                        content_hash=emb_result.content_hash,
-                        embedding=emb_result.embedding,
-                        model_name=settings.embedding_model,
-                        chunk_index=emb_result.chunk_index,
-                        chunk_type=(
-                            chunk.chunk_type.value
-                            if hasattr(chunk.chunk_type, "value")
-                            else str(chunk.chunk_type)
-                        ),
-                        heading_context=emb_result.heading_context,
-                        position_ratio=(
-                            chunk.position_ratio if hasattr(chunk, "position_ratio") else 0.0
-                        ),
-                        source_url=emb_result.source_url,
-                        page_title=emb_result.page_title,
-                    )
-
-                    # Also add to in-memory retriever for this run
-                    retriever.add_document(
-                        doc_id=emb_result.content_hash,
-                        content=chunk.content,
-                        embedding=emb_result.embedding,
-                        source_url=emb_result.source_url,
-                        page_title=emb_result.page_title,
-                        heading_context=emb_result.heading_context,
-                    )
-
-            await db.commit()
-
-        logger.info(
-            "indexing_completed",
-            documents=len(retriever._documents),
-            persisted=total_embeddings,
-        )
-
-        # =========================================================
-        # Step 6: Generate Questions
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "generating_questions",
-            {},
+        graph = build_audit_graph(
+            include_observation=include_observation,
+            streaming=settings.audit_streaming_enabled,
         )
-
-        logger.info("question_generation_starting", company=company_name)
-
-        # Collect schema types and headings from extraction
-        schema_types = list(set(extraction_result.schema_types_found))
-        headings: dict[str, list[str]] = {"h1": [], "h2": [], "h3": []}
-        for page in extraction_result.pages:  # type: ignore[assignment]
-            page_headings = page.metadata.headings or {}  # type: ignore[attr-defined]
-            for level in ["h1", "h2", "h3"]:
-                if level in page_headings:
-                    headings[level].extend(page_headings[level])
-
-        site_context = SiteContext(
-            company_name=company_name,
+        reporter = RunStatusReporter(run_id, graph.stages.values())
+        context = AuditContext(
             domain=domain,
-            schema_types=schema_types,
-            headings=headings,
-        )
-
-        question_generator = QuestionGenerator()
-        questions = question_generator.generate(site_context)
-
-        logger.info("question_generation_completed", questions=len(questions))
-
-        await update_run_status(
-            run_id,
-            "generating_questions",
-            {"questions_generated": len(questions)},
-        )
-
-        # =========================================================
-        # Step 7: Simulating
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "simulating",
-            {"questions_processed": 0, "questions_total": len(questions)},
-        )
-
-        logger.info("simulation_starting", questions=len(questions))
-
-        simulation_runner = SimulationRunner(retriever=retriever)
-        simulation_result = simulation_runner.run(
-            site_id=site_id,
-            run_id=run_id,
             company_name=company_name,
-            questions=questions,
-        )
-
-        logger.info(
-            "simulation_completed",
-            overall_score=simulation_result.overall_score,
-            questions_answered=simulation_result.questions_answered,
-            questions_partial=simulation_result.questions_partial,
-            questions_unanswered=simulation_result.questions_unanswered,
-        )
-
-        await update_run_status(
-            run_id,
-            "simulating",
-            {
-                "questions_processed": len(questions),
-                "questions_total": len(questions),
-            },
-        )
-
-        # =========================================================
-        # Step 7.5: Observation (Optional - Real AI Calls)
-        # =========================================================
-        observation_run = None
-        comparison_summary = None
-
-        # Check if observation is enabled and requested
-        include_observation = False
-        async with async_session_maker() as db:
-            run_result = await db.execute(select(Run).where(Run.id == run_id))
-            run_record = run_result.scalar_one_or_none()
-            if run_record and run_record.config:
-                include_observation = run_record.config.get("include_observation", False)
-
-        if settings.observation_enabled and include_observation:
-            await update_run_status(
-                run_id,
-                "observing",
-                {"questions_to_observe": len(questions)},
-            )
-
-            logger.info("observation_starting", questions=len(questions))
-
-            try:
-                # Create questions list for observation (question_id, question_text tuples)
-                observation_questions = [(str(q.id), q.text) for q in questions]
-
-                # Run observations
-                run_config = RunConfig.from_settings()
-                observation_runner = ObservationRunner(config=run_config)
-                observation_run = await observation_runner.run_observation(
-                    site_id=site_id,
-                    run_id=run_id,
-                    company_name=company_name,
-                    domain=domain,
-                    questions=observation_questions,
-                )
-
-                logger.info(
-                    "observation_completed",
-                    status=observation_run.status.value,
-                    mention_rate=observation_run.company_mention_rate,
-                    citation_rate=observation_run.citation_rate,
-                    total_cost=(
-                        observation_run.total_usage.estimated_cost_usd
-                        if observation_run.total_usage
-                        else 0
-                    ),
-                )
-
-                # Compare simulation with observation
-                comparison_summary = compare_simulation_observation(
-                    simulation=simulation_result,
-                    observation=observation_run,
-                )
-
-                logger.info(
-                    "comparison_completed",
-                    prediction_accuracy=comparison_summary.prediction_accuracy,
-                    optimistic_predictions=comparison_summary.optimistic_predictions,
-                    pessimistic_predictions=comparison_summary.pessimistic_predictions,
-                )
-
-                # Collect calibration samples for learning
-                if settings.calibration_enabled and settings.calibration_sample_collection:
-                    pillar_scores_snapshot = None
-                    if (
-                        technical_score
-                        or structure_score
-                        or schema_score
-                        or authority_score
-                        or entity_recognition_result
-                        or simulation_result
-                    ):
-                        pillar_scores_snapshot = {
-                            "technical": technical_score.total_score if technical_score else None,
-                            "structure": structure_score.total_score if structure_score else None,
-                            "schema": schema_score.total_score if schema_score else None,
-                            "authority": authority_score.total_score if authority_score else None,
-                            "entity_recognition": (
-                                entity_recognition_result.normalized_score
-                                if entity_recognition_result
-                                else None
-                            ),
-                            "retrieval": (
-                                simulation_result.overall_score if simulation_result else None
-                            ),
-                            "coverage": (
-                                simulation_result.coverage_score if simulation_result else None
-                            ),
-                        }
-
-                        # Add source primacy score (0-100 scale) for optimizer
-                        try:
-                            from worker.extraction.source_primacy import analyze_source_primacy
-
-                            # Collect page content for content uniqueness analysis
-                            pages_content_list = [
-                                p.main_content
-                                for p in extraction_result.pages
-                                if hasattr(p, "main_content") and p.main_content
-                            ]
-
-                            primacy_result = analyze_source_primacy(
-                                domain=domain,
-                                site_type=(
-                                    site_type_result.site_type
-                                    if site_type_result
-                                    else SiteType.MIXED
-                                ),
-                                page_urls=page_urls if page_urls else [],
-                                brand_name=company_name,
-                                pages_content=pages_content_list,
-                            )
-                            # Store as 0-100 to match pillar score scale
-                            pillar_scores_snapshot["source_primacy"] = round(
-                                primacy_result.primacy_score * 100, 1
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                "source_primacy_for_calibration_failed",
-                                error=str(e),
-                            )
-
-                        # Add content uniqueness score directly for optimizer
-                        try:
-                            from worker.extraction.content_uniqueness import (
-                                analyze_content_uniqueness,
-                            )
-
-                            pages_content_list = [
-                                p.main_content
-                                for p in extraction_result.pages
-                                if hasattr(p, "main_content") and p.main_content
-                            ]
-                            if pages_content_list:
-                                uniqueness = analyze_content_uniqueness(
-                                    pages_content=pages_content_list,
-                                    page_urls=page_urls if page_urls else [],
-                                    domain=domain,
-                                )
-                                pillar_scores_snapshot["content_uniqueness"] = round(
-                                    uniqueness.score, 1
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                "content_uniqueness_for_calibration_failed",
-                                error=str(e),
-                            )
-
-                        # Add competitive density score for optimizer
-                        try:
-                            from worker.scoring.competitive_density import (
-                                analyze_competitive_density,
-                            )
-
-                            question_categories = [
-                                q.category if hasattr(q, "category") else "unknown"
-                                for q in questions
-                            ]
-                            # Determine if each question is about the site's own brand
-                            is_own_brand = [
-                                (
-                                    company_name.lower() in q.text.lower()
-                                    or domain.split(".")[0].lower() in q.text.lower()
-                                )
-                                for q in questions
-                            ]
-
-                            density_result = analyze_competitive_density(
-                                site_type=(
-                                    site_type_result.site_type
-                                    if site_type_result
-                                    else SiteType.MIXED
-                                ),
-                                question_categories=question_categories,
-                                is_own_brand_query=is_own_brand,
-                                domain=domain,
-                            )
-                            # Store inverse (high = less competition = better)
-                            pillar_scores_snapshot["competitive_density"] = round(
-                                density_result.inverse_score, 1
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                "competitive_density_for_calibration_failed",
-                                error=str(e),
-                            )
-
-                    samples_collected = await collect_calibration_samples(
-                        run_id=run_id,
-                        simulation_result=simulation_result,
-                        observation_run=observation_run,
-                        pillar_scores=pillar_scores_snapshot,  # type: ignore[arg-type]
-                        site_type=(site_type_result.site_type.value if site_type_result else None),
-                    )
-
-                    logger.info(
-                        "calibration_samples_collected",
-                        samples=samples_collected,
-                    )
-
-                await update_run_status(
-                    run_id,
-                    "observing",
-                    {
-                        "questions_observed": len(observation_run.results),
-                        "mention_rate": observation_run.company_mention_rate,
-                        "citation_rate": observation_run.citation_rate,
-                    },
-                )
-
-            except Exception as e:
-                logger.warning(
-                    "observation_failed",
-                    error=str(e),
-                )
-                # Continue with audit even if observation fails
-
-        # =========================================================
-        # Step 8: Scoring
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "scoring",
-            {},
-        )
-
-        logger.info("scoring_starting")
-
-        score_calculator = ScoreCalculator()
-        score_breakdown = score_calculator.calculate(simulation_result)
-
-        logger.info(
-            "scoring_completed",
-            total_score=score_breakdown.total_score,
-            grade=score_breakdown.grade,
-        )
-
-        # =========================================================
-        # Step 9: Generate Fixes
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "generating_fixes",
-            {},
-        )
-
-        logger.info("fix_generation_starting")
-
-        # Build site content map for fix generation
-        site_content = {page.url: page.main_content for page in extraction_result.pages}
-
-        fix_generator = FixGenerator()
-        fix_plan = fix_generator.generate(
-            simulation=simulation_result,
-            site_content=site_content,
-        )
-
-        logger.info(
-            "fix_generation_completed",
-            total_fixes=fix_plan.total_fixes,
-            critical_fixes=fix_plan.critical_fixes,
-        )
-
-        # Generate technical fixes and merge if we have technical score
-        technical_fixes_count = 0
-        if technical_score:
-            technical_fixes = generate_technical_fixes(technical_score)
-            technical_fixes_count = len(technical_fixes)
-
-            # Log technical fixes (they'll be included in the report via technical section)
-            if technical_fixes:
-                logger.info(
-                    "technical_fixes_generated",
-                    count=technical_fixes_count,
-                    fixes=[f["title"] for f in technical_fixes],
-                )
-
-        # Generate structure fixes if we have structure score
-        structure_fixes_count = 0
-        if structure_score:
-            structure_fixes = generate_structure_fixes(structure_score)
-            structure_fixes_count = len(structure_fixes)
-
-            # Log structure fixes
-            if structure_fixes:
-                logger.info(
-                    "structure_fixes_generated",
-                    count=structure_fixes_count,
-                    fixes=[f["title"] for f in structure_fixes],
-                )
-
-        # Generate schema fixes if we have schema score
-        schema_fixes_count = 0
-        if schema_score:
-            schema_fixes = generate_schema_fixes(schema_score)
-            schema_fixes_count = len(schema_fixes)
-
-            # Log schema fixes
-            if schema_fixes:
-                logger.info(
-                    "schema_fixes_generated",
-                    count=schema_fixes_count,
-                    fixes=[f["title"] for f in schema_fixes],
-                )
-
-        # Generate authority fixes if we have authority score
-        authority_fixes_count = 0
-        if authority_score:
-            authority_fixes = generate_authority_fixes(authority_score)
-            authority_fixes_count = len(authority_fixes)
-
-            # Log authority fixes
-            if authority_fixes:
-                logger.info(
-                    "authority_fixes_generated",
-                    count=authority_fixes_count,
-                    fixes=[f["title"] for f in authority_fixes],
-                )
-
-        # =========================================================
-        # Step 10: Assembling Report
-        # =========================================================
-        await update_run_status(
-            run_id,
-            "assembling",
-            {},
-        )
-
-        run_completed_at = datetime.now(UTC)
-
-        logger.info("report_assembly_starting")
-
-        # Build crawl data for report
-        crawl_pages_data = []
-        for i, page in enumerate(crawl_result.pages):
-            # Find matching extraction and chunk data
-            word_count = 0
-            chunk_count = 0
-            if i < len(extraction_result.pages):
-                word_count = extraction_result.pages[i].word_count
-            if i < len(chunked_pages):
-                chunk_count = chunked_pages[i].total_chunks
-
-            crawl_pages_data.append(
-                {
-                    "url": page.url,
-                    "title": page.title,
-                    "status_code": page.status_code,
-                    "depth": page.depth,
-                    "word_count": word_count,
-                    "chunk_count": chunk_count,
-                }
-            )
-
-        crawl_data = {
-            "total_pages": len(crawl_result.pages),
-            "total_words": extraction_result.total_words,
-            "total_chunks": total_chunks,
-            "urls_discovered": crawl_result.urls_discovered,
-            "urls_failed": crawl_result.urls_failed,
-            "max_depth_reached": crawl_result.max_depth_reached,
-            "duration_seconds": crawl_result.duration_seconds,
-            "pages": crawl_pages_data,
-        }
-
-        full_report = assemble_report(
+            start_url=start_url,
             site_id=site_id,
             run_id=run_id,
-            company_name=company_name,
-            domain=domain,
-            simulation=simulation_result,
-            score_breakdown=score_breakdown,
-            fix_plan=fix_plan,
-            observation=observation_run,
-            comparison=comparison_summary,
-            crawl_data=crawl_data,
-            technical_score=technical_score,
-            structure_score=structure_score,
-            schema_score=schema_score,
-            authority_score=authority_score,
-            entity_recognition_result=entity_recognition_result,
-            site_type_result=site_type_result,
-        )
-
-        logger.info("report_assembly_completed", report_id=str(full_report.metadata.report_id))
+            crawl=crawl,
+            reporter=reporter,
+            baseline=baseline,
+            baseline_store=baseline_store,
+            analysis_config=PageAnalysisConfig(
+                workers=settings.audit_analysis_workers,
+                min_pages_for_pool=settings.audit_analysis_min_pages,
+            ),
+            embedding_cache=get_embedding_cache(),
+            persist_embeddings=True,
+            stream_config=PageStreamConfig(
+                queue_size=settings.audit_stream_queue_pages,
+                # The baseline and the crawl cache keep the crawled HTML
+                release_html=baseline_store is None and not settings.crawler_cache_enabled,
+            ),
+        )
+
+        initial = (
+            {} if include_observation else {"observation_run": None, "comparison_summary": None}
+        )
+        graph_run = await graph.run(context, values=initial, listener=reporter)
+        logger.info("audit_stage_timings", run_id=str(run_id), **graph_run.summary())
+
+        observation_run = graph_run.values["observation_run"]
+        score_breakdown = graph_run.values["score_breakdown"]
+        full_report = graph_run.values["full_report"]
+        run_completed_at = graph_run.values["run_completed_at"]
 
         # =========================================================
         # Step 11: Save Report and Complete Run (atomic transaction)
@@ -1188,9 +331,10 @@ async def run_audit(run_id: uuid.UUID, site_id: uuid.UUID) -> dict:
             if observation_run:
                 mention_rate = observation_run.company_mention_rate
 
+            report_data = full_report.to_dict()
             report = Report(
                 report_version=full_report.metadata.version,
-                data=full_report.to_dict(),
+                data=report_data,
                 score_conservative=int(score_breakdown.total_score * SCORE_BAND_CONSERVATIVE),
                 score_typical=int(score_breakdown.total_score),
                 score_generous=int(min(100, score_breakdown.total_score * SCORE_BAND_GENEROUS)),
@@ -1205,11 +349,32 @@ async def run_audit(run_id: uuid.UUID, site_id: uuid.UUID) -> dict:
             run.report_id = report.id  # type: ignore[attr-defined]
             run.status = "complete"  # type: ignore[attr-defined]
             run.completed_at = datetime.now(UTC)  # type: ignore[attr-defined]
+            pending_progress = _progress_checkpoints.discard(str(run_id))
+            if pending_progress:
+                run.progress = {**(run.progress or {}), **pending_progress}  # type: ignore[attr-defined]
+            final_progress = dict(run.progress or {})  # type: ignore[attr-defined]
+            shareable_id = run.shareable_id or shareable_id_for(run_id)  # type: ignore[attr-defined]
 
             await db.commit()
 
             report_id = report.id
 
+        await publish_run_progress(
+            RunProgressEvent(
+                run_id=str(run_id),
+                status="complete",
+                progress=final_progress,
+                report_id=str(report_id),
+            )
+        )
+
+        # Pre-render the public score page artifacts so shared links are
+        # served from the artifact cache
+        try:
+            await asyncio.to_thread(publish_score_artifacts, shareable_id, report_data, domain)
+        except Exception as e:
+            logger.warning("score_artifacts_failed", run_id=str(run_id), error=str(e))
+
         logger.info(
             "audit_completed",
             run_id=str(run_id),
@@ -1243,3 +408,8 @@ async def run_audit(run_id: uuid.UUID, site_id: uuid.UUID) -> dict:
         )
 
         raise
+
+    finally:
+        # Release pooled keep-alive connections opened during this run
+        await close_http_pool()
+        await close_async_redis()
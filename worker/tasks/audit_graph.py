@@ -0,0 +1,1332 @@
+"""The audit pipeline as a graph of stages.
+
+Each step of an audit is a ``Stage`` with explicit inputs and outputs, so
+``StageGraph`` can overlap the ones with no data dependency: the technical
+checks and entity recognition (pure network) run while the site is
+crawled, question generation runs alongside chunking and embedding, and
+scoring and fix generation run alongside observation. With
+``streaming=True`` a single "stream" stage (see ``PageStream``) replaces
+crawl, page analysis, chunking and embedding, processing each page as it
+is crawled.
+
+``run_audit`` executes the full graph; ``worker.testing.pipeline`` runs
+the subset needed for its scores. Stages that used to be skipped on error
+still are: they log the failure and produce None. CPU-heavy stages run
+their work in a thread so network stages keep progressing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+import structlog
+
+from api.database import async_session_maker
+from worker.chunking.chunker import ChunkedPage, SemanticChunker
+from worker.crawler.crawler import CrawlResult, PageCallback
+from worker.embeddings.cache import EmbeddingCache
+from worker.embeddings.embedder import EmbeddedPage, Embedder
+from worker.embeddings.storage import EmbeddingStore
+from worker.extraction.entity_cache import get_entity_signal_cache
+from worker.extraction.entity_recognition import EntityRecognitionAnalyzer
+from worker.extraction.extractor import ContentExtractor, ExtractedPage
+from worker.extraction.page_type import detect_page_type
+from worker.extraction.site_type import SiteType, detect_site_type
+from worker.fixes.generator import FixGenerator
+from worker.observation.comparison import compare_simulation_observation
+from worker.observation.runner import ObservationRunner, RunConfig
+from worker.questions.generator import QuestionGenerator, SiteContext
+from worker.reports.assembler import assemble_report
+from worker.retrieval.retriever import HybridRetriever
+from worker.scoring.calculator import ScoreCalculator
+from worker.simulation.runner import SimulationRunner
+from worker.tasks.authority_check import aggregate_authority_scores, generate_authority_fixes
+from worker.tasks.calibration import collect_calibration_samples
+from worker.tasks.incremental import AuditBaseline, AuditBaselineStore, IncrementalStats
+from worker.tasks.page_analysis import (
+    PageAnalysisConfig,
+    PageAnalysisExecutor,
+    PageAnalysisResult,
+)
+from worker.tasks.page_stream import PageStream, PageStreamConfig
+from worker.tasks.schema_check import aggregate_schema_scores, generate_schema_fixes
+from worker.tasks.stage_graph import Stage, StageGraph
+from worker.tasks.structure_check import aggregate_structure_scores, generate_structure_fixes
+from worker.tasks.technical_check import generate_technical_fixes, run_technical_checks_parallel
+
+logger = structlog.get_logger(__name__)
+
+# Run statuses in pipeline order (as shown on the progress page)
+AUDIT_STATUSES = (
+    "technical_check",
+    "crawling",
+    "extracting",
+    "structure_analysis",
+    "schema_analysis",
+    "authority_analysis",
+    "entity_recognition",
+    "chunking",
+    "embedding",
+    "generating_questions",
+    "simulating",
+    "observing",
+    "scoring",
+    "generating_fixes",
+    "assembling",
+)
+
+
+class ProgressReporter(Protocol):
+    """Receives progress updates from stages."""
+
+    async def update(self, progress: dict) -> None: ...
+
+
+class NullReporter:
+    """Discards progress (runs without a Run record)."""
+
+    async def update(self, progress: dict) -> None:  # noqa: ARG002 - Protocol signature
+        return None
+
+
+@dataclass
+class AuditContext:
+    """Per-run settings and collaborators shared by all audit stages."""
+
+    domain: str
+    company_name: str
+    start_url: str
+    site_id: uuid.UUID
+    # Performs the crawl, awaiting the callback (if given) with each page
+    crawl: Callable[[PageCallback | None], Awaitable[CrawlResult]]
+    run_id: uuid.UUID | None = None
+    reporter: ProgressReporter = field(default_factory=NullReporter)
+    baseline: AuditBaseline | None = None
+    baseline_store: AuditBaselineStore | None = None
+    analysis_config: PageAnalysisConfig = field(default_factory=PageAnalysisConfig)
+    embedding_cache: EmbeddingCache | None = None
+    persist_embeddings: bool = False  # Prefetch from and write to the embeddings table
+    stream_config: PageStreamConfig = field(default_factory=PageStreamConfig)
+
+
+# =========================================================
+# Network stages (no dependency on the crawl)
+# =========================================================
+
+
+async def technical_check_stage(ctx: AuditContext) -> dict[str, Any]:
+    """Robots.txt, TTFB and llms.txt checks (JS dependency is added later)."""
+    logger.info("technical_check_starting", domain=ctx.domain)
+    await ctx.reporter.update({"checking": "robots.txt, TTFB, llms.txt, JS dependency"})
+
+    technical_score = None
+    try:
+        technical_score = await run_technical_checks_parallel(
+            url=ctx.start_url,
+            html=None,  # JS is checked on the crawled homepage instead
+            timeout=10.0,
+        )
+
+        logger.info(
+            "technical_check_completed",
+            score=technical_score.total_score,
+            level=technical_score.level,
+            critical_issues=len(technical_score.critical_issues),
+        )
+
+        await ctx.reporter.update(
+            {
+                "technical_score": technical_score.total_score,
+                "technical_level": technical_score.level,
+                "critical_issues": technical_score.critical_issues,
+            }
+        )
+
+        # Log warning if critical issues found but continue
+        if technical_score.critical_issues:
+            logger.warning(
+                "technical_critical_issues",
+                domain=ctx.domain,
+                issues=technical_score.critical_issues,
+            )
+
+    except Exception as e:
+        logger.warning("technical_check_failed", domain=ctx.domain, error=str(e))
+        # Continue with audit even if technical check fails
+
+    return {"technical_base": technical_score}
+
+
+async def entity_recognition_stage(ctx: AuditContext) -> dict[str, Any]:
+    """Wikipedia, Wikidata, domain age and web presence lookups."""
+    logger.info("entity_recognition_starting", domain=ctx.domain, company_name=ctx.company_name)
+    await ctx.reporter.update({"analyzing": "Wikipedia, Wikidata, domain age, web presence"})
+
+    entity_recognition_result = None
+    try:
+        analyzer = EntityRecognitionAnalyzer(
+            timeout=15.0,  # Give external APIs time
+            skip_web_presence=False,  # Include all signals
+            cache=get_entity_signal_cache(),  # Reuse lookups from earlier audits
+        )
+        entity_recognition_result = await analyzer.analyze(
+            domain=ctx.domain,
+            brand_name=ctx.company_name,
+        )
+
+        logger.info(
+            "entity_recognition_completed",
+            total_score=entity_recognition_result.total_score,
+            normalized_score=entity_recognition_result.normalized_score,
+            has_wikipedia=entity_recognition_result.wikipedia.has_page,
+            has_wikidata=entity_recognition_result.wikidata.has_entity,
+            domain_age_years=entity_recognition_result.domain_signals.domain_age_years,
+        )
+
+        await ctx.reporter.update(
+            {
+                "entity_recognition_score": entity_recognition_result.normalized_score,
+                "has_wikipedia": entity_recognition_result.wikipedia.has_page,
+                "has_wikidata": entity_recognition_result.wikidata.has_entity,
+            }
+        )
+
+    except Exception as e:
+        logger.warning("entity_recognition_failed", domain=ctx.domain, error=str(e))
+        # Continue with audit even if entity recognition fails
+
+    return {"entity_recognition_result": entity_recognition_result}
+
+
+# =========================================================
+# Crawl and per-page analysis
+# =========================================================
+
+
+async def crawl_stage(ctx: AuditContext) -> dict[str, Any]:
+    """Crawl the site."""
+    logger.info("crawl_starting", domain=ctx.domain)
+    await ctx.reporter.update({"pages_crawled": 0})
+
+    crawl_result = await ctx.crawl(None)
+
+    logger.info(
+        "crawl_completed",
+        pages_crawled=len(crawl_result.pages),
+        urls_discovered=crawl_result.urls_discovered,
+        duration_seconds=crawl_result.duration_seconds,
+    )
+
+    await ctx.reporter.update(
+        {
+            "pages_crawled": len(crawl_result.pages),
+            "urls_discovered": crawl_result.urls_discovered,
+        }
+    )
+    return {"crawl_result": crawl_result}
+
+
+async def page_analysis_stage(ctx: AuditContext, crawl_result: CrawlResult) -> dict[str, Any]:
+    """Extraction and the per-page structure, schema and authority checks."""
+    logger.info("extraction_starting", pages=len(crawl_result.pages))
+    await ctx.reporter.update({"pages_to_extract": len(crawl_result.pages)})
+
+    # Extraction and the per-page checks run together, one job per page,
+    # off the event loop.
+    async def analysis_progress(pages_done: int, pages_total: int) -> None:
+        await ctx.reporter.update({"pages_analyzed": pages_done, "pages_to_extract": pages_total})
+
+    page_analyzer = PageAnalysisExecutor(ctx.analysis_config)
+    incremental_stats: IncrementalStats | None = None
+    if ctx.baseline is not None:
+        incremental_stats = IncrementalStats.compare(crawl_result, ctx.baseline)
+    try:
+        page_results = await page_analyzer.analyze_pages(
+            crawl_result.pages,
+            progress_callback=analysis_progress,
+            previous=ctx.baseline.page_results if ctx.baseline else None,
+        )
+    finally:
+        page_analyzer.shutdown()
+
+    # Per-page HTML analysis is done; free the parsed DOMs
+    for page in crawl_result.pages:
+        page.document.release()
+
+    extraction_result = ContentExtractor.summarize(
+        crawl_result.domain, [r.extracted for r in page_results]
+    )
+
+    logger.info(
+        "extraction_completed",
+        pages_extracted=extraction_result.total_pages,
+        total_words=extraction_result.total_words,
+        errors=extraction_result.extraction_errors,
+    )
+
+    await ctx.reporter.update(
+        {
+            "pages_extracted": extraction_result.total_pages,
+            "total_words": extraction_result.total_words,
+        }
+    )
+    return {
+        "page_results": page_results,
+        "extraction_result": extraction_result,
+        "incremental_stats": incremental_stats,
+    }
+
+
+async def technical_js_stage(
+    ctx: AuditContext,  # noqa: ARG001 - Stage signature
+    technical_base: Any,
+    crawl_result: CrawlResult,
+    page_results: list,
+) -> dict[str, Any]:
+    """Update the technical score with JS detection from the homepage."""
+    technical_score = technical_base
+    if technical_score and crawl_result.pages:
+        # JS dependency was checked on the homepage HTML
+        js_result = next((r.js for r in page_results if r.js), None)
+
+        if js_result:
+            try:
+                from worker.scoring.technical import calculate_technical_score
+
+                technical_score = calculate_technical_score(
+                    robots_result=technical_score.robots_result,
+                    ttfb_result=technical_score.ttfb_result,
+                    llms_txt_result=technical_score.llms_txt_result,
+                    js_result=js_result,
+                    is_https=technical_score.is_https,
+                )
+
+                logger.info(
+                    "technical_js_detection_complete",
+                    js_dependent=js_result.likely_js_dependent,
+                    framework=js_result.framework_detected,
+                    updated_score=technical_score.total_score,
+                )
+            except Exception as e:
+                logger.warning("js_detection_failed", error=str(e))
+
+    return {"technical_score": technical_score}
+
+
+async def site_type_stage(
+    ctx: AuditContext, crawl_result: CrawlResult, page_results: list
+) -> dict[str, Any]:
+    """Classify the site's content type."""
+    site_type_result = None
+    page_urls = [page.url for page in crawl_result.pages]
+
+    try:
+        page_type_results = [r.page_type or detect_page_type(r.url) for r in page_results]
+
+        site_type_result = detect_site_type(
+            domain=ctx.domain,
+            page_urls=page_urls,
+            page_type_results=page_type_results,
+        )
+
+        logger.info(
+            "site_type_detected",
+            domain=ctx.domain,
+            site_type=site_type_result.site_type.value,
+            confidence=site_type_result.confidence,
+            citation_baseline=site_type_result.citation_baseline,
+        )
+
+    except Exception as e:
+        logger.warning("site_type_detection_failed", domain=ctx.domain, error=str(e))
+        # Continue with audit even if site type detection fails
+
+    return {"site_type_result": site_type_result, "page_urls": page_urls}
+
+
+async def structure_stage(ctx: AuditContext, page_results: list) -> dict[str, Any]:
+    """Aggregate per-page structure scores into the site score."""
+    await ctx.reporter.update({"analyzing": "headings, answer-first, FAQ, links, formats"})
+    logger.info("structure_analysis_starting", pages=len(page_results))
+
+    structure_score = None
+    try:
+        page_scores = [r.structure for r in page_results if r.structure]
+        if page_scores:
+            structure_score = aggregate_structure_scores(page_scores)
+
+            logger.info(
+                "structure_analysis_completed",
+                total_score=structure_score.total_score,
+                level=structure_score.level,
+                pages_analyzed=len(page_scores),
+            )
+
+            await ctx.reporter.update(
+                {
+                    "structure_score": structure_score.total_score,
+                    "structure_level": structure_score.level,
+                    "pages_analyzed": len(page_scores),
+                }
+            )
+
+    except Exception as e:
+        logger.warning("structure_analysis_failed", error=str(e))
+        # Continue with audit even if structure analysis fails
+
+    return {"structure_score": structure_score}
+
+
+async def schema_stage(ctx: AuditContext, page_results: list) -> dict[str, Any]:
+    """Aggregate per-page schema scores into the site score."""
+    await ctx.reporter.update({"analyzing": "FAQPage, Article, Organization, HowTo, validation"})
+    logger.info("schema_analysis_starting", pages=len(page_results))
+
+    schema_score = None
+    try:
+        schema_page_scores = [r.schema for r in page_results if r.schema]
+        if schema_page_scores:
+            schema_score = aggregate_schema_scores(schema_page_scores)
+
+            logger.info(
+                "schema_analysis_completed",
+                total_score=schema_score.total_score,
+                level=schema_score.level,
+                pages_analyzed=len(schema_page_scores),
+            )
+
+            await ctx.reporter.update(
+                {
+                    "schema_score": schema_score.total_score,
+                    "schema_level": schema_score.level,
+                    "pages_analyzed": len(schema_page_scores),
+                }
+            )
+
+    except Exception as e:
+        logger.warning("schema_analysis_failed", error=str(e))
+        # Continue with audit even if schema analysis fails
+
+    return {"schema_score": schema_score}
+
+
+async def authority_stage(ctx: AuditContext, page_results: list) -> dict[str, Any]:
+    """Aggregate per-page authority signals into the site score."""
+    await ctx.reporter.update(
+        {"analyzing": "author, credentials, citations, freshness, original data"}
+    )
+    logger.info("authority_analysis_starting", pages=len(page_results))
+
+    authority_score = None
+    try:
+        authority_page_scores = [r.authority for r in page_results if r.authority]
+        if authority_page_scores:
+            authority_score = aggregate_authority_scores(authority_page_scores)
+
+            logger.info(
+                "authority_analysis_completed",
+                total_score=authority_score.total_score,
+                level=authority_score.level,
+                pages_analyzed=len(authority_page_scores),
+            )
+
+            await ctx.reporter.update(
+                {
+                    "authority_score": authority_score.total_score,
+                    "authority_level": authority_score.level,
+                    "pages_analyzed": len(authority_page_scores),
+                }
+            )
+
+    except Exception as e:
+        logger.warning("authority_analysis_failed", error=str(e))
+        # Continue with audit even if authority analysis fails
+
+    return {"authority_score": authority_score}
+
+
+# =========================================================
+# Chunking, embedding and retrieval
+# =========================================================
+
+
+def _chunk_page(
+    ctx: AuditContext,
+    chunker: SemanticChunker,
+    page: ExtractedPage,
+    content_hash: str | None,
+    incremental_stats: IncrementalStats | None,
+) -> ChunkedPage:
+    """Chunk one page, reusing the baseline's chunks if its content is unchanged."""
+    baseline = ctx.baseline
+    chunked_page = baseline.reusable_chunks(page.url, content_hash) if baseline else None
+    if chunked_page is not None and incremental_stats is not None:
+        incremental_stats.chunks_reused += chunked_page.total_chunks
+        return chunked_page
+    return chunker.chunk_text(text=page.main_content, url=page.url, title=page.title)
+
+
+def _finish_chunking(
+    ctx: AuditContext,
+    crawl_result: CrawlResult,
+    page_results: list[PageAnalysisResult],
+    chunks_by_hash: dict[str, ChunkedPage],
+    incremental_stats: IncrementalStats | None,
+) -> None:
+    """Log what an incremental run reused and save this run as the baseline."""
+    if incremental_stats is not None:
+        previous_results = ctx.baseline.page_results if ctx.baseline else {}
+        incremental_stats.analysis_reused = sum(
+            1
+            for r in page_results
+            if r.content_hash in previous_results and previous_results[r.content_hash].url == r.url
+        )
+        logger.info("incremental_audit_stats", **incremental_stats.to_dict())
+
+    if ctx.baseline_store is not None:
+        ctx.baseline_store.save(ctx.site_id, crawl_result, page_results, chunks_by_hash)
+
+
+async def _prefetch_embeddings(
+    ctx: AuditContext, embedder: Embedder, chunked_pages: list[ChunkedPage]
+) -> None:
+    """Reuse embeddings stored by previous runs for unchanged chunks."""
+    if not ctx.persist_embeddings:
+        return
+    try:
+        async with async_session_maker() as db:
+            await embedder.prefetch(
+                db,
+                [chunk.content_hash for cp in chunked_pages for chunk in cp.chunks],
+            )
+    except Exception as e:
+        logger.warning("embedding_prefetch_failed", error=str(e))
+
+
+def _log_embedding(
+    embedder: Embedder, cache_before: dict[str, int], embedded_pages: list[EmbeddedPage]
+) -> int:
+    """Log embedding totals and cache use; returns the number of embeddings."""
+    total_embeddings = sum(len(ep.embeddings) for ep in embedded_pages)
+    cache_after = embedder.cache.metrics.to_dict()
+    logger.info(
+        "embedding_completed",
+        total_embeddings=total_embeddings,
+        cache={
+            key: cache_after[key] - cache_before[key]
+            for key in ("memory_hits", "disk_hits", "database_hits", "misses")
+        },
+    )
+    return total_embeddings
+
+
+async def chunking_stage(
+    ctx: AuditContext,
+    crawl_result: CrawlResult,
+    extraction_result: Any,
+    page_results: list,
+    incremental_stats: IncrementalStats | None,
+) -> dict[str, Any]:
+    """Chunk extracted pages, reusing unchanged pages' chunks from the baseline."""
+    await ctx.reporter.update({"chunks_created": 0})
+    logger.info("chunking_starting", pages=extraction_result.total_pages)
+
+    page_hashes = {r.url: r.content_hash for r in page_results}
+
+    def chunk_pages() -> tuple[list, dict]:
+        chunker = SemanticChunker()
+        chunked_pages = []
+        chunks_by_hash = {}
+        for page in extraction_result.pages:
+            content_hash = page_hashes.get(page.url)
+            chunked_page = _chunk_page(ctx, chunker, page, content_hash, incremental_stats)
+            chunked_pages.append(chunked_page)
+            if content_hash:
+                chunks_by_hash[content_hash] = chunked_page
+        return chunked_pages, chunks_by_hash
+
+    chunked_pages, chunks_by_hash = await asyncio.to_thread(chunk_pages)
+    total_chunks = sum(cp.total_chunks for cp in chunked_pages)
+
+    logger.info("chunking_completed", total_chunks=total_chunks)
+
+    _finish_chunking(ctx, crawl_result, page_results, chunks_by_hash, incremental_stats)
+
+    await ctx.reporter.update({"chunks_created": total_chunks})
+    return {"chunked_pages": chunked_pages, "total_chunks": total_chunks}
+
+
+async def embedding_stage(
+    ctx: AuditContext, chunked_pages: list, total_chunks: int
+) -> dict[str, Any]:
+    """Embed all chunks, reusing stored embeddings for unchanged content."""
+    await ctx.reporter.update({"chunks_to_embed": total_chunks})
+    logger.info("embedding_starting", chunks=total_chunks)
+
+    embedder = Embedder(cache=ctx.embedding_cache)
+    cache_before = embedder.cache.metrics.to_dict()
+
+    await _prefetch_embeddings(ctx, embedder, chunked_pages)
+    embedded_pages = await asyncio.to_thread(embedder.embed_pages, chunked_pages)
+
+    total_embeddings = _log_embedding(embedder, cache_before, embedded_pages)
+
+    await ctx.reporter.update({"chunks_embedded": total_embeddings})
+    return {"embedder": embedder, "embedded_pages": embedded_pages}
+
+
+async def stream_stage(ctx: AuditContext) -> dict[str, Any]:
+    """
+    Crawl, analyze, chunk and embed in one pass (see ``worker.tasks.page_stream``).
+
+    Produces the same values as the crawl, page_analysis, chunking and
+    embedding stages, but processes each page as soon as it is crawled.
+    """
+    logger.info("crawl_starting", domain=ctx.domain, streaming=True)
+    await ctx.reporter.update({"pages_crawled": 0})
+
+    async def stream_progress(pages_done: int, pages_crawled: int) -> None:
+        await ctx.reporter.update({"pages_crawled": pages_crawled, "pages_analyzed": pages_done})
+
+    chunker = SemanticChunker()
+    reuse_stats = IncrementalStats()  # Chunk reuse, counted as pages stream in
+
+    def chunk(result: PageAnalysisResult) -> ChunkedPage:
+        assert result.extracted is not None
+        return _chunk_page(
+            ctx,
+            chunker,
+            result.extracted,
+            result.content_hash,
+            reuse_stats if ctx.baseline is not None else None,
+        )
+
+    async def before_embed(embedder: Embedder, chunked_pages: list[ChunkedPage]) -> None:
+        await _prefetch_embeddings(ctx, embedder, chunked_pages)
+
+    cache_before: dict[str, int] = {}
+
+    def create_embedder() -> Embedder:
+        embedder = Embedder(cache=ctx.embedding_cache)
+        cache_before.update(embedder.cache.metrics.to_dict())
+        return embedder
+
+    page_analyzer = PageAnalysisExecutor(ctx.analysis_config)
+    stream = PageStream(
+        analyzer=page_analyzer,
+        chunk=chunk,
+        embedder_factory=create_embedder,
+        start_url=ctx.start_url,
+        config=ctx.stream_config,
+        previous=ctx.baseline.page_results if ctx.baseline else None,
+        before_embed=before_embed,
+        progress_callback=stream_progress,
+    )
+    try:
+        streamed = await stream.run(ctx.crawl)
+    finally:
+        page_analyzer.shutdown()
+
+    crawl_result = streamed.crawl
+    embedder = streamed.embedder
+    page_results = streamed.page_results
+    chunked_pages = streamed.chunked_pages
+    embedded_pages = streamed.embedded_pages
+    total_chunks = sum(cp.total_chunks for cp in chunked_pages)
+
+    logger.info(
+        "crawl_completed",
+        pages_crawled=len(crawl_result.pages),
+        urls_discovered=crawl_result.urls_discovered,
+        duration_seconds=crawl_result.duration_seconds,
+    )
+
+    extraction_result = ContentExtractor.summarize(
+        crawl_result.domain, [r.extracted for r in page_results]
+    )
+    logger.info(
+        "extraction_completed",
+        pages_extracted=extraction_result.total_pages,
+        total_words=extraction_result.total_words,
+        errors=extraction_result.extraction_errors,
+    )
+    logger.info("chunking_completed", total_chunks=total_chunks)
+    total_embeddings = _log_embedding(embedder, cache_before, embedded_pages)
+
+    incremental_stats: IncrementalStats | None = None
+    if ctx.baseline is not None:
+        incremental_stats = IncrementalStats.compare(crawl_result, ctx.baseline)
+        incremental_stats.chunks_reused = reuse_stats.chunks_reused
+    chunks_by_hash = {
+        p.result.content_hash: p.chunked
+        for p in streamed.pages
+        if p.result.content_hash and p.chunked is not None
+    }
+    _finish_chunking(ctx, crawl_result, page_results, chunks_by_hash, incremental_stats)
+
+    await ctx.reporter.update(
+        {
+            "pages_crawled": len(crawl_result.pages),
+            "urls_discovered": crawl_result.urls_discovered,
+            "pages_extracted": extraction_result.total_pages,
+            "total_words": extraction_result.total_words,
+            "chunks_created": total_chunks,
+            "chunks_embedded": total_embeddings,
+        }
+    )
+    return {
+        "crawl_result": crawl_result,
+        "page_results": page_results,
+        "extraction_result": extraction_result,
+        "incremental_stats": incremental_stats,
+        "chunked_pages": chunked_pages,
+        "total_chunks": total_chunks,
+        "embedder": embedder,
+        "embedded_pages": embedded_pages,
+    }
+
+
+async def indexing_stage(
+    ctx: AuditContext, embedder: Embedder, embedded_pages: list, chunked_pages: list
+) -> dict[str, Any]:
+    """Persist embeddings and build the in-memory retriever for this run."""
+    logger.info("indexing_starting", pages=len(embedded_pages))
+
+    retriever = HybridRetriever(embedder=embedder)
+
+    embedding_rows: list[dict] = []
+    retriever_documents: list[dict] = []
+    for page_idx, ep in enumerate(embedded_pages):
+        # Generate a stable page_id from URL hash
+        page_id = uuid.uuid5(uuid.NAMESPACE_URL, ep.url)
+
+        for emb_result in ep.embeddings:
+            chunk = chunked_pages[page_idx].chunks[emb_result.chunk_index]
+
+            if ctx.persist_embeddings:
+                embedding_rows.append(
+                    {
+                        "chunk_id": uuid.uuid5(page_id, emb_result.content_hash),
+                        "page_id": page_id,
+                        "site_id": ctx.site_id,
+                        "content": chunk.content,
+                        "content_hash": emb_result.content_hash,
+                        "embedding": emb_result.embedding,
+                        "model_name": embedder.model_id,
+                        "chunk_index": emb_result.chunk_index,
+                        "chunk_type": (
+                            chunk.chunk_type.value
+                            if hasattr(chunk.chunk_type, "value")
+                            else str(chunk.chunk_type)
+                        ),
+                        "heading_context": emb_result.heading_context,
+                        "position_ratio": (
+                            chunk.position_ratio if hasattr(chunk, "position_ratio") else 0.0
+                        ),
+                        "source_url": emb_result.source_url,
+                        "page_title": emb_result.page_title,
+                    }
+                )
+            retriever_documents.append(
+                {
+                    "doc_id": emb_result.content_hash,
+                    "content": chunk.content,
+                    "embedding": emb_result.embedding,
+                    "source_url": emb_result.source_url,
+                    "page_title": emb_result.page_title,
+                    "heading_context": emb_result.heading_context,
+                }
+            )
+
+    # Persist embeddings to database for future reuse
+    write_result = None
+    if ctx.persist_embeddings:
+        async with async_session_maker() as db:
+            write_result = await EmbeddingStore().store_embeddings_bulk(db, embedding_rows)
+            await db.commit()
+
+    # Also add to in-memory retriever for this run
+    await asyncio.to_thread(retriever.add_documents, retriever_documents)
+
+    logger.info(
+        "indexing_completed",
+        documents=len(retriever._documents),
+        persisted=write_result.rows if write_result else 0,
+        write_method=write_result.method if write_result else None,
+        rows_per_second=round(write_result.rows_per_second, 1) if write_result else 0.0,
+    )
+    return {"retriever": retriever}
+
+
+async def questions_stage(ctx: AuditContext, extraction_result: Any) -> dict[str, Any]:
+    """Generate the questions to simulate from the site's schema and headings."""
+    await ctx.reporter.update({})
+    logger.info("question_generation_starting", company=ctx.company_name)
+
+    # Collect schema types and headings from extraction
+    schema_types = list(set(extraction_result.schema_types_found))
+    headings: dict[str, list[str]] = {"h1": [], "h2": [], "h3": []}
+    for page in extraction_result.pages:
+        page_headings = page.metadata.headings or {}
+        for level in ["h1", "h2", "h3"]:
+            if level in page_headings:
+                headings[level].extend(page_headings[level])
+
+    site_context = SiteContext(
+        company_name=ctx.company_name,
+        domain=ctx.domain,
+        schema_types=schema_types,
+        headings=headings,
+    )
+
+    questions = QuestionGenerator().generate(site_context)
+
+    logger.info("question_generation_completed", questions=len(questions))
+
+    await ctx.reporter.update({"questions_generated": len(questions)})
+    return {"questions": questions}
+
+
+async def simulation_stage(ctx: AuditContext, retriever: Any, questions: list) -> dict[str, Any]:
+    """Answer every question from the retriever."""
+    await ctx.reporter.update({"questions_processed": 0, "questions_total": len(questions)})
+    logger.info("simulation_starting", questions=len(questions))
+
+    simulation_runner = SimulationRunner(retriever=retriever)
+    simulation_result = await asyncio.to_thread(
+        simulation_runner.run,
+        site_id=ctx.site_id,
+        run_id=ctx.run_id or uuid.uuid4(),
+        company_name=ctx.company_name,
+        questions=questions,
+    )
+
+    logger.info(
+        "simulation_completed",
+        overall_score=simulation_result.overall_score,
+        questions_answered=simulation_result.questions_answered,
+        questions_partial=simulation_result.questions_partial,
+        questions_unanswered=simulation_result.questions_unanswered,
+    )
+
+    await ctx.reporter.update(
+        {"questions_processed": len(questions), "questions_total": len(questions)}
+    )
+    return {"simulation_result": simulation_result}
+
+
+# =========================================================
+# Observation, scoring, fixes and report
+# =========================================================
+
+
+def _calibration_pillar_scores(
+    ctx: AuditContext,
+    simulation_result: Any,
+    questions: list,
+    technical_score: Any,
+    structure_score: Any,
+    schema_score: Any,
+    authority_score: Any,
+    entity_recognition_result: Any,
+    site_type_result: Any,
+    page_urls: list[str],
+    extraction_result: Any,
+) -> dict | None:
+    """Pillar scores stored with calibration samples."""
+    if not (
+        technical_score
+        or structure_score
+        or schema_score
+        or authority_score
+        or entity_recognition_result
+        or simulation_result
+    ):
+        return None
+
+    pillar_scores_snapshot = {
+        "technical": technical_score.total_score if technical_score else None,
+        "structure": structure_score.total_score if structure_score else None,
+        "schema": schema_score.total_score if schema_score else None,
+        "authority": authority_score.total_score if authority_score else None,
+        "entity_recognition": (
+            entity_recognition_result.normalized_score if entity_recognition_result else None
+        ),
+        "retrieval": simulation_result.overall_score if simulation_result else None,
+        "coverage": simulation_result.coverage_score if simulation_result else None,
+    }
+    site_type = site_type_result.site_type if site_type_result else SiteType.MIXED
+    pages_content_list = [
+        p.main_content
+        for p in extraction_result.pages
+        if hasattr(p, "main_content") and p.main_content
+    ]
+
+    # Add source primacy score (0-100 scale) for optimizer
+    try:
+        from worker.extraction.source_primacy import analyze_source_primacy
+
+        primacy_result = analyze_source_primacy(
+            domain=ctx.domain,
+            site_type=site_type,
+            page_urls=page_urls if page_urls else [],
+            brand_name=ctx.company_name,
+            pages_content=pages_content_list,
+        )
+        # Store as 0-100 to match pillar score scale
+        pillar_scores_snapshot["source_primacy"] = round(primacy_result.primacy_score * 100, 1)
+    except Exception as e:
+        logger.warning("source_primacy_for_calibration_failed", error=str(e))
+
+    # Add content uniqueness score directly for optimizer
+    try:
+        from worker.extraction.content_uniqueness import analyze_content_uniqueness
+
+        if pages_content_list:
+            uniqueness = analyze_content_uniqueness(
+                pages_content=pages_content_list,
+                page_urls=page_urls if page_urls else [],
+                domain=ctx.domain,
+            )
+            pillar_scores_snapshot["content_uniqueness"] = round(uniqueness.score, 1)
+    except Exception as e:
+        logger.warning("content_uniqueness_for_calibration_failed", error=str(e))
+
+    # Add competitive density score for optimizer
+    try:
+        from worker.scoring.competitive_density import analyze_competitive_density
+
+        question_categories = [
+            q.category if hasattr(q, "category") else "unknown" for q in questions
+        ]
+        # Determine if each question is about the site's own brand
+        is_own_brand = [
+            (
+                ctx.company_name.lower() in q.text.lower()
+                or ctx.domain.split(".")[0].lower() in q.text.lower()
+            )
+            for q in questions
+        ]
+
+        density_result = analyze_competitive_density(
+            site_type=site_type,
+            question_categories=question_categories,
+            is_own_brand_query=is_own_brand,
+            domain=ctx.domain,
+        )
+        # Store inverse (high = less competition = better)
+        pillar_scores_snapshot["competitive_density"] = round(density_result.inverse_score, 1)
+    except Exception as e:
+        logger.warning("competitive_density_for_calibration_failed", error=str(e))
+
+    return pillar_scores_snapshot
+
+
+async def observation_stage(
+    ctx: AuditContext,
+    questions: list,
+    simulation_result: Any,
+    technical_score: Any,
+    structure_score: Any,
+    schema_score: Any,
+    authority_score: Any,
+    entity_recognition_result: Any,
+    site_type_result: Any,
+    page_urls: list[str],
+    extraction_result: Any,
+) -> dict[str, Any]:
+    """Ask real AI models the questions and compare with the simulation."""
+    from api.config import get_settings
+
+    settings = get_settings()
+    await ctx.reporter.update({"questions_to_observe": len(questions)})
+    logger.info("observation_starting", questions=len(questions))
+
+    observation_run = None
+    comparison_summary = None
+    try:
+        # Create questions list for observation (question_id, question_text tuples)
+        observation_questions = [(str(q.id), q.text) for q in questions]
+
+        observation_runner = ObservationRunner(config=RunConfig.from_settings())
+        observation_run = await observation_runner.run_observation(
+            site_id=ctx.site_id,
+            run_id=ctx.run_id,
+            company_name=ctx.company_name,
+            domain=ctx.domain,
+            questions=observation_questions,
+        )
+
+        logger.info(
+            "observation_completed",
+            status=observation_run.status.value,
+            mention_rate=observation_run.company_mention_rate,
+            citation_rate=observation_run.citation_rate,
+            total_cost=(
+                observation_run.total_usage.estimated_cost_usd if observation_run.total_usage else 0
+            ),
+        )
+
+        # Compare simulation with observation
+        comparison_summary = compare_simulation_observation(
+            simulation=simulation_result,
+            observation=observation_run,
+        )
+
+        logger.info(
+            "comparison_completed",
+            prediction_accuracy=comparison_summary.prediction_accuracy,
+            optimistic_predictions=comparison_summary.optimistic_predictions,
+            pessimistic_predictions=comparison_summary.pessimistic_predictions,
+        )
+
+        # Collect calibration samples for learning
+        if settings.calibration_enabled and settings.calibration_sample_collection:
+            pillar_scores_snapshot = _calibration_pillar_scores(
+                ctx,
+                simulation_result,
+                questions,
+                technical_score,
+                structure_score,
+                schema_score,
+                authority_score,
+                entity_recognition_result,
+                site_type_result,
+                page_urls,
+                extraction_result,
+            )
+
+            samples_collected = await collect_calibration_samples(
+                run_id=ctx.run_id,
+                simulation_result=simulation_result,
+                observation_run=observation_run,
+                pillar_scores=pillar_scores_snapshot,  # type: ignore[arg-type]
+                site_type=(site_type_result.site_type.value if site_type_result else None),
+            )
+
+            logger.info("calibration_samples_collected", samples=samples_collected)
+
+        await ctx.reporter.update(
+            {
+                "questions_observed": len(observation_run.results),
+                "mention_rate": observation_run.company_mention_rate,
+                "citation_rate": observation_run.citation_rate,
+            }
+        )
+
+    except Exception as e:
+        logger.warning("observation_failed", error=str(e))
+        # Continue with audit even if observation fails
+
+    return {"observation_run": observation_run, "comparison_summary": comparison_summary}
+
+
+async def scoring_stage(ctx: AuditContext, simulation_result: Any) -> dict[str, Any]:
+    """Calculate the Findable Score."""
+    await ctx.reporter.update({})
+    logger.info("scoring_starting")
+
+    score_breakdown = ScoreCalculator().calculate(simulation_result)
+
+    logger.info(
+        "scoring_completed",
+        total_score=score_breakdown.total_score,
+        grade=score_breakdown.grade,
+    )
+    return {"score_breakdown": score_breakdown}
+
+
+async def fixes_stage(
+    ctx: AuditContext,
+    simulation_result: Any,
+    extraction_result: Any,
+    technical_score: Any,
+    structure_score: Any,
+    schema_score: Any,
+    authority_score: Any,
+) -> dict[str, Any]:
+    """Generate the fix plan, and log the per-pillar fixes."""
+    await ctx.reporter.update({})
+    logger.info("fix_generation_starting")
+
+    # Build site content map for fix generation
+    site_content = {page.url: page.main_content for page in extraction_result.pages}
+
+    fix_plan = FixGenerator().generate(
+        simulation=simulation_result,
+        site_content=site_content,
+    )
+
+    logger.info(
+        "fix_generation_completed",
+        total_fixes=fix_plan.total_fixes,
+        critical_fixes=fix_plan.critical_fixes,
+    )
+
+    # Pillar fixes are included in the report via each pillar's section
+    for name, score, generate in (
+        ("technical", technical_score, generate_technical_fixes),
+        ("structure", structure_score, generate_structure_fixes),
+        ("schema", schema_score, generate_schema_fixes),
+        ("authority", authority_score, generate_authority_fixes),
+    ):
+        if score:
+            pillar_fixes = generate(score)
+            if pillar_fixes:
+                logger.info(
+                    f"{name}_fixes_generated",
+                    count=len(pillar_fixes),
+                    fixes=[f["title"] for f in pillar_fixes],
+                )
+
+    return {"fix_plan": fix_plan}
+
+
+async def report_stage(
+    ctx: AuditContext,
+    crawl_result: CrawlResult,
+    extraction_result: Any,
+    chunked_pages: list,
+    total_chunks: int,
+    simulation_result: Any,
+    score_breakdown: Any,
+    fix_plan: Any,
+    observation_run: Any,
+    comparison_summary: Any,
+    technical_score: Any,
+    structure_score: Any,
+    schema_score: Any,
+    authority_score: Any,
+    entity_recognition_result: Any,
+    site_type_result: Any,
+) -> dict[str, Any]:
+    """Assemble the full report."""
+    await ctx.reporter.update({})
+    run_completed_at = datetime.now(UTC)
+    logger.info("report_assembly_starting")
+
+    # Build crawl data for report
+    crawl_pages_data = []
+    for i, page in enumerate(crawl_result.pages):
+        # Find matching extraction and chunk data
+        word_count = 0
+        chunk_count = 0
+        if i < len(extraction_result.pages):
+            word_count = extraction_result.pages[i].word_count
+        if i < len(chunked_pages):
+            chunk_count = chunked_pages[i].total_chunks
+
+        crawl_pages_data.append(
+            {
+                "url": page.url,
+                "title": page.title,
+                "status_code": page.status_code,
+                "depth": page.depth,
+                "word_count": word_count,
+                "chunk_count": chunk_count,
+            }
+        )
+
+    crawl_data = {
+        "total_pages": len(crawl_result.pages),
+        "total_words": extraction_result.total_words,
+        "total_chunks": total_chunks,
+        "urls_discovered": crawl_result.urls_discovered,
+        "urls_failed": crawl_result.urls_failed,
+        "max_depth_reached": crawl_result.max_depth_reached,
+        "duration_seconds": crawl_result.duration_seconds,
+        "pages": crawl_pages_data,
+    }
+
+    full_report = assemble_report(
+        site_id=ctx.site_id,
+        run_id=ctx.run_id,
+        company_name=ctx.company_name,
+        domain=ctx.domain,
+        simulation=simulation_result,
+        score_breakdown=score_breakdown,
+        fix_plan=fix_plan,
+        observation=observation_run,
+        comparison=comparison_summary,
+        crawl_data=crawl_data,
+        technical_score=technical_score,
+        structure_score=structure_score,
+        schema_score=schema_score,
+        authority_score=authority_score,
+        entity_recognition_result=entity_recognition_result,
+        site_type_result=site_type_result,
+    )
+
+    logger.info("report_assembly_completed", report_id=str(full_report.metadata.report_id))
+    return {"full_report": full_report, "run_completed_at": run_completed_at}
+
+
+_PILLARS = ("technical_score", "structure_score", "schema_score", "authority_score")
+
+
+def build_audit_graph(include_observation: bool = False, streaming: bool = False) -> StageGraph:
+    """
+    The audit pipeline's stages.
+
+    Args:
+        include_observation: Include the observation stage (real AI calls).
+            Without it, ``observation_run`` and ``comparison_summary`` must
+            be given as initial values.
+        streaming: Analyze, chunk and embed pages while the crawl runs (one
+            ``stream`` stage) instead of in separate stages after it
+    """
+    if streaming:
+        page_stages = [
+            Stage(
+                "stream",
+                stream_stage,
+                (),
+                (
+                    "crawl_result",
+                    "page_results",
+                    "extraction_result",
+                    "incremental_stats",
+                    "chunked_pages",
+                    "total_chunks",
+                    "embedder",
+                    "embedded_pages",
+                ),
+                "crawling",
+            )
+        ]
+    else:
+        page_stages = [
+            Stage("crawl", crawl_stage, (), ("crawl_result",), "crawling"),
+            Stage(
+                "page_analysis",
+                page_analysis_stage,
+                ("crawl_result",),
+                ("page_results", "extraction_result", "incremental_stats"),
+                "extracting",
+            ),
+            Stage(
+                "chunking",
+                chunking_stage,
+                ("crawl_result", "extraction_result", "page_results", "incremental_stats"),
+                ("chunked_pages", "total_chunks"),
+                "chunking",
+            ),
+            Stage(
+                "embedding",
+                embedding_stage,
+                ("chunked_pages", "total_chunks"),
+                ("embedder", "embedded_pages"),
+                "embedding",
+            ),
+        ]
+
+    stages = [
+        *page_stages,
+        Stage("technical_check", technical_check_stage, (), ("technical_base",), "technical_check"),
+        Stage(
+            "entity_recognition",
+            entity_recognition_stage,
+            (),
+            ("entity_recognition_result",),
+            "entity_recognition",
+        ),
+        Stage(
+            "technical_js",
+            technical_js_stage,
+            ("technical_base", "crawl_result", "page_results"),
+            ("technical_score",),
+        ),
+        Stage(
+            "site_type",
+            site_type_stage,
+            ("crawl_result", "page_results"),
+            ("site_type_result", "page_urls"),
+        ),
+        Stage(
+            "structure",
+            structure_stage,
+            ("page_results",),
+            ("structure_score",),
+            "structure_analysis",
+        ),
+        Stage("schema", schema_stage, ("page_results",), ("schema_score",), "schema_analysis"),
+        Stage(
+            "authority",
+            authority_stage,
+            ("page_results",),
+            ("authority_score",),
+            "authority_analysis",
+        ),
+        Stage(
+            "indexing",
+            indexing_stage,
+            ("embedder", "embedded_pages", "chunked_pages"),
+            ("retriever",),
+        ),
+        Stage(
+            "questions",
+            questions_stage,
+            ("extraction_result",),
+            ("questions",),
+            "generating_questions",
+        ),
+        Stage(
+            "simulation",
+            simulation_stage,
+            ("retriever", "questions"),
+            ("simulation_result",),
+            "simulating",
+        ),
+        Stage("scoring", scoring_stage, ("simulation_result",), ("score_breakdown",), "scoring"),
+        Stage(
+            "fixes",
+            fixes_stage,
+            ("simulation_result", "extraction_result", *_PILLARS),
+            ("fix_plan",),
+            "generating_fixes",
+        ),
+        Stage(
+            "report",
+            report_stage,
+            (
+                "crawl_result",
+                "extraction_result",
+                "chunked_pages",
+                "total_chunks",
+                "simulation_result",
+                "score_breakdown",
+                "fix_plan",
+                "observation_run",
+                "comparison_summary",
+                *_PILLARS,
+                "entity_recognition_result",
+                "site_type_result",
+            ),
+            ("full_report", "run_completed_at"),
+            "assembling",
+        ),
+    ]
+    if include_observation:
+        stages.append(
+            Stage(
+                "observation",
+                observation_stage,
+                (
+                    "questions",
+                    "simulation_result",
+                    *_PILLARS,
+                    "entity_recognition_result",
+                    "site_type_result",
+                    "page_urls",
+                    "extraction_result",
+                ),
+                ("observation_run", "comparison_summary"),
+                "observing",
+            )
+        )
+    return StageGraph(stages)
@@ -7,6 +7,7 @@ missing or weak authority signals.
 import structlog
 
 from worker.extraction.authority import analyze_authority
+from worker.extraction.document import PageDocument
 from worker.scoring.authority import AuthoritySignalsScore, calculate_authority_score
 
 logger = structlog.get_logger(__name__)
@@ -52,6 +53,7 @@ def run_authority_checks_sync(
     html: str,
     url: str,
     main_content: str = "",
+    document: PageDocument | None = None,
 ) -> AuthoritySignalsScore:
     """
     Synchronous version of authority checks.
@@ -60,11 +62,12 @@ def run_authority_checks_sync(
         html: Full HTML content
         url: Page URL
         main_content: Extracted main content text
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         AuthoritySignalsScore with all component scores
     """
-    authority_analysis = analyze_authority(html, url, main_content)
+    authority_analysis = analyze_authority(html, url, main_content, document=document)
     return calculate_authority_score(authority_analysis)
 
 
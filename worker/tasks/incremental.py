@@ -0,0 +1,290 @@
+"""Incremental re-audits for monitoring runs.
+
+After each audit the crawl (HTML plus ETag/Last-Modified validators), the
+per-page analysis results and the chunks are saved as the site's baseline.
+The next incremental run:
+
+1. Re-crawls with conditional requests, so unchanged pages answer
+   ``304 Not Modified`` and reuse the stored HTML.
+2. Reuses analysis results and chunks for every page whose content hash
+   matches the baseline, analyzing and chunking only changed pages.
+3. Embeds only new chunks; unchanged ones hit the embedding cache by
+   content hash (see ``worker.embeddings.cache``).
+
+Site-level aggregation (scoring, questions, simulation) always runs on the
+full page set.
+
+Saved analysis results and chunks are tagged with :func:`analysis_version`,
+a digest of the per-page analysis and chunking code and the HTML parser
+backend. After a deploy that
+changes that code, older results are ignored and every page is analyzed
+again; the stored crawl is still used for conditional requests.
+
+Baselines live under ``audit_baseline_dir``, which must be a volume shared
+by every worker and kept across deploys; otherwise runs land on hosts
+without a baseline. A missing or unreadable baseline means a full audit.
+"""
+
+import hashlib
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from uuid import UUID
+
+import structlog
+
+from worker.chunking.chunker import ChunkedPage
+from worker.crawler.crawler import CrawlPage, CrawlResult
+from worker.crawler.storage import CrawlStorage
+from worker.extraction.document import get_default_parser
+from worker.tasks.page_analysis import PageAnalysisResult
+
+logger = structlog.get_logger(__name__)
+
+RESULTS_FILE = "results.pkl"
+GC_MARKER_FILE = ".last_gc"
+
+# Bump to invalidate saved results for changes the source digest can't see
+# (e.g. a dependency upgrade that changes extraction output)
+ANALYSIS_VERSION = 1
+
+# Code whose output is stored in baselines (relative to the worker package)
+_ANALYSIS_SOURCES = (
+    "chunking",
+    "extraction",
+    "scoring",
+    "tasks/page_analysis.py",
+    "tasks/authority_check.py",
+    "tasks/schema_check.py",
+    "tasks/structure_check.py",
+)
+
+
+def analysis_version() -> str:
+    """Version of the per-page analysis and chunking code.
+
+    ``ANALYSIS_VERSION`` plus a digest of the source files that produce
+    saved results, so any deploy that changes them invalidates baselines.
+    The HTML parser backend is included too: lxml and html.parser repair
+    malformed pages differently.
+    """
+    return _analysis_version(get_default_parser())
+
+
+@lru_cache
+def _analysis_version(parser: str) -> str:
+    root = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256(f"{ANALYSIS_VERSION}:{parser}".encode())
+    for source in _ANALYSIS_SOURCES:
+        path = root / source
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            digest.update(file.relative_to(root).as_posix().encode())
+            try:
+                digest.update(file.read_bytes())
+            except OSError:
+                continue
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class AuditBaseline:
+    """Reusable state from a site's previous audit."""
+
+    crawl: CrawlResult
+    page_results: dict[str, PageAnalysisResult] = field(default_factory=dict)  # by content hash
+    chunked_pages: dict[str, ChunkedPage] = field(default_factory=dict)  # by content hash
+
+    @property
+    def pages_by_url(self) -> dict[str, CrawlPage]:
+        return {page.url: page for page in self.crawl.pages}
+
+    def reusable_chunks(self, url: str, content_hash: str | None) -> ChunkedPage | None:
+        """Chunks stored for a page with the same URL and content, if any."""
+        if content_hash is None:
+            return None
+        chunked = self.chunked_pages.get(content_hash)
+        if chunked is None or chunked.url != url:
+            return None
+        return chunked
+
+
+@dataclass
+class IncrementalStats:
+    """How much of an incremental audit was reused."""
+
+    pages_total: int = 0
+    pages_not_modified: int = 0  # Answered 304 to a conditional request
+    pages_unchanged: int = 0  # Same content hash as the baseline
+    pages_changed: int = 0
+    pages_new: int = 0
+    analysis_reused: int = 0
+    chunks_reused: int = 0
+
+    @classmethod
+    def compare(cls, crawl: CrawlResult, baseline: AuditBaseline) -> "IncrementalStats":
+        """Classify crawled pages against the baseline."""
+        previous = baseline.pages_by_url
+        stats = cls(pages_total=len(crawl.pages), pages_not_modified=crawl.pages_not_modified)
+        for page in crawl.pages:
+            prior = previous.get(page.url)
+            if prior is None:
+                stats.pages_new += 1
+            elif prior.content_hash == page.content_hash:
+                stats.pages_unchanged += 1
+            else:
+                stats.pages_changed += 1
+        return stats
+
+    def to_dict(self) -> dict:
+        return {
+            "pages_total": self.pages_total,
+            "pages_not_modified": self.pages_not_modified,
+            "pages_unchanged": self.pages_unchanged,
+            "pages_changed": self.pages_changed,
+            "pages_new": self.pages_new,
+            "analysis_reused": self.analysis_reused,
+            "chunks_reused": self.chunks_reused,
+        }
+
+
+class AuditBaselineStore:
+    """
+    On-disk store of per-site audit baselines.
+
+    The crawl is kept in ``CrawlStorage`` under the site ID; analysis
+    results and chunks are pickled beside it. Only this worker writes the
+    files, so unpickling them is safe. Page blobs no baseline references
+    any more are garbage collected at most every ``gc_interval_seconds``,
+    tracked by a marker file so the schedule holds across forked jobs.
+    """
+
+    def __init__(self, base_path: Path | str, gc_interval_seconds: float = 3600.0):
+        self.storage = CrawlStorage(base_path)
+        self.gc_interval_seconds = gc_interval_seconds
+
+    def load(self, site_id: UUID | str) -> AuditBaseline | None:
+        """
+        Load the baseline saved by the site's previous audit.
+
+        Args:
+            site_id: The site ID
+
+        Returns:
+            AuditBaseline, or None if there is none or it cannot be read
+        """
+        key = str(site_id)
+        try:
+            crawl = self.storage.load_crawl(key)
+            if crawl is None:
+                return None
+
+            results_path = self.storage.base_path / key / RESULTS_FILE
+            page_results: dict[str, PageAnalysisResult] = {}
+            chunked_pages: dict[str, ChunkedPage] = {}
+            if results_path.exists():
+                with results_path.open("rb") as f:
+                    saved = pickle.load(f)
+                if isinstance(saved, dict) and saved.get("version") == analysis_version():
+                    page_results = saved["page_results"]
+                    chunked_pages = saved["chunked_pages"]
+                else:
+                    logger.info("audit_baseline_results_outdated", site_id=key)
+        except Exception as e:
+            logger.warning("audit_baseline_load_failed", site_id=key, error=str(e))
+            return None
+
+        return AuditBaseline(crawl=crawl, page_results=page_results, chunked_pages=chunked_pages)
+
+    def save(
+        self,
+        site_id: UUID | str,
+        crawl: CrawlResult,
+        page_results: list[PageAnalysisResult],
+        chunked_pages: dict[str, ChunkedPage],
+    ) -> bool:
+        """
+        Replace the site's baseline with this audit's state.
+
+        Args:
+            site_id: The site ID
+            crawl: The crawl result
+            page_results: Per-page analysis results
+            chunked_pages: Chunks keyed by the page's content hash
+
+        Returns:
+            True if saved, False otherwise
+        """
+        key = str(site_id)
+        try:
+            self.storage.store_crawl(crawl, crawl_id=key)
+            results = {r.content_hash: r for r in page_results if r.content_hash and not r.errors}
+            results_path = self.storage.base_path / key / RESULTS_FILE
+            tmp_path = results_path.with_suffix(".tmp")
+            saved = {
+                "version": analysis_version(),
+                "page_results": results,
+                "chunked_pages": chunked_pages,
+            }
+            with tmp_path.open("wb") as f:
+                pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(results_path)
+
+            if self._gc_due():
+                self.storage.collect_garbage()
+        except Exception as e:
+            logger.warning("audit_baseline_save_failed", site_id=key, error=str(e))
+            return False
+
+        logger.info(
+            "audit_baseline_saved",
+            site_id=key,
+            pages=len(crawl.pages),
+            results=len(results),
+            chunked_pages=len(chunked_pages),
+        )
+        return True
+
+    def _gc_due(self) -> bool:
+        """Whether to collect garbage now; claims the pass if so.
+
+        The last pass is recorded as the marker file's mtime, which every
+        process sees, unlike an in-memory counter in a forked job.
+        """
+        if not self.gc_interval_seconds:
+            return False
+        marker = self.storage.base_path / GC_MARKER_FILE
+        now = time.time()
+        try:
+            if now - marker.stat().st_mtime < self.gc_interval_seconds:
+                return False
+        except FileNotFoundError:
+            pass
+        marker.touch()
+        return True
+
+
+# Process-wide store, so the blob index connection is shared
+_baseline_store: AuditBaselineStore | None = None
+
+
+def get_audit_baseline_store() -> AuditBaselineStore:
+    """Get the baseline store configured from settings."""
+    global _baseline_store
+    if _baseline_store is None:
+        from api.config import get_settings
+
+        settings = get_settings()
+        path = settings.audit_baseline_dir
+        if not path:
+            path = str(Path(tempfile.gettempdir()) / "findable-baselines")
+            logger.warning(
+                "audit_baseline_dir_not_shared",
+                path=path,
+                hint="Set AUDIT_BASELINE_DIR to a shared volume",
+            )
+        _baseline_store = AuditBaselineStore(path)
+    return _baseline_store
@@ -39,9 +39,9 @@ def run_snapshot_sync(
 
     This is the entry point for RQ which requires sync functions.
     """
-    import asyncio
+    from worker.http_pool import run_with_http_pool
 
-    return asyncio.run(
+    return run_with_http_pool(
         run_snapshot(
             uuid.UUID(site_id),
             trigger,
@@ -114,6 +114,8 @@ async def run_snapshot(
                     "include_observation": include_observation,
                     "include_benchmark": include_benchmark,
                     "trigger": trigger,
+                    # Re-crawl conditionally and reuse unchanged pages
+                    "incremental": True,
                 },
             )
             db.add(run)
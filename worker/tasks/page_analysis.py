@@ -0,0 +1,334 @@
+"""Parallel per-page analysis for audit runs.
+
+Extraction, JS detection, page-type detection and the structure, schema
+and authority checks are pure CPU work on independent pages. Running them
+serially inside ``run_audit`` blocked the event loop for seconds on large
+sites, so they are fanned out here as one job per page:
+
+- Small crawls (or ``workers=1``) run in a thread, reusing the documents
+  the crawler already parsed.
+- Larger crawls run in a process pool. Pages are pickled without their
+  parsed DOM (see ``PageDocument``) and each worker parses a page once for
+  all of its checks.
+
+Results come back in crawl order, and the progress callback is awaited
+from the event loop while the pool works. For incremental re-audits,
+results from the previous run are reused for pages whose HTML is unchanged.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from typing import TypeVar
+
+import structlog
+
+from worker.crawler.crawler import CrawlPage
+from worker.extraction.extractor import ContentExtractor, ExtractedPage
+from worker.extraction.js_detection import JSDetectionResult, detect_js_dependency
+from worker.extraction.page_type import PageTypeResult, detect_page_type
+from worker.scoring.authority import AuthoritySignalsScore
+from worker.scoring.schema import SchemaRichnessScore
+from worker.scoring.structure import StructureQualityScore
+from worker.tasks.authority_check import run_authority_checks_sync
+from worker.tasks.schema_check import run_schema_checks_sync
+from worker.tasks.structure_check import run_structure_checks_sync
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+@dataclass
+class PageAnalysisConfig:
+    """Configuration for per-page analysis."""
+
+    workers: int = 0  # 0 = one process per CPU, 1 = run in-process
+    min_pages_for_pool: int = 8  # Smaller crawls are not worth the pool overhead
+    start_method: str | None = None  # multiprocessing start method (platform default)
+    progress_interval_seconds: float = 1.0  # Minimum time between progress callbacks
+
+    @property
+    def max_workers(self) -> int:
+        return self.workers or os.cpu_count() or 1
+
+
+@dataclass
+class PageAnalysisResult:
+    """Everything computed for one crawled page."""
+
+    index: int
+    url: str
+    extracted: ExtractedPage | None = None
+    page_type: PageTypeResult | None = None
+    js: JSDetectionResult | None = None
+    structure: StructureQualityScore | None = None
+    schema: SchemaRichnessScore | None = None
+    authority: AuthoritySignalsScore | None = None
+    errors: dict[str, str] = field(default_factory=dict)
+    content_hash: str | None = None  # Hash of the analyzed HTML (see CrawlPage.content_hash)
+
+
+def analyze_page(page: CrawlPage, index: int, detect_js: bool = False) -> PageAnalysisResult:
+    """
+    Run every per-page analysis on a single crawled page.
+
+    This is the unit of work submitted to the pool, so it must stay a
+    module-level function with picklable arguments and result. A failing
+    check is recorded in ``errors`` without affecting the others.
+
+    Args:
+        page: The crawled page
+        index: Position of the page in the crawl
+        detect_js: Whether to run JS dependency detection (homepage only)
+
+    Returns:
+        PageAnalysisResult for the page
+    """
+    result = PageAnalysisResult(index=index, url=page.url)
+    if not page.html:
+        return result
+    result.content_hash = page.content_hash
+
+    document = page.document
+
+    def run(name: str, check: Callable[[], T]) -> T | None:
+        try:
+            return check()
+        except Exception as e:
+            result.errors[name] = str(e)
+            return None
+
+    result.extracted = ContentExtractor().extract_page(page)
+    result.page_type = run(
+        "page_type", lambda: detect_page_type(page.url, page.html, document=document)
+    )
+    if detect_js:
+        result.js = run("js", lambda: detect_js_dependency(page.html, page.url, document=document))
+    result.schema = run(
+        "schema", lambda: run_schema_checks_sync(page.html, page.url, document=document)
+    )
+
+    extracted = result.extracted
+    if extracted is not None:
+        result.structure = run(
+            "structure",
+            lambda: run_structure_checks_sync(
+                page.html,
+                page.url,
+                main_content=extracted.main_content,
+                word_count=extracted.word_count,
+                document=document,
+            ),
+        )
+        result.authority = run(
+            "authority",
+            lambda: run_authority_checks_sync(
+                page.html,
+                page.url,
+                main_content=extracted.main_content,
+                document=document,
+            ),
+        )
+
+    return result
+
+
+class PageAnalysisExecutor:
+    """Runs ``analyze_page`` over a crawl on a thread or process pool."""
+
+    def __init__(self, config: PageAnalysisConfig | None = None):
+        self.config = config or PageAnalysisConfig()
+        self._pool: ProcessPoolExecutor | None = None
+        self._submitted = 0  # Pages passed to analyze()
+        self._pool_broken = False
+
+    def uses_processes(self, page_count: int) -> bool:
+        return self.config.max_workers > 1 and page_count >= self.config.min_pages_for_pool
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            context = (
+                multiprocessing.get_context(self.config.start_method)
+                if self.config.start_method
+                else None
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.config.max_workers, mp_context=context
+            )
+        return self._pool
+
+    async def analyze_pages(
+        self,
+        pages: list[CrawlPage],
+        progress_callback: ProgressCallback | None = None,
+        previous: Mapping[str, PageAnalysisResult] | None = None,
+    ) -> list[PageAnalysisResult]:
+        """
+        Analyze all pages of a crawl.
+
+        Args:
+            pages: Crawled pages
+            progress_callback: Awaited with (pages_done, pages_total), at most
+                once per ``progress_interval_seconds`` plus once at the end
+            previous: Results of an earlier run keyed by content hash; a
+                page with the same URL and HTML reuses its result
+
+        Returns:
+            One PageAnalysisResult per page, in crawl order
+        """
+        start = time.perf_counter()
+        homepage = next((i for i, page in enumerate(pages) if page.html), None)
+        reused = self._reusable(pages, homepage, previous or {})
+        jobs = [(i, page) for i, page in enumerate(pages) if i not in reused]
+
+        executor: Executor | None = None
+        if self.uses_processes(len(jobs)):
+            executor = self._process_pool()
+
+        try:
+            computed = await self._run(jobs, homepage, len(pages), executor, progress_callback)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. OOM); finish the crawl in-process instead
+            logger.warning("page_analysis_pool_broken", error=str(e))
+            self.shutdown()
+            executor = None
+            computed = await self._run(jobs, homepage, len(pages), None, progress_callback)
+
+        results = sorted([*reused.values(), *computed], key=lambda r: r.index)
+        failed = sum(1 for r in results if r.errors)
+        logger.info(
+            "page_analysis_completed",
+            pages=len(pages),
+            pages_reused=len(reused),
+            mode="process" if executor else "thread",
+            workers=self.config.max_workers if executor else 1,
+            pages_with_errors=failed,
+            duration_seconds=round(time.perf_counter() - start, 2),
+        )
+        return results
+
+    @staticmethod
+    def reusable_result(
+        page: CrawlPage,
+        index: int,
+        is_homepage: bool,
+        previous: Mapping[str, PageAnalysisResult],
+    ) -> PageAnalysisResult | None:
+        """An earlier result that still applies to this page, if any."""
+        if not page.html or not previous:
+            return None
+        prior = previous.get(page.content_hash)
+        if (
+            prior is not None
+            and prior.url == page.url
+            and not prior.errors
+            and (not is_homepage or prior.js is not None)
+        ):
+            return replace(prior, index=index)
+        return None
+
+    @classmethod
+    def _reusable(
+        cls,
+        pages: list[CrawlPage],
+        homepage: int | None,
+        previous: Mapping[str, PageAnalysisResult],
+    ) -> dict[int, PageAnalysisResult]:
+        """Pick earlier results that still apply, keyed by page index."""
+        reused: dict[int, PageAnalysisResult] = {}
+        for i, page in enumerate(pages):
+            prior = cls.reusable_result(page, i, i == homepage, previous)
+            if prior is not None:
+                reused[i] = prior
+        return reused
+
+    async def analyze(
+        self, page: CrawlPage, index: int, detect_js: bool = False
+    ) -> PageAnalysisResult:
+        """
+        Analyze one page, e.g. as it arrives from a crawl still in progress.
+
+        Pages run in a thread until ``min_pages_for_pool`` have been
+        submitted, then in the process pool. If the pool breaks, the rest
+        run in threads.
+
+        Args:
+            page: The crawled page
+            index: Position of the page in the crawl
+            detect_js: Whether to run JS dependency detection (homepage only)
+
+        Returns:
+            PageAnalysisResult for the page
+        """
+        loop = asyncio.get_running_loop()
+        self._submitted += 1
+        if self._pool_broken or not self.uses_processes(self._submitted):
+            return await loop.run_in_executor(None, analyze_page, page, index, detect_js)
+        try:
+            return await loop.run_in_executor(
+                self._process_pool(), analyze_page, page, index, detect_js
+            )
+        except BrokenProcessPool as e:
+            logger.warning("page_analysis_pool_broken", error=str(e))
+            self._pool_broken = True
+            self.shutdown()
+            return await loop.run_in_executor(None, analyze_page, page, index, detect_js)
+
+    async def _run(
+        self,
+        jobs: list[tuple[int, CrawlPage]],
+        homepage: int | None,
+        total: int,
+        executor: Executor | None,
+        progress_callback: ProgressCallback | None,
+    ) -> list[PageAnalysisResult]:
+        loop = asyncio.get_running_loop()
+        already_done = total - len(jobs)
+        last_report = time.perf_counter()
+
+        async def report(done: int) -> None:
+            nonlocal last_report
+            now = time.perf_counter()
+            if progress_callback and (
+                done == total or now - last_report >= self.config.progress_interval_seconds
+            ):
+                last_report = now
+                await progress_callback(done, total)
+
+        if not jobs:
+            await report(total)
+            return []
+
+        if executor is None:
+            # Pages are analyzed one at a time off the event loop, reusing
+            # the documents the crawler already parsed.
+            results = []
+            for done, (i, page) in enumerate(jobs, start=already_done + 1):
+                results.append(
+                    await loop.run_in_executor(None, analyze_page, page, i, i == homepage)
+                )
+                await report(done)
+            return results
+
+        futures = [
+            loop.run_in_executor(executor, analyze_page, page, i, i == homepage) for i, page in jobs
+        ]
+        for done, future in enumerate(asyncio.as_completed(futures), start=already_done + 1):
+            await future
+            await report(done)
+
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,289 @@
+"""Streaming crawl-to-embedding processing.
+
+Without streaming, an audit waits for the whole crawl, then analyzes every
+page, then chunks every page, then embeds every chunk. The CPU idles while
+the crawl runs, the network idles afterwards, and every page's HTML is
+held until the end.
+
+``PageStream`` connects the stages with bounded queues instead:
+
+    crawler --(pages)--> analysis workers --(results)--> chunk + embed
+
+- The crawler awaits ``PageStream.add`` for each page as it is crawled
+  (``Crawler.crawl(page_callback=...)``). When the page queue is full the
+  crawl worker waits, so at most ``queue_size`` pages (plus one per crawl
+  worker) are buffered: backpressure caps memory.
+- Analysis workers run ``analyze_page`` through ``PageAnalysisExecutor``
+  (threads, then the process pool once enough pages have arrived) and free
+  each page's parsed DOM, and optionally its HTML, as soon as it is done.
+- A single consumer chunks each analyzed page and embeds chunks in batches
+  of about ``embed_batch_chunks`` while the crawl continues. The embedder
+  (and its model) is created in a thread as the crawl starts.
+
+Results are returned in crawl order, so they match the non-streaming path.
+Pages the crawl returned without passing them to the callback (e.g. a
+cached crawl) are processed after it returns.
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+
+import structlog
+
+from worker.chunking.chunker import ChunkedPage
+from worker.crawler.crawler import CrawlPage, CrawlResult, PageCallback
+from worker.crawler.url import normalize_url
+from worker.embeddings.embedder import EmbeddedPage, Embedder
+from worker.extraction.js_detection import detect_js_dependency
+from worker.tasks.page_analysis import PageAnalysisExecutor, PageAnalysisResult, ProgressCallback
+
+logger = structlog.get_logger(__name__)
+
+# Runs the crawl, passing each page to the callback as it arrives
+CrawlFunc = Callable[[PageCallback | None], Awaitable[CrawlResult]]
+# Chunks one analyzed page (runs in a thread)
+ChunkFunc = Callable[[PageAnalysisResult], ChunkedPage]
+# Awaited before each embedding batch (e.g. to prefetch stored embeddings)
+BatchHook = Callable[[Embedder, list[ChunkedPage]], Awaitable[None]]
+
+
+@dataclass
+class PageStreamConfig:
+    """Configuration for streaming page processing."""
+
+    queue_size: int = 16  # Crawled pages awaiting analysis before the crawl waits
+    embed_batch_chunks: int = 64  # Chunks gathered before an embedding batch runs
+    release_html: bool = False  # Drop each page's HTML once analyzed (crawl not kept)
+
+
+@dataclass
+class StreamedPage:
+    """One page and everything computed for it."""
+
+    page: CrawlPage
+    result: PageAnalysisResult
+    chunked: ChunkedPage | None = None
+    embedded: EmbeddedPage | None = None
+
+
+@dataclass
+class PageStreamResult:
+    """The crawl and its processed pages, in crawl order."""
+
+    crawl: CrawlResult
+    embedder: Embedder
+    pages: list[StreamedPage] = field(default_factory=list)
+    pages_reused: int = 0  # Analysis results reused from the previous run
+    max_queued: int = 0  # Most pages waiting for analysis at once
+
+    @property
+    def page_results(self) -> list[PageAnalysisResult]:
+        return [p.result for p in self.pages]
+
+    @property
+    def chunked_pages(self) -> list[ChunkedPage]:
+        """Chunked pages, one per page with extracted content."""
+        return [p.chunked for p in self.pages if p.chunked is not None]
+
+    @property
+    def embedded_pages(self) -> list[EmbeddedPage]:
+        """Embedded pages, aligned with ``chunked_pages``."""
+        return [p.embedded for p in self.pages if p.embedded is not None]
+
+
+class PageStream:
+    """Analyzes, chunks and embeds pages while the crawl is still running."""
+
+    def __init__(
+        self,
+        analyzer: PageAnalysisExecutor,
+        chunk: ChunkFunc,
+        embedder_factory: Callable[[], Embedder],
+        start_url: str,
+        config: PageStreamConfig | None = None,
+        previous: Mapping[str, PageAnalysisResult] | None = None,
+        before_embed: BatchHook | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ):
+        """
+        Set up the stream.
+
+        Args:
+            analyzer: Runs the per-page analysis
+            chunk: Chunks an analyzed page with extracted content
+            embedder_factory: Creates the embedder for chunk batches
+            start_url: The crawl's start URL (its page gets JS detection)
+            config: Queue and batch sizes
+            previous: Results of an earlier run keyed by content hash
+            before_embed: Awaited with each batch before it is embedded
+            progress_callback: Awaited with (pages_analyzed, pages_crawled),
+                at most once per the analyzer's progress interval
+        """
+        self.analyzer = analyzer
+        self.chunk = chunk
+        self.embedder_factory = embedder_factory
+        self.config = config or PageStreamConfig()
+        self.previous = previous or {}
+        self.before_embed = before_embed
+        self.progress_callback = progress_callback
+        self.homepage_url = normalize_url(start_url)
+
+        self._pages: asyncio.Queue[CrawlPage | None] = asyncio.Queue(self.config.queue_size)
+        self._analyzed: asyncio.Queue[StreamedPage | None] = asyncio.Queue(self.config.queue_size)
+        self._streamed: dict[int, StreamedPage] = {}  # By id(page)
+        self._arrival = itertools.count()  # Provisional indexes, until crawl order is known
+        self._received: set[int] = set()
+        self._reused = 0
+        self._max_queued = 0
+        self._last_report = 0.0
+        self._embedder: asyncio.Future[Embedder] | None = None
+
+    @property
+    def analysis_workers(self) -> int:
+        """Concurrent analyses: one per pool process, else one at a time."""
+        return self.analyzer.config.max_workers
+
+    async def add(self, page: CrawlPage) -> None:
+        """Queue a crawled page, waiting while the queue is full."""
+        self._received.add(id(page))
+        await self._pages.put(page)
+        self._max_queued = max(self._max_queued, self._pages.qsize())
+
+    async def run(self, crawl: CrawlFunc) -> PageStreamResult:
+        """
+        Crawl and process every page.
+
+        Args:
+            crawl: Runs the crawl, awaiting its page callback per page
+
+        Returns:
+            The crawl and its processed pages, in crawl order
+
+        Raises:
+            Exception: Whatever the crawl or a consumer raised; the rest of
+                the stream is cancelled
+        """
+        start = time.perf_counter()
+        self._embedder = asyncio.ensure_future(asyncio.to_thread(self.embedder_factory))
+        workers = [asyncio.create_task(self._analyze()) for _ in range(self.analysis_workers)]
+        embedder_task = asyncio.create_task(self._chunk_and_embed())
+        crawl_task = asyncio.ensure_future(crawl(self.add))
+        tasks = [crawl_task, *workers, embedder_task, self._embedder]
+
+        try:
+            # Consumers only finish early by failing; surface that at once.
+            # The embedder build finishes early without failing and is not
+            # waited on here (its errors surface where it is awaited), or
+            # every wait would return immediately for the rest of the crawl
+            pending = {crawl_task, *workers, embedder_task}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if crawl_task in done:
+                    break
+                for task in done:
+                    task.result()
+            crawl_result = crawl_task.result()
+
+            for page in crawl_result.pages:
+                if id(page) not in self._received:
+                    await self.add(page)
+            for _ in workers:
+                await self._pages.put(None)
+            await asyncio.gather(*workers)
+            await self._analyzed.put(None)
+            await embedder_task
+            embedder = await self._embedder
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        result = self._collect(crawl_result, embedder)
+        logger.info(
+            "page_stream_completed",
+            pages=len(result.pages),
+            pages_reused=result.pages_reused,
+            chunks=sum(cp.total_chunks for cp in result.chunked_pages),
+            max_queued=result.max_queued,
+            duration_seconds=round(time.perf_counter() - start, 2),
+        )
+        return result
+
+    async def _analyze(self) -> None:
+        while (page := await self._pages.get()) is not None:
+            index = next(self._arrival)
+            is_homepage = page.url == self.homepage_url
+            result = self.analyzer.reusable_result(page, index, is_homepage, self.previous)
+            if result is not None:
+                self._reused += 1
+            else:
+                result = await self.analyzer.analyze(page, index, detect_js=is_homepage)
+
+            # Free the page's memory as soon as the analysis is done
+            page.document.release()
+            if self.config.release_html:
+                page.release_html()
+
+            streamed = StreamedPage(page=page, result=result)
+            self._streamed[id(page)] = streamed
+            await self._report()
+            await self._analyzed.put(streamed)
+
+    async def _chunk_and_embed(self) -> None:
+        batch: list[StreamedPage] = []
+        batch_chunks = 0
+        while (streamed := await self._analyzed.get()) is not None:
+            if streamed.result.extracted is None:
+                continue
+            streamed.chunked = await asyncio.to_thread(self.chunk, streamed.result)
+            batch.append(streamed)
+            batch_chunks += streamed.chunked.total_chunks
+            if batch_chunks >= self.config.embed_batch_chunks:
+                await self._embed(batch)
+                batch, batch_chunks = [], 0
+        if batch:
+            await self._embed(batch)
+
+    async def _embed(self, batch: list[StreamedPage]) -> None:
+        assert self._embedder is not None
+        embedder = await self._embedder
+        chunked = [streamed.chunked for streamed in batch if streamed.chunked is not None]
+        if self.before_embed is not None:
+            await self.before_embed(embedder, chunked)
+        embedded = await asyncio.to_thread(embedder.embed_pages, chunked)
+        for streamed, page in zip(batch, embedded, strict=True):
+            streamed.embedded = page
+
+    async def _report(self) -> None:
+        if self.progress_callback is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_report >= self.analyzer.config.progress_interval_seconds:
+            self._last_report = now
+            await self.progress_callback(len(self._streamed), len(self._received))
+
+    def _collect(self, crawl: CrawlResult, embedder: Embedder) -> PageStreamResult:
+        """Order processed pages as the crawl does."""
+        result = PageStreamResult(
+            crawl=crawl,
+            embedder=embedder,
+            pages_reused=self._reused,
+            max_queued=self._max_queued,
+        )
+        for index, page in enumerate(crawl.pages):
+            streamed = self._streamed[id(page)]
+            streamed.result.index = index
+            result.pages.append(streamed)
+
+        # JS detection ran on the start URL's page; if that page failed, the
+        # first crawled page stands in as the homepage (when its HTML is kept)
+        homepage = next((p for p in result.pages if p.result.content_hash), None)
+        if homepage is not None and homepage.result.js is None and homepage.page.html:
+            try:
+                homepage.result.js = detect_js_dependency(homepage.page.html, homepage.page.url)
+            except Exception as e:
+                homepage.result.errors["js"] = str(e)
+        return result
@@ -6,6 +6,7 @@ missing or incomplete structured data.
 
 import structlog
 
+from worker.extraction.document import PageDocument
 from worker.extraction.schema import analyze_schema
 from worker.scoring.schema import SchemaRichnessScore, calculate_schema_score
 
@@ -48,6 +49,7 @@ async def run_schema_checks(
 def run_schema_checks_sync(
     html: str,
     url: str,
+    document: PageDocument | None = None,
 ) -> SchemaRichnessScore:
     """
     Synchronous version of schema checks.
@@ -55,11 +57,12 @@ def run_schema_checks_sync(
     Args:
         html: Full HTML content
         url: Page URL
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         SchemaRichnessScore with all component scores
     """
-    schema_analysis = analyze_schema(html, url)
+    schema_analysis = analyze_schema(html, url, document=document)
     return calculate_schema_score(schema_analysis)
 
 
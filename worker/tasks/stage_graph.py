@@ -0,0 +1,264 @@
+"""Dependency-graph executor for multi-stage pipelines.
+
+A pipeline is declared as ``Stage`` objects, each naming the values it
+reads (``inputs``) and the values it produces (``outputs``). ``StageGraph``
+validates the declarations (every value has one producer, no cycles) and
+runs the stages as soon as their inputs are available, so stages with no
+data dependency overlap. A network-bound stage, for example, runs while a
+crawl is still in progress.
+
+Each run records when every stage started and finished. From this the
+``GraphRun`` derives the critical path: the chain of stages that
+determined the total time, found by following, from the last stage to
+finish, the input that became available last.
+
+Stages are coroutines called as ``func(context, **inputs)`` and return a
+dict with exactly their declared outputs. CPU-heavy stages should move
+their work off the event loop (``asyncio.to_thread`` or a process pool) so
+concurrent network stages keep making progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+StageFunc = Callable[..., Awaitable[dict[str, Any] | None]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of a pipeline and the values it consumes and produces."""
+
+    name: str
+    func: StageFunc
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    status: str | None = None  # Progress status shown while the stage runs
+
+
+class StageListener(Protocol):
+    """Notified as stages start and finish (e.g. to publish run status)."""
+
+    async def stage_started(self, stage: Stage) -> None: ...
+
+    async def stage_finished(self, stage: Stage) -> None: ...
+
+
+@dataclass
+class StageTiming:
+    """When a stage ran, in seconds since the graph started."""
+
+    name: str
+    started: float
+    finished: float = 0.0
+    # Stage whose output was the last input to become available
+    waited_on: str | None = None
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass
+class GraphRun:
+    """Values and timings from one execution of a graph."""
+
+    values: dict[str, Any]
+    timings: dict[str, StageTiming] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def critical_path(self) -> list[StageTiming]:
+        """Stages on the longest dependency chain, in execution order."""
+        if not self.timings:
+            return []
+        current: StageTiming | None = max(self.timings.values(), key=lambda t: t.finished)
+        path = []
+        while current is not None:
+            path.append(current)
+            current = self.timings.get(current.waited_on) if current.waited_on else None
+        return path[::-1]
+
+    def summary(self) -> dict[str, Any]:
+        """Timing report suitable for structured logging."""
+        path = self.critical_path()
+        busy = sum(t.duration for t in self.timings.values())
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "stage_seconds": round(busy, 3),
+            "parallelism": round(busy / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "critical_path": [t.name for t in path],
+            "critical_path_seconds": round(sum(t.duration for t in path), 3),
+            "stages": {
+                t.name: {"start": round(t.started, 3), "seconds": round(t.duration, 3)}
+                for t in sorted(self.timings.values(), key=lambda t: t.started)
+            },
+        }
+
+
+class StageGraph:
+    """A validated set of stages, executed with maximal overlap."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        """
+        Validate and store the stages.
+
+        Raises:
+            ValueError: On duplicate stage names, a value produced by more
+                than one stage, or a dependency cycle
+        """
+        self.stages: dict[str, Stage] = {}
+        self.producers: dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            self.stages[stage.name] = stage
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(
+                        f"{output!r} is produced by both {self.producers[output].name!r} "
+                        f"and {stage.name!r}"
+                    )
+                self.producers[output] = stage
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(stage: Stage, chain: tuple[str, ...]) -> None:
+            if stage.name in done:
+                return
+            if stage.name in visiting:
+                cycle = " -> ".join((*chain[chain.index(stage.name) :], stage.name))
+                raise ValueError(f"Stage dependency cycle: {cycle}")
+            visiting.add(stage.name)
+            for value in stage.inputs:
+                producer = self.producers.get(value)
+                if producer is not None:
+                    visit(producer, (*chain, stage.name))
+            visiting.discard(stage.name)
+            done.add(stage.name)
+
+        for stage in self.stages.values():
+            visit(stage, ())
+
+    def required_stages(self, targets: Iterable[str] | None = None) -> list[Stage]:
+        """
+        Stages needed to produce ``targets`` (all stages if None).
+
+        Returns:
+            Stages in declaration order
+        """
+        if targets is None:
+            return list(self.stages.values())
+        needed: set[str] = set()
+        pending = list(targets)
+        while pending:
+            producer = self.producers.get(pending.pop())
+            if producer is not None and producer.name not in needed:
+                needed.add(producer.name)
+                pending.extend(producer.inputs)
+        return [stage for name, stage in self.stages.items() if name in needed]
+
+    async def run(
+        self,
+        context: Any,
+        values: Mapping[str, Any] | None = None,
+        targets: Iterable[str] | None = None,
+        listener: StageListener | None = None,
+    ) -> GraphRun:
+        """
+        Execute the graph.
+
+        A stage starts as soon as all of its inputs are available. If a
+        stage raises, the stages still running are cancelled and the
+        exception propagates.
+
+        Args:
+            context: Passed as the first argument to every stage
+            values: Initial values (inputs not produced by any stage)
+            targets: Only run the stages these values depend on
+            listener: Notified as stages start and finish
+
+        Returns:
+            All values produced, with per-stage timings
+        """
+        stages = self.required_stages(targets)
+        available: dict[str, Any] = dict(values or {})
+        missing = {
+            value
+            for stage in stages
+            for value in stage.inputs
+            if value not in available and value not in self.producers
+        }
+        if missing:
+            raise ValueError(f"Missing graph inputs: {sorted(missing)}")
+
+        graph_run = GraphRun(values=available)
+        ready_at: dict[str, tuple[float, str | None]] = dict.fromkeys(available, (0.0, None))
+        pending = {stage.name: stage for stage in stages}
+        running: dict[asyncio.Task[dict[str, Any] | None], Stage] = {}
+        start = time.perf_counter()
+
+        try:
+            while pending or running:
+                for stage in list(pending.values()):
+                    if not all(value in available for value in stage.inputs):
+                        continue
+                    del pending[stage.name]
+                    if listener is not None:
+                        await listener.stage_started(stage)
+                    latest = max(
+                        (ready_at[value] for value in stage.inputs),
+                        default=(0.0, None),
+                        key=lambda ready: ready[0],
+                    )
+                    graph_run.timings[stage.name] = StageTiming(
+                        name=stage.name,
+                        started=time.perf_counter() - start,
+                        waited_on=latest[1],
+                    )
+                    inputs = {value: available[value] for value in stage.inputs}
+                    task = asyncio.create_task(stage.func(context, **inputs), name=stage.name)
+                    running[task] = stage
+
+                if not running:
+                    # Unreachable after validation, but never spin forever
+                    raise RuntimeError(f"Stages cannot start: {sorted(pending)}")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    timing = graph_run.timings[stage.name]
+                    timing.finished = time.perf_counter() - start
+                    try:
+                        outputs = task.result() or {}
+                    except Exception as e:
+                        logger.warning("stage_failed", stage=stage.name, error=str(e))
+                        raise
+                    if set(outputs) != set(stage.outputs):
+                        raise ValueError(
+                            f"Stage {stage.name!r} returned {sorted(outputs)}, "
+                            f"declared {sorted(stage.outputs)}"
+                        )
+                    available.update(outputs)
+                    for value in outputs:
+                        ready_at[value] = (timing.finished, stage.name)
+                    if listener is not None:
+                        await listener.stage_finished(stage)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            graph_run.wall_seconds = time.perf_counter() - start
+
+        return graph_run
@@ -7,6 +7,7 @@ fixes for identified issues.
 
 import structlog
 
+from worker.extraction.document import PageDocument
 from worker.extraction.structure import analyze_structure
 from worker.scoring.structure import StructureQualityScore, calculate_structure_score
 
@@ -60,6 +61,7 @@ def run_structure_checks_sync(
     url: str,
     main_content: str = "",
     word_count: int = 0,
+    document: PageDocument | None = None,
 ) -> StructureQualityScore:
     """
     Synchronous version of structure checks.
@@ -69,6 +71,7 @@ def run_structure_checks_sync(
         url: Page URL
         main_content: Extracted main content text
         word_count: Word count of content
+        document: Optional pre-parsed page to avoid re-parsing ``html``
 
     Returns:
         StructureQualityScore with all component scores
@@ -78,6 +81,7 @@ def run_structure_checks_sync(
         url=url,
         main_content=main_content,
         word_count=word_count,
+        document=document,
     )
     return calculate_structure_score(structure_analysis)
 
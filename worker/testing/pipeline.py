@@ -14,17 +14,28 @@ from typing import Any
 
 import structlog
 
-from worker.chunking.chunker import SemanticChunker
-from worker.crawler.crawler import crawl_site
-from worker.embeddings.embedder import Embedder
-from worker.extraction.extractor import ContentExtractor
-from worker.questions.generator import QuestionGenerator, SiteContext
-from worker.retrieval.retriever import HybridRetriever
-from worker.simulation.runner import SimulationRunner
+from worker.crawler.crawler import CrawlResult, PageCallback, crawl_site
+from worker.tasks.audit_graph import AuditContext, build_audit_graph
+from worker.tasks.page_stream import PageStreamConfig
 from worker.testing.config import PipelineConfig
 
 logger = structlog.get_logger(__name__)
 
+# Graph values the pipeline reports
+PIPELINE_TARGETS = (
+    "crawl_result",
+    "total_chunks",
+    "technical_score",
+    "structure_score",
+    "schema_score",
+    "authority_score",
+    "simulation_result",
+)
+
+
+class _NoPagesCrawledError(Exception):
+    """The crawl returned no pages."""
+
 
 @dataclass
 class PillarScores:
@@ -251,238 +262,48 @@ async def run_pipeline(
 
     logger.info("pipeline_starting", url=url, domain=domain)
 
-    try:
-        # Initialize result with defaults
-        pillar_scores = PillarScores()
-        question_results: list[QuestionResult] = []
-
-        # =========================================================
-        # Step 1: Crawl
-        # =========================================================
-        logger.info("crawl_starting", url=url, max_pages=config.max_pages)
+    # Create synthetic IDs for standalone run
+    site_id = uuid.uuid5(uuid.NAMESPACE_URL, url)
 
+    async def crawl(page_callback: PageCallback | None) -> CrawlResult:
         crawl_result = await crawl_site(
             url=url,
             max_pages=config.max_pages,
             max_depth=config.max_depth,
+            page_callback=page_callback,
         )
+        if not crawl_result.pages:
+            raise _NoPagesCrawledError
+        return crawl_result
 
-        pages_crawled = len(crawl_result.pages)
-        logger.info("crawl_completed", pages=pages_crawled)
-
-        if pages_crawled == 0:
-            return PipelineResult(
-                url=url,
-                domain=domain,
-                status="failed",
-                overall_score=0.0,
-                pillar_scores=pillar_scores,
-                error_message="No pages crawled",
-                duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
-            )
-
-        # =========================================================
-        # Step 2: Extract
-        # =========================================================
-        logger.info("extraction_starting", pages=pages_crawled)
-
-        extractor = ContentExtractor()
-        extraction_result = extractor.extract_crawl(crawl_result)
-
-        logger.info(
-            "extraction_completed",
-            pages=extraction_result.total_pages,
-            words=extraction_result.total_words,
-        )
-
-        # =========================================================
-        # Step 3: Technical Score
-        # =========================================================
-        from worker.tasks.technical_check import run_technical_checks_parallel
-
-        try:
-            technical_score = await run_technical_checks_parallel(
-                url=url,
-                html=crawl_result.pages[0].html if crawl_result.pages else None,
-                timeout=10.0,
-            )
-            pillar_scores.technical = technical_score.total_score
-            logger.info("technical_score", score=technical_score.total_score)
-        except Exception as e:
-            logger.warning("technical_check_failed", error=str(e))
-
-        # =========================================================
-        # Step 4: Structure Score
-        # =========================================================
-        from worker.tasks.structure_check import (
-            aggregate_structure_scores,
-            run_structure_checks_sync,
-        )
-
-        try:
-            structure_page_scores = []
-            for i, page in enumerate(crawl_result.pages):
-                if page.html and i < len(extraction_result.pages):
-                    extracted = extraction_result.pages[i]
-                    page_score = run_structure_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                        main_content=extracted.main_content,
-                        word_count=extracted.word_count,
-                    )
-                    structure_page_scores.append(page_score)
-
-            if structure_page_scores:
-                structure_score = aggregate_structure_scores(structure_page_scores)
-                pillar_scores.structure = structure_score.total_score
-                logger.info("structure_score", score=structure_score.total_score)
-        except Exception as e:
-            logger.warning("structure_check_failed", error=str(e))
-
-        # =========================================================
-        # Step 5: Schema Score
-        # =========================================================
-        from worker.tasks.schema_check import (
-            aggregate_schema_scores,
-            run_schema_checks_sync,
-        )
-
-        try:
-            schema_page_scores = []
-            for page in crawl_result.pages:
-                if page.html:
-                    page_schema_score = run_schema_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                    )
-                    schema_page_scores.append(page_schema_score)
-
-            if schema_page_scores:
-                schema_score = aggregate_schema_scores(schema_page_scores)
-                pillar_scores.schema = schema_score.total_score
-                logger.info("schema_score", score=schema_score.total_score)
-        except Exception as e:
-            logger.warning("schema_check_failed", error=str(e))
-
-        # =========================================================
-        # Step 6: Authority Score
-        # =========================================================
-        from worker.tasks.authority_check import (
-            aggregate_authority_scores,
-            run_authority_checks_sync,
-        )
-
-        try:
-            authority_page_scores = []
-            for i, page in enumerate(crawl_result.pages):
-                if page.html and i < len(extraction_result.pages):
-                    extracted = extraction_result.pages[i]
-                    page_authority_score = run_authority_checks_sync(
-                        html=page.html,
-                        url=page.url,
-                        main_content=extracted.main_content,
-                    )
-                    authority_page_scores.append(page_authority_score)
-
-            if authority_page_scores:
-                authority_score = aggregate_authority_scores(authority_page_scores)
-                pillar_scores.authority = authority_score.total_score
-                logger.info("authority_score", score=authority_score.total_score)
-        except Exception as e:
-            logger.warning("authority_check_failed", error=str(e))
-
-        # =========================================================
-        # Step 7: Chunking & Embedding
-        # =========================================================
-        logger.info("chunking_starting")
-
-        chunker = SemanticChunker()
-        chunked_pages = []
-        total_chunks = 0
-
-        for page in extraction_result.pages:  # type: ignore[assignment]
-            chunked_page = chunker.chunk_text(
-                text=page.main_content,  # type: ignore[attr-defined]
-                url=page.url,
-                title=page.title,
-            )
-            chunked_pages.append(chunked_page)
-            total_chunks += chunked_page.total_chunks
-
-        logger.info("chunking_completed", chunks=total_chunks)
-
-        # Embed chunks
-        logger.info("embedding_starting")
-
-        embedder = Embedder()
-        embedded_pages = embedder.embed_pages(chunked_pages)
-
-        # Build retriever index
-        retriever = HybridRetriever(embedder=embedder)
-        for page_idx, ep in enumerate(embedded_pages):
-            for emb_result in ep.embeddings:
-                chunk = chunked_pages[page_idx].chunks[emb_result.chunk_index]
-                retriever.add_document(
-                    doc_id=emb_result.content_hash,
-                    content=chunk.content,
-                    embedding=emb_result.embedding,
-                    source_url=emb_result.source_url,
-                    page_title=emb_result.page_title,
-                    heading_context=emb_result.heading_context,
-                )
-
-        logger.info("embedding_completed", documents=len(retriever._documents))
-
-        # =========================================================
-        # Step 8: Generate Questions
-        # =========================================================
-        logger.info("question_generation_starting")
-
-        # Collect schema types and headings
-        schema_types = list(set(extraction_result.schema_types_found))
-        headings: dict[str, list[str]] = {"h1": [], "h2": [], "h3": []}
-        for page in extraction_result.pages:  # type: ignore[assignment]
-            page_headings = page.metadata.headings or {}  # type: ignore[attr-defined]
-            for level in ["h1", "h2", "h3"]:
-                if level in page_headings:
-                    headings[level].extend(page_headings[level])
+    try:
+        # Initialize result with defaults
+        pillar_scores = PillarScores()
+        question_results: list[QuestionResult] = []
 
-        site_context = SiteContext(
-            company_name=domain.split(".")[0].title(),
+        # The audit's stage graph, up to simulation (no persistence,
+        # entity recognition or observation). Pages are processed as they
+        # are crawled and nothing keeps their HTML afterwards.
+        context = AuditContext(
             domain=domain,
-            schema_types=schema_types,
-            headings=headings,
-        )
-
-        question_generator = QuestionGenerator()
-        questions = question_generator.generate(site_context)
-
-        logger.info("question_generation_completed", questions=len(questions))
-
-        # =========================================================
-        # Step 9: Simulation
-        # =========================================================
-        logger.info("simulation_starting", questions=len(questions))
-
-        # Create synthetic IDs for standalone run
-        site_id = uuid.uuid5(uuid.NAMESPACE_URL, url)
-        run_id = uuid.uuid4()
-
-        simulation_runner = SimulationRunner(retriever=retriever)
-        simulation_result = simulation_runner.run(
-            site_id=site_id,
-            run_id=run_id,
             company_name=domain.split(".")[0].title(),
-            questions=questions,
-        )
-
-        logger.info(
-            "simulation_completed",
-            overall_score=simulation_result.overall_score,
-            answered=simulation_result.questions_answered,
-            partial=simulation_result.questions_partial,
-            unanswered=simulation_result.questions_unanswered,
+            start_url=url,
+            site_id=site_id,
+            crawl=crawl,
+            stream_config=PageStreamConfig(release_html=True),
         )
+        graph = build_audit_graph(streaming=True)
+        graph_run = await graph.run(context, targets=PIPELINE_TARGETS)
+        logger.info("pipeline_stage_timings", url=url, **graph_run.summary())
+
+        values = graph_run.values
+        pages_crawled = len(values["crawl_result"].pages)
+        total_chunks = values["total_chunks"]
+        simulation_result = values["simulation_result"]
+        for pillar in ("technical", "structure", "schema", "authority"):
+            score = values[f"{pillar}_score"]
+            if score is not None:
+                setattr(pillar_scores, pillar, score.total_score)
 
         # Extract retrieval and coverage from simulation
         pillar_scores.coverage = simulation_result.coverage_score
@@ -560,6 +381,17 @@ async def run_pipeline(
 
         return result
 
+    except _NoPagesCrawledError:
+        return PipelineResult(
+            url=url,
+            domain=domain,
+            status="failed",
+            overall_score=0.0,
+            pillar_scores=PillarScores(),
+            error_message="No pages crawled",
+            duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
+        )
+
     except Exception as e:
         logger.exception("pipeline_failed", url=url, error=str(e))
 
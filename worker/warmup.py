@@ -0,0 +1,130 @@
+"""Warm-up for worker processes.
+
+RQ's default ``Worker`` forks a fresh work horse for every job, so anything
+a job loads lazily (the embedding model, heavy imports) is loaded again per
+job and thrown away when the horse exits. Loading it once in the parent
+before the first fork lets every horse inherit it copy-on-write.
+
+The model's weights are loaded in the parent but no inference runs there:
+BLAS/OpenMP thread pools started before a fork can deadlock in the child.
+"""
+
+import asyncio
+import gc
+import importlib
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Modules audit and monitoring jobs import; importing them pulls in
+# numpy, BeautifulSoup, SQLAlchemy and the rest of the worker package
+PRELOAD_MODULES: tuple[str, ...] = (
+    "worker.tasks.audit",
+    "worker.tasks.monitoring",
+    "worker.tasks.calibration",
+    "worker.embeddings.embedder",
+    "worker.retrieval.retriever",
+    "sqlalchemy.dialects.postgresql.asyncpg",
+)
+
+
+@dataclass
+class WarmupReport:
+    """Time spent warming up a worker process."""
+
+    module_seconds: dict[str, float] = field(default_factory=dict)
+    model_name: str | None = None
+    model_seconds: float = 0.0
+    calibration_seconds: float = 0.0
+    total_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "module_seconds": {k: round(v, 3) for k, v in self.module_seconds.items()},
+            "model_name": self.model_name,
+            "model_seconds": round(self.model_seconds, 3),
+            "calibration_seconds": round(self.calibration_seconds, 3),
+            "total_seconds": round(self.total_seconds, 3),
+            "errors": self.errors,
+        }
+
+
+async def _load_calibration() -> None:
+    from api.database import get_engine
+    from worker.scoring.calculator_v2 import load_active_calibration_weights
+
+    try:
+        weights = await load_active_calibration_weights()
+        logger.info("calibration_config_loaded", weights=weights)
+    finally:
+        # Pooled connections belong to this event loop; don't hand them to children
+        await get_engine().dispose()
+
+
+def warm_up(
+    modules: Iterable[str] = PRELOAD_MODULES,
+    model_name: str | None = None,
+    load_model: bool = True,
+    load_calibration: bool = True,
+) -> WarmupReport:
+    """
+    Load everything jobs need into the current process.
+
+    Failures are logged and recorded, never raised: a worker that could not
+    warm up still runs jobs, just slower.
+
+    Args:
+        modules: Modules to import
+        model_name: Embedding model to load (default: the embedder's default)
+        load_model: Whether to load the embedding model
+        load_calibration: Whether to load the active calibration weights
+
+    Returns:
+        WarmupReport
+    """
+    report = WarmupReport()
+    started = time.perf_counter()
+
+    for module in modules:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            report.errors.append(f"import {module}: {e}")
+            continue
+        report.module_seconds[module] = time.perf_counter() - t0
+
+    if load_model:
+        from worker.embeddings.models import DEFAULT_MODEL, get_model
+
+        report.model_name = model_name or DEFAULT_MODEL
+        t0 = time.perf_counter()
+        try:
+            get_model(report.model_name)
+        except Exception as e:
+            report.errors.append(f"model {report.model_name}: {e}")
+        report.model_seconds = time.perf_counter() - t0
+
+    if load_calibration:
+        t0 = time.perf_counter()
+        try:
+            asyncio.run(_load_calibration())
+        except Exception as e:
+            report.errors.append(f"calibration: {e}")
+        report.calibration_seconds = time.perf_counter() - t0
+
+    # Move everything loaded so far out of the collector's reach, so GC passes
+    # in the children don't write to (and copy) the shared pages
+    gc.collect()
+    gc.freeze()
+
+    report.total_seconds = time.perf_counter() - started
+    if report.errors:
+        logger.warning("worker_warmup_errors", errors=report.errors)
+    logger.info("worker_warmup_completed", **report.to_dict())
+    return report